@@ -0,0 +1,18 @@
+from beamng_envs.lazy import lazy_module_attrs
+
+# Simulation management classes are imported on first access, so importing the package (or one module in it) stays cheap.
+_LAZY_ATTRS = {
+    "AsyncBNGSim": "beamng_envs.bng_sim.async_bng_sim",
+    "BeamNGPyConfig": "beamng_envs.bng_sim.beamngpy_config",
+    "BNGSim": "beamng_envs.bng_sim.bng_sim",
+    "BNGSimConfig": "beamng_envs.bng_sim.bng_sim_config",
+    "BNGSimPortLease": "beamng_envs.bng_sim.bng_sim_port_lease",
+    "BNGSimWatchdog": "beamng_envs.bng_sim.bng_sim_watchdog",
+    "BNGSimWorker": "beamng_envs.bng_sim.bng_sim_worker",
+    "BNGSimWorkerPool": "beamng_envs.bng_sim.bng_sim_worker_pool",
+    "BNGSimWorkspaceTemplate": "beamng_envs.bng_sim.bng_sim_workspace",
+    "StepUntilResult": "beamng_envs.bng_sim.bng_sim",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,149 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from beamngpy import Scenario, Vehicle
+
+from beamng_envs.bng_sim import step_predicates
+from beamng_envs.bng_sim.bng_sim import BNGSim, StepUntilResult
+from beamng_envs.envs.errors import SimulationStalledException
+
+T = TypeVar("T")
+
+
+class AsyncBNGSim:
+    """
+    Asyncio interface to a BNGSim, so one event loop can drive many game instances concurrently.
+
+    BeamNGpy's socket calls block, so each call is run in a thread dedicated to this instance (calls to one instance
+    are run in order, as its connection isn't thread safe), and awaited. While one instance's call is waiting on the
+    game, the loop runs the Python-side processing of the others.
+
+      - call_timeout: Wall-clock timeout (s) for each call (e.g. a step). If exceeded the game process is killed (so the
+                      blocked call returns) and SimulationStalledException is raised, which envs retry as for the
+                      watchdog.
+      - setup_timeout: Wall-clock timeout (s) for each setup call (.setup_call, e.g. launching the game and loading a
+                       scenario), which take much longer than steps. Handled as for call_timeout.
+      - limit: Optional semaphore shared by several instances, limiting the number of calls in flight across them
+               (back-pressure, e.g. so a large host isn't saturated by scenario loads). Create it in the running loop.
+
+    e.g.
+    ````
+    async def run_all(sims):
+        limit = asyncio.Semaphore(8)
+        async_sims = [AsyncBNGSim(sim, call_timeout=30, limit=limit) for sim in sims]
+        await asyncio.gather(*[s.launch() for s in async_sims])
+        ...
+    ````
+
+    Envs use this via IEnv.async_step and IEnv.async_run.
+    """
+
+    def __init__(
+        self,
+        sim: BNGSim,
+        call_timeout: Optional[float] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+        setup_timeout: Optional[float] = None,
+    ):
+        """
+        :param sim: The BNGSim to drive.
+        :param call_timeout: Optional timeout (s) for each call.
+        :param limit: Optional semaphore limiting the number of calls in flight, shared with other instances.
+        :param setup_timeout: Optional timeout (s) for each setup call.
+        """
+        self.sim = sim
+        self.call_timeout = call_timeout
+        self.setup_timeout = setup_timeout
+        self.limit = limit
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncBNGSim"
+        )
+
+    def __repr__(self):
+        return f"AsyncBNGSim for {self.sim}"
+
+    async def call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking call on this instance (e.g. a BNGSim method, or a paradigm step using it) in its thread.
+
+        :param fn: The callable.
+        :param args: Args for fn.
+        :param kwargs: Kwargs for fn.
+        :return: The output of fn.
+        """
+        return await self._limited_call(self.call_timeout, fn, *args, **kwargs)
+
+    async def setup_call(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        """As .call, but subject to setup_timeout, for calls that launch the game or load a scenario (e.g. env.reset)."""
+        return await self._limited_call(self.setup_timeout, fn, *args, **kwargs)
+
+    async def _limited_call(
+        self, timeout: Optional[float], fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        if self.limit is None:
+            return await self._call(timeout, fn, *args, **kwargs)
+
+        async with self.limit:
+            return await self._call(timeout, fn, *args, **kwargs)
+
+    async def _call(
+        self, timeout: Optional[float], fn: Callable[..., T], *args, **kwargs
+    ) -> T:
+        future = asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            # The thread can't be cancelled, so unblock it by killing the game; the next call waits for it to return
+            self.sim._kill_game_process()
+            raise SimulationStalledException(
+                f"{getattr(fn, '__name__', fn)} exceeded the timeout of {timeout}s."
+            )
+
+    async def launch(self) -> None:
+        await self.setup_call(self.sim.launch)
+
+    async def start_scenario(self, scenario: Scenario, load_start_wait: int = 0):
+        await self.setup_call(
+            self.sim.start_scenario, scenario, load_start_wait=load_start_wait
+        )
+
+    async def step(self, n_steps: int = 1) -> None:
+        await self.call(self.sim.step, n_steps)
+
+    async def step_until(
+        self,
+        vehicle: Vehicle,
+        predicate: step_predicates.Predicate,
+        max_steps: int,
+        record_every: int = 1,
+    ) -> StepUntilResult:
+        return await self.call(
+            self.sim.step_until,
+            vehicle,
+            predicate,
+            max_steps=max_steps,
+            record_every=record_every,
+        )
+
+    async def step_and_poll(
+        self, vehicles: Sequence[Vehicle], n_steps: int = 1
+    ) -> List[Dict[str, Any]]:
+        return await self.call(self.sim.step_and_poll, vehicles, n_steps=n_steps)
+
+    async def poll_sensors_for_vehicle(self, vehicle: Vehicle) -> Dict[str, Any]:
+        return await self.call(self.sim.poll_sensors_for_vehicle, vehicle)
+
+    async def kill(self) -> None:
+        """Kill the game instance, after any call in progress returns."""
+        # Kill immediately, so a hung call in progress returns
+        self.sim._kill_game_process()
+        await self._call(None, self.sim.kill)
+
+    async def close(self, force: bool = False) -> None:
+        """Close the game instance (if the config allows it, or force) and stop this instance's thread."""
+        await self.setup_call(self.sim.close, force=force)
+        self._executor.shutdown(wait=False)
@@ -2,9 +2,14 @@ import os
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class BeamNGPyConfig:
-    """Config class for a beamng.BeamNGPy instance."""
+    """
+    Config class for a beamng.BeamNGPy instance.
+
+    Immutable, so one config can be shared between threads; derive per-instance configs with dataclasses.replace, e.g.
+    dataclasses.replace(bng_config, port=64260).
+    """
 
     home: str = os.environ.get("BEAMNG_PATH", "/path/to/beamng")
     user: str = os.environ.get("BEAMNG_USER_PATH", "/beamng_workspace/")
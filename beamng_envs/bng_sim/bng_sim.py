@@ -1,18 +1,41 @@
+import os
+import shutil
+import socket
 import time
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Sequence
 
 from beamngpy import BeamNGpy, Vehicle, Scenario
+from beamngpy.logging import BNGError, BNGValueError
 
+from beamng_envs import __BNG_VERSION__
+from beamng_envs.bng_sim import step_predicates
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.bng_sim.bng_sim_watchdog import BNGSimWatchdog
 from beamng_envs.envs.errors import OutOfTimeException
 from beamng_envs.envs.sensor_set import SensorSet
 
 
+@dataclass
+class StepUntilResult:
+    # The vehicle state (pos, dir, vel and step) every record_every steps, and at the final step
+    frames: List[Dict[str, Any]]
+
+    # Number of steps simulated
+    n_steps: int
+
+    # Whether the predicate was met, rather than max_steps being reached
+    satisfied: bool
+
+
 class BNGSim:
     """
     Manages the BeamNG simulation via the beamnpy.BeamNGpy API.
 
       - Launching and closing
+      - Stepping, under a watchdog that kills the game if it hangs
+      - Stepping until a condition is met, in the game (see .step_until)
+      - Stepping and polling sensors in one request (see .step_and_poll)
       - Sensors and sample timing
       - Vehicle logs
       - Debug features such path visualisation
@@ -23,6 +46,12 @@ class BNGSim:
     _debug_sphere_ids: Optional[List[int]]
     _debug_line_ids: Optional[List[int]]
 
+    _lua_path = os.path.join(os.path.dirname(__file__), "lua")
+    _step_until_extension = "beamngEnvs_stepUntil"
+    _step_until_request = "BeamNGEnvsStepUntil"
+    _step_and_poll_extension = "beamngEnvs_stepAndPoll"
+    _step_and_poll_request = "BeamNGEnvsStepAndPoll"
+
     def __init__(self, config: BNGSimConfig, bng: Optional[BeamNGpy] = None):
         """
 
@@ -31,45 +60,308 @@ class BNGSim:
         """
         self.config = config
         self.bng = bng
+        self._supplied_bng = bng
         self._bng_vehicle_logs = {}
-        self._sensor_set = SensorSet(include_tech_sensors=config.use_tech_sensors)
+        self._sensor_set = SensorSet(
+            include_tech_sensors=config.use_tech_sensors,
+            sensor_keys=config.sensor_keys,
+        )
+        self._loaded_extensions = set()
+        self._step_and_poll_supported = True
+        self.watchdog = BNGSimWatchdog(
+            on_fire=self._kill_game_process,
+            step_timeout=config.step_timeout,
+            job_timeout=config.job_timeout,
+        )
 
     def launch(self):
-        """Launch a BeamNG instance if one doesn't currently exist."""
+        """Launch a BeamNG instance if one doesn't currently exist, and connect to it if not already connected."""
         if self.bng is None:
+            if self.config.server_side_stepping:
+                self.install_extension(self.config.bng_config.user)
             self.bng = BeamNGpy(**self.config.bng_config.__dict__)
+            self._loaded_extensions = set()
+            self._step_and_poll_supported = True
+
+        if self.bng.connection is None:
+            self.bng.open()
 
-        self.bng.open()
+    @classmethod
+    def install_extension(cls, user_path: str, bng_version: str = __BNG_VERSION__):
+        """
+        Install the bundled game-side extensions (used by .step_until) as an unpacked mod in a game user path.
+
+        :param user_path: The game user path, e.g. BeamNGPyConfig.user.
+        :param bng_version: The BeamNG version, used for the mods directory.
+        """
+        mod_path = os.path.join(
+            user_path, bng_version, "mods", "unpacked", "beamng_envs", "lua"
+        )
+        for root, _, files in os.walk(cls._lua_path):
+            dst_root = os.path.join(mod_path, os.path.relpath(root, cls._lua_path))
+            os.makedirs(dst_root, exist_ok=True)
+            for fn in files:
+                if fn.endswith(".lua"):
+                    shutil.copy2(os.path.join(root, fn), os.path.join(dst_root, fn))
 
     def close(self, force: bool = False):
-        """Close the BeamNG instance if it exists and the config allows it to be closed (or force)."""
-        if ((self.bng is not None) and self.config.close_on_done) or force:
+        """
+        Close the BeamNG instance if it exists and the config allows it to be closed (or force).
+
+        The watchdog thread is always stopped, as the sim is finished with (it's restarted if another job is started).
+
+        If a caller-supplied instance was killed (e.g. on a retry) and replaced with one launched here, the replacement
+        is always closed, as the caller has no reference to it (and it's using the caller's port and user path).
+        """
+        self.watchdog.stop()
+        replaced_supplied = (
+            (self._supplied_bng is not None)
+            and (self.bng is not None)
+            and (self.bng is not self._supplied_bng)
+        )
+        if (
+            ((self.bng is not None) and self.config.close_on_done)
+            or force
+            or replaced_supplied
+        ):
             self.bng.close()
             self.bng = None
             time.sleep(1)
 
+    def _kill_game_process(self) -> None:
+        """
+        Kill the game process and shut down its socket, so any blocking calls to it return.
+
+        Safe to call from the watchdog thread; doesn't modify .bng.
+        """
+        bng = self.bng
+        if bng is None:
+            return
+
+        if bng.process is not None:
+            bng.process.kill()
+
+        if (bng.connection is not None) and (bng.connection.skt is not None):
+            try:
+                bng.connection.skt.skt.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                # Already closed
+                pass
+
+    def kill(self):
+        """
+        Kill the game instance regardless of config, e.g. if it's hung. The next .launch starts a new instance.
+
+        The instance is also disconnected, so if it was supplied by a caller (e.g. a BNGSimWorker), the owner sees it's
+        no longer alive and can relaunch it.
+        """
+        bng = self.bng
+        self._kill_game_process()
+        if bng is not None:
+            try:
+                bng.disconnect()
+            except OSError:
+                # Socket already closed
+                pass
+        self.bng = None
+        self.watchdog.end_job()
+
+    def step(self, n_steps: int = 1):
+        """
+        Advance the simulation n_steps, under the watchdog.
+
+        Raises the watchdog's exception if it fired during or before the step.
+        """
+        self.watchdog.check()
+        with self.watchdog.watch_step():
+            try:
+                self.bng.step(n_steps, wait=True)
+            except Exception:
+                # The step is expected to fail if the watchdog killed the game; report why
+                self.watchdog.check()
+                raise
+        self.watchdog.check()
+
+    def step_until(
+        self,
+        vehicle: Vehicle,
+        predicate: step_predicates.Predicate,
+        max_steps: int,
+        record_every: int = 1,
+    ) -> StepUntilResult:
+        """
+        Advance the simulation until a predicate on the vehicle's state is met, or for max_steps.
+
+        With config.server_side_stepping, the predicate is evaluated in the game after each physics step, and the
+        recorded frames are returned in one reply; otherwise this steps and polls the state sensor one step at a time.
+        The step timeout is scaled by max_steps.
+
+        e.g.
+        ````
+        result = bng_simulation.step_until(vehicle, predicate=step_predicates.pos_past(axis=0, value=450), max_steps=600)
+        ````
+
+        :param vehicle: The vehicle the predicate is evaluated on.
+        :param predicate: The stop condition; see beamng_envs.bng_sim.step_predicates.
+        :param max_steps: Maximum number of steps to simulate.
+        :param record_every: Record the vehicle state every record_every steps (the final step is always recorded).
+        """
+        if not self.config.server_side_stepping:
+            return self._step_until_polling(
+                vehicle, predicate, max_steps=max_steps, record_every=record_every
+            )
+
+        self.watchdog.check()
+        with self.watchdog.watch_step(n_steps=max_steps):
+            try:
+                self._load_extension(self._step_until_extension)
+                response = self.bng.connection.send(
+                    {
+                        "type": self._step_until_request,
+                        "vid": vehicle.vid,
+                        "predicate": predicate,
+                        "maxSteps": max_steps,
+                        "recordEvery": record_every,
+                    }
+                ).recv(self._step_until_request)
+            except Exception:
+                self.watchdog.check()
+                raise
+        self.watchdog.check()
+
+        return StepUntilResult(
+            frames=list(response["frames"]),
+            n_steps=response["steps"],
+            satisfied=response["satisfied"],
+        )
+
+    def step_and_poll(
+        self, vehicles: Sequence[Vehicle], n_steps: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Advance the simulation n_steps, under the watchdog, then poll the managed sensors for each vehicle.
+
+        With config.server_side_stepping, the step and the sensor requests for all the vehicles are sent as one request
+        to the bundled beamngEnvs/stepAndPoll extension. If that isn't available (e.g. an older game build), or any of
+        the sensors are polled from the game engine, this falls back to .step and .poll_sensors_for_vehicle.
+
+        :param vehicles: The vehicles to poll.
+        :param n_steps: Number of steps to advance.
+        :return: The sensor data for each vehicle, as from .poll_sensors_for_vehicle.
+        """
+        sensor_requests = (
+            {
+                vehicle.vid: self._sensor_set.sensor_request_for_vehicle(vehicle)
+                for vehicle in vehicles
+            }
+            if self.config.server_side_stepping and self._step_and_poll_supported
+            else None
+        )
+        if (sensor_requests is None) or any(
+            r is None for r in sensor_requests.values()
+        ):
+            self.step(n_steps)
+
+            return [self.poll_sensors_for_vehicle(vehicle) for vehicle in vehicles]
+
+        self.watchdog.check()
+        with self.watchdog.watch_step(n_steps=n_steps):
+            try:
+                self._load_extension(self._step_and_poll_extension)
+                response = self.bng.connection.send(
+                    {
+                        "type": self._step_and_poll_request,
+                        "count": n_steps,
+                        "vehicles": sensor_requests,
+                    }
+                ).recv(self._step_and_poll_request)
+            except (BNGError, BNGValueError):
+                # Rejected by the game before stepping, e.g. the extension isn't supported by this build
+                self.watchdog.check()
+                self._step_and_poll_supported = False
+                response = None
+            except Exception:
+                self.watchdog.check()
+                raise
+        self.watchdog.check()
+
+        if response is None:
+            return self.step_and_poll(vehicles, n_steps=n_steps)
+
+        return [
+            self._sensor_set.update_for_vehicle(vehicle, response["data"][vehicle.vid])
+            for vehicle in vehicles
+        ]
+
+    def _load_extension(self, name: str) -> None:
+        """Load a bundled game-side extension, if not already loaded in this instance."""
+        if name not in self._loaded_extensions:
+            self.bng.queue_lua_command(f"extensions.load('{name}')")
+            self._loaded_extensions.add(name)
+
+    def _step_until_polling(
+        self,
+        vehicle: Vehicle,
+        predicate: step_predicates.Predicate,
+        max_steps: int,
+        record_every: int = 1,
+    ) -> StepUntilResult:
+        """Python equivalent of the game-side step_until, with a round trip per step."""
+        record_every = max(1, record_every)
+        frames = []
+        satisfied = False
+        n_steps = 0
+        while (not satisfied) and (n_steps < max_steps):
+            self.step(1)
+            n_steps += 1
+
+            vehicle.sensors.poll("state")
+            state = dict(vehicle.sensors["state"].data, step=n_steps)
+            if n_steps % record_every == 0:
+                frames.append(state)
+
+            satisfied = step_predicates.evaluate(predicate, state)
+
+        if n_steps and ((not frames) or (frames[-1]["step"] != n_steps)):
+            frames.append(state)
+
+        return StepUntilResult(frames=frames, n_steps=n_steps, satisfied=satisfied)
+
     def remove_debug_paths(self):
-        """Remove debug lines and spheres - these are independent of the scenario state."""
-        if getattr(self, "_debug_sphere_ids", None) is not None:
+        """Remove all debug lines and spheres - these are independent of the scenario state."""
+        if getattr(self, "_debug_sphere_ids", None):
             self.bng.debug.remove_spheres(self._debug_sphere_ids)
 
-        if getattr(self, "_debug_line_ids", None) is not None:
-            self.bng.debug.remove_polyline(self._debug_line_ids)
+        for line_id in getattr(self, "_debug_line_ids", None) or []:
+            self.bng.debug.remove_polyline(line_id)
+
+        self._debug_sphere_ids = []
+        self._debug_line_ids = []
 
     def add_debug_path(self, path_nodes):
-        """Display a path visually with nodes and lines - these are independent of the scenario state."""
+        """
+        Display a path visually with nodes and lines - these are independent of the scenario state.
+
+        Multiple paths can be added, e.g. one per vehicle; .remove_debug_paths removes them all.
+        """
+        if getattr(self, "_debug_sphere_ids", None) is None:
+            self._debug_sphere_ids = []
+            self._debug_line_ids = []
+
         n_nodes = len(path_nodes)
         path_points = [(node["x"], node["y"], node["z"]) for node in path_nodes]
 
-        self._debug_sphere_ids = self.bng.debug.add_spheres(
+        self._debug_sphere_ids += self.bng.debug.add_spheres(
             coordinates=path_points,
             radii=[0.25 for _ in range(n_nodes)],
             rgba_colors=[(0.5, 0, 0, 0.8) for _ in range(n_nodes)],
             cling=True,
             offset=0.1,
         )
-        self._debug_line_ids = self.bng.debug.add_polyline(
-            path_points, [0, 0, 0, 0.1], cling=True, offset=0.1
+        self._debug_line_ids.append(
+            self.bng.debug.add_polyline(
+                path_points, [0, 0, 0, 0.1], cling=True, offset=0.1
+            )
         )
 
     def check_time_limit(self, scenario_step: int) -> bool:
@@ -125,12 +417,17 @@ class BNGSim:
 
     def reset(self):
         self.close()
+        self.watchdog.start_job()
         self.launch()
 
     def get_real_time(self, step: int) -> float:
         """Return the real time in seconds for a given step."""
         return step * (1 / self.config.fps)
 
+    @property
+    def sensor_set(self) -> SensorSet:
+        return self._sensor_set
+
     def attach_sensors_to_vehicle(self, vehicle: Vehicle) -> Vehicle:
         """Attach the managed sensors to a vehicle."""
         return self._sensor_set.attach_to_vehicle(vehicle)
@@ -1,13 +1,20 @@
 import warnings
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
 from beamng_envs.cars.cars_and_configs import CarConfigs
 
 
-@dataclass
+@dataclass(frozen=True)
 class BNGSimConfig:
+    """
+    Config for a BNGSim and the envs using it.
+
+    Configs are immutable, so one config can be shared by envs running in several threads. Derive variations (e.g. a
+    worker's BeamNGPy config) with dataclasses.replace, rather than modifying a shared config.
+    """
+
     # Maximum time in seconds
     max_time: float = 180
 
@@ -15,11 +22,15 @@ class BNGSimConfig:
     error_on_out_of_time: bool = False
 
     # The BeamNG specific config; passed to BeamNGpy
-    bng_config: BeamNGPyConfig = BeamNGPyConfig()
+    bng_config: BeamNGPyConfig = field(default_factory=BeamNGPyConfig)
 
     # Path to save results to
     output_path: str = "results"
 
+    # Layout of the results in output_path: "flat" (a directory of json files per run), or "sharded" (run directories
+    # sharded by ID prefix, with the scalar files packed per batch, and an index); see beamng_envs.data.sharded_results
+    results_layout: str = "flat"
+
     # Frequency of game physics updates and framerate
     fps: int = 60
 
@@ -37,6 +48,43 @@ class BNGSimConfig:
     # Whether to use the advanced BeamNG.tech sensors. False uses just the basic sensors available in BeamNG.drive
     use_tech_sensors: bool = False
 
+    # Path to a result cache (see beamng_envs.data.result_cache.ResultCache). If set, runs are looked up in the cache
+    # before simulating, and completed runs are added to it.
+    cache_path: Optional[str] = None
+
+    # Number of replicates of each run to store in the cache before serving hits from it (for stochastic runs)
+    cache_replicates: int = 1
+
+    # Wall-clock timeouts (s) for a single simulation step, and for a whole job (launch, scenario load and run). If
+    # exceeded the game process is killed, and the run is retried up to max_retries times. None disables the timeout.
+    step_timeout: Optional[float] = None
+    job_timeout: Optional[float] = None
+    max_retries: int = 0
+
+    # Wall-clock timeouts (s) for game calls made via AsyncBNGSim (e.g. by IEnv.async_run): each step, and each setup
+    # call (launching the game, loading the scenario, and saving the results). If exceeded the game process is killed,
+    # and the run is retried as for step_timeout. None disables the timeout.
+    async_call_timeout: Optional[float] = None
+    async_setup_timeout: Optional[float] = None
+
+    # Fidelity level of the run, e.g. the rung in a multi-fidelity search (see
+    # beamng_envs.optimisation.multi_fidelity). If set, it's recorded in the results.
+    fidelity: Optional[int] = None
+
+    # Whether .step returns the nested sensor data dicts, rather than the flat float32 observation vector (see
+    # beamng_envs.envs.sensor_set.SensorSet.to_vector)
+    dict_observations: bool = False
+
+    # Whether to use the bundled game-side extensions (installed into the user path on .launch): BNGSim.step_until runs
+    # in the game, rather than stepping and polling one step at a time from Python, and BNGSim.step_and_poll steps and
+    # polls the sensors in one request (falling back to separate requests if the game doesn't support it)
+    server_side_stepping: bool = False
+
+    # Keys to keep from each sensor's data, by sensor name, e.g. {"state": None, "damage": ["damage"]}; None keeps all
+    # of a sensor's keys. Sensors that aren't listed aren't polled, and unselected keys are dropped at poll time, so
+    # aren't stored in the history. None keeps everything. See beamng_envs.envs.sensor_set.SensorSet.
+    sensor_keys: Optional[Dict[str, Optional[List[str]]]] = None
+
     def __post_init__(self):
         if self.fps < 20:
             raise ValueError(f"bng_fps {self.fps} is less than minimum 20 Hz.")
@@ -0,0 +1,155 @@
+import os
+import socket
+import sys
+import tempfile
+from typing import Iterable, Optional
+
+import numpy as np
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class BNGSimPortLease:
+    """
+    A lease on a port for a game instance, held via an OS lock on a lockfile.
+
+    Lockfiles are kept in a shared directory (one per port), and the lease holds an exclusive lock (fcntl.flock, or
+    msvcrt.locking on Windows) on its file until released, so leases are safe across concurrent processes on one
+    machine. The OS drops the lock when the holding process dies, so leases left by crashed processes are free to take
+    over without checking PIDs. The file also contains the owner's PID, for debugging. Ports are also probed by binding
+    to them, to skip ports in use by anything else.
+
+    Workspaces are named by port (see BNGSimWorker), so a port lease also covers the workspace using it.
+
+    e.g.
+    ````
+    lease = BNGSimPortLease.acquire(start_port=58000)
+    bng_config = dataclasses.replace(bng_config, port=lease.port)
+    ...
+    lease.release()
+    ````
+    """
+
+    default_lock_path = os.path.join(tempfile.gettempdir(), "beamng_envs_ports")
+
+    def __init__(self, port: int, lock_fn: str, fd: int):
+        self.port = port
+        self.lock_fn = lock_fn
+        self._fd: Optional[int] = fd
+
+    def __repr__(self):
+        return f"BNGSimPortLease on port {self.port} ({self.lock_fn})"
+
+    @classmethod
+    def acquire(
+        cls,
+        host: str = "localhost",
+        start_port: Optional[int] = None,
+        low: int = 51000,
+        high: int = 65000,
+        lock_path: Optional[str] = None,
+    ) -> "BNGSimPortLease":
+        """
+        Lease a free port.
+
+        :param host: Host the game instance will listen on, used to probe the port.
+        :param start_port: If set, lease the first free port from this one upwards. Otherwise, lease a random free port
+                           in [low, high).
+        :param low: Lowest port to use.
+        :param high: Upper limit of ports to use.
+        :param lock_path: Directory to hold the lockfiles in. Defaults to a directory in the system temp path, shared by
+                          all processes on the machine.
+        """
+        if lock_path is None:
+            lock_path = cls.default_lock_path
+        os.makedirs(lock_path, exist_ok=True)
+
+        if start_port is not None:
+            candidates: Iterable[int] = range(start_port, high)
+        else:
+            candidates = np.random.permutation(np.arange(low, high))
+
+        for port in candidates:
+            lease = cls._try_lock(port=int(port), lock_path=lock_path)
+            if lease is None:
+                continue
+            if cls._port_is_free(host=host, port=lease.port):
+                return lease
+            lease.release()
+
+        raise RuntimeError(f"No free ports available on {host} in [{low}, {high}).")
+
+    @classmethod
+    def _try_lock(cls, port: int, lock_path: str) -> Optional["BNGSimPortLease"]:
+        lock_fn = os.path.join(lock_path, f"port_{port}.lock")
+        for _ in range(2):
+            fd = os.open(lock_fn, os.O_CREAT | os.O_RDWR)
+            if not _lock_fd(fd):
+                os.close(fd)
+                return None
+
+            # The previous holder removes the file before unlocking on release, so check the lock is on the current
+            # file, rather than one that's been removed since it was opened
+            try:
+                current = os.path.samestat(os.fstat(fd), os.stat(lock_fn))
+            except FileNotFoundError:
+                current = False
+            if not current:
+                _unlock_fd(fd)
+                os.close(fd)
+                continue
+
+            os.ftruncate(fd, 0)
+            os.write(fd, str(os.getpid()).encode())
+
+            return cls(port=port, lock_fn=lock_fn, fd=fd)
+
+        return None
+
+    @staticmethod
+    def _port_is_free(host: str, port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as skt:
+            try:
+                skt.bind((host, port))
+            except OSError:
+                return False
+
+        return True
+
+    def release(self) -> None:
+        """Release the lease, if still held."""
+        if self._fd is None:
+            return
+
+        try:
+            os.remove(self.lock_fn)
+        except OSError:
+            # On Windows, the file can't be removed while others have it open; it's left to be reused
+            pass
+        _unlock_fd(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+
+def _lock_fd(fd: int) -> bool:
+    """Try to take an exclusive, non-blocking lock on an open file. Returns True if locked."""
+    try:
+        if sys.platform == "win32":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+
+    return True
+
+
+def _unlock_fd(fd: int) -> None:
+    if sys.platform == "win32":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
@@ -0,0 +1,130 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from beamng_envs.envs.errors import (
+    BeamNGEnvsError,
+    JobTimeoutException,
+    SimulationStalledException,
+)
+
+
+class BNGSimWatchdog:
+    """
+    Background watchdog for a game instance.
+
+    Fires if a single step takes longer than step_timeout (e.g. the game has hung or crashed mid-step), or if a job
+    (scenario load + run) takes longer than job_timeout (e.g. the game is stuck on the loading screen). On firing it
+    calls on_fire, which should kill the game process so blocking socket calls in the main thread return. The reason
+    is kept in .fired until the next job is started.
+
+    The thread is only started if at least one of the timeouts is set.
+    """
+
+    fired: Optional[BeamNGEnvsError]
+
+    def __init__(
+        self,
+        on_fire: Callable[[], None],
+        step_timeout: Optional[float] = None,
+        job_timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+    ):
+        self.on_fire = on_fire
+        self.step_timeout = step_timeout
+        self.job_timeout = job_timeout
+        self.poll_interval = poll_interval
+        self.fired = None
+
+        self._job_started: Optional[float] = None
+        self._step_started: Optional[float] = None
+        self._step_n: int = 1
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return (self.step_timeout is not None) or (self.job_timeout is not None)
+
+    def start_job(self) -> None:
+        """Start timing a new job, and clear any previous firing."""
+        with self._lock:
+            self.fired = None
+            self._job_started = time.monotonic()
+            self._step_started = None
+
+        if self.enabled and ((self._thread is None) or not self._thread.is_alive()):
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, daemon=True)
+            self._thread.start()
+
+    def end_job(self) -> None:
+        with self._lock:
+            self._job_started = None
+            self._step_started = None
+
+    def stop(self) -> None:
+        """Stop the watchdog thread, waiting for it to exit. It's restarted by the next .start_job."""
+        self.end_job()
+        self._stop.set()
+        thread = self._thread
+        if (thread is not None) and (thread is not threading.current_thread()):
+            thread.join()
+        self._thread = None
+
+    @contextmanager
+    def watch_step(self, n_steps: int = 1):
+        """
+        Time a step call against step_timeout.
+
+        :param n_steps: Number of steps the call covers, e.g. for BNGSim.step_until; the timeout is scaled by this.
+        """
+        with self._lock:
+            self._step_started = time.monotonic()
+            self._step_n = max(1, n_steps)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._step_started = None
+                self._step_n = 1
+
+    def check(self) -> None:
+        """Raise the reason the watchdog fired, if it has."""
+        if self.fired is not None:
+            raise self.fired
+
+    def _check_timeouts(self, now: float) -> Optional[BeamNGEnvsError]:
+        if (
+            (self.step_timeout is not None)
+            and (self._step_started is not None)
+            and ((now - self._step_started) > (self.step_timeout * self._step_n))
+        ):
+            return SimulationStalledException(
+                f"Step stalled for more than {self.step_timeout * self._step_n}s."
+            )
+
+        if (
+            (self.job_timeout is not None)
+            and (self._job_started is not None)
+            and ((now - self._job_started) > self.job_timeout)
+        ):
+            return JobTimeoutException(
+                f"Job exceeded wall-clock timeout of {self.job_timeout}s."
+            )
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            with self._lock:
+                if self.fired is not None:
+                    continue
+                self.fired = self._check_timeouts(time.monotonic())
+                fired = self.fired is not None
+                if fired:
+                    self._job_started = None
+                    self._step_started = None
+
+            if fired:
+                self.on_fire()
@@ -1,33 +1,97 @@
+import dataclasses
 import os
 from typing import Optional
 
-import numpy as np
+from beamngpy import BeamNGpy, Scenario
+from beamngpy.logging import BNGError
 
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.bng_sim.bng_sim_port_lease import BNGSimPortLease
 
 
 class BNGSimWorker:
+    """
+    A game instance slot: a user path workspace and port, and optionally the live BeamNGpy instance using them.
+
+    Workers in a BNGSimWorkerPool own their instance; it's launched (and optionally preloaded with a level) ahead of
+    demand, then handed to envs via .bng.
+
+    The port (and so the workspace) is leased on creation, so it isn't used by other workers in this or other processes
+    on the machine. If a port is specified, the first free port from it upwards is leased; otherwise a random free port
+    is used. The lease is held until .release_port is called.
+    """
+
+    bng: Optional[BeamNGpy]
+
+    _preload_scenario_name = "beamng_envs_preload"
+
     def __init__(
-        self, user_path: str, host: str = "localhost", port: Optional[int] = None
+        self,
+        user_path: str,
+        host: str = "localhost",
+        port: Optional[int] = None,
+        lock_path: Optional[str] = None,
     ):
         self.host = host
-        self.port: int = (
-            port if port is not None else int(np.random.randint(low=51000, high=65000))
+        self.port_lease = BNGSimPortLease.acquire(
+            host=host, start_port=port, lock_path=lock_path
         )
+        self.port: int = self.port_lease.port
         self.worker_path = os.path.join(user_path, f"port_{self.port}")
         self.busy: bool = False
+        self.bng = None
 
     def __repr__(self):
         return f"BNGSimWorker referencing a BNGInstance using path {self.worker_path} on {self.host}:{self.port}"
 
-    def get_config(self, bng_config: BeamNGPyConfig):
-        bng_config.user = self.worker_path
-        bng_config.port = self.port
-
-        return bng_config
+    def get_config(self, bng_config: BeamNGPyConfig) -> BeamNGPyConfig:
+        """Derive the config for this worker's instance, with its user path and port. The input isn't modified."""
+        return dataclasses.replace(bng_config, user=self.worker_path, port=self.port)
 
     def set_busy(self):
         self.busy = True
 
     def set_free(self):
         self.busy = False
+
+    @property
+    def alive(self) -> bool:
+        """Whether the worker has an open instance with a running game process (if it launched one)."""
+        return (
+            (self.bng is not None)
+            and (self.bng.connection is not None)
+            and ((self.bng.process is None) or (self.bng.process.poll() is None))
+        )
+
+    def launch(
+        self, bng_config: BeamNGPyConfig, level: Optional[str] = None
+    ) -> BeamNGpy:
+        """
+        Launch and connect to a game instance using this worker's path and port.
+
+        :param bng_config: Config for the instance; the user path and port are set from the worker.
+        :param level: Optional level to load, so it's ready (and cached) for the first scenario on it.
+        """
+        self.bng = BeamNGpy(**self.get_config(bng_config).__dict__)
+        self.bng.open()
+
+        if level is not None:
+            scenario = Scenario(level, self._preload_scenario_name)
+            scenario.make(self.bng)
+            self.bng.load_scenario(scenario)
+
+        return self.bng
+
+    def close(self) -> None:
+        if self.bng is not None:
+            try:
+                self.bng.close()
+            except (BNGError, OSError, ValueError):
+                # Instance has already died
+                pass
+            self.bng = None
+
+    def release_port(self) -> None:
+        """Close the instance, if open, and release the port lease."""
+        self.close()
+        self.port_lease.release()
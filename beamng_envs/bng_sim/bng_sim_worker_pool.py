@@ -1,34 +1,206 @@
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
 
 import numpy as np
 
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
 from beamng_envs.bng_sim.bng_sim_worker import BNGSimWorker
+from beamng_envs.bng_sim.bng_sim_workspace import BNGSimWorkspaceTemplate
 
 
 class BNGSimWorkerPool:
-    """Set and track state of currently active bng instances."""
+    """
+    Set and track state of currently active bng instances.
 
-    def __init__(self, user_path: str, n_workers: int, start_port: int = 58000):
+    Optionally, the pool can own the live game instances: .launch starts all the workers' instances in parallel in the
+    background (preloading a level), and workers are only handed out once their instance is ready. When a worker is
+    released its instance is kept for the next job, or relaunched in the background if it's died or recycling is
+    requested, so launches happen while other workers are simulating rather than on the critical path. If an env retries
+    a run (see BNGSimConfig.max_retries), it kills and disconnects the worker's instance, and closes the replacement it
+    launched itself when done, so the worker's instance is relaunched on release without a port clash.
+
+    If a template_path is set (see BNGSimWorkspaceTemplate), each worker's user path workspace is provisioned from the
+    template before its first launch, so new workspaces don't need manual setup or to regenerate the game's caches.
+
+    Failed launches are retried in the background, waiting launch_backoff * 2 ** (failures - 1) seconds between
+    attempts. After max_launch_attempts failures in a row a worker is given up on, and once every worker has been given
+    up on, .get_free_worker raises the last launch exception rather than waiting forever.
+
+    Workers lease free ports from start_port upwards (see BNGSimPortLease), so multiple pools can share a port range.
+    The leases are released by .close.
+
+    e.g.
+    ````
+    pool = BNGSimWorkerPool(user_path=..., n_workers=4)
+    pool.launch(bng_config=bng_config, level="gridmap_v2")
+    with pool.checkout() as worker:
+        env = CrashTestEnv(params=params, config=config, bng=worker.bng)
+        env.run()
+    pool.close()
+    ````
+    """
+
+    def __init__(
+        self,
+        user_path: str,
+        n_workers: int,
+        start_port: int = 58000,
+        template_path: Optional[str] = None,
+        lock_path: Optional[str] = None,
+        max_launch_attempts: int = 3,
+        launch_backoff: float = 5,
+    ):
         self.n_workers = n_workers
-        self.workers = [
-            BNGSimWorker(user_path=user_path, port=start_port + p)
-            for p in range(n_workers)
-        ]
+        self.workers = []
+        port = start_port
+        for _ in range(n_workers):
+            worker = BNGSimWorker(user_path=user_path, port=port, lock_path=lock_path)
+            self.workers.append(worker)
+            port = worker.port + 1
         self.start_port = start_port
+        self.workspace_template = (
+            BNGSimWorkspaceTemplate(path=template_path)
+            if template_path is not None
+            else None
+        )
+        self.max_launch_attempts = max_launch_attempts
+        self.launch_backoff = launch_backoff
+
+        self._bng_config: Optional[BeamNGPyConfig] = None
+        self._level: Optional[str] = None
+        self._launches: Dict[int, Future] = {}
+        self._launch_failures: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _is_ready(self, worker: BNGSimWorker) -> bool:
+        """Workers are ready if the pool isn't managing instances, or once their instance has launched."""
+        launch = self._launches.get(worker.port)
+        if launch is None:
+            return True
+        if not launch.done():
+            return False
+        if launch.exception() is None:
+            self._launch_failures[worker.port] = 0
+            return True
+        if self._has_failed(worker):
+            return False
+
+        n_failures = self._launch_failures.get(worker.port, 0) + 1
+        self._launch_failures[worker.port] = n_failures
+        if self._has_failed(worker):
+            print(
+                f"Launch failed for {worker}: {launch.exception()}, giving up after {n_failures} attempts."
+            )
+        else:
+            delay = self.launch_backoff * 2 ** (n_failures - 1)
+            print(
+                f"Launch failed for {worker}: {launch.exception()}, relaunching in {delay}s."
+            )
+            self._launch_worker(worker, delay=delay)
+
+        return False
+
+    def _has_failed(self, worker: BNGSimWorker) -> bool:
+        """Whether the worker's instance failed to launch max_launch_attempts times in a row."""
+        return self._launch_failures.get(worker.port, 0) >= self.max_launch_attempts
+
+    def _launch_worker(self, worker: BNGSimWorker, delay: float = 0) -> None:
+        def relaunch():
+            time.sleep(delay)
+            worker.close()
+            self._provision_worker(worker)
+            worker.launch(bng_config=self._bng_config, level=self._level)
+
+        self._launches[worker.port] = self._executor.submit(relaunch)
+
+    def _provision_worker(self, worker: BNGSimWorker) -> None:
+        if self.workspace_template is not None:
+            self.workspace_template.provision(workspace_path=worker.worker_path)
+
+    def provision(self) -> None:
+        """Provision all the workers' workspaces from the template, if set. Done automatically by .launch."""
+        for worker in self.workers:
+            self._provision_worker(worker)
+
+    def launch(self, bng_config: BeamNGPyConfig, level: Optional[str] = None) -> None:
+        """
+        Launch all the workers' game instances in parallel, in the background.
+
+        :param bng_config: Config for the instances; the user path and port are set per worker.
+        :param level: Optional level to preload in each instance.
+        """
+        self._bng_config = bng_config
+        self._level = level
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.n_workers)
+
+        with self._lock:
+            self._launch_failures = {}
+            for worker in self.workers:
+                self._launch_worker(worker)
+
+    def wait_until_ready(self) -> None:
+        """Block until all launches in progress have finished."""
+        for launch in list(self._launches.values()):
+            _ = launch.exception()
 
     def get_free_worker(self) -> BNGSimWorker:
+        """
+        Wait for a worker that is free (and has a ready instance, if the pool is managing them), and mark it busy.
+
+        :raises Exception: The last launch exception, if every worker's instance has failed to launch
+                           max_launch_attempts times.
+        """
         time.sleep(np.random.uniform(1, 2))
         worker = None
         while worker is None:
-            for w in self.workers:
-                if not w.busy:
-                    worker = w
-                break
-            else:
-                print(f"Bool busy, still looking for a worker.")
+            with self._lock:
+                for w in self.workers:
+                    if not w.busy and self._is_ready(w):
+                        worker = w
+                        worker.set_busy()
+                        break
+
+                if worker is None and all(self._has_failed(w) for w in self.workers):
+                    raise self._launches[self.workers[-1].port].exception()
+
+            if worker is None:
+                print(f"Pool busy, still looking for a worker.")
                 time.sleep(np.random.uniform(1, 2))
 
-        else:
-            print(f"Worker: {worker} is free.")
+        print(f"Worker: {worker} is free.")
 
         return worker
+
+    def release(self, worker: BNGSimWorker, recycle: bool = False) -> None:
+        """
+        Mark a worker free. If the pool is managing instances and the worker's instance has died (or recycle is set),
+        relaunch it in the background.
+        """
+        with self._lock:
+            if (self._bng_config is not None) and (recycle or not worker.alive):
+                self._launch_worker(worker)
+            worker.set_free()
+
+    @contextmanager
+    def checkout(self, recycle: bool = False) -> Iterator[BNGSimWorker]:
+        """Get a free worker for the duration of the context, then release it."""
+        worker = self.get_free_worker()
+        try:
+            yield worker
+        finally:
+            self.release(worker, recycle=recycle)
+
+    def close(self) -> None:
+        """Close all the workers' instances, and release their ports."""
+        self.wait_until_ready()
+        for worker in self.workers:
+            worker.release_port()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._launches = {}
@@ -0,0 +1,145 @@
+import dataclasses
+import fnmatch
+import os
+import pathlib
+import shutil
+from typing import Optional
+
+from beamngpy import BeamNGpy, Scenario
+
+from beamng_envs import __BNG_VERSION__
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.bng_sim.bng_sim import BNGSim
+
+
+class BNGSimWorkspaceTemplate:
+    """
+    A template game user path, used to quickly provision the workspaces for BNGSimWorkers.
+
+    The template contains the manual setup from the README (ResearchHelper.txt and [version]/mods/BeamNGpy.zip), the
+    bundled game-side extensions (see BNGSim.install_extension) and, once warmed, the caches the game generates on first
+    run (shaders, levels, etc.). Workspaces are provisioned by hard linking the files in known read-only cache
+    directories and the mod zips, so caches are shared rather than regenerated for each new workspace. Everything else
+    (settings, logs, mods/db.json and other metadata the game may rewrite in place) is copied, so running instances
+    don't share it. Where hard links aren't supported (e.g. across drives), files are copied.
+
+    e.g.
+    ````
+    template = BNGSimWorkspaceTemplate.create(path="c:\\beamng_template\\")
+    template.warm(bng_config=bng_config, level="gridmap_v2")
+    template.provision(workspace_path="c:\\worker_pool\\port_58000\\")
+    ````
+    """
+
+    _research_helper_fn = "ResearchHelper.txt"
+    _mods_zip_fn = "BeamNGpy.zip"
+    _provisioned_fn = ".beamng_envs_workspace"
+    _warm_fn = ".beamng_envs_warm"
+    _link_patterns = (
+        "*/temp/shaders/*",
+        "*/temp/levels/*",
+        "*/temp/art/*",
+        "*/mods/*.zip",
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def create(
+        cls,
+        path: str,
+        bng_version: str = __BNG_VERSION__,
+        mods_zip_path: Optional[str] = None,
+    ) -> "BNGSimWorkspaceTemplate":
+        """
+        Create the template user path, if it doesn't already exist.
+
+        :param path: Path to create the template at.
+        :param bng_version: The BeamNG version, used for the mods directory.
+        :param mods_zip_path: Path to the BeamNGpy mod. Defaults to the one included in this package.
+        """
+        if mods_zip_path is None:
+            mods_zip_path = os.path.join(
+                os.path.dirname(os.path.dirname(__file__)), cls._mods_zip_fn
+            )
+
+        mods_path = os.path.join(path, bng_version, "mods")
+        pathlib.Path(mods_path).mkdir(parents=True, exist_ok=True)
+        pathlib.Path(os.path.join(path, cls._research_helper_fn)).touch()
+        if not os.path.exists(os.path.join(mods_path, cls._mods_zip_fn)):
+            shutil.copy2(mods_zip_path, os.path.join(mods_path, cls._mods_zip_fn))
+        BNGSim.install_extension(path, bng_version=bng_version)
+
+        return cls(path=path)
+
+    def warm(self, bng_config: BeamNGPyConfig, level: Optional[str] = None) -> None:
+        """
+        Launch the game once on the template user path, so it generates its first-run caches there.
+
+        :param bng_config: Config for the instance; the user path is set to the template.
+        :param level: Optional level to load, so its caches are also generated.
+        """
+        bng_config = dataclasses.replace(bng_config, user=self.path)
+        bng = BeamNGpy(**bng_config.__dict__)
+        bng.open()
+        try:
+            if level is not None:
+                scenario = Scenario(level, "beamng_envs_warm")
+                scenario.make(bng)
+                bng.load_scenario(scenario)
+        finally:
+            bng.close()
+
+        pathlib.Path(os.path.join(self.path, self._warm_fn)).touch()
+
+    @property
+    def is_warm(self) -> bool:
+        return os.path.exists(os.path.join(self.path, self._warm_fn))
+
+    def is_provisioned(self, workspace_path: str) -> bool:
+        return os.path.exists(os.path.join(workspace_path, self._provisioned_fn))
+
+    def provision(self, workspace_path: str) -> None:
+        """
+        Provision a workspace from the template. Does nothing if the workspace has already been provisioned.
+
+        Files already in the workspace are kept, so an interrupted provision can be resumed.
+
+        :param workspace_path: The user path to provision.
+        """
+        if self.is_provisioned(workspace_path):
+            return
+
+        for root, _, files in os.walk(self.path):
+            rel_root = os.path.relpath(root, self.path)
+            pathlib.Path(os.path.join(workspace_path, rel_root)).mkdir(
+                parents=True, exist_ok=True
+            )
+
+            for fn in files:
+                if fn in (self._provisioned_fn, self._warm_fn):
+                    continue
+
+                rel_path = pathlib.PurePath(rel_root, fn).as_posix()
+                src = os.path.join(root, fn)
+                dst = os.path.join(workspace_path, rel_root, fn)
+                if os.path.exists(dst):
+                    continue
+
+                if self._is_read_only(rel_path):
+                    self._link_or_copy(src, dst)
+                else:
+                    shutil.copy2(src, dst)
+
+        pathlib.Path(os.path.join(workspace_path, self._provisioned_fn)).touch()
+
+    def _is_read_only(self, rel_path: str) -> bool:
+        return any(fnmatch.fnmatch(rel_path, p) for p in self._link_patterns)
+
+    @staticmethod
+    def _link_or_copy(src: str, dst: str) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
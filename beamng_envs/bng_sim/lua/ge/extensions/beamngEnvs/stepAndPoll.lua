@@ -0,0 +1,83 @@
+-- beamng_envs step and poll extension.
+--
+-- Handles BeamNGEnvsStepAndPoll requests from beamng_envs.bng_sim.bng_sim.BNGSim.step_and_poll: steps the (paused)
+-- simulation count steps, then polls each vehicle's sensors, and returns all the sensor data in one reply, rather than
+-- a Step request followed by a SensorRequest per vehicle.
+--
+-- The sensor requests are the same as BeamNGpy sends to the vehicles, and are handled by the vehicles' techCore; the
+-- responses are passed back to this extension with onSensorData.
+
+local M = {}
+
+local requestType = 'BeamNGEnvsStepAndPoll'
+local active = nil
+
+-- Run in each vehicle's Lua VM: handle the sensor request, and pass the data back to the game engine
+local vehicleChunk = [[
+local request = %s
+request.sendResponse = function(_, response)
+  obj:queueGameEngineLua(string.format('extensions.beamngEnvs_stepAndPoll.onSensorData(%%q, %%s)', %q, serialize(response.data)))
+end
+extensions.tech_techCore.handleSensorRequest(request)
+]]
+
+local function finish()
+  local request = active.request
+  local response = {type = requestType, steps = active.steps, data = active.data}
+  active = nil
+  request:sendResponse(response)
+end
+
+local function pollVehicles()
+  be:physicsStopSimulation()
+  for vid, sensorRequest in pairs(active.request.vehicles) do
+    local veh = scenetree.findObject(vid)
+    veh:queueLuaCommand(string.format(vehicleChunk, serialize(sensorRequest), vid))
+  end
+end
+
+local function handleStepAndPoll(request)
+  for vid, _ in pairs(request.vehicles) do
+    if scenetree.findObject(vid) == nil then
+      request:sendBNGValueError('Vehicle not found: ' .. tostring(vid))
+      return
+    end
+  end
+
+  active = {request = request, steps = 0, data = {}, nPending = tableSize(request.vehicles)}
+  if request.count > 0 then
+    be:physicsStartSimulation()
+  else
+    pollVehicles()
+  end
+end
+
+M.onSensorData = function(vid, data)
+  if active == nil then return end
+
+  active.data[vid] = data
+  active.nPending = active.nPending - 1
+  if active.nPending <= 0 then
+    finish()
+  end
+end
+
+-- Called by techCore for request types it doesn't handle itself
+M.onSocketMessage = function(request)
+  if request.type == requestType then
+    handleStepAndPoll(request)
+    return true
+  end
+end
+
+-- Each frame simulates one step, as the simulation runs at a fixed number of steps per second (set by BNGSim)
+M.onUpdate = function(dtReal, dtSim, dtRaw)
+  if active == nil or dtSim <= 0 or active.steps >= active.request.count then return end
+
+  active.steps = active.steps + 1
+  if active.steps >= active.request.count then
+    pollVehicles()
+  end
+end
+
+return M
@@ -0,0 +1,118 @@
+-- beamng_envs step until extension.
+--
+-- Handles BeamNGEnvsStepUntil requests from beamng_envs.bng_sim.bng_sim.BNGSim.step_until: steps the (paused)
+-- simulation until a predicate on a vehicle's state is true, or max steps is reached, recording the vehicle state every
+-- recordEvery steps. The frames are returned in one reply, rather than a request/reply round-trip per step.
+--
+-- Predicates are the dicts built by beamng_envs.bng_sim.step_predicates; evaluate mirrors step_predicates.evaluate.
+
+local M = {}
+
+local requestType = 'BeamNGEnvsStepUntil'
+local active = nil
+
+local function vehicleState(veh)
+  local pos = veh:getPosition()
+  local dir = veh:getDirectionVector()
+  local vel = veh:getVelocity()
+  return {
+    pos = {pos.x, pos.y, pos.z},
+    dir = {dir.x, dir.y, dir.z},
+    vel = {vel.x, vel.y, vel.z},
+  }
+end
+
+local function norm(v)
+  local sum = 0
+  for _, x in ipairs(v) do
+    sum = sum + x * x
+  end
+  return math.sqrt(sum)
+end
+
+local function evaluate(predicate, state)
+  local kind = predicate.type
+  if kind == 'pos_past' then
+    -- Axes are 0-indexed, as in Python
+    return state.pos[predicate.axis + 1] >= predicate.value
+  elseif kind == 'within' then
+    local d = {}
+    for i = 1, 3 do
+      d[i] = state.pos[i] - predicate.pos[i]
+    end
+    return norm(d) < predicate.radius
+  elseif kind == 'speed_below' then
+    return norm(state.vel) < predicate.value
+  elseif kind == 'any' then
+    for _, p in ipairs(predicate.predicates) do
+      if evaluate(p, state) then return true end
+    end
+    return false
+  elseif kind == 'all' then
+    for _, p in ipairs(predicate.predicates) do
+      if not evaluate(p, state) then return false end
+    end
+    return true
+  end
+  log('E', 'beamngEnvs.stepUntil', 'Unknown predicate type: ' .. tostring(kind))
+  return true
+end
+
+local function finish(satisfied)
+  be:physicsStopSimulation()
+  local request = active.request
+  local frames = active.frames
+  local steps = active.steps
+  active = nil
+  request:sendResponse({type = requestType, frames = frames, steps = steps, satisfied = satisfied})
+end
+
+local function handleStepUntil(request)
+  local veh = scenetree.findObject(request.vid)
+  if veh == nil then
+    request:sendBNGValueError('Vehicle not found: ' .. tostring(request.vid))
+    return
+  end
+
+  active = {
+    request = request,
+    veh = veh,
+    predicate = request.predicate,
+    maxSteps = request.maxSteps,
+    recordEvery = math.max(1, request.recordEvery or 1),
+    steps = 0,
+    frames = {},
+  }
+  be:physicsStartSimulation()
+end
+
+-- Called by techCore for request types it doesn't handle itself
+M.onSocketMessage = function(request)
+  if request.type == requestType then
+    handleStepUntil(request)
+    return true
+  end
+end
+
+-- Each frame simulates one step, as the simulation runs at a fixed number of steps per second (set by BNGSim)
+M.onUpdate = function(dtReal, dtSim, dtRaw)
+  if active == nil or dtSim <= 0 then return end
+
+  active.steps = active.steps + 1
+  local state = vehicleState(active.veh)
+  state.step = active.steps
+  if active.steps % active.recordEvery == 0 then
+    table.insert(active.frames, state)
+  end
+
+  local satisfied = active.predicate ~= nil and evaluate(active.predicate, state)
+  if satisfied or active.steps >= active.maxSteps then
+    -- Always return the last frame, so the caller has the state at the stop
+    if active.frames[#active.frames] ~= state then
+      table.insert(active.frames, state)
+    end
+    finish(satisfied)
+  end
+end
+
+return M
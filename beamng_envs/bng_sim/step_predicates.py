@@ -0,0 +1,68 @@
+"""
+Stop conditions for BNGSim.step_until.
+
+Predicates are JSON-able dicts, so they can be sent to the game and evaluated by the beamngEnvs/stepUntil extension
+after each physics step, without a round-trip per step. evaluate is the reference implementation, used when stepping
+from Python (e.g. if the extension isn't installed). Both evaluate against the vehicle state: pos, dir and vel.
+
+e.g. stop once the car is past x=450, or within 10m of (0, 0, 0):
+````
+predicate = any_of(pos_past(axis=0, value=450), within(pos=(0, 0, 0), radius=10))
+````
+"""
+
+import math
+from typing import Any, Dict, Sequence
+
+Predicate = Dict[str, Any]
+
+
+def pos_past(axis: int, value: float) -> Predicate:
+    """True once the vehicle's position along an axis (0=x, 1=y, 2=z) is at least value."""
+    return {"type": "pos_past", "axis": axis, "value": value}
+
+
+def within(pos: Sequence[float], radius: float) -> Predicate:
+    """True once the vehicle is within radius (m) of pos."""
+    return {"type": "within", "pos": list(pos), "radius": radius}
+
+
+def speed_below(value: float) -> Predicate:
+    """True once the vehicle's speed (m/s) is below value, e.g. it's stopped after a crash."""
+    return {"type": "speed_below", "value": value}
+
+
+def any_of(*predicates: Predicate) -> Predicate:
+    return {"type": "any", "predicates": list(predicates)}
+
+
+def all_of(*predicates: Predicate) -> Predicate:
+    return {"type": "all", "predicates": list(predicates)}
+
+
+def _norm(v: Sequence[float]) -> float:
+    return math.sqrt(sum(x**2 for x in v))
+
+
+def evaluate(predicate: Predicate, state: Dict[str, Any]) -> bool:
+    """
+    Evaluate a predicate against a vehicle state.
+
+    :param predicate: The predicate spec.
+    :param state: The vehicle state, e.g. the state sensor data, with at least pos and vel.
+    """
+    kind = predicate["type"]
+    if kind == "pos_past":
+        return state["pos"][predicate["axis"]] >= predicate["value"]
+    if kind == "within":
+        return _norm([a - b for a, b in zip(state["pos"], predicate["pos"])]) < (
+            predicate["radius"]
+        )
+    if kind == "speed_below":
+        return _norm(state["vel"]) < predicate["value"]
+    if kind == "any":
+        return any(evaluate(p, state) for p in predicate["predicates"])
+    if kind == "all":
+        return all(evaluate(p, state) for p in predicate["predicates"])
+
+    raise ValueError(f"Unknown predicate type {kind}.")
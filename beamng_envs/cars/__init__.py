@@ -0,0 +1,10 @@
+from beamng_envs.lazy import lazy_module_attrs
+
+# Car configs are imported on first access, so importing the package (or one module in it) stays cheap.
+_LAZY_ATTRS = {
+    "CarConfigs": "beamng_envs.cars.cars_and_configs",
+    "ScintillaRally": "beamng_envs.cars.scintilla_rally",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -1,4157 +1,23 @@
-PART_OPTIONS = {
-    "sunburst_doorpanel_RR": ["sunburst_doorpanel_RR"],
-    "gps_alt": ["gps_alt"],
-    "sunburst_doordetent_RR": ["sunburst_doordetent_RR"],
-    "tire_F_17x7": [
-        "tire_F_215_45_17_race",
-        "tire_F_205_45_17_race",
-        "tire_F_215_45_17_sport",
-        "tire_F_215_60_17_standard",
-    ],
-    "tire_F_22x9": ["tire_F_265_30_22_sport", "tire_F_245_30_22_sport"],
-    "skin_taxi_ad": ["taxi_ad_pointie", "taxi_ad_burger"],
-    "pickup_driveshaft_R": ["pickup_driveshaft_R"],
-    "pickup_driveshaft_R_short": ["pickup_driveshaft_R_short"],
-    "sunburst_doorpanel_RL": ["sunburst_doorpanel_RL"],
-    "pickup_driveshaft_R_short_ext": ["pickup_driveshaft_R_short_ext"],
-    "sunburst_doordetent_RL": ["sunburst_doordetent_RL"],
-    "brakepad_RR": [
-        "brakepad_RR_sport",
-        "brakepad_RR_semi_race",
-        "brakepad_RR_race",
-        "brakepad_RR",
-        "brakepad_RR_premium",
-    ],
-    "pickup_driveshaft_R_longbed": ["pickup_driveshaft_R_longbed"],
-    "pickup_driveshaft_R_ext": ["pickup_driveshaft_R_ext"],
-    "tire_F_18x5": ["tire_F_28_4_5_18_drag"],
-    "pickup_driveshaft_R_extlongbed": ["pickup_driveshaft_R_extlongbed"],
-    "pickup_driveshaft_R_crew": ["pickup_driveshaft_R_crew"],
-    "pickup_driveshaft_R_crewlongbed": ["pickup_driveshaft_R_crewlongbed"],
-    "pickup_driveshaft_R_upfit": ["pickup_driveshaft_R_upfit"],
-    "skin_van_cargobox": ["van_cargobox_skin_truckitup", "van_cargobox_skin_moving"],
-    "pickup_fueltank_short": ["pickup_fueltank_short", "pickup_fueltank_diesel_short"],
-    "brakepad_F_carbon": ["brakepad_F_carbon"],
-    "pickup_fueltank_upfit": ["pickup_fueltank_upfit", "pickup_fueltank_upfit_diesel"],
-    "brakepad_R_carbon": ["brakepad_R_carbon"],
-    "van_licenseplate_R_alt": ["van_licenseplate_R_alt_EU", "van_licenseplate_R_alt"],
-    "brakepad_RR_carbon": ["brakepad_RR_carbon"],
-    "roofbar_beambox_top": ["roofbar_beambox_top_black", "roofbar_beambox_top_color"],
-    "pickup_roofrack_accessory": [
-        "pickup_roofracklight_round_quad",
-        "pickup_roofrack_squarelights",
-        "pickup_roofrack_lights",
-        "pickup_roofracklight_square_quad",
-    ],
-    "roofbar_beambox_load_F": [
-        "roofbar_beambox_load_F_backpack_double",
-        "roofbar_beambox_load_F_backpack",
-        "roofbar_beambox_load_F_suitcase",
-    ],
-    "roofbar_beambox_load_M": [
-        "roofbar_beambox_load_M_suitcase_double",
-        "roofbar_beambox_load_M_suitcase",
-        "roofbar_beambox_load_M_backpck_double",
-    ],
-    "roofbar_beambox_load_R": [
-        "roofbar_beambox_load_R_backpack_double",
-        "roofbar_beambox_load_R_backpack",
-        "roofbar_beambox_load_R_suitcase",
-    ],
-    "etk_DSE": ["etk_DSE", "etk_DSE_race"],
-    "digidash_screen_logic": ["digidash_screen_logic_bng"],
-    "digidash_branding": ["digidash_branding_grd"],
-    "etk_DSE_ABS": ["etk_DSE_ABS"],
-    "digidash_cells_top_bar": ["digidash_cells_top_bar_rpm"],
-    "bastion_v8_exhmanifold": [
-        "bastion_v8_exhmanifold_twinturbo",
-        "bastion_v8_exhmanifold",
-    ],
-    "pickup_roofracklight_quadround_accessory": [
-        "pickup_roofracklight_quadround_halogen",
-        "pickup_roofracklight_quadround_LED",
-        "pickup_roofracklight_quadround_grille",
-        "pickup_roofracklight_quadround_mesh",
-        "pickup_roofracklight_quadround_cover",
-        "pickup_roofracklight_quadround_cover_yellow",
-        "pickup_roofracklight_quadround_cover_beamng",
-        "pickup_roofracklight_quadround_cover_beamngmono",
-        "pickup_roofracklight_quadround_cover_tims",
-    ],
-    "bastion_v8_ecu": [
-        "bastion_v8_ecu",
-        "bastion_v8_ecu_sport",
-        "bastion_v8_ecu_race",
-        "bastion_v8_ecu_redtail",
-    ],
-    "bastion_v8_internals": [
-        "bastion_v8_internals_heavy",
-        "bastion_v8_internals_ultra",
-        "bastion_v8_internals_stage1",
-        "bastion_v8_internals_stage2",
-        "bastion_v8_internals_stage3",
-        "bastion_v8_internals",
-    ],
-    "digidash_cells_top_right_widget": ["digidash_cells_top_right_text"],
-    "digidash_cells_bottom_left": [
-        "digidash_cells_bottom_left_boost",
-        "digidash_cells_bottom_left_engine_torque",
-        "digidash_cells_bottom_left_engine_power",
-        "digidash_cells_bottom_left_engine_consumption_current",
-        "digidash_cells_bottom_left_engine_consumption_average",
-        "digidash_cells_bottom_left_engine_range",
-        "digidash_cells_bottom_left_motor_torque",
-        "digidash_cells_bottom_left_motor_power",
-        "digidash_cells_bottom_left_motor_range",
-        "digidash_cells_bottom_left_acceleration_X",
-        "digidash_cells_bottom_left_acceleration_Y",
-        "digidash_cells_bottom_left_acceleration_Z",
-        "digidash_cells_bottom_left_wheelspeed",
-        "digidash_cells_bottom_left_airspeed",
-        "digidash_cells_bottom_left_gear",
-        "digidash_cells_bottom_left_waterTemp",
-        "digidash_cells_bottom_left_oilTemp",
-        "digidash_cells_bottom_left_envTemp",
-        "digidash_cells_bottom_left_time_OS",
-        "digidash_cells_bottom_left_fuelVolume",
-        "digidash_cells_bottom_left_lowfuel",
-        "digidash_cells_bottom_left_engineRunning",
-        "digidash_cells_bottom_left_checkengine",
-        "digidash_cells_bottom_left_lights",
-    ],
-    "sunburst_finaldrive_F": [
-        "sunburst_finaldrive_F_411",
-        "sunburst_finaldrive_F_race",
-    ],
-    "digidash_cells_bottom_center": [
-        "digidash_cells_bottom_center_wheelspeed",
-        "digidash_cells_bottom_center_boost",
-        "digidash_cells_bottom_center_engine_torque",
-        "digidash_cells_bottom_center_engine_power",
-        "digidash_cells_bottom_center_engine_consumption_current",
-        "digidash_cells_bottom_center_engine_consumption_average",
-        "digidash_cells_bottom_center_engine_range",
-        "digidash_cells_bottom_center_motor_torque",
-        "digidash_cells_bottom_center_motor_power",
-        "digidash_cells_bottom_center_motor_range",
-        "digidash_cells_bottom_center_acceleration_X",
-        "digidash_cells_bottom_center_acceleration_Y",
-        "digidash_cells_bottom_center_acceleration_Z",
-        "digidash_cells_bottom_center_airspeed",
-        "digidash_cells_bottom_center_gear",
-        "digidash_cells_bottom_center_waterTemp",
-        "digidash_cells_bottom_center_oilTemp",
-        "digidash_cells_bottom_center_envTemp",
-        "digidash_cells_bottom_center_time_OS",
-        "digidash_cells_bottom_center_fuelVolume",
-        "digidash_cells_bottom_center_lowfuel",
-        "digidash_cells_bottom_center_engineRunning",
-        "digidash_cells_bottom_center_checkengine",
-        "digidash_cells_bottom_center_lights",
-    ],
-    "sunburst_halfshafts_F": ["sunburst_halfshafts_F"],
-    "digidash_cells_bottom_right_widget": [
-        "digidash_cells_bottom_right_text",
-        "digidash_cells_bottom_right_input",
-    ],
-    "van_rollback_deck": ["van_rollback_deck"],
-    "van_rollback_toolboxes": ["van_rollback_toolboxes"],
-    "van_rollback_feet": ["van_rollback_feet"],
-    "tire_R_16x8_altb": [
-        "tire_R_225_50_16_altb_race",
-        "tire_R_225_45_16_altb_race",
-        "tire_R_225_45_16_altb_sport",
-        "tire_R_235_55_16_altb_sport",
-        "tire_R_225_50_16_altb_sport",
-        "tire_R_235_55_16_altb_standard",
-        "tire_R_235_55_16_altb_standard_ww",
-    ],
-    "van_licenseplate_R_rollback": [
-        "van_licenseplate_R_rollback",
-        "van_licenseplate_R_rollback_EU",
-    ],
-    "etk_enginemounts": [
-        "etk_enginemounts",
-        "etk_enginemounts_heavy",
-        "etk_enginemounts_ultra",
-    ],
-    "etk_transmission": [
-        "etk_transmission_6M",
-        "etk_transmission_6M_diesel",
-        "etk_transmission_6M_sport",
-        "etk_transmission_8A",
-        "etk_transmission_8A_diesel",
-        "etk_transmission_7DCT",
-        "etk_transmission_6M_race",
-        "etk_transmission_6M_sq",
-    ],
-    "etk_flywheel": [
-        "etk_flywheel_race",
-        "etk_flywheel",
-        "etk_flywheel_heavy",
-        "etk_flywheel_sport",
-    ],
-    "etk_transfer_case": ["etk_transfer_case_AWD", "etk_transfer_case_RWD"],
-    "etk_engine": [
-        "etk_engine_i4_2.0_diesel",
-        "etk_engine_i4_2.0",
-        "etk_engine_i6_3.0_diesel",
-        "etk_engine_i6_3.0",
-        "etk_engine_v8_4.4_petrol",
-    ],
-    "pickup_roofracklight_square_accessory": [
-        "pickup_roofracklight_square_halogen",
-        "pickup_roofracklight_square_LED",
-        "pickup_roofracklight_square_grille",
-        "pickup_roofracklight_square_mesh",
-        "pickup_roofracklight_square_cover",
-        "pickup_roofracklight_square_cover_beamng",
-        "pickup_roofracklight_square_cover_beamngmono",
-        "pickup_roofracklight_square_cover_tims",
-    ],
-    "pickup_roofracklight_quadsquare_accessory": [
-        "pickup_roofracklight_quadsquare_cover_tims",
-        "pickup_roofracklight_quadsquare_halogen",
-        "pickup_roofracklight_quadsquare_LED",
-        "pickup_roofracklight_quadsquare_grille",
-        "pickup_roofracklight_quadsquare_mesh",
-        "pickup_roofracklight_quadsquare_cover",
-        "pickup_roofracklight_quadsquare_cover_beamng",
-        "pickup_roofracklight_quadsquare_cover_beamngmono",
-    ],
-    "etk_converter": ["etk_converter", "etk_converter_diesel", "etk_converter_heavy"],
-    "tire_R_15x8": [
-        "tire_R_26_8_15_race",
-        "tire_R_26_8_15_drag",
-        "tire_R_225_45_15_race",
-        "tire_R_225_50_15_race",
-        "tire_R_225_50_15_rally",
-        "tire_R_235_60_15_sport",
-        "tire_R_225_50_15_sport",
-        "tire_R_235_55_15_sport",
-        "tire_R_27_10_15_offroad",
-        "tire_R_225_70_15_offroad",
-        "tire_R_235_75_15_standard",
-    ],
-    "sunburst_halfshafts_R": ["sunburst_halfshafts_R"],
-    "sunburst_driveshaft": ["sunburst_driveshaft"],
-    "pickup_steer": [
-        "pickup_steer",
-        "pickup_steer_airbag",
-        "pickup_steer_01a",
-        "pickup_steer_02a",
-        "pickup_steer_02b",
-        "pickup_steer_02c",
-        "pickup_steer_03a",
-        "pickup_steer_04a",
-        "pickup_steer_05a",
-        "roamer_steer",
-    ],
-    "tire_F_19x8": [
-        "tire_F_225_35_19_race",
-        "tire_F_210_650_19_race",
-        "tire_F_225_35_19_sport",
-    ],
-    "wheel_R_centerlug": [
-        "centerlug_wheel_01a_19x8_R",
-        "civetta_wheel_02a_18x12_R",
-        "civetta_wheel_01a_16x12_R",
-        "civetta_wheel_03b_16x12_R",
-        "civetta_wheel_02c_18x12_R",
-        "civetta_wheel_01b_16x9_R",
-        "civetta_wheel_03b_18x12_R",
-        "civetta_wheel_01b_16x12_R",
-        "civetta_wheel_03b_16x9_R",
-        "civetta_wheel_03a_16x12_R",
-        "civetta_wheel_01c_16x9_R",
-        "civetta_wheel_03a_18x12_R",
-        "civetta_wheel_01a_16x9_R",
-        "civetta_wheel_03a_16x9_R",
-        "civetta_wheel_01c_16x12_R",
-        "wheel_civetta_03a_15x10_R",
-        "wheel_civetta_03b_15x10_R",
-        "wheel_civetta_03a_15x8_R",
-        "wheel_civetta_03b_15x8_R",
-    ],
-    "tire_R_14x7_alt": [
-        "tire_R_185_60_14_alt_race",
-        "tire_R_185_60_14_alt_sport",
-        "tire_R_195_65_14_alt_sport",
-        "tire_R_195_75_14_alt_sport",
-        "tire_R_E70_14_alt",
-        "tire_R_E70_14_alt_thinww",
-        "tire_R_E70_14_alt_redline",
-        "tire_R_185_60_14_alt_standard",
-        "tire_R_195_70_14_alt_standard",
-        "tire_R_195_70_14_alt_standard_ww",
-    ],
-    "paint_design": [
-        "sunburst_skin_police",
-        "sunburst_skin_interceptor",
-        "sunburst_skin_firwoodpolice",
-        "sunburst_skin_custom",
-        "sunburst_skin_rally",
-        "sunburst_skin_gripall",
-        "sunburst_skin_gendarmerie",
-    ],
-    "digidash_cells_top_left0": [
-        "digidash_cells_top_left0_boost",
-        "digidash_cells_top_left0_engine_torque",
-        "digidash_cells_top_left0_engine_power",
-        "digidash_cells_top_left0_engine_consumption_current",
-        "digidash_cells_top_left0_engine_consumption_average",
-        "digidash_cells_top_left0_engine_range",
-        "digidash_cells_top_left0_motor_torque",
-        "digidash_cells_top_left0_motor_power",
-        "digidash_cells_top_left0_motor_range",
-        "digidash_cells_top_left0_acceleration_X",
-        "digidash_cells_top_left0_acceleration_Y",
-        "digidash_cells_top_left0_acceleration_Z",
-        "digidash_cells_top_left0_wheelspeed",
-        "digidash_cells_top_left0_airspeed",
-        "digidash_cells_top_left0_gear",
-        "digidash_cells_top_left0_waterTemp",
-        "digidash_cells_top_left0_oilTemp",
-        "digidash_cells_top_left0_envTemp",
-        "digidash_cells_top_left0_time_OS",
-        "digidash_cells_top_left0_fuelVolume",
-        "digidash_cells_top_left0_lowfuel",
-        "digidash_cells_top_left0_engineRunning",
-        "digidash_cells_top_left0_checkengine",
-        "digidash_cells_top_left0_lights",
-    ],
-    "tire_R_14x8_alt": [
-        "tire_R_205_55_14_alt_race",
-        "tire_R_215_60_14_alt_race",
-        "tire_R_225_60_14_alt_sport",
-        "tire_R_205_55_14_alt_sport",
-        "tire_R_215_70_14_alt_sport",
-    ],
-    "etk_intake_i4_2.0_diesel": ["etk_intake_i4_2.0_diesel_turbo"],
-    "digidash_cells_top_left2": [
-        "digidash_cells_top_left2_boost",
-        "digidash_cells_top_left2_engine_torque",
-        "digidash_cells_top_left2_engine_power",
-        "digidash_cells_top_left2_engine_consumption_current",
-        "digidash_cells_top_left2_engine_consumption_average",
-        "digidash_cells_top_left2_engine_range",
-        "digidash_cells_top_left2_motor_torque",
-        "digidash_cells_top_left2_motor_power",
-        "digidash_cells_top_left2_motor_range",
-        "digidash_cells_top_left2_acceleration_X",
-        "digidash_cells_top_left2_acceleration_Y",
-        "digidash_cells_top_left2_acceleration_Z",
-        "digidash_cells_top_left2_wheelspeed",
-        "digidash_cells_top_left2_airspeed",
-        "digidash_cells_top_left2_gear",
-        "digidash_cells_top_left2_waterTemp",
-        "digidash_cells_top_left2_oilTemp",
-        "digidash_cells_top_left2_envTemp",
-        "digidash_cells_top_left2_time_OS",
-        "digidash_cells_top_left2_fuelVolume",
-        "digidash_cells_top_left2_lowfuel",
-        "digidash_cells_top_left2_engineRunning",
-        "digidash_cells_top_left2_checkengine",
-        "digidash_cells_top_left2_lights",
-    ],
-    "etk_engine_i4_2.0_diesel_ecu": [
-        "etk_engine_i4_2.0_diesel_ecu_230_stage1",
-        "etk_engine_i4_2.0_diesel_ecu_150",
-        "etk_engine_i4_2.0_diesel_ecu_230",
-        "etk_engine_i4_2.0_diesel_ecu_190",
-    ],
-    "etk_engine_i4_2.0_diesel_internals": [
-        "etk_engine_i4_2.0_diesel_internals_heavy",
-        "etk_engine_i4_2.0_diesel_internals",
-    ],
-    "tire_F_17x10": ["tire_F_265_40_17_race", "tire_F_265_40_17_sport"],
-    "digidash_cells_bottom_right0": [
-        "digidash_cells_bottom_right0_lights",
-        "digidash_cells_bottom_right0_boost",
-        "digidash_cells_bottom_right0_engine_torque",
-        "digidash_cells_bottom_right0_engine_power",
-        "digidash_cells_bottom_right0_engine_consumption_current",
-        "digidash_cells_bottom_right0_engine_consumption_average",
-        "digidash_cells_bottom_right0_engine_range",
-        "digidash_cells_bottom_right0_motor_torque",
-        "digidash_cells_bottom_right0_motor_power",
-        "digidash_cells_bottom_right0_motor_range",
-        "digidash_cells_bottom_right0_acceleration_X",
-        "digidash_cells_bottom_right0_acceleration_Y",
-        "digidash_cells_bottom_right0_acceleration_Z",
-        "digidash_cells_bottom_right0_wheelspeed",
-        "digidash_cells_bottom_right0_airspeed",
-        "digidash_cells_bottom_right0_gear",
-        "digidash_cells_bottom_right0_waterTemp",
-        "digidash_cells_bottom_right0_oilTemp",
-        "digidash_cells_bottom_right0_envTemp",
-        "digidash_cells_bottom_right0_time_OS",
-        "digidash_cells_bottom_right0_fuelVolume",
-        "digidash_cells_bottom_right0_lowfuel",
-        "digidash_cells_bottom_right0_engineRunning",
-        "digidash_cells_bottom_right0_checkengine",
-    ],
-    "digidash_cells_bottom_right1": [
-        "digidash_cells_bottom_right1_boost",
-        "digidash_cells_bottom_right1_engine_torque",
-        "digidash_cells_bottom_right1_engine_power",
-        "digidash_cells_bottom_right1_engine_consumption_current",
-        "digidash_cells_bottom_right1_engine_consumption_average",
-        "digidash_cells_bottom_right1_engine_range",
-        "digidash_cells_bottom_right1_motor_torque",
-        "digidash_cells_bottom_right1_motor_power",
-        "digidash_cells_bottom_right1_motor_range",
-        "digidash_cells_bottom_right1_acceleration_X",
-        "digidash_cells_bottom_right1_acceleration_Y",
-        "digidash_cells_bottom_right1_acceleration_Z",
-        "digidash_cells_bottom_right1_wheelspeed",
-        "digidash_cells_bottom_right1_airspeed",
-        "digidash_cells_bottom_right1_gear",
-        "digidash_cells_bottom_right1_waterTemp",
-        "digidash_cells_bottom_right1_oilTemp",
-        "digidash_cells_bottom_right1_envTemp",
-        "digidash_cells_bottom_right1_time_OS",
-        "digidash_cells_bottom_right1_fuelVolume",
-        "digidash_cells_bottom_right1_lowfuel",
-        "digidash_cells_bottom_right1_engineRunning",
-        "digidash_cells_bottom_right1_checkengine",
-        "digidash_cells_bottom_right1_lights",
-    ],
-    "tire_R_15x10": [
-        "tire_R_28_10_15_drag",
-        "tire_R_27_10_15_race",
-        "tire_R_285_40_15_race",
-        "tire_R_26_10_15_drag",
-        "tire_R_275_50_15_sport",
-        "tire_R_285_40_15_sport",
-    ],
-    "tire_R_15x12_alt": [
-        "tire_R_345_35_15_alt_race",
-        "tire_R_29_12_15_drag",
-        "tire_R_345_35_15_alt_sport",
-    ],
-    "digidash_cells_top_right0": [
-        "digidash_cells_top_right0_fuelVolume",
-        "digidash_cells_top_right0_boost",
-        "digidash_cells_top_right0_engine_torque",
-        "digidash_cells_top_right0_engine_power",
-        "digidash_cells_top_right0_engine_consumption_current",
-        "digidash_cells_top_right0_engine_consumption_average",
-        "digidash_cells_top_right0_engine_range",
-        "digidash_cells_top_right0_motor_torque",
-        "digidash_cells_top_right0_motor_power",
-        "digidash_cells_top_right0_motor_range",
-        "digidash_cells_top_right0_acceleration_X",
-        "digidash_cells_top_right0_acceleration_Y",
-        "digidash_cells_top_right0_acceleration_Z",
-        "digidash_cells_top_right0_wheelspeed",
-        "digidash_cells_top_right0_airspeed",
-        "digidash_cells_top_right0_gear",
-        "digidash_cells_top_right0_waterTemp",
-        "digidash_cells_top_right0_oilTemp",
-        "digidash_cells_top_right0_envTemp",
-        "digidash_cells_top_right0_time_OS",
-        "digidash_cells_top_right0_lowfuel",
-        "digidash_cells_top_right0_engineRunning",
-        "digidash_cells_top_right0_checkengine",
-        "digidash_cells_top_right0_lights",
-    ],
-    "tire_R_16x9": [
-        "tire_R_245_45_16_race",
-        "tire_R_245_45_16_rally",
-        "tire_R_245_45_16_sport",
-    ],
-    "digidash_cells_top_right1": [
-        "digidash_cells_top_right1_waterTemp",
-        "digidash_cells_top_right1_boost",
-        "digidash_cells_top_right1_engine_torque",
-        "digidash_cells_top_right1_engine_power",
-        "digidash_cells_top_right1_engine_consumption_current",
-        "digidash_cells_top_right1_engine_consumption_average",
-        "digidash_cells_top_right1_engine_range",
-        "digidash_cells_top_right1_motor_torque",
-        "digidash_cells_top_right1_motor_power",
-        "digidash_cells_top_right1_motor_range",
-        "digidash_cells_top_right1_acceleration_X",
-        "digidash_cells_top_right1_acceleration_Y",
-        "digidash_cells_top_right1_acceleration_Z",
-        "digidash_cells_top_right1_wheelspeed",
-        "digidash_cells_top_right1_airspeed",
-        "digidash_cells_top_right1_gear",
-        "digidash_cells_top_right1_oilTemp",
-        "digidash_cells_top_right1_envTemp",
-        "digidash_cells_top_right1_time_OS",
-        "digidash_cells_top_right1_fuelVolume",
-        "digidash_cells_top_right1_lowfuel",
-        "digidash_cells_top_right1_engineRunning",
-        "digidash_cells_top_right1_checkengine",
-        "digidash_cells_top_right1_lights",
-    ],
-    "tire_R_16x12": ["tire_R_335_35_16_race", "tire_R_335_35_16_sport"],
-    "digidash_cells_top_right2": [
-        "digidash_cells_top_right2_oilTemp",
-        "digidash_cells_top_right2_boost",
-        "digidash_cells_top_right2_engine_torque",
-        "digidash_cells_top_right2_engine_power",
-        "digidash_cells_top_right2_engine_consumption_current",
-        "digidash_cells_top_right2_engine_consumption_average",
-        "digidash_cells_top_right2_engine_range",
-        "digidash_cells_top_right2_motor_torque",
-        "digidash_cells_top_right2_motor_power",
-        "digidash_cells_top_right2_motor_range",
-        "digidash_cells_top_right2_acceleration_X",
-        "digidash_cells_top_right2_acceleration_Y",
-        "digidash_cells_top_right2_acceleration_Z",
-        "digidash_cells_top_right2_wheelspeed",
-        "digidash_cells_top_right2_airspeed",
-        "digidash_cells_top_right2_gear",
-        "digidash_cells_top_right2_waterTemp",
-        "digidash_cells_top_right2_envTemp",
-        "digidash_cells_top_right2_time_OS",
-        "digidash_cells_top_right2_fuelVolume",
-        "digidash_cells_top_right2_lowfuel",
-        "digidash_cells_top_right2_engineRunning",
-        "digidash_cells_top_right2_checkengine",
-        "digidash_cells_top_right2_lights",
-    ],
-    "etk_intake_i4_2.0_petrol": ["etk_intake_i4_2.0_petrol_turbo"],
-    "tire_R_16x8": [
-        "tire_R_225_45_16_race",
-        "tire_R_225_50_16_race",
-        "tire_R_235_55_16_sport",
-        "tire_R_225_45_16_sport",
-        "tire_R_225_50_16_sport",
-        "tire_R_235_55_16_standard",
-        "tire_R_235_55_16_standard_ww",
-    ],
-    "etk_engine_i4_2.0_ecu": [
-        "etk_engine_i4_2.0_ecu_190",
-        "etk_engine_i4_2.0_ecu_250_stage1",
-        "etk_engine_i4_2.0_ecu_150",
-        "etk_engine_i4_2.0_ecu_250",
-    ],
-    "etk_engine_i4_2.0_internals": [
-        "etk_engine_i4_2.0_internals",
-        "etk_engine_i4_2.0_internals_heavy",
-    ],
-    "tire_R_20x9": [
-        "tire_R_245_30_20_sport",
-        "tire_R_275_40_20_sport",
-        "tire_R_245_30_20_sport_plus",
-    ],
-    "tire_R_18x12": ["tire_R_345_35_18_race"],
-    "sunburst_lip_F": ["sunburst_lip_F", "sunburst_bigsplitter_01a"],
-    "simple_traffic_sunburst_engine": ["simple_traffic_sunburst_engine"],
-    "sunburst_mudflap_R": ["sunburst_mudflap_R"],
-    "simple_traffic_sunburst_transmission": ["simple_traffic_sunburst_transmission"],
-    "etk_intake_i6_3.0_diesel": ["etk_intake_i6_3.0_diesel_turbo"],
-    "etk_engine_i6_3.0_diesel_ecu": [
-        "etk_engine_i6_3.0_diesel_ecu_310",
-        "etk_engine_i6_3.0_diesel_ecu_260",
-        "etk_engine_i6_3.0_diesel_ecu_310_stage1",
-    ],
-    "tire_R_18x8": [
-        "tire_R_225_40_18_race",
-        "tire_R_235_40_18_tarmac",
-        "tire_R_235_40_18_race",
-        "tire_R_235_40_18_sport",
-        "tire_R_225_40_18_sport",
-        "tire_R_235_50_18_standard",
-        "tire_R_235_55_18_standard",
-    ],
-    "etk_engine_i6_3.0_diesel_internals": [
-        "etk_engine_i6_3.0_diesel_internals_heavy",
-        "etk_engine_i6_3.0_diesel_internals",
-    ],
-    "pickup_brake_F": [
-        "pickup_brake_F",
-        "pickup_brake_F_race",
-        "pickup_brake_F_offroad",
-        "pickup_brake_F_heavy",
-    ],
-    "simple_traffic_sunburst_wheels_F": [
-        "simple_traffic_sunburst_wheels_F",
-        "simple_traffic_sunburst_wheels_F_alt",
-        "simple_traffic_sunburst_wheels_F_alt2",
-    ],
-    "simple_traffic_sunburst_wheels_R": [
-        "simple_traffic_sunburst_wheels_R",
-        "simple_traffic_sunburst_wheels_R_alt",
-        "simple_traffic_sunburst_wheels_R_alt2",
-    ],
-    "simple_traffic_sunburst_bumper_F": [
-        "simple_traffic_sunburst_bumper_F_alt",
-        "simple_traffic_sunburst_bumper_F",
-    ],
-    "simple_traffic_sunburst_bumper_R": ["simple_traffic_sunburst_bumper_R"],
-    "simple_traffic_sunburst_hood": ["simple_traffic_sunburst_hood"],
-    "simple_traffic_sunburst_trunk": [
-        "simple_traffic_sunburst_trunk",
-        "simple_traffic_sunburst_trunk_alt",
-    ],
-    "simple_traffic_sunburst_mirrors": ["simple_traffic_sunburst_mirrors"],
-    "tire_R_18x10_alt": [
-        "tire_R_33_12_18_offroad",
-        "tire_R_35_12_18_offroad",
-        "tire_R_275_40_18_alt_race",
-        "tire_R_275_35_18_alt_race",
-        "tire_R_255_40_18_alt_sport",
-        "tire_R_275_55_18_alt_sport",
-        "tire_R_275_40_18_alt_sport",
-    ],
-    "tire_F_15x8_altb": [
-        "tire_F_225_45_15_altb_race",
-        "tire_F_26_8_15_altb_race",
-        "tire_F_26_8_15_altb_drag",
-        "tire_F_225_50_15_altb_race",
-        "tire_F_225_50_15_altb_rally",
-        "tire_F_225_50_15_altb_sport",
-        "tire_F_235_60_15_altb_sport",
-        "tire_F_235_55_15_altb_sport",
-        "tire_F_225_70_15_altb_offroad",
-        "tire_F_27_10_15_altb_offroad",
-        "tire_F_235_75_15_altb_standard",
-    ],
-    "pickup_brake_R_heavy": [
-        "pickup_brake_R_heavy_alt",
-        "pickup_brake_R_drum_heavy_alt",
-    ],
-    "sunburst_lip_sideskirt": ["sunburst_lip_sideskirt_kit"],
-    "etk_engine_i6_3.0_petrol_ecu": [
-        "etk_engine_i6_3.0_petrol_ecu_500_ttsport",
-        "etk_engine_i6_3.0_petrol_ecu_300",
-        "etk_engine_i6_3.0_petrol_ecu_340",
-        "etk_engine_i6_3.0_petrol_ecu_360",
-        "etk_engine_i6_3.0_petrol_ecu_500_ttsport_stage3",
-        "etk_engine_i6_3.0_petrol_ecu_360_stage1",
-        "etk_engine_i6_3.0_petrol_ecu_500_ttsport_stage2",
-        "etk_engine_i6_3.0_petrol_ecu_360_stage2",
-        "etk_engine_i6_3.0_petrol_ecu_500_ttsport_stage1",
-        "etk_engine_i6_3.0_petrol_ecu_440_ttsport",
-        "etk_engine_i6_3.0_petrol_ecu_na_270",
-        "etk_engine_i6_3.0_petrol_ecu_460_ttsport",
-    ],
-    "sunburst_diffuser_R": ["sunburst_diffuser_R"],
-    "etk_engine_i6_3.0_petrol_internals": [
-        "etk_engine_i6_3.0_petrol_internals_ttsport",
-        "etk_engine_i6_3.0_petrol_internals",
-        "etk_engine_i6_3.0_petrol_internals_heavy",
-    ],
-    "van_rollback_winch": ["van_rollback_winch"],
-    "sunburst_glass_sunroof": ["sunburst_glass_sunroof"],
-    "tire_R_15x8_altb": [
-        "tire_R_225_45_15_altb_race",
-        "tire_R_225_50_15_altb_race",
-        "tire_R_26_8_15_altb_race",
-        "tire_R_26_8_15_altb_drag",
-        "tire_R_225_50_15_altb_rally",
-        "tire_R_235_60_15_altb_sport",
-        "tire_R_225_50_15_altb_sport",
-        "tire_R_235_55_15_altb_sport",
-        "tire_R_27_10_15_altb_offroad",
-        "tire_R_225_70_15_altb_offroad",
-        "tire_R_235_75_15_altb_standard",
-    ],
-    "tire_R_17x10": ["tire_R_265_40_17_race", "tire_R_265_40_17_sport"],
-    "tire_R_17x12": ["tire_R_295_35_17_race", "tire_R_295_35_17_sport"],
-    "pickup_ABS": ["pickup_ABS"],
-    "tire_F_17x9_offroad": [
-        "tire_F_33_12_17_offroad",
-        "tire_F_35_12_17_offroad",
-        "tire_F_255_60_17_offroad_sport",
-        "tire_F_42_14_17_crawler",
-        "tire_F_44_15_17_crawler",
-        "tire_F_38_13_17_crawler",
-        "tire_F_36_13_17_crawler",
-        "tire_F_35_13_17_desert",
-        "tire_F_40_13_17_desert",
-        "tire_F_38_13_17_desert",
-    ],
-    "tire_R_19x9": [
-        "tire_R_245_35_19_race",
-        "tire_R_245_35_19_sport_plus",
-        "tire_R_245_35_19_sport",
-    ],
-    "pickup_wheeldata_F": ["pickup_wheeldata_F"],
-    "tire_R_19x10": [
-        "tire_R_265_35_19_race",
-        "tire_R_265_35_19_sport_plus",
-        "tire_R_265_35_19_sport",
-    ],
-    "tire_R_20x11": [
-        "tire_R_305_35_20_race",
-        "tire_R_305_35_20_sport",
-        "tire_R_305_30_20_sport_plus",
-        "tire_R_305_30_20_sport",
-    ],
-    "etk_oilpan_v8": ["etk_oilpan_v8_ttSport", "etk_oilpan_v8_race", "etk_oilpan_v8"],
-    "etk_intake_v8_4.4_petrol": [
-        "etk_intake_v8_4.4_petrol_ttSport",
-        "etk_intake_v8_4.4_petrol_turbo_ttSport",
-        "etk_intake_v8_4.4_petrol_restricted",
-        "etk_intake_v8_4.4_petrol_rennspecht",
-    ],
-    "etk_engine_v8_4.4_petrol_ecu": [
-        "etk_engine_v8_4.4_petrol_ecu_rennspecht_630",
-        "etk_engine_v8_4.4_petrol_ecu_ttSport_470",
-        "etk_engine_v8_4.4_petrol_ecu_ttSport_550",
-        "etk_engine_v8_4.4_petrol_ecu_ttSport_600_stage2",
-        "etk_engine_v8_4.4_petrol_ecu_ttSport_600",
-        "etk_engine_v8_4.4_petrol_ecu_ttSport_600_stage1",
-        "etk_engine_v8_4.4_petrol_ecu_rennspecht_500",
-    ],
-    "etk_engine_v8_4.4_petrol_internals": [
-        "etk_engine_v8_4.4_petrol_internals_heavy",
-        "etk_engine_v8_4.4_petrol_internals_ttsport",
-    ],
-    "race_seat_FL": ["race_seat_FL"],
-    "race_seat_FR": ["race_seat_FR"],
-    "tire_F_16x7_alt": [
-        "tire_F_215_45_16_alt_race",
-        "tire_F_205_50_16_alt_race",
-        "tire_F_245_75_16_alt_heavy",
-        "tire_F_265_75_16_alt_heavy",
-        "tire_F_225_75_16_alt_heavy",
-        "tire_F_205_55_16_alt_sport",
-        "tire_F_205_50_16_alt_sport",
-        "tire_F_265_75_16_alt_offroad",
-        "tire_F_245_75_16_alt_standard",
-        "tire_F_265_75_16_alt_standard",
-        "tire_F_205_55_16_alt_standard",
-        "tire_F_215_65_16_alt_standard",
-        "tire_F_225_75_16_alt_standard",
-    ],
-    "etk_enginelogo_v8.4.4": [
-        "etk_enginelogo_v8.4.4_rennspecht",
-        "etk_enginelogo_v8.4.4_etk",
-    ],
-    "tire_R_19x11": [
-        "tire_R_295_35_19_tarmac",
-        "tire_R_295_25_19_race",
-        "tire_R_295_35_19_race",
-        "tire_R_295_25_19_sport",
-    ],
-    "simple_traffic_sunburst_wheels_F_parked": [
-        "simple_traffic_sunburst_wheels_F_parked",
-        "simple_traffic_sunburst_wheels_F_parked_alt",
-        "simple_traffic_sunburst_wheels_F_parked_alt2",
-    ],
-    "simple_traffic_sunburst_wheels_R_parked": [
-        "simple_traffic_sunburst_wheels_R_parked",
-        "simple_traffic_sunburst_wheels_R_parked_alt",
-        "simple_traffic_sunburst_wheels_R_parked_alt2",
-    ],
-    "simple_traffic_sunburst_suspension_F": ["simple_traffic_sunburst_strut_F"],
-    "tire_R_16x7_alt": [
-        "tire_R_205_50_16_alt_race",
-        "tire_R_215_45_16_alt_race",
-        "tire_R_225_75_16_alt_heavy",
-        "tire_R_245_75_16_alt_heavy",
-        "tire_R_265_75_16_alt_heavy",
-        "tire_R_205_55_16_alt_sport",
-        "tire_R_205_50_16_alt_sport",
-        "tire_R_265_75_16_alt_offroad",
-        "tire_R_245_75_16_alt_standard",
-        "tire_R_265_75_16_alt_standard",
-        "tire_R_225_75_16_alt_standard",
-        "tire_R_205_55_16_alt_standard",
-        "tire_R_215_65_16_alt_standard",
-    ],
-    "pickup_wheeldata_R_dually": ["pickup_wheeldata_R_dually"],
-    "etk_engine_ecu_speedlimit": [
-        "etk_engine_ecu_speedlimit_off",
-        "etk_engine_ecu_speedlimit_230",
-        "etk_engine_ecu_speedlimit_330",
-        "etk_engine_ecu_speedlimit_250",
-        "etk_engine_ecu_speedlimit_310",
-        "etk_engine_ecu_speedlimit_270",
-        "etk_engine_ecu_speedlimit_210",
-        "etk_engine_ecu_speedlimit_290",
-    ],
-    "tire_R_16x7_dually_true": [
-        "tire_R_225_75_16_dually_true",
-        "tire_R_265_75_16_dually_true",
-        "tire_R_245_75_16_dually_true",
-        "tire_R_265_75_16_dually_true_offroad",
-    ],
-    "simple_traffic_sunburst_suspension_R": [
-        "simple_traffic_sunburst_doublewishbone_R"
-    ],
-    "roofbars_load": [
-        "pallet",
-        "fridge_body_single",
-        "roofbar_mattress",
-        "roofbars_woodcrate",
-        "roofbar_pipes_ladder",
-        "roofbars_couch_sideways",
-        "roofbar_beambox",
-    ],
-    "tire_F_22x12": ["tire_F_295_25_22_sport"],
-    "skin_race_seat_FL": [
-        "skin_race_seat_FL_gray",
-        "skin_race_seat_FL_red",
-        "skin_race_seat_FL_green",
-        "skin_race_seat_FL_blue",
-    ],
-    "skin_race_seat_FR": [
-        "skin_race_seat_FR_blue",
-        "skin_race_seat_FR_gray",
-        "skin_race_seat_FR_red",
-        "skin_race_seat_FR_green",
-    ],
-    "simple_traffic_sunburst_brake_F": ["simple_traffic_sunburst_brake_F"],
-    "etk_DSE_drivemodes_default": [
-        "etk_DSE_drivemodes_default_sport_plus",
-        "etk_DSE_drivemodes_default_comfort",
-        "etk_DSE_drivemodes_default_off",
-        "etk_DSE_drivemodes_default_sport",
-    ],
-    "simple_traffic_sunburst_coilover_F_strut": [
-        "simple_traffic_sunburst_coilover_F_strut"
-    ],
-    "tire_R_15x9_alt": [
-        "tire_R_245_40_15_alt_race",
-        "tire_R_245_50_15_alt_race",
-        "tire_R_26.5_8.5_15_alt_race",
-        "tire_R_245_50_15_alt_sport",
-        "tire_R_255_55_15_alt_sport",
-        "tire_R_255_60_15_alt_sport",
-        "tire_R_29_10_15_alt_offroad",
-        "tire_R_31_12_15_alt_offroad",
-        "tire_R_255_70_15_alt_standard",
-    ],
-    "simple_traffic_sunburst_swaybar_F_strut": [
-        "simple_traffic_sunburst_swaybar_F_strut"
-    ],
-    "simple_traffic_sunburst_steering_strut": [
-        "simple_traffic_sunburst_steering_strut",
-        "simple_traffic_sunburst_steering_strut_parked",
-    ],
-    "pickup_towhitch_bumper": ["pickup_towhitch_bumper"],
-    "tire_R_15x11": ["tire_R_195_65_15_stretched"],
-    "pickup_towhitch": ["pickup_towhitch", "pickup_fasteners"],
-    "tire_F_15x9": [
-        "tire_F_26.5_8.5_15_race",
-        "tire_F_245_40_15_race",
-        "tire_F_245_50_15_race",
-        "tire_F_245_50_15_sport",
-        "tire_F_255_55_15_sport",
-        "tire_F_255_60_15_sport",
-        "tire_F_31_12_15_offroad",
-        "tire_F_29_10_15_offroad",
-        "tire_F_255_70_15_standard",
-    ],
-    "offroad_seat_FR": ["offroad_seat_FR"],
-    "pickup_receiver_attachment": ["pickup_receiver_drop", "pickup_receiver_ball"],
-    "skin_offroad_seat_FR": [
-        "skin_offroad_seat_FR_red",
-        "skin_offroad_seat_FR_yellow",
-        "skin_offroad_seat_FR_blue",
-        "skin_offroad_seat_FR_gray",
-    ],
-    "offroad_seat_FL": ["offroad_seat_FL"],
-    "pickup_differential_SFA": [
-        "pickup_differential_SFA_heavy_LSD",
-        "pickup_differential_SFA_welded",
-        "pickup_differential_SFA_locking",
-        "pickup_differential_SFA",
-        "pickup_differential_SFA_LSD",
-    ],
-    "pickup_axleshafts_F": ["pickup_axleshafts_F"],
-    "tire_R_15x12": [
-        "tire_R_345_35_15_race",
-        "tire_R_29_12_15_drag_2",
-        "tire_R_345_35_15_sport",
-    ],
-    "pickup_finaldrive_SFA": [
-        "pickup_finaldrive_SFA_410",
-        "pickup_finaldrive_SFA_444",
-        "pickup_finaldrive_SFA_race",
-        "pickup_finaldrive_SFA_355",
-    ],
-    "sunburst_doorglass_FL": ["sunburst_doorglass_FL"],
-    "tire_F_17x8_altb": [
-        "tire_F_225_45_17_altb_race",
-        "tire_F_225_40_17_altb_race",
-        "tire_F_225_40_17_altb_drift",
-        "tire_F_225_45_17_altb_sport",
-        "tire_F_225_50_17_altb_sport",
-        "tire_F_225_50_17_altb_standard",
-        "tire_F_225_70_17_altb_standard",
-    ],
-    "simple_traffic_sunburst_brake_R": ["simple_traffic_sunburst_brake_R"],
-    "simple_traffic_sunburst_wheeldata_R_doublewishbone": [
-        "simple_traffic_sunburst_wheeldata_R_doublewishbone"
-    ],
-    "simple_traffic_sunburst_coilover_R_doublewishbone": [
-        "simple_traffic_sunburst_coilover_R_doublewishbone"
-    ],
-    "simple_traffic_sunburst_swaybar_R_doublewishbone": [
-        "simple_traffic_sunburst_swaybar_R_doublewishbone"
-    ],
-    "pickup_driveshaft_SFA": ["pickup_driveshaft_SFA"],
-    "bogie": ["bogie"],
-    "bogie_airbag": ["bogie_airbag"],
-    "sunburst_doorglass_RR": ["sunburst_doorglass_RR"],
-    "bogie_leaf": ["bogie_leaf"],
-    "tire_R_22x14": ["tire_R_335_25_22_sport"],
-    "bogie_wheel_F": ["bogie_wheel_F_alt", "bogie_wheel_F"],
-    "bogie_brake_F": ["bogie_brake_F"],
-    "bogie_wheeldata_F": ["bogie_wheeldata_F"],
-    "pickup_roofbasket_lights": [
-        "pickup_roofbasketlight_round_quad",
-        "pickup_roofbasket_squarelights",
-        "pickup_roofbasketlight_square_quad",
-        "pickup_roofbasket_lights",
-    ],
-    "pickup_roofbasketlight_round_accessory": [
-        "pickup_roofbasketlight_round_LED",
-        "pickup_roofbasketlight_round_grille",
-        "pickup_roofbasketlight_round_mesh",
-        "pickup_roofbasketlight_round_cover",
-        "pickup_roofbasketlight_round_cover_yellow",
-        "pickup_roofbasketlight_round_cover_beamng",
-        "pickup_roofbasketlight_round_cover_beamngmono",
-        "pickup_roofbasketlight_round_cover_tims",
-        "pickup_roofbasketlight_round_halogen",
-    ],
-    "bogie_mudflap": ["bogie_mudflap"],
-    "bogie_wheeldata_R": ["bogie_wheeldata_R"],
-    "tire_F_24x9": ["tire_F_255_25_24_sport"],
-    "sunburst_doorglass_RL": ["sunburst_doorglass_RL"],
-    "tire_F_26x9": ["tire_F_305_30_26_sport", "tire_F_255_30_26_sport"],
-    "pickup_roofbasketlight_quadround_accessory": [
-        "pickup_roofbasketlight_quadround_halogen",
-        "pickup_roofbasketlight_quadround_LED",
-        "pickup_roofbasketlight_quadround_grille",
-        "pickup_roofbasketlight_quadround_mesh",
-        "pickup_roofbasketlight_quadround_cover",
-        "pickup_roofbasketlight_quadround_cover_yellow",
-        "pickup_roofbasketlight_quadround_cover_beamng",
-        "pickup_roofbasketlight_quadround_cover_beamngmono",
-        "pickup_roofbasketlight_quadround_cover_tims",
-    ],
-    "tire_F_17x9_alt": [
-        "tire_F_245_40_17_alt_race",
-        "tire_F_245_35_17_alt_race",
-        "tire_F_245_35_17_alt_drift",
-        "tire_F_255_60_17_alt_sport",
-        "tire_F_245_35_17_alt_sport",
-        "tire_F_245_40_17_alt_sport",
-        "tire_F_245_50_17_alt_sport",
-    ],
-    "pickup_exhaust_i6": ["pickup_exhaust_i6", "pickup_exhaust_i6_race"],
-    "etk_finaldrive_F": [
-        "etk_finaldrive_F_281",
-        "etk_finaldrive_F_391",
-        "etk_finaldrive_F_315",
-        "etk_finaldrive_F_323",
-        "etk_finaldrive_F_race",
-        "etk_finaldrive_F_346",
-    ],
-    "tire_R_22x9": ["tire_R_245_30_22_sport", "tire_R_265_30_22_sport"],
-    "tire_R_14x6_alt": [
-        "tire_R_175_65_14_alt_sport",
-        "tire_R_735_14_alt_redline",
-        "tire_R_695_14_alt_thinww",
-        "tire_R_695_14_alt_ww",
-        "tire_R_695_14_alt_redline",
-        "tire_R_695_14_alt_mixed",
-        "tire_R_735_14_alt",
-        "tire_R_735_14_alt_thinww",
-        "tire_R_735_14_alt_mixed",
-        "tire_R_735_14_alt_ww",
-        "tire_R_695_14_alt",
-        "tire_R_175_65_14_alt_standard",
-    ],
-    "tire_R_14x7_altb": [
-        "tire_R_185_60_14_altb_race",
-        "tire_R_195_75_14_altb_sport",
-        "tire_R_195_65_14_altb_sport",
-        "tire_R_185_60_14_altb_sport",
-        "tire_R_E70_14_altb",
-        "tire_R_E70_14_altb_redline",
-        "tire_R_E70_14_altb_thinww",
-        "tire_R_195_70_14_altb_standard",
-        "tire_R_195_70_14_altb_standard_ww",
-        "tire_R_185_60_14_altb_standard",
-    ],
-    "etk_finaldrive_R": [
-        "etk_finaldrive_R_315",
-        "etk_finaldrive_R_323",
-        "etk_finaldrive_R_346",
-        "etk_finaldrive_R_281",
-        "etk_finaldrive_R_391",
-        "etk_finaldrive_R_race",
-    ],
-    "tire_R_18x12_alt": ["tire_R_28_13_5_18_drag"],
-    "pickup_exhaust_v8": [
-        "pickup_exhaust_v8",
-        "pickup_exhaust_v8_race",
-        "pickup_exhaust_v8_race_tip",
-    ],
-    "pickup_roofbasketlight_square_accessory": [
-        "pickup_roofbasketlight_square_halogen",
-        "pickup_roofbasketlight_square_LED",
-        "pickup_roofbasketlight_square_grille",
-        "pickup_roofbasketlight_square_mesh",
-        "pickup_roofbasketlight_square_cover",
-        "pickup_roofbasketlight_square_cover_beamng",
-        "pickup_roofbasketlight_square_cover_beamngmono",
-        "pickup_roofbasketlight_square_cover_tims",
-    ],
-    "wheel_F_3": [
-        "pigeon_wheel_01b_F",
-        "wheel_39c_altb_F",
-        "wheel_39a_altb_F",
-        "wheel_39b_altb_F",
-        "pigeon_wheel_02b_F",
-        "pigeon_wheel_02a_F",
-        "pigeon_wheel_01a_F",
-        "wigeon_wheel_01a_F",
-    ],
-    "tire_F_10x4.5": ["tire_F_145_80_10_standard"],
-    "pickup_roofbasketlight_quadsquare_accessory": [
-        "pickup_roofbasketlight_quadsquare_halogen",
-        "pickup_roofbasketlight_quadsquare_LED",
-        "pickup_roofbasketlight_quadsquare_grille",
-        "pickup_roofbasketlight_quadsquare_mesh",
-        "pickup_roofbasketlight_quadsquare_cover",
-        "pickup_roofbasketlight_quadsquare_cover_beamng",
-        "pickup_roofbasketlight_quadsquare_cover_tims",
-        "pickup_roofbasketlight_quadsquare_cover_beamngmono",
-    ],
-    "tire_R_15x9": [
-        "tire_R_245_50_15_race",
-        "tire_R_26.5_8.5_15_race",
-        "tire_R_245_40_15_race",
-        "tire_R_245_50_15_sport",
-        "tire_R_255_55_15_sport",
-        "tire_R_255_60_15_sport",
-        "tire_R_31_12_15_offroad",
-        "tire_R_29_10_15_offroad",
-        "tire_R_255_70_15_standard",
-    ],
-    "etk_DSE_drivemodes_ttSport_default": [
-        "etk_DSE_drivemodes_ttSport_default_ttSport_plus",
-        "etk_DSE_drivemodes_ttSport_default_2WD",
-        "etk_DSE_drivemodes_ttSport_default_off",
-        "etk_DSE_drivemodes_ttSport_default_comfort",
-        "etk_DSE_drivemodes_ttSport_default_ttSport",
-    ],
-    "pickup_enginemounts": [
-        "pickup_enginemounts",
-        "pickup_enginemounts_heavy",
-        "pickup_enginemounts_ultra",
-    ],
-    "tire_F_10x6": [
-        "tire_F_165_70_10_race",
-        "tire_F_20_8_10_mud",
-        "tire_F_165_70_10_standard",
-    ],
-    "tire_R_17x8_altb": [
-        "tire_R_225_45_17_altb_race",
-        "tire_R_225_40_17_altb_race",
-        "tire_R_225_40_17_altb_drift",
-        "tire_R_225_45_17_altb_sport",
-        "tire_R_225_50_17_altb_sport",
-        "tire_R_225_70_17_altb_standard",
-        "tire_R_225_50_17_altb_standard",
-    ],
-    "pickup_muffler_sport_tip": [
-        "pickup_muffler_sport_tip_c",
-        "pickup_muffler_sport_tip_a",
-        "pickup_muffler_sport_tip_b",
-    ],
-    "pickup_pushbumper_F": ["pickup_pushbumper_F"],
-    "skin_roundlights": [
-        "roundlights_skin_beamng",
-        "roundlights_skin_beamngmono",
-        "roundlights_skin_blank",
-        "roundlights_skin_tims",
-    ],
-    "pickup_exhaust_v8_diesel": [
-        "pickup_exhaust_v8_diesel",
-        "pickup_exhaust_v8_diesel_race",
-    ],
-    "wheel_R_3": [
-        "pigeon_wheel_02b_R",
-        "pigeon_wheel_02a_R",
-        "wigeon_wheel_01a_R",
-        "pigeon_wheel_01b_R",
-        "pigeon_wheel_01a_R",
-        "wheel_39c_altb_R",
-        "wheel_39b_altb_R",
-        "wheel_39a_altb_R",
-    ],
-    "tire_R_10x4.5": ["tire_R_145_80_10_standard"],
-    "tire_R_26x9": ["tire_R_305_30_26_sport", "tire_R_255_30_26_sport"],
-    "pickup_shock_F": [
-        "pickup_shock_F_lifted",
-        "pickup_shock_F_medium",
-        "pickup_shock_F",
-        "pickup_shock_F_heavy",
-        "pickup_shock_F_offroad",
-    ],
-    "skin_squarelights": [
-        "squarelights_skin_beamngmono",
-        "squarelights_skin_blank",
-        "squarelights_skin_tims",
-        "squarelights_skin_beamng",
-    ],
-    "pickup_steering_SFA": ["pickup_steering_SFA", "pickup_steering_SFA_offroad"],
-    "bogie_tire_F": ["bogie_tire_F"],
-    "sunburst_flywheel": [
-        "sunburst_flywheel",
-        "sunburst_flywheel_race",
-        "sunburst_flywheel_light",
-    ],
-    "bogie_tire_R": ["bogie_tire_R"],
-    "tire_F_10x4.5_3w": ["tire_F_145_80_10_standard_3w"],
-    "pickup_suspension_F": [
-        "pickup_IFS",
-        "pickup_beamaxle_F",
-        "pickup_4link",
-        "pickup_SFA",
-        "pickup_IFS_offroad",
-    ],
-    "pickup_coilover_IFS": [
-        "pickup_coilover_IFS_base",
-        "pickup_coilover_IFS_lifted",
-        "pickup_coilover_IFS_sport",
-        "pickup_coilover_IFS_race",
-        "pickup_coilover_IFS_medium",
-        "pickup_coilover_IFS",
-        "pickup_coilover_IFS_heavy",
-    ],
-    "pickup_differential_F": [
-        "pickup_differential_F_LSD",
-        "pickup_differential_F_welded",
-        "pickup_differential_F_locking",
-        "pickup_differential_F",
-    ],
-    "tire_F_10x6_3w": [
-        "tire_F_165_70_10_race_3w",
-        "tire_F_20_8_10_mud_3w",
-        "tire_F_165_70_10_standard_3w",
-    ],
-    "pickup_swaybar_F": ["pickup_swaybar_F", "pickup_swaybar_F_sport"],
-    "pickup_steering": [
-        "pickup_steering_sport",
-        "pickup_steering_drift",
-        "pickup_steering",
-    ],
-    "tire_F_15x6_alt": [
-        "tire_F_175_70_15_alt_rally",
-        "tire_F_195_65_15_alt_rally",
-        "tire_F_195_55_15_alt_sport",
-        "tire_F_800_15_alt_ww",
-        "tire_F_800_15_alt_thinww",
-        "tire_F_800_15_alt_redline",
-        "tire_F_800_15_alt_mixed",
-        "tire_F_800_15_alt",
-        "tire_F_27_7_15_alt_offroad",
-        "tire_F_185_60_15_alt_standard",
-        "tire_F_195_70_15_alt_standard",
-        "tire_F_35_115_15_alt_sand",
-        "tire_F_35_115_15_alt_offroad",
-    ],
-    "pickup_coilover_4link_F": [
-        "pickup_coilover_4link_F_lifted",
-        "pickup_coilover_4link_F_heavy",
-        "pickup_coilover_4link_F",
-        "pickup_coilover_4link_F_offroad",
-    ],
-    "pickup_steering_4link": ["pickup_steering_4link"],
-    "pickup_swaybar_F_SFA": [
-        "pickup_swaybar_F_SFA_heavy",
-        "pickup_swaybar_F_SFA_offroad",
-        "pickup_swaybar_F_SFA",
-    ],
-    "sunburst_ABS_nop": ["sunburst_ABS_legacy"],
-    "trailer_feet": ["trailer_feet"],
-    "tire_F_20x8": ["tire_F_245_45_20_sport"],
-    "sunburst_enginemounts": [
-        "sunburst_enginemounts_heavy",
-        "sunburst_enginemounts",
-        "sunburst_enginemounts_ultra",
-    ],
-    "sunburst_oilpan": ["sunburst_oilpan", "sunburst_oilpan_race"],
-    "sunburst_engine_ecu": [
-        "sunburst_engine_ecu_sport",
-        "sunburst_engine_ecu_race",
-        "sunburst_engine_ecu",
-    ],
-    "tire_R_15x6_alt": [
-        "tire_R_175_70_15_alt_rally",
-        "tire_R_195_65_15_alt_rally",
-        "tire_R_195_55_15_alt_sport",
-        "tire_R_800_15_alt_thinww",
-        "tire_R_800_15_alt_mixed",
-        "tire_R_800_15_alt_redline",
-        "tire_R_800_15_alt",
-        "tire_R_800_15_alt_ww",
-        "tire_R_27_7_15_alt_offroad",
-        "tire_R_185_60_15_alt_standard",
-        "tire_R_195_70_15_alt_standard",
-        "tire_R_35_115_15_alt_sand",
-        "tire_R_35_115_15_alt_offroad",
-    ],
-    "sunburst_engine_internals": [
-        "sunburst_engine_internals",
-        "sunburst_engine_internals_ultra",
-        "sunburst_engine_internals_stage1",
-        "sunburst_engine_internals_stage2",
-        "sunburst_engine_internals_heavy",
-    ],
-    "pickup_power_steering": ["pickup_power_steering"],
-    "tire_R_18x8_alt": [
-        "tire_R_235_40_18_alt_race",
-        "tire_R_225_40_18_alt_race",
-        "tire_R_235_40_18_alt_tarmac",
-        "tire_R_225_40_18_alt_sport",
-        "tire_R_235_40_18_alt_sport",
-        "tire_R_235_50_18_alt_standard",
-        "tire_R_235_55_18_alt_standard",
-    ],
-    "pickup_suspension_R": [
-        "pickup_axle_R",
-        "pickup_axle_R_4link",
-        "pickup_axle_R_heavy",
-    ],
-    "wheel_F_8": [
-        "wheel_square_01a_large_F",
-        "steelwheel_03c_17x9_F",
-        "steelwheel_03b_17x9_F",
-        "steelwheel_03d_17x9_F",
-        "steelwheel_03a_17x9_F",
-        "wheel_28b_16x7_8_F",
-        "wheel_41a_16x7_8_F",
-        "wheel_41b_16x7_8_F",
-        "wheel_28a_16x7_8_F",
-    ],
-    "pickup_spring_R": [
-        "roamer_spring_R",
-        "pickup_spring_R_lifted",
-        "roamer_spring_R_lifted",
-        "pickup_spring_R_medium",
-        "pickup_spring_R_sport",
-        "pickup_spring_R_base",
-        "pickup_spring_R",
-        "pickup_spring_R_ultra",
-        "pickup_spring_R_heavy",
-        "pickup_spring_R_super",
-        "pickup_spring_R_super_lifted",
-        "pickup_spring_R_offroad",
-    ],
-    "pickup_shock_R": [
-        "pickup_shock_R_lifted",
-        "pickup_shock_R_medium",
-        "pickup_shock_R_sport",
-        "pickup_shock_R",
-        "pickup_shock_R_heavy",
-        "pickup_shock_R_super",
-        "pickup_shock_R_offroad",
-    ],
-    "pickup_swaybar_R": [
-        "pickup_swaybar_R",
-        "pickup_swaybar_R_heavy",
-        "pickup_swaybar_R_sport",
-        "pickup_swaybar_R_offroad",
-    ],
-    "pickup_differential_R": [
-        "pickup_differential_R",
-        "pickup_differential_R_LSD",
-        "pickup_differential_R_heavy_LSD",
-        "pickup_differential_R_welded",
-        "pickup_differential_R_locking",
-    ],
-    "tire_F_14x7": [
-        "tire_F_185_60_14_race",
-        "tire_F_195_75_14_sport",
-        "tire_F_195_65_14_sport",
-        "tire_F_185_60_14_sport",
-        "tire_F_E70_14",
-        "tire_F_E70_14_thinww",
-        "tire_F_E70_14_redline",
-        "tire_F_185_60_14_standard",
-        "tire_F_195_70_14_standard_ww",
-        "tire_F_195_70_14_standard",
-    ],
-    "tire_F_14x7_altc": ["tire_F_165_70_14_standard_ww"],
-    "tire_R_19x9_alt": ["tire_R_245_35_19_alt_race", "tire_R_245_35_19_alt_sport"],
-    "trailer_sparetireholder": ["trailer_sparetireholder"],
-    "trailer_sparetire": ["trailer_sparetire"],
-    "wheel_R_8": [
-        "wheel_square_01a_large_R",
-        "steelwheel_03b_17x9_R",
-        "steelwheel_03d_17x9_R",
-        "steelwheel_03c_17x9_R",
-        "steelwheel_03a_17x9_R",
-        "wheel_41a_16x7_8_R",
-        "wheel_41b_16x7_8_R",
-        "wheel_28a_16x7_8_R",
-        "wheel_28b_16x7_8_R",
-    ],
-    "tire_F_14x5.5": [
-        "tire_F_185_70_14_eco",
-        "tire_F_165_70_14_rally",
-        "tire_F_175_65_14_sport",
-        "tire_F_185_70_14_sport",
-        "tire_F_175_65_14_standard",
-        "tire_F_185_75_14_standard",
-        "tire_F_185_75_14_standard_ww",
-        "tire_F_185_70_14_standard",
-    ],
-    "sunburst_trunk": ["sunburst_trunk"],
-    "tire_F_15x7": [
-        "tire_F_195_50_15_race",
-        "tire_F_205_65_15_rally",
-        "tire_F_205_60_15_sport",
-        "tire_F_195_60_15_sport",
-        "tire_F_215_65_15_sport",
-        "tire_F_205_50_15_sport",
-        "tire_F_E70_15",
-        "tire_F_E70_15_thinww",
-        "tire_F_E70_15_redline",
-        "tire_F_F78_15",
-        "tire_F_F78_15_thinww",
-        "tire_F_28_8_15_offroad",
-        "tire_F_205_75_15_offroad",
-        "tire_F_205_60_15_standard",
-        "tire_F_205_75_15_standard",
-        "tire_F_205_75_15_standard_ww",
-        "tire_F_225_75_15_standard",
-        "tire_F_195_60_15_standard",
-    ],
-    "sunburst_taillight_R": ["sunburst_taillight_R"],
-    "sunburst_fueltank": ["sunburst_fueltank"],
-    "sunburst_steering": [
-        "sunburst_steering_race",
-        "sunburst_steering_rally",
-        "sunburst_steering",
-        "sunburst_steering_drift",
-    ],
-    "sunburst_headlight_L": ["sunburst_headlight_L"],
-    "sunburst_brake_R": [
-        "sunburst_brake_R_sport_S",
-        "sunburst_brake_R_race",
-        "sunburst_brake_R_rally",
-        "sunburst_brake_R_sport_RS",
-        "sunburst_brake_R",
-    ],
-    "sunburst_rallylights": ["sunburst_rallylights"],
-    "sunburst_headlight_R": ["sunburst_headlight_R"],
-    "wheel_R_5": [
-        "wheel_square_01a_small_R",
-        "wheel_07a_20x11_R",
-        "wheel_33a_15x7_R",
-        "wheel_33a_15x8_R",
-        "wheel_33a_15x9_R",
-        "wheel_33b_15x7_R",
-        "wheel_33b_15x8_R",
-        "wheel_33b_15x9_R",
-        "wheel_34a_19x8_R",
-        "wheel_34a_19x9_R",
-        "wheel_34a_19x10_R",
-        "wheel_34a_19x11_R",
-        "wheel_34a_18x8_R",
-        "wheel_34a_18x9_R",
-        "wheel_34a_18x10_R",
-        "wheel_34a_17x8_R",
-        "wheel_34a_17x9_R",
-        "wheel_34b_19x8_R",
-        "wheel_34b_19x9_R",
-        "wheel_34b_19x10_R",
-        "wheel_34b_19x11_R",
-        "wheel_34b_18x8_R",
-        "wheel_34b_18x9_R",
-        "wheel_22b_14x7_R",
-        "wheel_34b_18x10_R",
-        "wheel_24a_14x7_R",
-        "wheel_34b_17x8_R",
-        "wheel_34b_17x9_R",
-        "wheel_24b_14x7_R",
-        "wheel_39a_15x7_R",
-        "wheel_03a_14x7_R_alt",
-        "wheel_03b_14x7_R_alt",
-        "wheel_39c_15x7_R",
-        "wheel_03d_14x7_R_alt",
-        "wheel_03a_15x7_R_alt",
-        "wheel_39c_15x8_R",
-        "wheel_39a_15x9_R",
-        "wheel_03c_15x7_R_alt",
-        "wheel_39b_15x9_R",
-        "wheel_39c_15x9_R",
-        "wheel_39a_15x11_R",
-        "wheel_03b_15x7_R_altb",
-        "wheel_03c_15x7_R_altb",
-        "wheel_39b_15x11_R",
-        "wheel_03d_15x7_R_altb",
-        "wheel_39c_15x11_R",
-        "wheel_03a_15x8_R_alt",
-        "wheel_39a_16x8_R",
-        "wheel_39b_16x8_R",
-        "wheel_39c_16x8_R",
-        "wheel_39a_17x8_R",
-        "wheel_03a_16x8_R",
-        "wheel_39b_17x8_R",
-        "wheel_39c_17x8_R",
-        "wheel_03b_16x8_R",
-        "wheel_39a_17x9_R",
-        "wheel_03c_16x8_R",
-        "wheel_39b_17x9_R",
-        "wheel_39c_17x9_R",
-        "wheel_39a_18x10_R",
-        "wheel_15b_14x7_R_alt",
-        "wheel_39b_18x10_R",
-        "wheel_15a_15x7_R_alt",
-        "wheel_39c_18x10_R",
-        "wheel_40a_18x8_R",
-        "wheel_15a_15x7_R_altb",
-        "wheel_40a_18x9_R",
-        "wheel_15b_15x7_R_altb",
-        "wheel_15a_15x8_R",
-        "wheel_40a_17x9_R",
-        "wheel_40b_18x8_R",
-        "wheel_15b_15x8_R",
-        "wheel_40b_18x9_R",
-        "wheel_15a_16x8_R",
-        "wheel_40b_17x8_R",
-        "wheel_15b_16x8_R",
-        "wheel_04a_15x8_R",
-        "wheel_40c_18x9_R",
-        "wheel_04a_15x9_R",
-        "wheel_40c_17x9_R",
-        "wheel_14a_14x7_R",
-        "wheel_42a_22x9_R",
-        "wheel_14b_14x7_R",
-        "wheel_42a_24x9_R",
-        "wheel_14a_14x8_R",
-        "wheel_42b_22x9_R",
-        "wheel_42b_24x9_R",
-        "wheel_14b_14x8_R",
-        "wheel_42c_22x9_R",
-        "wheel_14a_15x8_R",
-        "wheel_42c_24x9_R",
-        "wheel_14b_15x8_R",
-        "wheel_43a_18x12_R",
-        "wheel_14a_15x9_R",
-        "wheel_14b_15x9_R",
-        "wheel_09a_15x7_R",
-        "wheel_09a_15x8_R",
-        "wheel_09a_15x9_R",
-        "wheel_43b_15x12_R",
-        "wheel_09a_15x10_R",
-        "wheel_09a_15x12_R",
-        "wheel_09a_15x14_R",
-        "wheel_13a_15x7_R",
-        "wheel_13a_15x9_R",
-        "wheel_02a_16x8_R",
-        "wheel_02b_16x8_R",
-        "wheel_11a_16x8_R",
-        "wheel_11b_16x8_R",
-        "wheel_11a_17x8_R",
-        "wheel_11b_17x8_R",
-        "wheel_11a_17x9_R",
-        "wheel_11b_17x9_R",
-        "wheel_11a_18x8_R",
-        "wheel_11b_18x8_R",
-        "wheel_11a_18x9_R",
-        "wheel_11b_18x9_R",
-        "wheel_11a_18x10_R",
-        "wheel_11b_18x10_R",
-        "wheel_43a_15x12_R",
-        "wheel_02a_18x10_R",
-        "wheel_43b_18x12_R",
-        "wheel_42c_26x9_R",
-        "wheel_42b_26x9_R",
-        "wheel_02b_18x10_R",
-        "wheel_42a_26x9_R",
-        "wheel_02a_18x10_R_alt",
-        "wheel_40c_17x8_R",
-        "wheel_02b_18x10_R_alt",
-        "wheel_40c_18x8_R",
-        "wheel_07a_17x8_R",
-        "wheel_40b_17x9_R",
-        "wheel_07a_17x9_R",
-        "wheel_40a_17x8_R",
-        "wheel_07a_17x10_R",
-        "wheel_22a_14x7_R",
-        "wheel_03b_15x8_R_alt",
-        "wheel_15a_14x7_R_alt",
-        "wheel_07a_17x12_R",
-        "wheel_03d_15x8_R_alt",
-        "wheel_15b_15x7_R_alt",
-        "wheel_39a_15x8_R",
-        "wheel_07a_18x9_R",
-        "wheel_03d_16x8_R",
-        "wheel_07a_18x10_R",
-        "wheel_03c_15x8_R_alt",
-        "wheel_07a_19x9_R",
-        "wheel_39b_15x7_R",
-        "wheel_03a_15x7_R_altb",
-        "wheel_03d_15x7_R_alt",
-        "wheel_07a_19x10_R",
-        "wheel_03b_15x7_R_alt",
-        "wheel_39b_15x8_R",
-        "wheel_03c_14x7_R_alt",
-        "etk_wheel_04a_19x10_R",
-        "etk_wheel_08a_19x10_R",
-        "etk_wheel_01a_18x9_R",
-        "etk_wheel_10a_19x10",
-        "etk_wheel_03a_18x9_R",
-        "etk_wheel_02a_18x9_R",
-        "etk_wheel_06a_18x9_R",
-        "etk_wheel_05a_17x8_R",
-        "etk_wheel_06b_18x9_R",
-        "etk_wheel_10b_19x10",
-        "etk_wheel_06a_19x9_R",
-        "wheel_rennspecht_01b_19x10_R",
-        "etk_wheel_06b_19x9_R",
-        "wheel_19b_15x7_R",
-        "etk_wheel_09a_19x9_R",
-        "wheel_21a_15x7_R",
-        "etk_wheel_09b_19x9_R",
-        "wheel_21b_15x7_R",
-        "etk_wheel_04a_19x9_R",
-        "wheel_21a_15x8_R",
-        "etk_wheel_08a_19x9_R",
-        "wheel_21b_15x8_R",
-        "etk_wheel_06a_19x10_R",
-        "etk_wheel_07a_16x7_R",
-        "etk_wheel_06b_19x10_R",
-        "wheel_19a_15x7_R",
-        "etk_wheel_09a_19x10_R",
-        "etk_wheel_07a_16x8_R",
-        "etk_wheel_09b_19x10_R",
-        "wheel_rennspecht_01a_19x10_R",
-        "steelwheel_01a_14x5.5_R_alt",
-        "offroadwheel_03d_15x8_R_alt",
-        "offroadwheel_03a_15x9_R_alt",
-        "steelwheel_01a_15x8_R",
-        "offroadwheel_03b_15x9_R_alt",
-        "steelwheel_03a_14x6_R",
-        "offroadwheel_03c_15x9_R_alt",
-        "offroadwheel_03d_15x9_R_alt",
-        "steelwheel_03b_14x6_R",
-        "steelwheel_01a_15x7_R_alt",
-        "steelwheel_03c_14x6_R",
-        "steelwheel_01a_15x11_R",
-        "steelwheel_03a_15x7_R",
-        "steelwheel_01a_17x8_R",
-        "steelwheel_03b_15x7_R",
-        "steelwheel_03c_15x7_R",
-        "steelwheel_03a_15x6_R",
-        "steelwheel_03b_15x6_R",
-        "steelwheel_03c_15x6_R",
-        "steelwheel_03a_15x9_R",
-        "steelwheel_03b_15x9_R",
-        "steelwheel_03c_15x9_R",
-        "steelwheel_09a_14x7_R",
-        "steelwheel_09a_15x7_R",
-        "steelwheel_13a_15x7_R",
-        "steelwheel_13b_15x7_R",
-        "steelwheel_14a_15x7_R",
-        "steelwheel_08a_14x7_R",
-        "steelwheel_08a_15x8_R",
-        "steelwheel_08a_15x9_R",
-        "steelwheel_05a_15x8_R",
-        "steelwheel_05a_15x9_R",
-        "offroadwheel_03a_15x8_R_alt",
-        "offroadwheel_03b_15x8_R_alt",
-        "steelwheel_01a_15x7_R",
-        "offroadwheel_03c_15x8_R_alt",
-        "wheel_27a_15x6_R",
-        "wheel_dreid_c70_19x11_R",
-        "wheel_dreid_c70_19x12_R",
-        "wheel_26a_15x6_R",
-        "wheel_26b_15x6_R",
-        "wheel_26a_15x7_R",
-        "wheel_26b_15x7_R",
-        "wheel_17a_15x6_R_alt",
-        "wheel_17b_15x6_R_alt",
-        "wheel_17c_15x6_R_alt",
-        "wheel_17d_15x6_R_alt",
-        "wheel_17a_15x7_R_alt",
-        "wheel_17b_15x7_R_alt",
-        "wheel_17c_15x7_R_alt",
-        "wheel_17d_15x7_R_alt",
-        "wheel_17a_15x8_R_alt",
-        "wheel_17a_16x8_R",
-        "wheel_17b_15x8_R_alt",
-        "wheel_17b_16x8_R",
-        "wheel_17c_15x8_R_alt",
-        "wheel_17c_16x8_R",
-        "wheel_17d_15x8_R_alt",
-        "wheel_17d_16x8_R",
-        "wheel_26a_16x8_R",
-        "wheel_26b_16x8_R",
-        "wheel_26b_17x8_R",
-        "wheel_26a_17x8_R",
-        "wheel_dreid_c70_18x9_R",
-        "wheel_dreid_c70_18x10_R",
-        "wheel_dreid_c70_18x11_R",
-        "wheel_dreid_c70_19x9_R",
-        "wheel_27a_15x7_R",
-        "wheel_dreid_c70_19x10_R",
-        "wheel_06b_17x8_R",
-        "wheel_06c_17x9_R",
-        "wheel_06c_17x8_R",
-        "wheel_25a_16x7_5_R",
-        "wheel_06a_17x9_R",
-        "wheel_25b_16x7_5_R",
-        "wheel_06a_17x8_R",
-        "wheel_06b_17x9_R",
-        "ibishu_wheel_04a_16x7_R",
-        "ibishu_wheel_03a_15x7_R",
-        "ibishu_wheel_05a_15x7_R",
-        "ibishu_wheel_02a_15x7_R",
-        "ibishu_wheel_07a_15x7_R",
-        "ibishu_wheel_07b_15x7_R",
-        "ibishu_wheel_09b_17x7_R",
-        "ibishu_wheel_09a_17x7_R",
-        "ibishu_wheel_01a_15x7_R",
-        "wheel_23a_20x11_R",
-        "wheel_23b_20x9_R",
-        "wheel_23b_20x11_R",
-        "wheel_23c_20x9_R",
-        "wheel_23c_20x11_R",
-        "wheel_20a_16x8_R",
-        "wheel_20b_16x8_R",
-        "wheel_20c_16x8_R",
-        "wheel_20a_17x8_R",
-        "wheel_20b_17x8_R",
-        "wheel_20c_17x8_R",
-        "wheel_20a_17x9_R",
-        "wheel_20b_17x9_R",
-        "wheel_20c_17x9_R",
-        "wheel_18a_16x8_R",
-        "wheel_18b_16x8_R",
-        "wheel_18c_16x8_R",
-        "wheel_18d_16x8_R",
-        "wheel_18e_16x8_R",
-        "wheel_23b_16x8_R",
-        "wheel_05a_17x7_R",
-        "wheel_23c_16x8_R",
-        "wheel_18e_17x9_R",
-        "wheel_23a_17x8_R",
-        "wheel_18d_17x9_R",
-        "wheel_23b_17x8_R",
-        "wheel_18c_17x9_R",
-        "wheel_23c_17x8_R",
-        "wheel_18b_17x9_R",
-        "wheel_23a_17x9_R",
-        "wheel_18a_17x9_R",
-        "wheel_23b_17x9_R",
-        "wheel_18e_17x8_R",
-        "wheel_23c_17x9_R",
-        "wheel_18d_17x8_R",
-        "wheel_23a_19x9_R",
-        "wheel_18c_17x8_R",
-        "wheel_23b_19x9_R",
-        "wheel_18b_17x8_R",
-        "wheel_23c_19x9_R",
-        "wheel_18a_17x8_R",
-        "wheel_23a_20x9_R",
-        "wheel_23a_16x8_R",
-        "wheel_36c_16x8_R",
-        "wheel_38b_15x7_R",
-        "wheel_37a_15x7_R",
-        "wheel_38a_15x7_R",
-        "wheel_36a_16x8_R",
-        "wheel_37b_15x7_R",
-        "wheel_36b_16x8_R",
-        "super_wheel_15x10_R",
-        "wheel_08c_15x12_R",
-        "wheel_civetta_forgiato_20x11_R",
-        "wheel_08a_15x9_R",
-        "wheel_civetta_scintilla_20x11_R",
-        "wheel_08b_15x9_R",
-        "wheel_civetta_velocita_b_20x11_R",
-        "wheel_08c_15x9_R",
-        "wheel_civetta_fuoco_20x11_R",
-        "wheel_08a_15x12_R",
-        "wheel_civetta_velocita_a_20x11_R",
-        "wheel_civetta_stradale_22x14_R",
-        "wheel_civetta_darkowl_22x14_R",
-        "super_wheel_15x8_R",
-        "wheel_08b_15x12_R",
-        "hirochi_wheel_05a_18x8_R",
-        "hirochi_wheel_05a_18x11_R",
-        "hirochi_wheel_03a_18x11_R",
-        "hirochi_wheel_04a_19x8_R",
-        "hirochi_wheel_04a_19x11_R",
-        "hirochi_wheel_06a_19x8_R",
-        "hirochi_wheel_06b_19x8_R",
-        "hirochi_wheel_06a_19x11_R",
-        "hirochi_wheel_07a_18x11_R",
-        "hirochi_wheel_06b_19x11_R",
-        "hirochi_wheel_07a_18x8_R",
-        "hirochi_wheel_07b_18x11_R",
-        "hirochi_wheel_07b_18x8_R",
-        "hirochi_wheel_01a_17x7_R",
-        "hirochi_wheel_01a_17x9_R",
-        "hirochi_wheel_02a_16x7_R",
-        "hirochi_wheel_03a_18x8_R",
-        "offroadwheel_07a_17x9_R",
-        "faser_offroadwheel_01b_17x9_R",
-        "offroadwheel_07a_17x7_R",
-        "faser_offroadwheel_01a_17x7_R",
-        "faser_offroadwheel_01b_17x7_R",
-        "offroadwheel_08a_15x6_R",
-        "faser_offroadwheel_01c_17x7_R",
-        "faser_offroadwheel_01a_15x6_R",
-        "faser_offroadwheel_01b_15x6_R",
-        "faser_offroadwheel_01c_17x9_R",
-        "faser_offroadwheel_01c_15x6_R",
-        "faser_offroadwheel_01a_17x9_R",
-        "steelwheel_16a_16x7_R",
-        "cherrier_wheel_02b_19x9_R",
-        "cherrier_wheel_04b_18x8_R",
-        "cherrier_wheel_01a_17x7_R",
-        "cherrier_wheel_03a_17x7_R",
-        "cherrier_wheel_02a_19x9_R",
-        "cherrier_wheel_03b_17x7_R",
-        "cherrier_wheel_04a_18x8_R",
-        "autobello_wheel_03_15x8_R",
-        "autobello_wheel_03_15x6_R",
-        "steelwheel_15b_15x9_R",
-        "steelwheel_15a_15x7_R",
-        "steelwheel_15c_15x9_R",
-        "steelwheel_15b_15x7_R",
-        "steelwheel_15a_15x10_R",
-        "steelwheel_15c_15x7_R",
-        "steelwheel_15b_15x10_R",
-        "steelwheel_15a_15x6_R",
-        "steelwheel_15c_15x10_R",
-        "steelwheel_15b_15x6_R",
-        "steelwheel_15a_14x6_R",
-        "steelwheel_15c_15x6_R",
-        "steelwheel_15b_14x6_R",
-        "steelwheel_15a_15x9_R",
-        "steelwheel_15c_14x6_R",
-        "bruckell_wheel_02a_20x9_R",
-        "bruckell_wheel_02b_20x9_R",
-        "bruckell_wheel_03a_20x8_R",
-        "bruckell_wheel_03a_20x9_R",
-        "bruckell_wheel_02b_18x8_R",
-        "bruckell_wheel_04b_20x11_R",
-        "bruckell_wheel_02a_20x8_R",
-        "bruckell_wheel_04a_20x11_R",
-        "bruckell_wheel_02a_18x8_R",
-        "bruckell_wheel_01a_17x8_R",
-        "bruckell_wheel_02b_20x8_R",
-    ],
-    "sunburst_licenseplate_F": [
-        "sunburst_licenseplate_F",
-        "sunburst_licenseplate_F_EU",
-    ],
-    "sunburst_transmission": [
-        "sunburst_transmission_6M_race",
-        "sunburst_transmission_6M_SQ",
-        "sunburst_transmission_6DCT",
-        "sunburst_transmission_6DCT_race",
-        "sunburst_transmission_CVT",
-        "sunburst_transmission_6M",
-    ],
-    "pickup_links_R_4link": ["pickup_links_R_4link_offroad", "pickup_links_R_4link"],
-    "trimring_R_15x7": ["trimring_02a_15x7_R", "trimring_01a_15x7_R"],
-    "pickup_transmission": [
-        "pickup_transmission_6M_race",
-        "pickup_transmission_3A_race",
-        "pickup_transmission_6A",
-        "pickup_transmission_6A_Diesel",
-        "pickup_transmission_4A_drag",
-        "pickup_transmission_5M",
-        "pickup_transmission_5M_diesel",
-        "pickup_transmission_4A",
-    ],
-    "sunburst_engine": ["sunburst_engine_2.0", "sunburst_engine_1.8"],
-    "pickup_transfer_case": [
-        "pickup_transfer_case_4WD",
-        "pickup_transfer_case_RWD",
-        "pickup_transfer_case_AWD",
-        "pickup_transfer_case_4WD_offroad",
-        "pickup_transfer_case_4WD_race",
-    ],
-    "sunburst_strut_bar": ["sunburst_strut_bar"],
-    "wheel_F_5": [
-        "wheel_square_01a_small_F",
-        "wheel_40c_17x8_F",
-        "wheel_11a_17x9_F",
-        "wheel_40c_17x9_F",
-        "wheel_11b_17x9_F",
-        "wheel_40c_18x8_F",
-        "wheel_11a_18x8_F",
-        "wheel_40c_18x9_F",
-        "wheel_11b_18x8_F",
-        "wheel_11a_18x9_F",
-        "wheel_42a_24x9_F",
-        "wheel_42a_26x9_F",
-        "wheel_42b_22x9_F",
-        "wheel_11b_18x9_F",
-        "wheel_42b_24x9_F",
-        "wheel_11a_18x10_F",
-        "wheel_42c_22x9_F",
-        "wheel_42c_24x9_F",
-        "wheel_11b_18x10_F",
-        "wheel_43a_18x5_F",
-        "wheel_02a_18x10_F",
-        "wheel_43b_18x5_F",
-        "wheel_02b_18x10_F",
-        "wheel_43a_15x4_F",
-        "wheel_02a_18x10_F_alt",
-        "wheel_43b_15x4_F",
-        "wheel_02b_18x10_F_alt",
-        "wheel_07a_17x8_F",
-        "wheel_07a_17x9_F",
-        "wheel_07a_17x10_F",
-        "wheel_22a_14x7_F",
-        "wheel_07a_18x9_F",
-        "wheel_07a_18x10_F",
-        "wheel_22b_14x7_F",
-        "wheel_07a_19x9_F",
-        "wheel_24a_14x7_F",
-        "wheel_07a_19x10_F",
-        "wheel_24b_14x7_F",
-        "wheel_03a_14x7_F_alt",
-        "wheel_07a_20x11_F",
-        "wheel_03b_14x7_F_alt",
-        "wheel_03c_14x7_F_alt",
-        "wheel_03d_14x7_F_alt",
-        "wheel_33a_15x8_F",
-        "wheel_03a_15x7_F_alt",
-        "wheel_33a_15x9_F",
-        "wheel_33b_15x7_F",
-        "wheel_03b_15x7_F_alt",
-        "wheel_33b_15x8_F",
-        "wheel_03c_15x7_F_alt",
-        "wheel_33b_15x9_F",
-        "wheel_03d_15x7_F_alt",
-        "wheel_34a_19x9_F",
-        "wheel_03a_15x7_F_altb",
-        "wheel_34a_19x8_F",
-        "wheel_03b_15x7_F_altb",
-        "wheel_34a_19x10_F",
-        "wheel_34a_19x11_F",
-        "wheel_03a_15x8_F_alt",
-        "wheel_34a_18x8_F",
-        "wheel_03b_15x8_F_alt",
-        "wheel_34a_18x9_F",
-        "wheel_03c_15x8_F_alt",
-        "wheel_34a_18x10_F",
-        "wheel_03d_15x8_F_alt",
-        "wheel_34a_17x8_F",
-        "wheel_03a_16x8_F",
-        "wheel_34a_17x9_F",
-        "wheel_34b_19x9_F",
-        "wheel_03b_16x8_F",
-        "wheel_34b_19x8_F",
-        "wheel_03c_16x8_F",
-        "wheel_34b_19x10_F",
-        "wheel_03d_16x8_F",
-        "wheel_34b_19x11_F",
-        "wheel_15a_14x7_F_alt",
-        "wheel_34b_18x8_F",
-        "wheel_15b_14x7_F_alt",
-        "wheel_34b_18x9_F",
-        "wheel_15a_15x7_F_alt",
-        "wheel_34b_18x10_F",
-        "wheel_15b_15x7_F_alt",
-        "wheel_34b_17x9_F",
-        "wheel_39a_15x7_F",
-        "wheel_15b_15x7_F_altb",
-        "wheel_15a_15x8_F",
-        "wheel_39c_15x7_F",
-        "wheel_15b_15x8_F",
-        "wheel_39a_15x8_F",
-        "wheel_15a_16x8_F",
-        "wheel_39b_15x8_F",
-        "wheel_15b_16x8_F",
-        "wheel_04a_15x8_F",
-        "wheel_04a_15x9_F",
-        "wheel_39c_15x9_F",
-        "wheel_14a_14x7_F",
-        "wheel_39a_15x11_F",
-        "wheel_14b_14x7_F",
-        "wheel_39b_15x11_F",
-        "wheel_14a_14x8_F",
-        "wheel_39c_15x11_F",
-        "wheel_39a_16x8_F",
-        "wheel_39b_16x8_F",
-        "wheel_39c_16x8_F",
-        "wheel_39a_17x8_F",
-        "wheel_14b_15x9_F",
-        "wheel_39b_17x8_F",
-        "wheel_09a_15x4_F",
-        "wheel_39c_17x8_F",
-        "wheel_39a_17x9_F",
-        "wheel_09a_15x7_F",
-        "wheel_39b_17x9_F",
-        "wheel_09a_15x8_F",
-        "wheel_39c_17x9_F",
-        "wheel_09a_15x9_F",
-        "wheel_42c_26x9_F",
-        "wheel_39a_18x10_F",
-        "wheel_09a_15x10_F",
-        "wheel_42b_26x9_F",
-        "wheel_39b_18x10_F",
-        "wheel_42a_22x9_F",
-        "wheel_39a_15x9_F",
-        "wheel_39c_18x10_F",
-        "wheel_34b_17x8_F",
-        "wheel_14a_15x9_F",
-        "wheel_40a_17x8_F",
-        "wheel_13a_15x9_F",
-        "wheel_03c_15x7_F_altb",
-        "wheel_03d_15x7_F_altb",
-        "wheel_40a_17x9_F",
-        "wheel_02a_16x8_F",
-        "wheel_39b_15x9_F",
-        "wheel_40a_18x8_F",
-        "wheel_14a_15x8_F",
-        "wheel_15a_15x7_F_altb",
-        "wheel_02b_16x8_F",
-        "wheel_40a_18x9_F",
-        "wheel_33a_15x7_F",
-        "wheel_11a_16x8_F",
-        "wheel_40b_17x8_F",
-        "wheel_13a_15x7_F",
-        "wheel_11b_16x8_F",
-        "wheel_40b_17x9_F",
-        "wheel_14b_15x8_F",
-        "wheel_11a_17x8_F",
-        "wheel_40b_18x8_F",
-        "wheel_14b_14x8_F",
-        "wheel_39c_15x8_F",
-        "wheel_40b_18x9_F",
-        "wheel_11b_17x8_F",
-        "wheel_39b_15x7_F",
-        "etk_wheel_06a_19x10_F",
-        "wheel_19b_15x7_F",
-        "etk_wheel_06b_19x10_F",
-        "wheel_21a_15x7_F",
-        "etk_wheel_03a_18x9_F",
-        "etk_wheel_09a_19x10_F",
-        "wheel_21b_15x7_F",
-        "etk_wheel_06a_18x9_F",
-        "etk_wheel_09b_19x10_F",
-        "wheel_21a_15x8_F",
-        "etk_wheel_06b_18x9_F",
-        "etk_wheel_04a_19x10_F",
-        "wheel_21b_15x8_F",
-        "etk_wheel_06a_19x9_F",
-        "etk_wheel_08a_19x10_F",
-        "etk_wheel_07a_16x7_F",
-        "etk_wheel_06b_19x9_F",
-        "etk_wheel_01a_18x9_F",
-        "etk_wheel_10b_19x9_F",
-        "etk_wheel_09a_19x9_F",
-        "wheel_19a_15x7_F",
-        "etk_wheel_02a_18x9_F",
-        "etk_wheel_09b_19x9_F",
-        "wheel_rennspecht_01a_19x9_F",
-        "etk_wheel_05a_17x8_F",
-        "etk_wheel_04a_19x9_F",
-        "wheel_rennspecht_01b_19x9_F",
-        "etk_wheel_07a_16x8_F",
-        "etk_wheel_08a_19x9_F",
-        "etk_wheel_10a_19x9_F",
-        "steelwheel_09a_15x7_F",
-        "steelwheel_13a_15x7_F",
-        "steelwheel_13b_15x7_F",
-        "steelwheel_01a_14x5.5_F_alt",
-        "steelwheel_08a_14x7_F",
-        "steelwheel_01a_15x8_F",
-        "steelwheel_08a_15x8_F",
-        "steelwheel_03a_14x6_F",
-        "steelwheel_08a_15x9_F",
-        "steelwheel_01a_15x7_F",
-        "steelwheel_05a_15x8_F",
-        "steelwheel_03b_14x6_F",
-        "steelwheel_05a_15x9_F",
-        "steelwheel_03c_14x6_F",
-        "offroadwheel_03a_15x8_F_alt",
-        "steelwheel_03a_15x7_F",
-        "offroadwheel_03b_15x8_F_alt",
-        "steelwheel_03b_15x7_F",
-        "steelwheel_03c_15x7_F",
-        "steelwheel_03a_15x6_F",
-        "offroadwheel_03b_15x9_F_alt",
-        "steelwheel_03b_15x6_F",
-        "offroadwheel_03c_15x9_F_alt",
-        "offroadwheel_03d_15x9_F_alt",
-        "steelwheel_03a_15x9_F",
-        "steelwheel_01a_15x7_F_alt",
-        "steelwheel_01a_17x8_F",
-        "steelwheel_01a_15x11_F",
-        "steelwheel_03b_15x9_F",
-        "offroadwheel_03a_15x9_F_alt",
-        "steelwheel_14a_15x7_F",
-        "steelwheel_03c_15x9_F",
-        "steelwheel_03c_15x6_F",
-        "offroadwheel_03c_15x8_F_alt",
-        "steelwheel_09a_14x7_F",
-        "offroadwheel_03d_15x8_F_alt",
-        "wheel_17a_15x8_F_alt",
-        "wheel_17a_16x8_F",
-        "wheel_17b_15x8_F_alt",
-        "wheel_17b_16x8_F",
-        "wheel_17c_15x8_F_alt",
-        "wheel_17c_16x8_F",
-        "wheel_27a_15x7_F",
-        "wheel_17d_16x8_F",
-        "wheel_27a_15x6_F",
-        "wheel_26a_16x8_F",
-        "wheel_26a_17x8_F",
-        "wheel_26b_16x8_F",
-        "wheel_26a_15x7_F",
-        "wheel_26b_15x7_F",
-        "wheel_17a_15x7_F_alt",
-        "wheel_dreid_c70_18x11_F",
-        "wheel_17c_15x7_F_alt",
-        "wheel_dreid_c70_19x9_F",
-        "wheel_17d_15x7_F_alt",
-        "wheel_dreid_c70_19x10_F",
-        "wheel_dreid_c70_19x12_F",
-        "wheel_17a_15x6_F_alt",
-        "wheel_dreid_c70_19x11_F",
-        "wheel_26b_15x6_F",
-        "wheel_17b_15x6_F_alt",
-        "wheel_17b_15x7_F_alt",
-        "wheel_26a_15x6_F",
-        "wheel_17c_15x6_F_alt",
-        "wheel_17d_15x8_F_alt",
-        "wheel_dreid_c70_18x10_F",
-        "wheel_17d_15x6_F_alt",
-        "wheel_dreid_c70_18x9_F",
-        "wheel_26b_17x8_F",
-        "wheel_06a_17x8_F",
-        "wheel_06a_17x9_F",
-        "wheel_25a_16x7_5_F",
-        "wheel_06b_17x8_F",
-        "wheel_25b_16x7_5_F",
-        "wheel_06b_17x9_F",
-        "wheel_06c_17x8_F",
-        "wheel_06c_17x9_F",
-        "ibishu_wheel_04a_16x7_F",
-        "ibishu_wheel_03a_15x7_F",
-        "ibishu_wheel_09a_17x7_F",
-        "ibishu_wheel_05a_15x7_F",
-        "ibishu_wheel_02a_15x7_F",
-        "ibishu_wheel_09b_17x7_F",
-        "ibishu_wheel_07a_15x7_F",
-        "ibishu_wheel_01a_15x7_F",
-        "ibishu_wheel_07b_15x7_F",
-        "wheel_23a_19x9_F",
-        "wheel_18e_16x8_F",
-        "wheel_23b_19x9_F",
-        "wheel_18a_17x8_F",
-        "wheel_23c_19x9_F",
-        "wheel_18b_17x8_F",
-        "wheel_23a_20x9_F",
-        "wheel_18c_17x8_F",
-        "wheel_18d_17x8_F",
-        "wheel_23a_20x11_F",
-        "wheel_18e_17x8_F",
-        "wheel_23b_20x9_F",
-        "wheel_18a_17x9_F",
-        "wheel_23b_20x11_F",
-        "wheel_18b_17x9_F",
-        "wheel_23c_20x9_F",
-        "wheel_18c_17x9_F",
-        "wheel_23c_20x11_F",
-        "wheel_18d_17x9_F",
-        "wheel_20a_16x8_F",
-        "wheel_18e_17x9_F",
-        "wheel_20b_16x8_F",
-        "wheel_05a_17x7_F",
-        "wheel_20c_16x8_F",
-        "wheel_23a_16x8_F",
-        "wheel_20a_17x8_F",
-        "wheel_23b_16x8_F",
-        "wheel_20b_17x8_F",
-        "wheel_23c_16x8_F",
-        "wheel_20c_17x8_F",
-        "wheel_23a_17x8_F",
-        "wheel_20a_17x9_F",
-        "wheel_20b_17x9_F",
-        "wheel_20c_17x9_F",
-        "wheel_23c_17x8_F",
-        "wheel_18a_16x8_F",
-        "wheel_23a_17x9_F",
-        "wheel_18b_16x8_F",
-        "wheel_23b_17x9_F",
-        "wheel_18c_16x8_F",
-        "wheel_23c_17x9_F",
-        "wheel_18d_16x8_F",
-        "wheel_23b_17x8_F",
-        "wheel_37a_15x7_F",
-        "wheel_38b_15x7_F",
-        "wheel_36b_16x8_F",
-        "wheel_37b_15x7_F",
-        "wheel_36c_16x8_F",
-        "wheel_38a_15x7_F",
-        "wheel_36a_16x8_F",
-        "wheel_civetta_darkowl_22x12_F",
-        "wheel_08c_15x9_F",
-        "wheel_civetta_velocita_a_20x9_F",
-        "super_wheel_15x8_F",
-        "super_wheel_15x10_F",
-        "wheel_civetta_fuoco_20x9_F",
-        "wheel_civetta_forgiato_20x9_F",
-        "wheel_civetta_stradale_22x12_F",
-        "wheel_civetta_velocita_b_20x9_F",
-        "wheel_civetta_scintilla_20x9_F",
-        "wheel_08b_15x9_F",
-        "wheel_08a_15x9_F",
-        "hirochi_wheel_01a_17x7_F",
-        "hirochi_wheel_01a_17x9_F",
-        "hirochi_wheel_02a_16x7_F",
-        "hirochi_wheel_07a_18x8_F",
-        "hirochi_wheel_03a_18x8_F",
-        "hirochi_wheel_07b_18x8_F",
-        "hirochi_wheel_05a_18x8_F",
-        "hirochi_wheel_07a_18x11_F",
-        "hirochi_wheel_03a_18x11_F",
-        "hirochi_wheel_07b_18x11_F",
-        "hirochi_wheel_04a_19x8_F",
-        "hirochi_wheel_04a_19x11_F",
-        "hirochi_wheel_06a_19x11_F",
-        "hirochi_wheel_06a_19x8_F",
-        "hirochi_wheel_06b_19x11_F",
-        "hirochi_wheel_05a_18x11_F",
-        "hirochi_wheel_06b_19x8_F",
-        "faser_offroadwheel_01a_17x9_F",
-        "faser_offroadwheel_01b_17x9_F",
-        "faser_offroadwheel_01c_17x9_F",
-        "faser_offroadwheel_01a_17x7_F",
-        "faser_offroadwheel_01a_15x6_F",
-        "faser_offroadwheel_01b_17x7_F",
-        "faser_offroadwheel_01b_15x6_F",
-        "offroadwheel_07a_17x9_F",
-        "faser_offroadwheel_01c_17x7_F",
-        "faser_offroadwheel_01c_15x6_F",
-        "offroadwheel_07a_17x7_F",
-        "offroadwheel_08a_15x6_F",
-        "cherrier_wheel_04b_18x8_F",
-        "cherrier_wheel_02a_19x9_F",
-        "steelwheel_16a_16x7_F",
-        "cherrier_wheel_01a_17x7_F",
-        "cherrier_wheel_03b_17x7_F",
-        "cherrier_wheel_03a_17x7_F",
-        "cherrier_wheel_02b_19x9_F",
-        "cherrier_wheel_04a_18x8_F",
-        "autobello_wheel_03_15x8_F",
-        "autobello_wheel_03_15x6_F",
-        "steelwheel_15a_15x10_F",
-        "steelwheel_15b_15x6_F",
-        "steelwheel_15c_14x6_F",
-        "steelwheel_15c_15x6_F",
-        "steelwheel_15a_15x7_F",
-        "steelwheel_15c_15x10_F",
-        "steelwheel_15a_15x9_F",
-        "steelwheel_15b_15x7_F",
-        "steelwheel_15b_15x10_F",
-        "steelwheel_15b_15x9_F",
-        "steelwheel_15c_15x7_F",
-        "steelwheel_15a_14x6_F",
-        "steelwheel_15c_15x9_F",
-        "steelwheel_15a_15x6_F",
-        "steelwheel_15b_14x6_F",
-        "bruckell_wheel_02a_18x8_F",
-        "bruckell_wheel_02b_20x9_F",
-        "bruckell_wheel_02b_18x8_F",
-        "bruckell_wheel_03a_20x8_F",
-        "bruckell_wheel_02a_20x8_F",
-        "bruckell_wheel_03a_20x9_F",
-        "bruckell_wheel_02a_20x9_F",
-        "bruckell_wheel_04a_20x11_F",
-        "bruckell_wheel_02b_20x8_F",
-        "bruckell_wheel_01a_17x8_F",
-        "bruckell_wheel_04b_20x11_F",
-    ],
-    "trimring_F_15x9": ["trimring_01a_15x9_F", "trimring_02a_15x9_F"],
-    "sunburst_seat_FL": ["sunburst_race_seat_FL", "sunburst_seat_FL"],
-    "sunburst_lettering_trunk": [
-        "sunburst_lettering_sport",
-        "sunburst_lettering_base",
-        "sunburst_lettering_sport_S",
-        "sunburst_lettering_sport_RS",
-    ],
-    "trimring_R_15x9": ["trimring_01a_15x9_R", "trimring_02a_15x9_R"],
-    "wheel_F_8_alt": [
-        "wheel_square_01a_large_F_heavy",
-        "steelwheel_04a_16x7_F",
-        "wheel_32a_16x7_F",
-    ],
-    "pickup_engine": [
-        "pickup_engine_i6_4.1",
-        "pickup_engine_v8_4.5",
-        "pickup_engine_v8_5.5",
-        "pickup_engine_v8_6.9",
-        "pickup_engine_v8_6.0_diesel",
-    ],
-    "sunburst_door_RL": ["sunburst_door_RL", "sunburst_door_RL_wide"],
-    "wheel_R_8_dually": [
-        "wheel_square_01a_large_R_heavy",
-        "steelwheel_04a_16x7_R_dually_true",
-        "wheel_32a_16x7_R_dually_true",
-    ],
-    "trimring_F_16x7": ["trimring_02a_16x7_F"],
-    "trimring_R_16x7": ["trimring_02a_16x7_R"],
-    "sunburst_taillight_L": ["sunburst_taillight_L"],
-    "sunburst_rollcage": ["sunburst_partition", "sunburst_rollcage"],
-    "sunburst_fender_R": ["sunburst_fender_R", "sunburst_fender_R_wide"],
-    "hubcap_F_14": [
-        "hubcap_01a_F_14",
-        "hubcap_06a_14_F",
-        "hubcap_08a_14_F",
-        "hubcap_07a_14_F",
-        "ibishu_hubcap_03a_14_F",
-        "ibishu_hubcap_04a_14_F",
-        "ibishu_hubcap_05a_14_F",
-        "ibishu_hubcap_02a_14_F",
-        "bruckell_hubcap_03a_14_F",
-        "bruckell_hubcap_01b_14_F",
-        "bruckell_hubcap_04a_14_F",
-        "bruckell_hubcap_02a_14_F",
-    ],
-    "sunburst_fender_L": ["sunburst_fender_L", "sunburst_fender_L_wide"],
-    "sunburst_differential_F": [
-        "sunburst_differential_F_welded",
-        "sunburst_differential_F_LSD",
-        "sunburst_differential_F_race",
-        "sunburst_differential_F",
-    ],
-    "hubcap_R_14": [
-        "hubcap_01a_R_14",
-        "hubcap_06a_14_R",
-        "hubcap_08a_14_R",
-        "hubcap_07a_14_R",
-        "ibishu_hubcap_02a_14_R",
-        "ibishu_hubcap_03a_14_R",
-        "ibishu_hubcap_04a_14_R",
-        "ibishu_hubcap_05a_14_R",
-        "bruckell_hubcap_02a_14_R",
-        "bruckell_hubcap_03a_14_R",
-        "bruckell_hubcap_04a_14_R",
-        "bruckell_hubcap_01b_14_R",
-    ],
-    "sunburst_mirror_R": ["sunburst_mirror_R"],
-    "sunburst_radio": ["sunburst_radio_1", "sunburst_radio_2"],
-    "pickup_flywheel": [
-        "pickup_flywheel_race",
-        "pickup_flywheel",
-        "pickup_flywheel_heavy",
-        "pickup_flywheel_light",
-    ],
-    "hubcap_R_15": [
-        "hubcap_01a_R_15",
-        "hubcap_06a_15_R",
-        "hubcap_07a_15_R",
-        "hubcap_08a_15_R",
-        "ibishu_hubcap_01a_15_R",
-        "ibishu_hubcap_03a_15_R",
-        "ibishu_hubcap_05a_15_R",
-        "hirochi_hubcap_01a_15_R",
-    ],
-    "sunburst_swaybar_R": [
-        "sunburst_swaybar_R",
-        "sunburst_swaybar_R_sport",
-        "sunburst_swaybar_R_sport_RS",
-        "sunburst_swaybar_R_race",
-    ],
-    "hubcap_F_15_altb": [
-        "hubcap_01a_F_altb",
-        "hubcap_02a_15_F",
-        "hubcap_03a_15_F",
-        "hubcap_05a_15_F_altb",
-        "gavril_hubcap_01a_15_F",
-    ],
-    "sunburst_brake_F": [
-        "sunburst_brake_F_sport_RS",
-        "sunburst_brake_F_rally",
-        "sunburst_brake_F_sport_S",
-        "sunburst_brake_F_race",
-        "sunburst_brake_F",
-    ],
-    "hubcap_R_15_altb": [
-        "hubcap_01a_R_altb",
-        "gavril_hubcap_01a_15_R",
-        "hubcap_02a_15_R",
-        "hubcap_03a_15_R",
-        "hubcap_05a_15_R_altb",
-    ],
-    "sunburst_suspension_F": ["sunburst_suspension_F"],
-    "sunburst_spoiler": [
-        "sunburst_bigwing_01a",
-        "sunburst_bigwing_02a",
-        "sunburst_bigwing_03a",
-        "sunburst_spoiler_sport",
-        "sunburst_spoiler_race",
-    ],
-    "hubcap_R_16": [
-        "hubcap_01a_R_16",
-        "hubcap_09c_R_alt",
-        "hubcap_10c_R_alt",
-        "hubcap_09c_R_altd",
-        "hubcap_10c_R_altd",
-        "hubcap_05a_16_R",
-    ],
-    "sunburst_door_FR": ["sunburst_door_FR"],
-    "hubcap_F_15_altc": ["hubcap_01a_F_altc"],
-    "sunburst_seats_R": ["sunburst_seats_R"],
-    "hubcap_R_15_altc": ["hubcap_01a_R_altc"],
-    "tire_R_16x7": [
-        "tire_R_215_45_16_race",
-        "tire_R_205_50_16_race",
-        "tire_R_205_55_16_sport",
-        "tire_R_205_50_16_sport",
-        "tire_R_215_65_16_standard",
-        "tire_R_205_55_16_standard",
-        "tire_R_225_75_16_standard",
-    ],
-    "hubcap_F_15_alt": [
-        "hubcap_01a_F_alt",
-        "hubcap_09a_F_alt",
-        "hubcap_10a_F_alt",
-        "hubcap_09b_F_alt",
-        "hubcap_10b_F_alt",
-        "hubcap_02a_15_F_alt",
-        "hubcap_03a_15_F_alt",
-        "hubcap_08a_15_F_alt",
-        "hubcap_06a_15_F_alt",
-        "hubcap_07a_15_F_alt",
-        "hubcap_05a_15_F_alt",
-        "soliad_hubcap_02a_15_F",
-        "soliad_hubcap_01a_15_F",
-        "bruckell_hubcap_01a_15_F",
-    ],
-    "sunburst_intake": [
-        "sunburst_turbo_stage2",
-        "sunburst_turbo_stage1",
-        "sunburst_turbo_stage3",
-        "sunburst_intake",
-        "sunburst_intake_sport",
-    ],
-    "hubcap_R_15_alt": [
-        "hubcap_01a_R_alt",
-        "hubcap_09a_R_alt",
-        "hubcap_10a_R_alt",
-        "hubcap_09b_R_alt",
-        "hubcap_10b_R_alt",
-        "hubcap_05a_15_R_alt",
-        "hubcap_02a_15_R_alt",
-        "hubcap_03a_15_R_alt",
-        "hubcap_08a_15_R_alt",
-        "hubcap_06a_15_R_alt",
-        "hubcap_07a_15_R_alt",
-        "soliad_hubcap_02a_15_R",
-        "soliad_hubcap_01a_15_R",
-        "bruckell_hubcap_01a_15_R",
-    ],
-    "sunburst_door_FL": ["sunburst_door_FL"],
-    "sunburst_door_RR": ["sunburst_door_RR", "sunburst_door_RR_wide"],
-    "tire_F_16x7": [
-        "tire_F_205_50_16_race",
-        "tire_F_215_45_16_race",
-        "tire_F_205_55_16_sport",
-        "tire_F_205_50_16_sport",
-        "tire_F_205_55_16_standard",
-        "tire_F_215_65_16_standard",
-        "tire_F_225_75_16_standard",
-    ],
-    "sunburst_strut_F": [
-        "sunburst_strut_F_rally",
-        "sunburst_strut_F",
-        "sunburst_strut_F_sport_RS",
-        "sunburst_strut_F_race",
-        "sunburst_strut_F_sport_S",
-    ],
-    "sunburst_bumper_F": [
-        "sunburst_bumper_F_wide",
-        "sunburst_bumper_F",
-        "sunburst_bumper_F_kit",
-        "sunburst_tubularbumper_F",
-    ],
-    "sunburst_wheeldata_F": ["sunburst_wheeldata_F"],
-    "sunburst_ESC": ["sunburst_ESC"],
-    "sunburst_exhaust_I4": [
-        "sunburst_exhaust_I4",
-        "sunburst_exhaust_I4_RS",
-        "sunburst_exhaust_race",
-    ],
-    "sunburst_lightbar": [
-        "sunburst_beaconlight_blue",
-        "sunburst_lightbar_b",
-        "sunburst_modern_lightbar",
-        "sunburst_roofbars",
-    ],
-    "sunburst_sideskirt": [
-        "sunburst_sideskirt",
-        "sunburst_sideskirt_kit",
-        "sunburst_sideskirt_wide",
-    ],
-    "sunburst_bumper_R": [
-        "sunburst_bumper_R_kit",
-        "sunburst_bumper_R",
-        "sunburst_bumper_R_wide",
-        "sunburst_bumper_R_kit_alt",
-    ],
-    "sunburst_suspension_R": ["sunburst_suspension_R"],
-    "brakepad_F": [
-        "brakepad_F_race",
-        "brakepad_F_premium",
-        "brakepad_F_semi_race",
-        "brakepad_F",
-        "brakepad_F_sport",
-    ],
-    "brakepad_R": [
-        "brakepad_R_premium",
-        "brakepad_R_race",
-        "brakepad_R_semi_race",
-        "brakepad_R",
-        "brakepad_R_sport",
-    ],
-    "hubcap_R_15_altd": [
-        "hubcap_09a_R_altd",
-        "hubcap_10a_R_altd",
-        "hubcap_09b_R_altd",
-        "hubcap_10b_R_altd",
-    ],
-    "soundscape_handbrake": [
-        "soundscape_ratchet_handbrake_1",
-        "soundscape_handbrake1",
-        "soundscape_handbrake2",
-        "soundscape_handbrake3",
-        "soundscape_handbrake4",
-        "soundscape_handbrake5",
-        "soundscape_handbrake6",
-        "soundscape_handbrake7",
-        "soundscape_handbrake8",
-        "soundscape_handbrake10",
-        "soundscape_handbrake9",
-        "soundscape_handbrake17",
-    ],
-    "alder_hubcap_F_15": ["alder_hubcap_01a_F", "alder_hubcap_01b_F"],
-    "alder_hubcap_R_15": ["alder_hubcap_01a_R", "alder_hubcap_01b_R"],
-    "tire_F_15x8_alt": [
-        "tire_F_26_8_15_alt_drag",
-        "tire_F_225_45_15_alt_race",
-        "tire_F_225_50_15_alt_race",
-        "tire_F_26_8_15_alt_race",
-        "tire_F_225_50_15_alt_rally",
-        "tire_F_225_50_15_alt_sport",
-        "tire_F_235_55_15_alt_sport",
-        "tire_F_235_60_15_alt_sport",
-        "tire_F_225_70_15_alt_offroad",
-        "tire_F_27_10_15_alt_offroad",
-        "tire_F_235_75_15_alt_standard",
-    ],
-    "sunburst_mudflap_FR": ["sunburst_mudflap_FR"],
-    "tire_F_13x5": [
-        "tire_F_165_70_13_sport",
-        "tire_F_560_13",
-        "tire_F_560_13_thinww",
-        "tire_F_560_13_mixed",
-        "tire_F_560_13_ww",
-        "tire_F_560_13_redline",
-        "tire_F_175_70_13_offroad",
-        "tire_F_175_80_13_offroad",
-        "tire_F_175_70_13_standard",
-        "tire_F_155_13_standard",
-        "tire_F_165_70_13_old",
-        "tire_F_165_70_13_standard",
-    ],
-    "sunburst_mudflap_FL": ["sunburst_mudflap_FL"],
-    "skin_couch": ["couch_skin_coush", "couch_skin_stripes", "couch_skin_pattern"],
-    "pickup_engine_v8_diesel_ecu": [
-        "pickup_engine_v8_diesel_ecu",
-        "pickup_engine_v8_diesel_ecu_race",
-    ],
-    "pickup_engine_v8_diesel_internals": [
-        "pickup_engine_v8_diesel_internals",
-        "pickup_engine_v8_diesel_internals_heavy",
-        "pickup_engine_v8_diesel_internals_ultra",
-        "pickup_engine_v8_diesel_internals_stage1",
-        "pickup_engine_v8_diesel_internals_stage2",
-        "pickup_engine_v8_diesel_internals_stage3",
-    ],
-    "tire_F_14x7_alt": [
-        "tire_F_185_60_14_alt_race",
-        "tire_F_195_75_14_alt_sport",
-        "tire_F_185_60_14_alt_sport",
-        "tire_F_195_65_14_alt_sport",
-        "tire_F_E70_14_alt",
-        "tire_F_E70_14_alt_thinww",
-        "tire_F_E70_14_alt_redline",
-        "tire_F_185_60_14_alt_standard",
-        "tire_F_195_70_14_alt_standard",
-        "tire_F_195_70_14_alt_standard_ww",
-    ],
-    "tire_F_13x5.5": ["tire_F_185_60_13_sport", "tire_F_165_13_standard"],
-    "tire_F_14x8_alt": [
-        "tire_F_215_60_14_alt_race",
-        "tire_F_205_55_14_alt_race",
-        "tire_F_225_60_14_alt_sport",
-        "tire_F_205_55_14_alt_sport",
-        "tire_F_215_70_14_alt_sport",
-    ],
-    "tire_F_13x7": [
-        "tire_F_24.5_8_13_drag",
-        "tire_F_195_60_13_race",
-        "tire_F_195_60_13_sport",
-    ],
-    "hubcap_F_16_alt": ["hubcap_10b_F_alte", "hubcap_10a_F_alte"],
-    "tire_R_14x5.5": [
-        "tire_R_185_70_14_eco",
-        "tire_R_165_70_14_rally",
-        "tire_R_185_70_14_sport",
-        "tire_R_175_65_14_sport",
-        "tire_R_175_65_14_standard",
-        "tire_R_185_70_14_standard",
-        "tire_R_185_75_14_standard_ww",
-        "tire_R_185_75_14_standard",
-    ],
-    "hubcap_R_16_alt": ["hubcap_10a_R_alte", "hubcap_10b_R_alte"],
-    "hubcap_F_17": [
-        "hubcap_10c_F_altg",
-        "hubcap_09c_F_altg",
-        "hubcap_10c_F_altf",
-        "hubcap_09c_F_altf",
-    ],
-    "tire_R_14x6": [
-        "tire_R_175_65_14_sport_2",
-        "tire_R_695_14",
-        "tire_R_695_14_thinww",
-        "tire_R_695_14_ww",
-        "tire_R_695_14_redline",
-        "tire_R_695_14_mixed",
-        "tire_R_735_14_thinww",
-        "tire_R_735_14",
-        "tire_R_735_14_mixed",
-        "tire_R_735_14_ww",
-        "tire_R_735_14_redline",
-        "tire_R_175_65_14_standard_2",
-    ],
-    "hubcap_R_17": [
-        "hubcap_10c_R_altf",
-        "hubcap_09c_R_altg",
-        "hubcap_10c_R_altg",
-        "hubcap_09c_R_altf",
-    ],
-    "tire_F_14x8": [
-        "tire_F_205_55_14_race",
-        "tire_F_215_60_14_race",
-        "tire_F_225_60_14_sport",
-        "tire_F_205_55_14_sport",
-        "tire_F_215_70_14_sport",
-    ],
-    "pickup_bullbar_accessory": [
-        "pickup_bullbar_squarelights",
-        "pickup_bullbar_roundlights",
-    ],
-    "pickup_bullbarlight_round_accessory": [
-        "pickup_bullbarlight_round_cover_beamng",
-        "pickup_bullbarlight_round_cover_beamngmono",
-        "pickup_bullbarlight_round_cover_tims",
-        "pickup_bullbarlight_round_halogen",
-        "pickup_bullbarlight_round_LED",
-        "pickup_bullbarlight_round_grille",
-        "pickup_bullbarlight_round_mesh",
-        "pickup_bullbarlight_round_cover",
-        "pickup_bullbarlight_round_cover_yellow",
-    ],
-    "tire_F_15x4": ["tire_F_26_4_15_drag", "tire_F_27.5_4_15_drag"],
-    "pickup_coilover_IFS_offroad": ["pickup_coilover_IFS_offroad"],
-    "pickup_swaybar_F_offroad": ["pickup_swaybar_F_offroad"],
-    "pickup_steering_offroad": ["pickup_steering_offroad"],
-    "hubcap_F_10_3w": ["hubcap_01a_F_10_3w"],
-    "soundscape_indicator": [
-        "soundscape_indicator9",
-        "soundscape_indicator1",
-        "soundscape_indicator2",
-        "soundscape_indicator3",
-        "soundscape_indicator4",
-        "soundscape_indicator5",
-        "soundscape_indicator6",
-        "soundscape_indicator7",
-        "soundscape_indicator8",
-    ],
-    "sunburst_police_radar": ["sunburst_dash_radar"],
-    "hubcap_R_10": ["hubcap_01a_R_10"],
-    "sunburst_police_laptop": ["sunburst_dash_laptop"],
-    "tire_F_15x10": [
-        "tire_F_285_40_15_race",
-        "tire_F_27_10_15_race",
-        "tire_F_285_40_15_sport",
-        "tire_F_275_50_15_sport",
-    ],
-    "hubcap_R_13": [
-        "hubcap_05a_13_R",
-        "hubcap_02a_13_R",
-        "hubcap_04a_13_R",
-        "ibishu_hubcap_02a_13_R",
-        "ibishu_hubcap_03a_13_R",
-        "ibishu_hubcap_04a_13_R",
-        "ibishu_hubcap_05a_13_R",
-        "autobello_hubcap_01a_13_R",
-    ],
-    "pickup_bullbarlight_square_accessory": [
-        "pickup_bullbarlight_square_LED",
-        "pickup_bullbarlight_square_mesh",
-        "pickup_bullbarlight_square_halogen",
-        "pickup_bullbarlight_square_cover",
-        "pickup_bullbarlight_square_cover_beamng",
-        "pickup_bullbarlight_square_cover_tims",
-        "pickup_bullbarlight_square_cover_beamngmono",
-        "pickup_bullbarlight_square_grille",
-    ],
-    "sunburst_lip_FR": ["sunburst_bigsplitter_01a_R"],
-    "van_ambulance_reardoors": ["van_ambulance_reardoors"],
-    "van_ambulance_sidedoor": ["van_ambulance_sidedoor"],
-    "van_ambulance_cabinetdoors": ["van_ambulance_cabinetdoors"],
-    "van_ambulance_bumper_R": ["van_ambulance_bumper_R"],
-    "van_ambulance_taillight": ["van_ambulance_taillight"],
-    "van_ambulance_stretcher": ["van_ambulance_stretcher"],
-    "soundscape_siren": [
-        "soundscape_siren_17",
-        "soundscape_siren_18",
-        "soundscape_siren_21",
-        "soundscape_siren_19",
-        "soundscape_siren_20",
-        "soundscape_siren_22",
-        "soundscape_siren_23",
-        "soundscape_siren_25",
-        "soundscape_siren_26",
-        "soundscape_siren_27",
-        "soundscape_siren_28",
-        "soundscape_siren_1",
-        "soundscape_siren_2",
-        "soundscape_siren_3",
-        "soundscape_siren_4",
-        "soundscape_siren_5",
-        "soundscape_siren_7",
-        "soundscape_siren_9",
-        "soundscape_siren_6",
-        "soundscape_siren_11",
-        "soundscape_siren_12",
-        "soundscape_siren_16",
-        "soundscape_siren_13",
-        "soundscape_siren_10",
-        "soundscape_siren_24",
-        "soundscape_siren_14",
-        "soundscape_siren_15",
-        "soundscape_siren_8",
-    ],
-    "sunburst_lip_FL": ["sunburst_bigsplitter_01a_L"],
-    "tire_F_18x8": [
-        "tire_F_235_40_18_race",
-        "tire_F_225_40_18_race",
-        "tire_F_235_40_18_tarmac",
-        "tire_F_225_40_18_sport",
-        "tire_F_235_40_18_sport",
-        "tire_F_235_50_18_standard",
-        "tire_F_235_55_18_standard",
-    ],
-    "hubcap_F_14_alt": [
-        "gavril_hubcap_04a_14_F",
-        "hubcap_02a_14_F",
-        "gavril_hubcap_05a_14_F",
-        "hubcap_05a_14_F",
-        "gavril_hubcap_01a_14_F",
-    ],
-    "hubcap_R_14_alt": [
-        "gavril_hubcap_01a_14_R",
-        "gavril_hubcap_04a_14_R",
-        "hubcap_02a_14_R",
-        "gavril_hubcap_05a_14_R",
-        "hubcap_05a_14_R",
-    ],
-    "soundscape_lights": [
-        "soundscape_lights1",
-        "soundscape_lights2",
-        "soundscape_lights3",
-        "soundscape_lights4",
-        "soundscape_lights5",
-        "soundscape_lights9",
-        "soundscape_lights10",
-        "soundscape_lights11",
-        "soundscape_lights14",
-        "soundscape_lights15",
-        "soundscape_lights12",
-        "soundscape_lights7",
-    ],
-    "tire_F_18x9": [
-        "tire_F_245_40_18_tarmac",
-        "tire_F_245_40_18_race",
-        "tire_F_245_40_18_sport",
-        "tire_F_245_40_18_standard",
-    ],
-    "tire_F_18x10_alt": [
-        "tire_F_33_12_18_offroad",
-        "tire_F_35_12_18_offroad",
-        "tire_F_275_35_18_alt_race",
-        "tire_F_275_40_18_alt_race",
-        "tire_F_275_40_18_alt_sport",
-        "tire_F_255_40_18_alt_sport",
-        "tire_F_275_55_18_alt_sport",
-    ],
-    "pickup_oilpan_i6": ["pickup_oilpan_i6_race", "pickup_oilpan_i6"],
-    "pickup_intake_i6": [
-        "pickup_intake_i6_early",
-        "pickup_intake_i6",
-        "pickup_intake_i6_late",
-    ],
-    "pickup_header_i6": ["pickup_header_i6"],
-    "pickup_engine_i6_ecu": ["pickup_engine_i6_ecu_late", "pickup_engine_i6_ecu"],
-    "pickup_engine_i6_internals": ["pickup_engine_i6_internals"],
-    "tire_F_18x10": [
-        "tire_F_275_35_18_race",
-        "tire_F_275_40_18_race",
-        "tire_F_255_40_18_sport",
-        "tire_F_275_55_18_sport",
-        "tire_F_275_40_18_sport",
-    ],
-    "van_cargobox_reardoor_R": ["van_cargobox_reardoor_R"],
-    "van_cargobox_reardoor_L": ["van_cargobox_reardoor_L"],
-    "tire_F_20x9": [
-        "tire_F_275_40_20_sport",
-        "tire_F_245_30_20_sport",
-        "tire_F_245_30_20_sport_plus",
-    ],
-    "digidash_cells_top_left_widget": [
-        "digidash_cells_top_left_wheelPressure",
-        "digidash_cells_top_left_text",
-    ],
-    "soundscape_gear": [
-        "soundscape_gear1",
-        "soundscape_gear9",
-        "soundscape_gear10",
-        "soundscape_gear8",
-        "soundscape_gear7",
-        "soundscape_gear6",
-        "soundscape_gear5",
-        "soundscape_gear4",
-        "soundscape_gear3",
-        "soundscape_gear2",
-    ],
-    "tire_F_19x9": [
-        "tire_F_245_35_19_race",
-        "tire_F_245_35_19_sport_plus",
-        "tire_F_245_35_19_sport",
-    ],
-    "skin_offroad_seat_FL": [
-        "skin_offroad_seat_FL_yellow",
-        "skin_offroad_seat_FL_gray",
-        "skin_offroad_seat_FL_red",
-        "skin_offroad_seat_FL_blue",
-    ],
-    "bogie_wheel_R": ["bogie_wheel_R_alt", "bogie_wheel_R"],
-    "wheel_F_centerlug": [
-        "centerlug_wheel_01a_19x8_F",
-        "wheel_civetta_03a_16x9_F",
-        "wheel_civetta_01b_16x9_F",
-        "wheel_civetta_03a_17x10_F",
-        "wheel_civetta_01c_16x9_F",
-        "wheel_civetta_03b_16x9_F",
-        "wheel_civetta_01a_17x10_F",
-        "wheel_civetta_03b_17x10_F",
-        "wheel_civetta_01c_17x10_F",
-        "wheel_civetta_01a_16x9_F",
-        "wheel_civetta_03b_15x10_F",
-        "wheel_civetta_03a_15x8_F",
-        "wheel_civetta_03b_15x8_F",
-        "wheel_civetta_03a_15x10_F",
-    ],
-    "sunburst_fenderflare_FL": ["sunburst_fenderflare_FL"],
-    "tire_F_19x10": [
-        "tire_F_265_35_19_race",
-        "tire_F_265_35_19_sport_plus",
-        "tire_F_265_35_19_sport",
-    ],
-    "pigeon_i3_internals": [
-        "pigeon_i3_internals_heavy",
-        "pigeon_i3_internals_stage1",
-        "pigeon_i3_internals",
-    ],
-    "tire_F_18x8_alt": [
-        "tire_F_235_40_18_alt_race",
-        "tire_F_235_40_18_alt_tarmac",
-        "tire_F_225_40_18_alt_race",
-        "tire_F_235_40_18_alt_sport",
-        "tire_F_225_40_18_alt_sport",
-        "tire_F_235_55_18_alt_standard",
-        "tire_F_235_50_18_alt_standard",
-    ],
-    "skin_grp": ["skin_grp_carbon", "skin_grp_alcantara", "skin_grp_aluminium"],
-    "tire_R_18x9": [
-        "tire_R_245_40_18_tarmac",
-        "tire_R_245_40_18_race",
-        "tire_R_245_40_18_sport",
-        "tire_R_245_40_18_standard",
-    ],
-    "tire_F_20x11": [
-        "tire_F_305_35_20_race",
-        "tire_F_305_30_20_sport_plus",
-        "tire_F_305_30_20_sport",
-        "tire_F_305_35_20_sport",
-    ],
-    "pickup_oilpan_v8": ["pickup_oilpan_v8", "pickup_oilpan_v8_race"],
-    "pickup_intake_v8": [
-        "pickup_supercharger_v8_stage3",
-        "pickup_intake_v8_late",
-        "pickup_intake_v8_prefacelift",
-        "pickup_intake_v8_sport",
-        "pickup_intake_v8_race",
-        "pickup_intake_v8",
-        "pickup_supercharger_v8_stage1",
-        "pickup_supercharger_v8_stage2",
-    ],
-    "pickup_header_v8": [
-        "pickup_header_v8_derby",
-        "pickup_header_v8",
-        "pickup_header_v8_race",
-    ],
-    "n2o_bottle": ["n2o_bottle_10lb"],
-    "pickup_engine_v8_internals": [
-        "pickup_engine_v8_internals_heavy",
-        "pickup_engine_v8_internals_ultra",
-        "pickup_engine_v8_internals_stage1",
-        "pickup_engine_v8_internals_stage2",
-        "pickup_engine_v8_internals_stage3",
-        "pickup_engine_v8_internals",
-    ],
-    "skin_interior": ["sunburst_skin_interior"],
-    "n2o_shot": [
-        "n2o_shot_variable",
-        "n2o_shot_100",
-        "n2o_shot_150",
-        "n2o_shot_200",
-        "n2o_shot_50",
-    ],
-    "pickup_sparetire": [
-        "pickup_sparetire_8l",
-        "pickup_sparetire_8l_heavy",
-        "pickup_sparetire_6l",
-        "pickup_sparetire_5l",
-    ],
-    "etk_oilpan_i6": ["etk_oilpan_i6", "etk_oilpan_i6_ttSport", "etk_oilpan_i6_race"],
-    "bastion_v6_ecu": ["bastion_v6_ecu_sport", "bastion_v6_ecu_race", "bastion_v6_ecu"],
-    "hubcap_F_10": ["hubcap_01a_F_10"],
-    "licenseplate_design_2_1": [
-        "license_plate_nz_1",
-        "license_plate_jungle_rock_island_2_1",
-        "license_plate_germany_2_1",
-        "license_plate_wca_2_1",
-        "license_plate_eca_2_1",
-        "license_plate_italy_old_2_1",
-        "license_plate_gridmap_2_1",
-        "license_plate_italy_2_1",
-        "license_plate_Texas_2_1",
-        "license_plate_Utah_2_1",
-    ],
-    "wheel_F_6": [
-        "wheel_square_01a_F",
-        "steelwheel_02a_16x7_F",
-        "wheel_42b_26x9_F6",
-        "steelwheel_02b_16x7_F",
-        "wheel_42c_24x9_F6",
-        "ibishu_wheel_08a_15x7_F",
-        "wheel_42c_26x9_F6",
-        "ibishu_wheel_08b_15x7_F",
-        "offroadwheel_02a_17x9_F",
-        "ibishu_wheel_08a_15x9_F",
-        "offroadwheel_03a_15x9_F",
-        "faser_offroadwheel_02c_17x9_F",
-        "ibishu_wheel_08b_15x9_F",
-        "faser_offroadwheel_02b_17x9_F",
-        "wheel_42a_24x9_F6",
-        "faser_offroadwheel_02a_17x9_F",
-        "wheel_42b_24x9_F6",
-        "offroadwheel_03c_15x9_F",
-        "offroadwheel_03b_15x9_F",
-        "wheel_42a_26x9_F6",
-        "offroadwheel_03d_15x9_F",
-        "pickup_alloy_17x8_F",
-        "offroadwheel_01a_17x9_F",
-        "roamer_alloy_17x8_F",
-        "wheel_30b_16x7_6_F",
-        "roamer_alloy_16x7_F",
-        "wheel_28a_16x7_6_F",
-        "wheel_41b_16x7_6_F",
-        "wheel_28b_16x7_6_F",
-        "wheel_25b_17x8_F",
-        "wheel_29a_16x7_6_F",
-        "wheel_41a_16x7_6_F",
-        "wheel_25a_16x7_6_F",
-        "wheel_30a_16x7_6_F",
-        "wheel_31a_16x7_6_F",
-        "wheel_25b_16x7_6_F",
-        "wheel_30c_16x7_6_F",
-        "wheel_25a_17x8_F",
-        "pickup_alloy_16x7_F",
-        "offroadwheel_03a_17x9_F",
-        "offroadwheel_05b_17x9_F",
-        "offroadwheel_05c_17x9_F",
-        "offroadwheel_05a_17x9_F",
-        "offroadwheel_04a_F",
-    ],
-    "bogie_brake_R": ["bogie_brake_R"],
-    "sunburst_shiftlight": ["sunburst_shiftlight_single", "sunburst_shiftlight_multi"],
-    "tire_R_17x8": [
-        "tire_R_225_45_17_race",
-        "tire_R_225_40_17_race",
-        "tire_R_225_40_17_drift",
-        "tire_R_225_50_17_sport",
-        "tire_R_225_45_17_sport",
-        "tire_R_235_60_17_standard",
-        "tire_R_225_70_17_standard",
-        "tire_R_225_50_17_standard",
-    ],
-    "tire_R_13x5": [
-        "tire_R_165_70_13_sport",
-        "tire_R_560_13_ww",
-        "tire_R_560_13_redline",
-        "tire_R_560_13_mixed",
-        "tire_R_560_13",
-        "tire_R_560_13_thinww",
-        "tire_R_175_80_13_offroad",
-        "tire_R_175_70_13_offroad",
-        "tire_R_165_70_13_old",
-        "tire_R_165_70_13_standard",
-        "tire_R_175_70_13_standard",
-        "tire_R_155_13_standard",
-    ],
-    "tire_F_17x7_alt": ["tire_F_35_11_17_desert"],
-    "pigeon_brake_F_3w": ["pigeon_brake_F_3w", "pigeon_brake_F_3w_disc"],
-    "pigeon_fueltank": ["pigeon_fueltank_gasoline"],
-    "tire_F_14x6_alt": [
-        "tire_F_175_65_14_alt_sport",
-        "tire_F_735_14_alt_thinww",
-        "tire_F_695_14_alt_thinww",
-        "tire_F_735_14_alt_ww",
-        "tire_F_695_14_alt_ww",
-        "tire_F_735_14_alt_redline",
-        "tire_F_695_14_alt_redline",
-        "tire_F_735_14_alt_mixed",
-        "tire_F_695_14_alt_mixed",
-        "tire_F_695_14_alt",
-        "tire_F_735_14_alt",
-        "tire_F_175_65_14_alt_standard",
-    ],
-    "van_rollback_lightbar": [
-        "van_modern_lightbar_amber_rollback",
-        "van_rollback_lightbar_red",
-        "van_rollback_lightbar_a",
-        "van_rollback_lightbar_police",
-    ],
-    "pigeon_brake_F_4w": ["pigeon_brake_F_4w", "pigeon_brake_F_4w_disc"],
-    "tire_R_15x14": ["tire_R_31_14_15_drag"],
-    "tire_R_13x5.5": ["tire_R_185_60_13_sport", "tire_R_165_13_standard"],
-    "wheel_F_3_3w": [
-        "wwheel_39b_altb_F_3w",
-        "wwheel_39c_altb_F_3w",
-        "pigeon_wheel_02b_F_3w",
-        "pigeon_wheel_02a_F_3w",
-        "wigeon_wheel_01a_F_3w",
-        "pigeon_wheel_01b_F_3w",
-        "wwheel_39a_altb_F_3w",
-        "pigeon_wheel_01a_F_3w",
-    ],
-    "pickup_reversewarn": ["pickup_reversewarn"],
-    "pigeon_brake_R": ["pigeon_brake_R", "pigeon_brake_R_disc"],
-    "tire_R_13x7": [
-        "tire_R_195_60_13_race",
-        "tire_R_24.5_8_13_drag",
-        "tire_R_195_60_13_sport",
-    ],
-    "tire_F_15x8": [
-        "tire_F_26_8_15_drag",
-        "tire_F_225_45_15_race",
-        "tire_F_225_50_15_race",
-        "tire_F_26_8_15_race",
-        "tire_F_225_50_15_rally",
-        "tire_F_225_50_15_sport",
-        "tire_F_235_55_15_sport",
-        "tire_F_235_60_15_sport",
-        "tire_F_27_10_15_offroad",
-        "tire_F_225_70_15_offroad",
-        "tire_F_235_75_15_standard",
-    ],
-    "hubcap_F_15_altd": [
-        "hubcap_09a_F_altd",
-        "hubcap_10a_F_altd",
-        "hubcap_09b_F_altd",
-        "hubcap_10b_F_altd",
-    ],
-    "digidash_cells_top_center": [
-        "digidash_cells_top_center_gear",
-        "digidash_cells_top_center_boost",
-        "digidash_cells_top_center_engine_torque",
-        "digidash_cells_top_center_engine_power",
-        "digidash_cells_top_center_engine_consumption_current",
-        "digidash_cells_top_center_engine_consumption_average",
-        "digidash_cells_top_center_engine_range",
-        "digidash_cells_top_center_motor_torque",
-        "digidash_cells_top_center_motor_power",
-        "digidash_cells_top_center_motor_range",
-        "digidash_cells_top_center_acceleration_X",
-        "digidash_cells_top_center_acceleration_Y",
-        "digidash_cells_top_center_acceleration_Z",
-        "digidash_cells_top_center_wheelspeed",
-        "digidash_cells_top_center_airspeed",
-        "digidash_cells_top_center_waterTemp",
-        "digidash_cells_top_center_oilTemp",
-        "digidash_cells_top_center_envTemp",
-        "digidash_cells_top_center_time_OS",
-        "digidash_cells_top_center_fuelVolume",
-        "digidash_cells_top_center_lowfuel",
-        "digidash_cells_top_center_engineRunning",
-        "digidash_cells_top_center_checkengine",
-        "digidash_cells_top_center_lights",
-    ],
-    "tire_F_14x9": ["tire_F_245_45_14_race", "tire_F_245_45_14_sport"],
-    "pickup_fueltank": ["pickup_fueltank_diesel", "pickup_fueltank"],
-    "tire_F_19x11": [
-        "tire_F_295_35_19_race",
-        "tire_F_295_25_19_race",
-        "tire_F_295_25_19_sport",
-    ],
-    "pickup_wheeldata_R": ["pickup_wheeldata_R"],
-    "hubcap_F_18": ["hirochi_hubcap_01a_18_F", "hirochi_hubcap_01b_18_F"],
-    "tire_F_18x11": [
-        "tire_F_295_35_18_race",
-        "tire_F_295_30_18_race",
-        "tire_F_295_30_18_sport",
-    ],
-    "tire_F_17x8": [
-        "tire_F_225_40_17_race",
-        "tire_F_225_45_17_race",
-        "tire_F_225_40_17_drift",
-        "tire_F_225_45_17_sport",
-        "tire_F_225_50_17_sport",
-        "tire_F_235_60_17_standard",
-        "tire_F_225_70_17_standard",
-        "tire_F_225_50_17_standard",
-    ],
-    "pickup_roofracklight_round_accessory": [
-        "pickup_roofracklight_round_LED",
-        "pickup_roofracklight_round_grille",
-        "pickup_roofracklight_round_mesh",
-        "pickup_roofracklight_round_cover",
-        "pickup_roofracklight_round_cover_yellow",
-        "pickup_roofracklight_round_cover_beamng",
-        "pickup_roofracklight_round_cover_beamngmono",
-        "pickup_roofracklight_round_cover_tims",
-        "pickup_roofracklight_round_halogen",
-    ],
-    "etk_oilpan_i4": ["etk_oilpan_i4", "etk_oilpan_i4_race"],
-    "tire_R_14x8": [
-        "tire_R_205_55_14_race",
-        "tire_R_215_60_14_race",
-        "tire_R_215_70_14_sport",
-        "tire_R_205_55_14_sport",
-        "tire_R_225_60_14_sport",
-    ],
-    "pigeon_finaldrive_R": [
-        "pigeon_finaldrive_R_422",
-        "pigeon_finaldrive_R_race",
-        "pigeon_finaldrive_R_456",
-        "pigeon_finaldrive_R_478",
-        "pigeon_finaldrive_R_513",
-    ],
-    "pickup_spring_F": [
-        "pickup_spring_F",
-        "pickup_spring_F_lifted",
-        "pickup_spring_F_medium",
-        "pickup_spring_F_heavy",
-        "pickup_spring_F_heavy_lifted",
-        "pickup_spring_F_offroad",
-    ],
-    "pickup_intake_v8_diesel": [
-        "pickup_intake_v8_diesel",
-        "pickup_intake_v8_diesel_stage3",
-        "pickup_intake_v8_diesel_stage2",
-        "pickup_intake_v8_diesel_prefacelift",
-        "pickup_intake_v8_diesel_late",
-        "pickup_intake_v8_diesel_stage1",
-    ],
-    "hubcap_R_18": ["hirochi_hubcap_01a_18_R", "hirochi_hubcap_01b_18_R"],
-    "pigeon_i4_transmission": [
-        "pigeon_i4_transmission_5M",
-        "pigeon_i4_transmission_5M_race",
-    ],
-    "sunburst_licenseplate_R": [
-        "sunburst_licenseplate_R",
-        "sunburst_licenseplate_R_EU",
-    ],
-    "sunburst_foglight": ["sunburst_foglight", "sunburst_foglight_filler"],
-    "tire_F_19x12": ["tire_F_345_35_19_race"],
-    "sunburst_roof": ["sunburst_roof_plain", "sunburst_roof_sun"],
-    "sunburst_mirror_L": ["sunburst_mirror_L"],
-    "sunburst_coilover_R": [
-        "sunburst_coilover_R",
-        "sunburst_coilover_R_rally",
-        "sunburst_coilover_R_sport_S",
-        "sunburst_coilover_R_sport_RS",
-        "sunburst_coilover_R_race",
-    ],
-    "sunburst_differential_R": [
-        "sunburst_differential_R_welded",
-        "sunburst_differential_R_LSD",
-        "sunburst_differential_R_race",
-        "sunburst_differential_R",
-    ],
-    "sunburst_swaybar_F": [
-        "sunburst_swaybar_F",
-        "sunburst_swaybar_F_sport_RS",
-        "sunburst_swaybar_F_race",
-        "sunburst_swaybar_F_sport",
-    ],
-    "sunburst_seat_FR": ["sunburst_race_seat_FR", "sunburst_seat_FR"],
-    "pallet_load": ["roofbars_couch", "roofbars_armchair"],
-    "wheel_R_4": [
-        "wheel_square_01a_small_R_alt",
-        "wheel_03b_15x8_R",
-        "wheel_03c_15x8_R",
-        "wheel_03d_15x8_R",
-        "wheel_15a_14x7_R",
-        "wheel_15b_14x7_R",
-        "wheel_15a_15x7_R",
-        "wheel_15b_15x7_R",
-        "wheel_13a_14x7_R",
-        "wheel_13a_14x8_R",
-        "wheel_10a_14x7_R",
-        "wheel_10b_14x7_R",
-        "wheel_10a_14x8_R",
-        "wheel_10b_14x8_R",
-        "wheel_12a_14x7_R",
-        "wheel_12a_14x8_R",
-        "wheel_12a_15x7_R",
-        "wheel_12a_15x8_R",
-        "wheel_11a_16x7_R",
-        "wheel_11b_16x7_R",
-        "hatch_wheel_R_skidplate",
-        "wheel_39a_alt_13x7_R",
-        "wheel_39b_alt_13x7_R",
-        "wheel_39c_alt_13x7_R",
-        "wheel_39a_alt_14x7_R",
-        "wheel_39b_alt_14x7_R",
-        "wheel_39c_alt_14x7_R",
-        "wheel_39a_alt_14x8_R",
-        "wheel_39b_alt_14x8_R",
-        "wheel_39c_alt_14x8_R",
-        "wheel_39a_alt_15x7_R",
-        "wheel_39b_alt_15x7_R",
-        "wheel_39c_alt_15x7_R",
-        "wheel_39a_alt_15x8_R",
-        "wheel_39b_alt_15x8_R",
-        "wheel_39c_alt_15x8_R",
-        "wheel_44a_13x7_R",
-        "wheel_44a_14x7_R",
-        "wheel_44a_14x8_R",
-        "wheel_44a_15x7_R",
-        "wheel_44b_13x7_R",
-        "wheel_44b_14x7_R",
-        "wheel_44b_14x8_R",
-        "wheel_44b_15x7_R",
-        "wheel_44c_13x7_R",
-        "wheel_44c_14x7_R",
-        "wheel_44c_14x8_R",
-        "wheel_44c_15x7_R",
-        "wheel_12a_13x5_R",
-        "wheel_10a_13x5_R",
-        "wheel_10b_13x5_R",
-        "wheel_12a_13x5.5_R",
-        "wheel_12a_13x7_R",
-        "wheel_10a_13x7_R",
-        "wheel_10b_13x7_R",
-        "wheel_03a_14x7_R",
-        "wheel_03b_14x7_R",
-        "wheel_03c_14x7_R",
-        "wheel_03d_14x7_R",
-        "wheel_03a_14x8_R",
-        "wheel_03b_14x8_R",
-        "wheel_03c_14x8_R",
-        "wheel_03d_14x8_R",
-        "wheel_03a_15x7_R",
-        "wheel_03b_15x7_R",
-        "wheel_03c_15x7_R",
-        "wheel_03d_15x7_R",
-        "wheel_03a_15x8_R",
-        "steelwheel_11a_14x8_R",
-        "steelwheel_11b_14x8_R",
-        "steelwheel_01a_13x5_R",
-        "steelwheel_01a_14x5.5_R",
-        "steelwheel_01a_13x5_R_old",
-        "steelwheel_11a_13x5_R",
-        "steelwheel_11b_13x5_R",
-        "steelwheel_11a_13x7_R",
-        "steelwheel_11b_13x7_R",
-        "wheel_27a_15x7_R_alt",
-        "wheel_27b_15x7_R_alt",
-        "wheel_17a_15x6_R",
-        "wheel_17b_15x6_R",
-        "wheel_17c_15x6_R",
-        "wheel_17d_15x6_R",
-        "wheel_17a_14x5.5_R",
-        "wheel_17d_15x8_R",
-        "wheel_17b_14x5.5_R",
-        "wheel_17d_15x7_R",
-        "wheel_17c_14x5.5_R",
-        "wheel_17d_14x8_R",
-        "wheel_17d_14x5.5_R",
-        "wheel_17d_14x7_R",
-        "wheel_17a_14x7_R",
-        "wheel_17c_15x8_R",
-        "wheel_17a_14x8_R",
-        "wheel_17c_15x7_R",
-        "wheel_17a_15x7_R",
-        "wheel_17a_15x8_R",
-        "wheel_17b_14x7_R",
-        "wheel_17c_14x8_R",
-        "wheel_17b_14x8_R",
-        "wheel_26a_14x5.5_R",
-        "wheel_17b_15x7_R",
-        "wheel_17b_15x8_R",
-        "wheel_26b_14x5.5_R",
-        "wheel_17c_14x7_R",
-        "wheel_26a_16x8_R_alt",
-        "wheel_26b_16x8_R_alt",
-        "wheel_26a_15x6_R_alt",
-        "wheel_26b_15x6_R_alt",
-        "ibishu_wheel_07a_14x7_R",
-        "ibishu_wheel_07b_14x7_R",
-        "ibishu_wheel_06a_14x7_R",
-        "ibishu_wheel_03a_15x7_alt_R",
-        "ibishu_wheel_05a_15x7_alt_R",
-        "ibishu_wheel_02a_15x7_alt_R",
-        "ibishu_wheel_07a_15x7_alt_R",
-        "ibishu_wheel_07b_15x7_alt_R",
-        "ibishu_wheel_11a_13x5_R",
-        "ibishu_steelwheel_11a_13x5_R_old",
-        "ibishu_wheel_10a_15x8_R",
-        "ibishu_wheel_10b_15x8_R",
-        "steelwheel_10a_13x5.5_R",
-        "steelwheel_10a_13x7_R",
-        "ibishu_wheel_13a_14x5.5_R",
-        "ibishu_wheel_03a_14x5.5_R",
-        "ibishu_wheel_12a_14x7_R",
-        "ibishu_wheel_10b_15x10_R",
-        "ibishu_wheel_02a_14x7_R",
-        "ibishu_wheel_10a_15x10_R",
-        "ibishu_wheel_05a_14x7_R",
-        "wheel_23a_15x8_R",
-        "wheel_23b_15x8_R",
-        "wheel_23c_15x8_R",
-        "wheel_23a_16x7_R",
-        "wheel_20c_16x7_R",
-        "wheel_23b_16x7_R",
-        "wheel_20b_16x7_R",
-        "wheel_23c_16x7_R",
-        "wheel_20a_16x7_R",
-        "wheel_16a_15x7_R",
-        "wheel_20c_15x8_R",
-        "wheel_16b_15x7_R",
-        "wheel_20b_15x8_R",
-        "wheel_16c_15x7_R",
-        "wheel_20a_15x8_R",
-        "wheel_16a_15x8_R",
-        "wheel_20c_15x7_R",
-        "wheel_23a_14x7_R",
-        "wheel_20b_15x7_R",
-        "wheel_23b_14x7_R",
-        "wheel_20a_15x7_R",
-        "wheel_23c_14x7_R",
-        "wheel_05a_16x7_R",
-        "wheel_23a_15x7_R",
-        "wheel_16c_15x8_R",
-        "wheel_23b_15x7_R",
-        "wheel_16b_15x8_R",
-        "wheel_23c_15x7_R",
-        "autobello_wheel_01_14x7_R",
-        "autobello_wheel_01_14x5.5_R",
-        "autobello_wheel_02_14x7_R",
-        "autobello_wheel_01_14x6_R",
-        "autobello_wheel_02_14x9_R",
-        "autobello_wheel_02_14x8_R",
-    ],
-    "tire_R_15x6_altb": [
-        "tire_R_195_65_15_altb_rally",
-        "tire_R_175_70_15_altb_rally",
-        "tire_R_195_55_15_altb_sport",
-        "tire_R_800_15_altb_mixed",
-        "tire_R_800_15_altb",
-        "tire_R_800_15_altb_ww",
-        "tire_R_800_15_altb_redline",
-        "tire_R_800_15_altb_thinww",
-        "tire_R_27_7_15_altb_offroad",
-        "tire_R_195_70_15_altb_standard",
-        "tire_R_185_60_15_altb_standard",
-    ],
-    "tire_R_15x8_alt": [
-        "tire_R_26_8_15_alt_race",
-        "tire_R_26_8_15_alt_drag",
-        "tire_R_225_45_15_alt_race",
-        "tire_R_225_50_15_alt_race",
-        "tire_R_225_50_15_alt_rally",
-        "tire_R_235_60_15_alt_sport",
-        "tire_R_225_50_15_alt_sport",
-        "tire_R_235_55_15_alt_sport",
-        "tire_R_27_10_15_alt_offroad",
-        "tire_R_225_70_15_alt_offroad",
-        "tire_R_235_75_15_alt_standard",
-    ],
-    "hubcap_F_16": [
-        "hubcap_01a_F_16",
-        "hubcap_10c_F_alt",
-        "hubcap_10c_F_altd",
-        "hubcap_09c_F_altd",
-        "hubcap_09c_F_alt",
-        "hubcap_05a_16_F",
-    ],
-    "tire_F_15x10_alt": [
-        "tire_F_285_40_15_alt_race",
-        "tire_F_27_10_15_alt_race",
-        "tire_F_285_40_15_alt_sport",
-        "tire_F_275_50_15_alt_sport",
-    ],
-    "wheel_R_6": [
-        "wheel_square_01a_R",
-        "wheel_42a_26x9_R6",
-        "offroadwheel_03a_15x9_R",
-        "wheel_42b_24x9_R6",
-        "offroadwheel_03b_15x9_R",
-        "wheel_42b_26x9_R6",
-        "offroadwheel_03c_15x9_R",
-        "wheel_42c_24x9_R6",
-        "offroadwheel_03d_15x9_R",
-        "wheel_42c_26x9_R6",
-        "roamer_alloy_17x8_R",
-        "faser_offroadwheel_02a_17x9_R",
-        "faser_offroadwheel_02b_17x9_R",
-        "pickup_alloy_17x8_R",
-        "faser_offroadwheel_02c_17x9_R",
-        "ibishu_wheel_08a_15x7_R",
-        "ibishu_wheel_08b_15x7_R",
-        "steelwheel_02a_16x7_R",
-        "ibishu_wheel_08a_15x9_R",
-        "steelwheel_02b_16x7_R",
-        "ibishu_wheel_08b_15x9_R",
-        "offroadwheel_01a_17x9_R",
-        "wheel_42a_24x9_R6",
-        "offroadwheel_02a_17x9_R",
-        "pickup_alloy_16x7_R",
-        "wheel_41b_16x7_6_R",
-        "roamer_alloy_16x7_R",
-        "wheel_41a_16x7_6_R",
-        "wheel_28a_16x7_6_R",
-        "wheel_28b_16x7_6_R",
-        "wheel_29a_16x7_6_R",
-        "wheel_31a_16x7_6_R",
-        "wheel_25a_17x8_R",
-        "wheel_30b_16x7_6_R",
-        "wheel_25b_17x8_R",
-        "wheel_30c_16x7_6_R",
-        "wheel_25a_16x7_6_R",
-        "wheel_30a_16x7_6_R",
-        "wheel_25b_16x7_6_R",
-        "offroadwheel_03a_17x9_R",
-        "offroadwheel_05b_17x9_R",
-        "offroadwheel_05a_17x9_R",
-        "offroadwheel_05c_17x9_R",
-        "offroadwheel_04a_R",
-    ],
-    "pickup_engine_v8_6.9_ecu": [
-        "pickup_engine_v8_6.9_ecu_sport",
-        "pickup_engine_v8_6.9_ecu_race",
-        "pickup_engine_v8_6.9_ecu",
-    ],
-    "hubcap_F_15": [
-        "hubcap_01a_F_15",
-        "hubcap_07a_15_F",
-        "hubcap_08a_15_F",
-        "hubcap_06a_15_F",
-        "ibishu_hubcap_01a_15_F",
-        "ibishu_hubcap_03a_15_F",
-        "ibishu_hubcap_05a_15_F",
-        "hirochi_hubcap_01a_15_F",
-    ],
-    "pickup_converter_diesel": ["pickup_converter_diesel"],
-    "pickup_converter": [
-        "pickup_converter",
-        "pickup_converter_heavy",
-        "pickup_converter_hi",
-    ],
-    "pigeon_enginemounts": [
-        "pigeon_enginemounts_heavy",
-        "pigeon_enginemounts_ultra",
-        "pigeon_enginemounts",
-    ],
-    "pickup_coilover_R": [
-        "pickup_coilover_R_heavy",
-        "pickup_coilover_R_super",
-        "pickup_coilover_R_offroad",
-        "roamer_coilover_R",
-        "pickup_coilover_R_lifted",
-        "pickup_coilover_R_sport",
-        "pickup_coilover_R",
-        "pickup_coilover_R_race",
-    ],
-    "pickup_rollbar_accessory": [
-        "pickup_rollbarlight_square",
-        "pickup_rollbarlight_round",
-        "pickup_rollbarlight_square_quad",
-        "pickup_rollbarlight_mixed_quad",
-        "pickup_rollbarlight_round_quad",
-    ],
-    "pickup_rollbarlight_round_accessory": [
-        "pickup_rollbarlight_round_cover_tims",
-        "pickup_rollbarlight_round_halogen",
-        "pickup_rollbarlight_round_LED",
-        "pickup_rollbarlight_round_grille",
-        "pickup_rollbarlight_round_mesh",
-        "pickup_rollbarlight_round_cover",
-        "pickup_rollbarlight_round_cover_yellow",
-        "pickup_rollbarlight_round_cover_beamng",
-        "pickup_rollbarlight_round_cover_beamngmono",
-    ],
-    "trimring_F_15x7": ["trimring_02a_15x7_F", "trimring_01a_15x7_F"],
-    "tire_F_16x8_altb": [
-        "tire_F_225_45_16_altb_race",
-        "tire_F_225_50_16_altb_race",
-        "tire_F_225_45_16_altb_sport",
-        "tire_F_225_50_16_altb_sport",
-        "tire_F_235_55_16_altb_sport",
-        "tire_F_235_55_16_altb_standard_ww",
-        "tire_F_235_55_16_altb_standard",
-    ],
-    "pickup_finaldrive_R": [
-        "pickup_finaldrive_R_355",
-        "pickup_finaldrive_R_410",
-        "pickup_finaldrive_R_444",
-        "pickup_finaldrive_R_race",
-    ],
-    "pickup_converter_drag": [
-        "pickup_converter_drag_lo",
-        "pickup_converter_drag_hi",
-        "pickup_converter_drag_med",
-    ],
-    "gps": ["gps"],
-    "wheel_F_4": [
-        "wheel_square_01a_small_F_alt",
-        "wheel_12a_15x8_F",
-        "wheel_11a_16x7_F",
-        "wheel_11b_16x7_F",
-        "wheel_39a_alt_13x7_F",
-        "wheel_39b_alt_13x7_F",
-        "wheel_39c_alt_13x7_F",
-        "wheel_39a_alt_14x7_F",
-        "wheel_39b_alt_14x7_F",
-        "wheel_39c_alt_14x7_F",
-        "wheel_39a_alt_14x8_F",
-        "wheel_39b_alt_14x8_F",
-        "wheel_39c_alt_14x8_F",
-        "wheel_39a_alt_15x7_F",
-        "wheel_39b_alt_15x7_F",
-        "wheel_39c_alt_15x7_F",
-        "wheel_39a_alt_15x8_F",
-        "wheel_12a_13x5_F",
-        "wheel_39b_alt_15x8_F",
-        "wheel_39c_alt_15x8_F",
-        "wheel_44a_13x7_F",
-        "wheel_44a_14x7_F",
-        "wheel_44a_14x8_F",
-        "wheel_44a_15x7_F",
-        "wheel_12a_13x7_F",
-        "wheel_44b_13x7_F",
-        "wheel_44b_14x7_F",
-        "wheel_10a_13x7_F",
-        "wheel_10b_13x7_F",
-        "wheel_03a_14x7_F",
-        "wheel_44b_15x7_F",
-        "wheel_03b_14x7_F",
-        "wheel_03c_14x7_F",
-        "wheel_44c_13x7_F",
-        "wheel_03a_14x8_F",
-        "wheel_44c_14x7_F",
-        "wheel_03b_14x8_F",
-        "wheel_03c_14x8_F",
-        "wheel_03d_14x8_F",
-        "wheel_03a_15x7_F",
-        "wheel_03b_15x7_F",
-        "wheel_03c_15x7_F",
-        "wheel_03d_15x7_F",
-        "wheel_03a_15x8_F",
-        "wheel_03b_15x8_F",
-        "wheel_03c_15x8_F",
-        "wheel_03d_15x8_F",
-        "wheel_15a_14x7_F",
-        "wheel_15b_14x7_F",
-        "wheel_15a_15x7_F",
-        "wheel_15b_15x7_F",
-        "wheel_13a_14x7_F",
-        "wheel_13a_14x8_F",
-        "wheel_10a_14x7_F",
-        "wheel_10b_14x7_F",
-        "wheel_10a_14x8_F",
-        "wheel_10b_14x8_F",
-        "wheel_44c_15x7_F",
-        "wheel_12a_14x7_F",
-        "wheel_44c_14x8_F",
-        "wheel_10a_13x5_F",
-        "wheel_12a_14x8_F",
-        "wheel_12a_13x5.5_F",
-        "wheel_10b_13x5_F",
-        "wheel_12a_15x7_F",
-        "wheel_44b_14x8_F",
-        "wheel_03d_14x7_F",
-        "steelwheel_11b_13x5_F",
-        "steelwheel_11a_13x7_F",
-        "steelwheel_01a_13x5_F",
-        "steelwheel_11b_13x7_F",
-        "steelwheel_01a_13x5_F_old",
-        "steelwheel_11a_14x8_F",
-        "steelwheel_11b_14x8_F",
-        "steelwheel_11a_13x5_F",
-        "steelwheel_01a_14x5.5_F",
-        "wheel_17d_15x6_F",
-        "wheel_17d_15x8_F",
-        "wheel_17a_14x5.5_F",
-        "wheel_17d_15x7_F",
-        "wheel_17b_15x8_F",
-        "wheel_17b_14x5.5_F",
-        "wheel_17c_14x8_F",
-        "wheel_26a_14x5.5_F",
-        "wheel_17c_14x5.5_F",
-        "wheel_17c_15x7_F",
-        "wheel_17c_15x8_F",
-        "wheel_17d_14x5.5_F",
-        "wheel_17d_14x7_F",
-        "wheel_17c_14x7_F",
-        "wheel_26a_16x8_F_alt",
-        "wheel_17d_14x8_F",
-        "wheel_26b_16x8_F_alt",
-        "wheel_17a_14x8_F",
-        "wheel_26a_15x6_F_alt",
-        "wheel_17b_15x7_F",
-        "wheel_26b_15x6_F_alt",
-        "wheel_17a_15x7_F",
-        "wheel_17a_15x6_F",
-        "wheel_17b_14x7_F",
-        "wheel_26a_15x7_F_alt",
-        "wheel_17a_15x8_F",
-        "wheel_26b_15x7_F_alt",
-        "wheel_17b_14x8_F",
-        "wheel_17b_15x6_F",
-        "wheel_17a_14x7_F",
-        "wheel_17c_15x6_F",
-        "wheel_26b_14x5.5_F",
-        "ibishu_wheel_07a_15x7_alt_F",
-        "ibishu_wheel_07b_15x7_alt_F",
-        "ibishu_wheel_11a_13x5_F",
-        "ibishu_wheel_11a_13x5_F_old",
-        "steelwheel_10a_13x5.5_F",
-        "ibishu_wheel_10a_15x8_F",
-        "steelwheel_10a_13x7_F",
-        "ibishu_wheel_03a_14x5.5_F",
-        "ibishu_wheel_13a_14x5.5_F",
-        "ibishu_wheel_02a_14x7_F",
-        "ibishu_wheel_05a_14x7_F",
-        "ibishu_wheel_07a_14x7_F",
-        "ibishu_wheel_07b_14x7_F",
-        "ibishu_wheel_06a_14x7_F",
-        "ibishu_wheel_12a_14x7_F",
-        "ibishu_wheel_10b_15x8_F",
-        "ibishu_wheel_03a_15x7_alt_F",
-        "ibishu_wheel_05a_15x7_alt_F",
-        "ibishu_wheel_02a_15x7_alt_F",
-        "wheel_23a_14x7_F",
-        "wheel_23c_16x7_F",
-        "wheel_20a_15x8_F",
-        "wheel_23b_14x7_F",
-        "wheel_16a_15x7_F",
-        "wheel_20b_15x8_F",
-        "wheel_23c_14x7_F",
-        "wheel_16b_15x7_F",
-        "wheel_20c_15x8_F",
-        "wheel_23a_15x7_F",
-        "wheel_16c_15x7_F",
-        "wheel_20a_16x7_F",
-        "wheel_23b_15x7_F",
-        "wheel_16a_15x8_F",
-        "wheel_20b_16x7_F",
-        "wheel_23c_15x7_F",
-        "wheel_16b_15x8_F",
-        "wheel_20c_16x7_F",
-        "wheel_23a_15x8_F",
-        "wheel_16c_15x8_F",
-        "wheel_23b_15x8_F",
-        "wheel_05a_16x7_F",
-        "wheel_23c_15x8_F",
-        "wheel_20a_15x7_F",
-        "wheel_23a_16x7_F",
-        "wheel_20b_15x7_F",
-        "wheel_23b_16x7_F",
-        "wheel_20c_15x7_F",
-        "autobello_wheel_02_14x8_F",
-        "autobello_wheel_01_14x6_F",
-        "autobello_wheel_02_14x7_F",
-        "autobello_wheel_02_14x9_F",
-        "autobello_wheel_01_14x5.5_F",
-        "autobello_wheel_01_14x7_F",
-    ],
-    "linelock": ["linelock_R", "linelock_F"],
-    "pigeon_transmission": ["pigeon_transmission_5M", "pigeon_transmission_3M"],
-    "pigeon_flywheel": [
-        "pigeon_flywheel_light",
-        "pigeon_flywheel_ultralight",
-        "pigeon_flywheel",
-    ],
-    "sunburst_steer": [
-        "sunburst_steer_05a",
-        "sunburst_steer_02a",
-        "sunburst_steer_03a",
-        "sunburst_steer",
-        "sunburst_steer_02b",
-        "sunburst_steer_04a",
-        "sunburst_steer_01a",
-        "sunburst_steer_02c",
-    ],
-    "sunburst_windshield": ["sunburst_windshield"],
-    "pigeon_engine": ["pigeon_engine_i3_550", "pigeon_engine_i4_1300"],
-    "sunburst_backlight": ["sunburst_backlight"],
-    "sunburst_finaldrive_R": [
-        "sunburst_finaldrive_R_race",
-        "sunburst_finaldrive_R_411",
-    ],
-    "sunburst_skidplate": ["sunburst_skidplate"],
-    "sunburst_transfer_case": [
-        "sunburst_transfer_case_AWD_race",
-        "sunburst_transfer_case_AWD_RS",
-        "sunburst_transfer_case_AWD",
-        "sunburst_transfer_case_FWD",
-        "sunburst_transfer_case_RWD",
-    ],
-    "simple_traffic_sunburst_licenseplate": ["simple_traffic_sunburst_licenseplate"],
-    "tire_R_14x9": ["tire_R_245_45_14_race", "tire_R_245_45_14_sport"],
-    "hubcap_F_16_b": ["cherrier_hubcap_02a_16_F", "cherrier_hubcap_01a_16_F"],
-    "sunburst_wheeldata_R": ["sunburst_wheeldata_R"],
-    "pigeon_i3_intake": ["pigeon_i3_intake"],
-    "pigeon_i3_oilpan": ["pigeon_i3_oilpan_race", "pigeon_i3_oilpan"],
-    "hubcap_R_16_b": ["cherrier_hubcap_02a_16_R", "cherrier_hubcap_01a_16_R"],
-    "pigeon_i3_ecu": ["pigeon_i3_ecu_race"],
-    "pickup_rollbarlight_quadround_accessory": [
-        "pickup_rollbarlight_quadround_LED",
-        "pickup_rollbarlight_quadround_grille",
-        "pickup_rollbarlight_quadround_mesh",
-        "pickup_rollbarlight_quadround_cover",
-        "pickup_rollbarlight_quadround_cover_yellow",
-        "pickup_rollbarlight_quadround_cover_beamng",
-        "pickup_rollbarlight_quadround_cover_beamngmono",
-        "pickup_rollbarlight_quadround_cover_tims",
-        "pickup_rollbarlight_quadround_halogen",
-    ],
-    "tire_R_14x7_altc": ["tire_R_165_70_14_standard_ww"],
-    "sunburst_bumperbar_F": ["sunburst_oilcooler", "sunburst_bumperbar_F"],
-    "tire_F_14x6": [
-        "tire_F_175_65_14_sport_2",
-        "tire_F_735_14_redline",
-        "tire_F_735_14_mixed",
-        "tire_F_735_14",
-        "tire_F_735_14_ww",
-        "tire_F_695_14",
-        "tire_F_695_14_thinww",
-        "tire_F_695_14_ww",
-        "tire_F_695_14_redline",
-        "tire_F_695_14_mixed",
-        "tire_F_735_14_thinww",
-        "tire_F_175_65_14_standard_2",
-    ],
-    "sunburst_hood": [
-        "sunburst_hood_CF",
-        "sunburst_hood",
-        "sunburst_hood_scoop",
-        "sunburst_hood_scoop_CF",
-    ],
-    "tire_F_15x9_alt": [
-        "tire_F_245_40_15_alt_race",
-        "tire_F_26.5_8.5_15_alt_race",
-        "tire_F_245_50_15_alt_race",
-        "tire_F_255_60_15_alt_sport",
-        "tire_F_245_50_15_alt_sport",
-        "tire_F_255_55_15_alt_sport",
-        "tire_F_31_12_15_alt_offroad",
-        "tire_F_29_10_15_alt_offroad",
-        "tire_F_255_70_15_alt_standard",
-    ],
-    "hubcap_F_18_alt": ["cherrier_hubcap_03a_18_F", "cherrier_hubcap_03b_18_F"],
-    "tire_R_19x8": [
-        "tire_R_225_35_19_race",
-        "tire_R_210_650_19_race",
-        "tire_R_225_35_19_sport",
-    ],
-    "sunburst_radiator": [
-        "sunburst_radiator_race",
-        "sunburst_radiator_ultra",
-        "sunburst_radiator",
-    ],
-    "tire_R_17x9": [
-        "tire_R_245_35_17_race",
-        "tire_R_245_40_17_race",
-        "tire_R_245_35_17_drift",
-        "tire_R_245_35_17_sport",
-        "tire_R_245_50_17_sport",
-        "tire_R_255_60_17_sport",
-        "tire_R_245_40_17_sport",
-    ],
-    "hubcap_R_18_alt": ["cherrier_hubcap_03a_18_R", "cherrier_hubcap_03b_18_R"],
-    "sunburst_underglow": [
-        "sunburst_underglow_cyan",
-        "sunburst_underglow_white",
-        "sunburst_underglow_green",
-        "sunburst_underglow_magenta",
-        "sunburst_underglow_blue",
-        "sunburst_underglow_yellow",
-        "sunburst_underglow_red",
-    ],
-    "sunburst_ABS": ["sunburst_ABS"],
-    "sunburst_interior_accessory": ["sunburst_interior_accessories_police"],
-    "sunburst_towhitch": ["sunburst_towhitch"],
-    "hubcap_F_13": [
-        "hubcap_05a_13_F",
-        "hubcap_02a_13_F",
-        "hubcap_04a_13_F",
-        "ibishu_hubcap_02a_13_F",
-        "ibishu_hubcap_03a_13_F",
-        "ibishu_hubcap_05a_13_F",
-        "ibishu_hubcap_04a_13_F",
-        "autobello_hubcap_01a_13_F",
-    ],
-    "tire_F_15x11": ["tire_F_195_65_15_stretched"],
-    "tire_R_24x9": ["tire_R_255_25_24_sport"],
-    "tire_R_17x9_alt": [
-        "tire_R_245_40_17_alt_race",
-        "tire_R_245_35_17_alt_race",
-        "tire_R_245_35_17_alt_drift",
-        "tire_R_245_35_17_alt_sport",
-        "tire_R_255_60_17_alt_sport",
-        "tire_R_245_40_17_alt_sport",
-        "tire_R_245_50_17_alt_sport",
-    ],
-    "pigeon_i4_intake": ["pigeon_i4_intake_sport"],
-    "tire_R_18x11": [
-        "tire_R_295_30_18_race",
-        "tire_R_295_35_18_race",
-        "tire_R_295_30_18_sport",
-    ],
-    "pigeon_i4_oilpan": ["pigeon_i4_oilpan_race", "pigeon_i4_oilpan"],
-    "sunburst_quarterpanel": ["sunburst_quarterpanel_wide", "sunburst_quarterpanel"],
-    "pigeon_i4_ecu": ["pigeon_i4_ecu_sport", "pigeon_i4_ecu_race", "pigeon_i4_ecu"],
-    "pigeon_i4_internals": [
-        "pigeon_i4_internals_stage2",
-        "pigeon_i4_internals_heavy",
-        "pigeon_i4_internals_stage1",
-        "pigeon_i4_internals",
-    ],
-    "bastion_engine": [
-        "bastion_engine_v6",
-        "bastion_engine_v8_large",
-        "bastion_engine_v8",
-    ],
-    "pickup_hub_F": [
-        "pickup_hub_F_5",
-        "pickup_hub_F_8_locking",
-        "pickup_hub_F_6_locking",
-        "pickup_hub_F_8_heavy",
-        "pickup_hub_F_8_heavy_locking",
-        "pickup_hub_F_8",
-        "pickup_hub_F_6",
-    ],
-    "bastion_v6_exhmanifold": [
-        "bastion_v6_exhmanifold_twinturbo",
-        "bastion_v6_exhmanifold",
-    ],
-    "van_rollback_headboard": [
-        "van_rollback_headboard_short",
-        "van_rollback_headboard",
-    ],
-    "bastion_v6_intake": [
-        "bastion_v6_intake",
-        "bastion_v6_supercharger_stage3",
-        "bastion_v6_turbo_stage3",
-        "bastion_intake_sport",
-        "bastion_v6_supercharger_stage2",
-        "bastion_v6_supercharger_stage1",
-    ],
-    "tire_R_19x12": ["tire_R_345_35_19_race"],
-    "bastion_v6_internals": [
-        "bastion_v6_internals",
-        "bastion_v6_internals_heavy",
-        "bastion_engine_v6_ultra",
-    ],
-    "soundscape_horn": [
-        "soundscape_horn_1",
-        "soundscape_horn_2",
-        "soundscape_horn_4",
-        "soundscape_horn_8",
-        "soundscape_horn_9",
-        "soundscape_horn_10",
-        "soundscape_horn_3",
-        "soundscape_horn_11",
-        "soundscape_horn_12",
-        "soundscape_horn_6",
-        "soundscape_horn_7",
-        "soundscape_horn_5",
-    ],
-    "etk_DSE_drivemodes_ttSport_2WD": ["etk_DSE_drivemodes_ttSport_2WD"],
-    "tire_R_10x6": [
-        "tire_R_165_70_10_race",
-        "tire_R_20_8_10_mud",
-        "tire_R_165_70_10_standard",
-    ],
-    "pickup_brake_R": [
-        "pickup_brake_R_race",
-        "pickup_brake_R_drum",
-        "pickup_brake_R_drum_heavy",
-        "pickup_brake_R",
-        "pickup_brake_R_offroad",
-        "pickup_brake_R_heavy",
-    ],
-    "pickup_rollbarlight_square_accessory": [
-        "pickup_rollbarlight_square_halogen",
-        "pickup_rollbarlight_square_LED",
-        "pickup_rollbarlight_square_grille",
-        "pickup_rollbarlight_square_mesh",
-        "pickup_rollbarlight_square_cover",
-        "pickup_rollbarlight_square_cover_beamng",
-        "pickup_rollbarlight_square_cover_beamngmono",
-        "pickup_rollbarlight_square_cover_tims",
-    ],
-    "tire_R_14x7": [
-        "tire_R_185_60_14_race",
-        "tire_R_185_60_14_sport",
-        "tire_R_195_65_14_sport",
-        "tire_R_195_75_14_sport",
-        "tire_R_E70_14",
-        "tire_R_E70_14_thinww",
-        "tire_R_E70_14_redline",
-        "tire_R_195_70_14_standard_ww",
-        "tire_R_185_60_14_standard",
-        "tire_R_195_70_14_standard",
-    ],
-    "pigeon_i4_flywheel": [
-        "pigeon_i4_flywheel_light",
-        "pigeon_i4_flywheel",
-        "pigeon_i4_flywheel_ultralight",
-    ],
-    "sunburst_doorpanel_FR": ["sunburst_doorpanel_FR"],
-    "pickup_rollbarlight_quadsquare_accessory": [
-        "pickup_rollbarlight_quadsquare_halogen",
-        "pickup_rollbarlight_quadsquare_LED",
-        "pickup_rollbarlight_quadsquare_grille",
-        "pickup_rollbarlight_quadsquare_mesh",
-        "pickup_rollbarlight_quadsquare_cover",
-        "pickup_rollbarlight_quadsquare_cover_beamng",
-        "pickup_rollbarlight_quadsquare_cover_beamngmono",
-        "pickup_rollbarlight_quadsquare_cover_tims",
-    ],
-    "sunburst_doordetent_FR": ["sunburst_doordetent_FR"],
-    "tire_R_15x6": [
-        "tire_R_175_70_15_rally",
-        "tire_R_195_65_15_rally",
-        "tire_R_195_55_15_sport",
-        "tire_R_800_15",
-        "tire_R_800_15_ww",
-        "tire_R_800_15_thinww",
-        "tire_R_800_15_mixed",
-        "tire_R_800_15_redline",
-        "tire_R_27_7_15_offroad",
-        "tire_R_185_60_15_standard",
-        "tire_R_195_70_15_standard",
-    ],
-    "main": ["sunburst"],
-    "pickup_ESC": ["pickup_ESC"],
-    "tire_F_16x8": [
-        "tire_F_225_50_16_race",
-        "tire_F_225_45_16_race",
-        "tire_F_235_55_16_sport",
-        "tire_F_225_45_16_sport",
-        "tire_F_225_50_16_sport",
-        "tire_F_235_55_16_standard",
-        "tire_F_235_55_16_standard_ww",
-    ],
-    "tire_F_14x7_altb": [
-        "tire_F_185_60_14_altb_race",
-        "tire_F_195_75_14_altb_sport",
-        "tire_F_185_60_14_altb_sport",
-        "tire_F_195_65_14_altb_sport",
-        "tire_F_E70_14_altb_redline",
-        "tire_F_E70_14_altb_thinww",
-        "tire_F_E70_14_altb",
-        "tire_F_185_60_14_altb_standard",
-        "tire_F_195_70_14_altb_standard",
-        "tire_F_195_70_14_altb_standard_ww",
-    ],
-    "tire_R_17x7": [
-        "tire_R_205_45_17_race",
-        "tire_R_215_45_17_race",
-        "tire_R_215_45_17_sport",
-        "tire_R_215_60_17_standard",
-    ],
-    "van_upfit_heavy": [
-        "van_flatbed_heavy",
-        "van_cargobox_heavy",
-        "van_ambulance",
-        "van_rollback",
-    ],
-    "van_licenseplate_R_alt2": [
-        "van_licenseplate_R_alt2",
-        "van_licenseplate_R_alt2_EU",
-    ],
-    "van_cargobox_load_F": [
-        "van_cargobox_woodcrate_load_F",
-        "van_cargobox_woodplanks_load_F",
-    ],
-    "van_cargobox_load_R": [
-        "van_cargobox_woodcrate_load_R",
-        "van_cargobox_woodplanks_load_R",
-    ],
-    "tire_F_15x7_alt": [
-        "tire_F_195_50_15_alt_race",
-        "tire_F_205_65_15_alt_rally",
-        "tire_F_205_50_15_alt_sport",
-        "tire_F_205_60_15_alt_sport",
-        "tire_F_195_60_15_alt_sport",
-        "tire_F_215_65_15_alt_sport",
-        "tire_F_F78_15_alt",
-        "tire_F_E70_15_alt_thinww",
-        "tire_F_E70_15_alt",
-        "tire_F_E70_15_alt_redline",
-        "tire_F_F78_15_alt_thinww",
-        "tire_F_28_8_15_alt_offroad",
-        "tire_F_205_75_15_alt_offroad",
-        "tire_F_205_75_15_alt_standard_ww",
-        "tire_F_225_75_15_alt_standard",
-        "tire_F_205_60_15_alt_standard",
-        "tire_F_195_60_15_alt_standard",
-        "tire_F_205_75_15_alt_standard",
-    ],
-    "pickup_engine_v8_ecu": [
-        "pickup_engine_v8_ecu_late",
-        "pickup_engine_v8_ecu_race",
-        "pickup_engine_v8_ecu_sport",
-        "pickup_engine_v8_ecu",
-    ],
-    "sunburst_power_steering": ["sunburst_power_steering"],
-    "sunburst_doorglass_FR": ["sunburst_doorglass_FR"],
-    "n2o_system": ["n2o_system"],
-    "simple_traffic_sunburst_wheeldata_F_strut": [
-        "simple_traffic_sunburst_wheeldata_F_strut"
-    ],
-    "pickup_rollbarlight_quadmixed_accessory": [
-        "pickup_rollbarlight_quadmixed_halogen",
-        "pickup_rollbarlight_quadmixed_LED",
-        "pickup_rollbarlight_quadmixed_grille",
-        "pickup_rollbarlight_quadmixed_cover",
-        "pickup_rollbarlight_quadmixed_cover_yellow",
-        "pickup_rollbarlight_quadmixed_cover_beamng",
-        "pickup_rollbarlight_quadmixed_cover_beamngmono",
-        "pickup_rollbarlight_quadmixed_cover_tims",
-        "pickup_rollbarlight_quadmixed_mesh",
-    ],
-    "etk_DSE_drivemodes_sport_plus": ["etk_DSE_drivemodes_sport_plus"],
-    "tire_F_16x9": [
-        "tire_F_245_45_16_race",
-        "tire_F_245_45_16_rally",
-        "tire_F_245_45_16_sport",
-    ],
-    "sunburst_fenderflare_FR": ["sunburst_fenderflare_FR"],
-    "tire_F_17x9": [
-        "tire_F_245_35_17_race",
-        "tire_F_245_40_17_race",
-        "tire_F_245_35_17_drift",
-        "tire_F_245_50_17_sport",
-        "tire_F_245_35_17_sport",
-        "tire_F_255_60_17_sport",
-        "tire_F_245_40_17_sport",
-    ],
-    "pickup_hub_R": [
-        "pickup_hub_R_6",
-        "pickup_hub_R_8",
-        "pickup_hub_R_5",
-        "pickup_hub_R_8_heavy",
-    ],
-    "tire_F_15x6_altb": [
-        "tire_F_175_70_15_altb_rally",
-        "tire_F_195_65_15_altb_rally",
-        "tire_F_195_55_15_altb_sport",
-        "tire_F_800_15_altb_redline",
-        "tire_F_800_15_altb_ww",
-        "tire_F_800_15_altb_mixed",
-        "tire_F_800_15_altb_thinww",
-        "tire_F_800_15_altb",
-        "tire_F_27_7_15_altb_offroad",
-        "tire_F_185_60_15_altb_standard",
-        "tire_F_195_70_15_altb_standard",
-    ],
-    "sunburst_doorpanel_FL": ["sunburst_doorpanel_FL"],
-    "tire_R_15x10_alt": [
-        "tire_R_26_10_15_alt_drag",
-        "tire_R_28_10_15_alt_drag",
-        "tire_R_27_10_15_alt_race",
-        "tire_R_285_40_15_alt_race",
-        "tire_R_275_50_15_alt_sport",
-        "tire_R_285_40_15_alt_sport",
-    ],
-    "sunburst_doordetent_FL": ["sunburst_doordetent_FL"],
-    "tire_R_15x7_alt": [
-        "tire_R_195_50_15_alt_race",
-        "tire_R_205_65_15_alt_rally",
-        "tire_R_205_50_15_alt_sport",
-        "tire_R_215_65_15_alt_sport",
-        "tire_R_195_60_15_alt_sport",
-        "tire_R_205_60_15_alt_sport",
-        "tire_R_F78_15_alt",
-        "tire_R_E70_15_alt",
-        "tire_R_F78_15_alt_thinww",
-        "tire_R_E70_15_alt_thinww",
-        "tire_R_E70_15_alt_redline",
-        "tire_R_28_8_15_alt_offroad",
-        "tire_R_205_75_15_alt_offroad",
-        "tire_R_205_75_15_alt_standard_ww",
-        "tire_R_195_60_15_alt_standard",
-        "tire_R_225_75_15_alt_standard",
-        "tire_R_205_75_15_alt_standard",
-        "tire_R_205_60_15_alt_standard",
-    ],
-    "etk_intake_i6_3.0_petrol": [
-        "etk_intake_i6_3.0_petrol_turbo_ttSport",
-        "etk_intake_i6_3.0_petrol_turbo",
-        "etk_intake_i6_3.0_petrol",
-    ],
-    "pickup_driveshaft_F": ["pickup_driveshaft_F"],
-    "tire_R_17x9_offroad": [
-        "tire_R_33_12_17_offroad",
-        "tire_R_35_12_17_offroad",
-        "tire_R_255_60_17_offroad_sport",
-        "tire_R_42_14_17_crawler",
-        "tire_R_38_13_17_crawler",
-        "tire_R_44_15_17_crawler",
-        "tire_R_36_13_17_crawler",
-        "tire_R_35_13_17_desert",
-        "tire_R_40_13_17_desert",
-        "tire_R_38_13_17_desert",
-    ],
-    "pickup_halfshafts_F": ["pickup_halfshafts_F"],
-    "pickup_finaldrive_F": [
-        "pickup_finaldrive_F_355",
-        "pickup_finaldrive_F_410",
-        "pickup_finaldrive_F_444",
-        "pickup_finaldrive_F_race",
-    ],
-    "tire_R_18x10": [
-        "tire_R_275_35_18_race",
-        "tire_R_275_40_18_race",
-        "tire_R_275_55_18_sport",
-        "tire_R_275_40_18_sport",
-        "tire_R_255_40_18_sport",
-    ],
-    "tire_R_20x8": ["tire_R_245_45_20_sport"],
-    "tire_R_15x7": [
-        "tire_R_195_50_15_race",
-        "tire_R_205_65_15_rally",
-        "tire_R_205_50_15_sport",
-        "tire_R_205_60_15_sport",
-        "tire_R_195_60_15_sport",
-        "tire_R_215_65_15_sport",
-        "tire_R_E70_15",
-        "tire_R_E70_15_thinww",
-        "tire_R_E70_15_redline",
-        "tire_R_F78_15",
-        "tire_R_F78_15_thinww",
-        "tire_R_205_75_15_offroad",
-        "tire_R_28_8_15_offroad",
-        "tire_R_205_60_15_standard",
-        "tire_R_205_75_15_standard",
-        "tire_R_205_75_15_standard_ww",
-        "tire_R_225_75_15_standard",
-        "tire_R_195_60_15_standard",
-    ],
-    "sunburst_fenderflare_R": ["sunburst_fenderflare_R"],
-    "tire_F_15x6": [
-        "tire_F_175_70_15_rally",
-        "tire_F_195_65_15_rally",
-        "tire_F_195_55_15_sport",
-        "tire_F_800_15_redline",
-        "tire_F_800_15_mixed",
-        "tire_F_800_15",
-        "tire_F_800_15_ww",
-        "tire_F_800_15_thinww",
-        "tire_F_27_7_15_offroad",
-        "tire_F_195_70_15_standard",
-        "tire_F_185_60_15_standard",
-    ],
-    "pickup_converter_alt": [
-        "pickup_converter_alt_hi",
-        "pickup_converter_alt_low",
-        "pickup_converter_alt_med",
-        "pickup_converter_alt_heavy",
-    ],
-    "tire_R_17x7_alt": ["tire_R_35_11_17_desert"],
-    "sunburst_body": [
-        "sunburst_body",
-        "simple_traffic_sunburst",
-        "simple_traffic_sunburst_PARKED",
-    ],
-    "alder_hubcap_R_15_alt": ["alder_hubcap_01a_R_alt", "alder_hubcap_01b_R_alt"],
-    "alder_hubcap_F_15_alt": ["alder_hubcap_01a_F_alt", "alder_hubcap_01b_F_alt"],
-    "tire_F_19x9_alt": ["tire_F_245_35_19_alt_race", "tire_F_245_35_19_alt_sport"],
-    "bastion_v8_intake": [
-        "bastion_v8_intake",
-        "bastion_v8_intake_sport",
-        "bastion_v8_supercharger_stage1",
-        "bastion_v8_supercharger_stage2",
-        "bastion_v8_supercharger_stage3",
-        "bastion_v8_turbo_stage3",
-    ],
-    "bastion_ecu_speedlimit": [
-        "bastion_ecu_speedlimit_155",
-        "bastion_ecu_speedlimit_125",
-        "bastion_ecu_speedlimit_off",
-        "bastion_ecu_speedlimit_140",
-    ],
-    "digidash_cells_top_left1": [
-        "digidash_cells_top_left1_boost",
-        "digidash_cells_top_left1_engine_torque",
-        "digidash_cells_top_left1_engine_power",
-        "digidash_cells_top_left1_engine_consumption_current",
-        "digidash_cells_top_left1_engine_consumption_average",
-        "digidash_cells_top_left1_engine_range",
-        "digidash_cells_top_left1_motor_torque",
-        "digidash_cells_top_left1_motor_power",
-        "digidash_cells_top_left1_motor_range",
-        "digidash_cells_top_left1_acceleration_X",
-        "digidash_cells_top_left1_acceleration_Y",
-        "digidash_cells_top_left1_acceleration_Z",
-        "digidash_cells_top_left1_wheelspeed",
-        "digidash_cells_top_left1_airspeed",
-        "digidash_cells_top_left1_gear",
-        "digidash_cells_top_left1_waterTemp",
-        "digidash_cells_top_left1_oilTemp",
-        "digidash_cells_top_left1_envTemp",
-        "digidash_cells_top_left1_time_OS",
-        "digidash_cells_top_left1_fuelVolume",
-        "digidash_cells_top_left1_lowfuel",
-        "digidash_cells_top_left1_engineRunning",
-        "digidash_cells_top_left1_checkengine",
-        "digidash_cells_top_left1_lights",
-    ],
-    "van_licenseplate_R_ambulance": [
-        "van_licenseplate_R_ambulance_EU",
-        "van_licenseplate_R_ambulance",
-    ],
-}
+import functools
+import json
+import os
+from typing import Any, Dict, List
+
+# The part options table is large, so it's stored as data and only loaded on first access of PART_OPTIONS
+_PART_OPTIONS_PATH = os.path.join(
+    os.path.dirname(__file__), "data", "sunburst_part_options.json"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_part_options() -> Dict[str, List[str]]:
+    """The available options for each Hirochi Sunburst part slot, e.g. {"brakepad_RR": ["brakepad_RR_sport", ...]}."""
+    with open(_PART_OPTIONS_PATH, "r") as f:
+        return json.load(f)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "PART_OPTIONS":
+        return load_part_options()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
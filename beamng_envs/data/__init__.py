@@ -0,0 +1,12 @@
+from beamng_envs.lazy import lazy_module_attrs
+
+# Results classes are imported on first access, so importing the package (or one module in it) stays cheap.
+_LAZY_ATTRS = {
+    "DiskResults": "beamng_envs.data.disk_results",
+    "ExperimentManifest": "beamng_envs.data.experiment_manifest",
+    "ResultCache": "beamng_envs.data.result_cache",
+    "SharedRunData": "beamng_envs.data.shared_run_data",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
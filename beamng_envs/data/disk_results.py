@@ -7,12 +7,25 @@ import uuid
 import warnings
 from distutils.dir_util import copy_tree
 from distutils.errors import DistutilsFileError
-from typing import Union, Dict, Any, Optional
-
-import pandas as pd
+from typing import Union, Dict, Any, Optional, List, Sequence, TYPE_CHECKING
 
 from beamng_envs import __VERSION__, __BNG_VERSION__
+from beamng_envs.data.history_encoding import decode_history, encode_history
 from beamng_envs.data.numpy_json_encoder import NumpyJSONEncoder
+from beamng_envs.data.sharded_results import (
+    FLAT_LAYOUT,
+    SHARDED_LAYOUT,
+    ResultsIndex,
+    ScalarsWriter,
+    read_all_scalars,
+    read_scalars,
+    run_path,
+    sharded_root,
+)
+
+if TYPE_CHECKING:
+    # pandas is slow to import, and only needed for the tabular views of the results, so is imported on first use
+    import pandas as pd
 
 
 class DiskResults:
@@ -20,6 +33,14 @@ class DiskResults:
     Class to handle saving and loading TrackTestEnv results to and from disk
 
     Automatically assigns each set of results a unique UUID.
+
+    Results are saved in the layout set by the config's results_layout: "flat" saves each run to output_path/<run_id>/
+    as separate json files, and "sharded" shards the run directories by ID prefix, and packs the scalar files of the
+    runs saved together into one file, listed in an append-only index (see beamng_envs.data.sharded_results). .load
+    reads either.
+
+    The history is saved with its low-cardinality car state fields (e.g. the current waypoint) stored once as constants
+    or categorical codes, and restored on load; see beamng_envs.data.history_encoding.
     """
 
     _env_name = "TrackTestEnv"
@@ -30,9 +51,9 @@ class DiskResults:
     _outcome_fn = "outcome.json"
     _results_fn = "results.json"
 
-    _scalars_series: Optional[pd.Series]
-    _ts_df: Optional[pd.DataFrame]
-    _bng_ts_df: Optional[pd.DataFrame]
+    _scalars_series: Optional["pd.Series"]
+    _ts_df: Optional["pd.DataFrame"]
+    _bng_ts_df: Optional["pd.DataFrame"]
 
     def __init__(
         self,
@@ -43,15 +64,20 @@ class DiskResults:
         history: Dict[str, Any],
         path_to_bng_logs: Optional[str] = None,
         run_id: Optional[str] = None,
+        failures: Optional[List[str]] = None,
+        pruned: bool = False,
     ):
         self._path = path
 
         self.config = config
+        self.layout = config.get("results_layout", FLAT_LAYOUT)
         self.bng_config = config["bng_config"]
         self.results = results
         self.params = params
         self.history = history
         self.path_to_bng_logs = path_to_bng_logs
+        self.failures = failures if failures is not None else []
+        self.pruned = pruned
 
         self._scalars_series = None
         self._ts_df = None
@@ -63,7 +89,9 @@ class DiskResults:
 
     @property
     def output_path(self) -> str:
-        path = os.path.abspath(os.path.join(self.config["output_path"], self.run_id))
+        path = os.path.abspath(
+            run_path(self.config["output_path"], self.run_id, layout=self.layout)
+        )
         pathlib.Path(path).mkdir(parents=True, exist_ok=True)
 
         return path
@@ -84,8 +112,22 @@ class DiskResults:
         # Save results and history
         with open(os.path.join(self.output_path, self._results_fn), "w") as f:
             json.dump(self.results, f, cls=NumpyJSONEncoder)
+        self._save_history()
+
+    def _save_history(self):
         with open(os.path.join(self.output_path, self._history_fn), "w") as f:
-            json.dump(self.history, f)
+            json.dump(encode_history(self.history), f)
+
+    def _packed_scalars(self) -> Dict[str, Any]:
+        """The contents of the scalar json files, as packed in the sharded layout."""
+        return {
+            "run_id": self.run_id,
+            "params": dict(self.params),
+            "config": {k: v for k, v in self.config.items() if k not in ["bng_config"]},
+            "bng_config": dict(self.config["bng_config"].__dict__),
+            "results": self.results,
+            "outcome": self.outcome,
+        }
 
     def _save_bng_logs(self):
         """
@@ -108,8 +150,15 @@ class DiskResults:
                 pass
 
     @property
-    def outcome(self) -> Dict[str, str]:
-        return {"complete": True, "env": self._env_name, "version": __VERSION__}
+    def outcome(self) -> Dict[str, Any]:
+        return {
+            "complete": True,
+            "env": self._env_name,
+            "version": __VERSION__,
+            "attempts": len(self.failures) + 1,
+            "failures": self.failures,
+            "pruned": self.pruned,
+        }
 
     def _save_outcome(self):
         # Finally save a small file to flag everything complete runs
@@ -117,11 +166,54 @@ class DiskResults:
             json.dump(self.outcome, f)
 
     def save(self):
+        if self.layout == SHARDED_LAYOUT:
+            self.save_batch([self])
+            return
+
         self._save_jsons()
         self._save_bng_logs()
         self._save_outcome()
 
-    def _get_scalars_series(self) -> pd.Series:
+    @classmethod
+    def save_batch(cls, disk_results: Sequence["DiskResults"]) -> None:
+        """
+        Save several runs, e.g. the runs of a batch env.
+
+        In the sharded layout their scalars are appended to the process's packed file together, and they're added to
+        the index together once their histories are saved. Runs in the flat layout are saved individually.
+        """
+        by_root: Dict[str, List[DiskResults]] = {}
+        for dr in disk_results:
+            if dr.layout == SHARDED_LAYOUT:
+                by_root.setdefault(
+                    os.path.abspath(dr.config["output_path"]), []
+                ).append(dr)
+            else:
+                dr.save()
+
+        for root, runs in by_root.items():
+            for dr in runs:
+                dr._save_history()
+                dr._save_bng_logs()
+
+            locations = ScalarsWriter.for_root(root).write(
+                [dr._packed_scalars() for dr in runs]
+            )
+            # Adding the runs to the index marks them complete, so is done last
+            ResultsIndex.for_root(root).append(
+                [
+                    {
+                        "run_id": dr.run_id,
+                        "path": os.path.relpath(dr.output_path, root),
+                        **location,
+                    }
+                    for dr, location in zip(runs, locations)
+                ]
+            )
+
+    def _get_scalars_series(self) -> "pd.Series":
+        import pandas as pd
+
         scalars_series = []
         for name in ["params", "config", "results", "outcome"]:
             scalars_series.append(
@@ -134,7 +226,7 @@ class DiskResults:
         return series
 
     @property
-    def scalars_series(self) -> pd.Series:
+    def scalars_series(self) -> "pd.Series":
         """
         pd.Series containing scalar values for run.
         """
@@ -150,12 +242,22 @@ class DiskResults:
 
         TODO: Switch to use History() object to more flexibly handle keys and shapes.
         """
+        import pandas as pd
 
         car_state_key = "car_state"
         time_index_key = "time_s"
         main_sensor_keys = self.history[car_state_key][0].keys()
 
-        dfs = [pd.DataFrame(self.history[time_index_key], columns=[time_index_key])]
+        # Steps may be recorded at a variable rate (e.g. by EventHistory), so include the time since the previous row
+        time_s = pd.Series(self.history[time_index_key], name=time_index_key)
+        dfs = [
+            pd.DataFrame(
+                {
+                    time_index_key: time_s,
+                    "dt_s": time_s.diff().fillna(time_s.iloc[:1]),
+                }
+            )
+        ]
         for sensor in main_sensor_keys:
             sensor_data = self.history[car_state_key][0][sensor]
             if isinstance(sensor_data, dict):
@@ -189,7 +291,9 @@ class DiskResults:
 
         return self._ts_df
 
-    def _get_bng_ts_df(self) -> Optional[pd.DataFrame]:
+    def _get_bng_ts_df(self) -> Optional["pd.DataFrame"]:
+        import pandas as pd
+
         bng_ts_dfs = []
         for fn in glob.glob(os.path.join(self._path, "*.csv")):
             try:
@@ -208,7 +312,7 @@ class DiskResults:
             pass
 
     @property
-    def bng_ts_df(self) -> Optional[pd.DataFrame]:
+    def bng_ts_df(self) -> Optional["pd.DataFrame"]:
         """Get the bng logs, if there are any"""
         if (self._bng_ts_df is None) and (self.path_to_bng_logs is not None):
             self._bng_ts_df = self._get_bng_ts_df()
@@ -216,16 +320,43 @@ class DiskResults:
         return self._bng_ts_df
 
     @classmethod
-    def load(cls, path: str) -> [Union[pd.Series, pd.DataFrame]]:
+    def load(cls, path: str, run_id: Optional[str] = None) -> "DiskResults":
         """
-        Load and tabulate previous results saved by a TrackTestEnv.
+        Load previous results saved by an env, from either layout.
 
         :param path: Full path to results, this can be either the raw path, or path to on-disk mlflow logs, e.g.
                        - raw results: '.../track_test_results/{UUID}/'
+                       - sharded results: '.../track_test_results/runs/{ab}/{cd}/{UUID}/'
                        - mmlflow longs: '.../mlruns/{experiment_id}/{run_id}
-        :returns: pd.Series containing scalar results/config/params/metrics/etc. and pd.DataFrame containing history
-                  timeseries as rows=time step and columns=[sensor]_[sensor_key]_[dimension].
+                     Or, if run_id is set, the output path the results were saved to, e.g. '.../track_test_results'.
+        :param run_id: Optional ID of the run to load from the output path.
+        :returns: The DiskResults, with .scalars_series containing scalar results/config/params/metrics/etc. and .ts_df
+                  containing history timeseries as rows=time step and columns=[sensor]_[sensor_key]_[dimension].
         """
+        if run_id is not None:
+            entry = ResultsIndex.for_root(path).get(run_id)
+            if entry is None:
+                return cls.load(run_path(path, run_id, layout=FLAT_LAYOUT))
+
+            return cls._load_sharded(root=os.path.abspath(path), entry=entry)
+
+        root = sharded_root(path)
+        if root is not None:
+            entry = ResultsIndex.for_root(root).get(
+                os.path.basename(os.path.abspath(path))
+            )
+            if entry is None:
+                raise ValueError(
+                    f"Unable to load results at {path}: the run isn't in the results index. Results are either "
+                    "incomplete/invalid, or path is incorrect"
+                )
+
+            return cls._load_sharded(root=root, entry=entry)
+
+        return cls._load_flat(path)
+
+    @classmethod
+    def _load_flat(cls, path: str) -> "DiskResults":
         path = path.replace("\\", "/")
 
         if "mlruns" in path and "artifacts" not in path:
@@ -244,6 +375,44 @@ class DiskResults:
                 "or path is incorrect"
             )
 
+        return cls._from_scalars(
+            path=path,
+            run_id=run_id,
+            scalars=cls._read_flat_scalars(path),
+            outcome=outcome,
+        )
+
+    @classmethod
+    def _read_flat_scalars(cls, path: str) -> Dict[str, Dict[str, Any]]:
+        scalar_json_files = [
+            cls._results_fn,
+            cls._params_fn,
+            cls._config_fn,
+            cls._bng_config_fn,
+        ]
+        scalars = {}
+        for fn in scalar_json_files:
+            name = os.path.split(fn)[-1].replace(".json", "")
+            with open(os.path.join(path, fn), "r") as f:
+                scalars[name] = json.load(f)
+
+        return scalars
+
+    @classmethod
+    def _load_sharded(cls, root: str, entry: Dict[str, Any]) -> "DiskResults":
+        scalars = read_scalars(root, entry)
+        outcome = scalars.pop("outcome")
+        run_id = scalars.pop("run_id")
+
+        return cls._from_scalars(
+            path=os.path.join(root, entry["path"]),
+            run_id=run_id,
+            scalars=scalars,
+            outcome=outcome,
+        )
+
+    @classmethod
+    def _check_outcome(cls, outcome: Dict[str, Any]) -> None:
         results_env = outcome.get("env", "UNKNOWN")
         if results_env != cls._env_name:
             raise ValueError(
@@ -257,23 +426,22 @@ class DiskResults:
                 f"{cls._env_name} version {__VERSION__}. This might not work..."
             )
 
-        scalar_json_files = [
-            cls._results_fn,
-            cls._params_fn,
-            cls._config_fn,
-            cls._bng_config_fn,
-        ]
-        scalars = {}
-        for fn in scalar_json_files:
-            name = os.path.split(fn)[-1].replace(".json", "")
-            with open(os.path.join(path, fn), "r") as f:
-                scalars[name] = json.load(f)
+    @classmethod
+    def _from_scalars(
+        cls,
+        path: str,
+        run_id: str,
+        scalars: Dict[str, Dict[str, Any]],
+        outcome: Dict[str, Any],
+    ) -> "DiskResults":
+        cls._check_outcome(outcome)
+
         bng_config = scalars.pop("bng_config")
         scalars["config"]["bng_config"] = bng_config
 
         # Load json files containing timeseries
         with open(os.path.join(path, "history.json"), "r") as f:
-            history = json.load(f)
+            history = decode_history(json.load(f))
 
         # Check for beamng logs in .csv files, don't load here
         path_to_bng_logs = (
@@ -285,7 +453,65 @@ class DiskResults:
             run_id=run_id,
             history=history,
             path_to_bng_logs=path_to_bng_logs,
+            failures=outcome.get("failures", []),
+            pruned=outcome.get("pruned", False),
             **scalars,
         )
 
         return results
+
+    @classmethod
+    def is_complete(cls, path: str, run_id: Optional[str] = None) -> bool:
+        """
+        Whether a run's results are completely saved, in either layout.
+
+        :param path: Path to the run's results, or if run_id is set, the output path they were saved to (as for .load).
+        :param run_id: Optional ID of the run in the output path.
+        """
+        if run_id is None:
+            root = sharded_root(path)
+            if root is None:
+                return os.path.exists(os.path.join(path, cls._outcome_fn))
+            path, run_id = root, os.path.basename(os.path.abspath(path))
+
+        return (ResultsIndex.for_root(path).get(run_id) is not None) or os.path.exists(
+            os.path.join(run_path(path, run_id, layout=FLAT_LAYOUT), cls._outcome_fn)
+        )
+
+    @classmethod
+    def load_scalars_df(cls, output_path: str) -> "pd.DataFrame":
+        """
+        Tabulate the scalars (params, config, results and outcome) of all the complete runs in an output path, without
+        loading their histories. In the sharded layout, these are read from the packed files.
+
+        :param output_path: The output path the results were saved to.
+        :return: pd.DataFrame with a row per run, and columns as in .scalars_series.
+        """
+        import pandas as pd
+
+        rows = read_all_scalars(output_path)
+        for fn in sorted(glob.glob(os.path.join(output_path, "*", cls._outcome_fn))):
+            path = os.path.dirname(fn)
+            with open(fn, "r") as f:
+                outcome = json.load(f)
+            rows.append(
+                dict(
+                    cls._read_flat_scalars(path),
+                    run_id=os.path.basename(path),
+                    outcome=outcome,
+                )
+            )
+
+        return pd.DataFrame(
+            [
+                dict(
+                    {
+                        f"{name}_{k}": v
+                        for name in ["params", "config", "results", "outcome"]
+                        for k, v in row[name].items()
+                    },
+                    run_id=row["run_id"],
+                )
+                for row in rows
+            ]
+        )
@@ -0,0 +1,157 @@
+import json
+import os
+import pathlib
+import shutil
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.data.hashing import canonicalise, hash_dict
+from beamng_envs.data.sharded_results import LAYOUTS, run_path
+
+
+@dataclass
+class ExperimentManifest:
+    """
+    The planned parameter sets for a batch of runs, with deterministic run IDs.
+
+    The run ID for each parameter set is derived from the params (and a replicate number for repeated params), salted
+    with a random experiment ID saved in the manifest file, so DiskResults for each run are saved to a known path:
+    output_path/run_id (or its shard, in the sharded layout). The salt keeps the IDs of repeated param sets in
+    different manifests in the same output_path from clashing.
+    DiskResults writes outcome.json (or adds the run to the index) last, so on restart runs with one are complete, any
+    other run directories are partial and can be removed, and only the remaining runs need to be scheduled.
+
+    e.g.
+    ````
+    manifest = ExperimentManifest.load_or_create(output_path=..., param_sets=param_sets)
+    for run_id, params in manifest.pending():
+        env = TrackTestEnv(params=params, config=config, run_id=run_id)
+        env.run()
+    ````
+    """
+
+    output_path: str
+    param_sets: List[Dict[str, Any]]
+    name: str = "manifest"
+    # Salt for the run IDs. Empty for manifests saved before it was added, which keep their unsalted IDs.
+    experiment_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    run_ids: List[str] = field(init=False)
+
+    _id_length = 32
+
+    def __post_init__(self):
+        self.param_sets = [canonicalise(p) for p in self.param_sets]
+
+        seen = Counter()
+        self.run_ids = []
+        for params in self.param_sets:
+            params_hash = hash_dict(params)
+            id_fields = {"params_hash": params_hash, "replicate": seen[params_hash]}
+            if self.experiment_id:
+                id_fields["experiment_id"] = self.experiment_id
+            self.run_ids.append(hash_dict(id_fields)[: self._id_length])
+            seen[params_hash] += 1
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.output_path, f"{self.name}.json")
+
+    def save(self) -> None:
+        pathlib.Path(self.output_path).mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            json.dump(
+                {
+                    "experiment_id": self.experiment_id,
+                    "runs": [
+                        {"run_id": run_id, "params": params}
+                        for run_id, params in zip(self.run_ids, self.param_sets)
+                    ],
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, output_path: str, name: str = "manifest") -> "ExperimentManifest":
+        with open(os.path.join(output_path, f"{name}.json"), "r") as f:
+            manifest = json.load(f)
+
+        return cls(
+            output_path=output_path,
+            param_sets=[r["params"] for r in manifest["runs"]],
+            name=name,
+            experiment_id=manifest.get("experiment_id", ""),
+        )
+
+    @classmethod
+    def load_or_create(
+        cls,
+        output_path: str,
+        param_sets: Optional[List[Dict[str, Any]]] = None,
+        name: Optional[str] = None,
+    ) -> "ExperimentManifest":
+        """
+        Load an existing manifest from the output path, or create and save a new one from the param_sets.
+
+        If a manifest already exists, param_sets are ignored, so restarted experiments resume the originally planned
+        runs.
+
+        :param output_path: Output path for the experiment's results.
+        :param param_sets: The param sets to plan, if creating a new manifest.
+        :param name: Name of the manifest. If not set, a new manifest is created with a timestamped name.
+        """
+        if name is None:
+            name = time.strftime("manifest_%Y%m%d_%H%M%S")
+
+        if os.path.exists(os.path.join(output_path, f"{name}.json")):
+            return cls.load(output_path=output_path, name=name)
+
+        if param_sets is None:
+            raise ValueError(
+                f"No manifest '{name}' found at {output_path}; param_sets are required."
+            )
+
+        manifest = cls(output_path=output_path, param_sets=param_sets, name=name)
+        manifest.save()
+
+        return manifest
+
+    def _run_paths(self, run_id: str) -> List[str]:
+        return [run_path(self.output_path, run_id, layout=layout) for layout in LAYOUTS]
+
+    def is_complete(self, run_id: str) -> bool:
+        return DiskResults.is_complete(self.output_path, run_id=run_id)
+
+    def completed(self) -> List[str]:
+        return [r for r in self.run_ids if self.is_complete(r)]
+
+    def clean_partial(self) -> List[str]:
+        """Remove the directories of any started, but incomplete, runs. Returns the IDs of the removed runs."""
+        removed = []
+        for run_id in self.run_ids:
+            paths = [p for p in self._run_paths(run_id) if os.path.isdir(p)]
+            if paths and not self.is_complete(run_id):
+                for path in paths:
+                    shutil.rmtree(path)
+                removed.append(run_id)
+
+        return removed
+
+    def pending(self, clean: bool = True) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Return (run_id, params) for the runs that still need to be run.
+
+        :param clean: Remove partial run directories first.
+        """
+        if clean:
+            self.clean_partial()
+
+        return [
+            (run_id, params)
+            for run_id, params in zip(self.run_ids, self.param_sets)
+            if not self.is_complete(run_id)
+        ]
@@ -0,0 +1,43 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+import numpy as np
+
+# Floats are rounded to this many significant figures before hashing, so float32/float64 representations of the same
+# sampled value produce the same key.
+FLOAT_SIG_FIGS = 10
+
+
+def canonicalise(obj: Any) -> Any:
+    """
+    Convert params/configs into a canonical, json-serialisable form.
+
+      - numpy arrays and scalars are converted to python types
+      - single element 1d numpy arrays (e.g. from gym Box samples) are squeezed to scalars; python lists aren't, so
+        {"a": [5]} and {"a": 5} stay distinct
+      - floats are rounded to FLOAT_SIG_FIGS significant figures
+      - dict keys are converted to str (and sorted when dumped)
+    """
+    if isinstance(obj, np.ndarray):
+        obj = obj.item() if obj.shape == (1,) else obj.tolist()
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+
+    if isinstance(obj, dict):
+        return {str(k): canonicalise(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [canonicalise(v) for v in obj]
+    if isinstance(obj, bool) or obj is None:
+        return obj
+    if isinstance(obj, float):
+        return float(f"{obj:.{FLOAT_SIG_FIGS}g}")
+
+    return obj
+
+
+def hash_dict(obj: Dict[str, Any]) -> str:
+    """Return a stable sha256 hex digest for a (canonicalised) dict."""
+    dumped = json.dumps(canonicalise(obj), sort_keys=True, default=str)
+
+    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
@@ -0,0 +1,174 @@
+"""
+Compact storage of histories, for DiskResults.
+
+Many fields in the per-step car state take only a few distinct values over a run, e.g. TrackTestParadigm's
+current_waypoint (a dict with the waypoint name and position) and current_waypoint_idx, or electrics channels such as
+the gear. Storing them in every step duplicates the same values thousands of times in history.json.
+
+encode_history moves these fields out of the per-step car states: fields with a single value are stored once, as
+run-level constants, and other low-cardinality fields as categorical codes with a side dictionary of the distinct
+values. decode_history restores the original history, so the encoding is transparent to History, ts_df, etc.
+
+Fields are the car state's top-level values (e.g. ["current_waypoint"]) and, for sensor dicts, their values (e.g.
+["electrics", "gear"]). Only fields present in every step are encoded.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+ENCODING_KEY = "_encoding"
+
+Field = Sequence[str]
+
+
+def _fields(frame: Dict[str, Any]) -> List[Field]:
+    fields = []
+    for k, v in frame.items():
+        if isinstance(v, dict):
+            fields += [(k, sk) for sk in v]
+        else:
+            fields.append((k,))
+
+    return fields
+
+
+def _get(frame: Dict[str, Any], field: Field) -> Any:
+    for k in field:
+        frame = frame[k]
+
+    return frame
+
+
+def _has(frame: Dict[str, Any], field: Field) -> bool:
+    return (field[0] in frame) and (
+        (len(field) == 1)
+        or (isinstance(frame[field[0]], dict) and (field[1] in frame[field[0]]))
+    )
+
+
+def _set(frame: Dict[str, Any], field: Field, value: Any) -> None:
+    for k in field[:-1]:
+        frame = frame.setdefault(k, {})
+    frame[field[-1]] = value
+
+
+def _pop(frame: Dict[str, Any], field: Field) -> None:
+    if len(field) == 1:
+        del frame[field[0]]
+    else:
+        del frame[field[0]][field[1]]
+
+
+def encode_history(
+    history: Dict[str, List[Any]],
+    car_state_key: str = "car_state",
+    max_categories: int = 256,
+    max_category_ratio: float = 0.25,
+) -> Dict[str, Any]:
+    """
+    Encode the low-cardinality car state fields of a history as constants and categorical codes.
+
+    The input isn't modified.
+
+    :param history: The history dict, e.g. History.__dict__.
+    :param car_state_key: Key of the per-step car states in the history.
+    :param max_categories: Maximum number of distinct values for a field to be encoded as categorical.
+    :param max_category_ratio: Maximum number of distinct values, as a fraction of the number of steps, for a field to
+                               be encoded as categorical.
+    :return: The encoded history, which can be saved as json. Returns the history unchanged if nothing is encoded.
+    """
+    frames = history.get(car_state_key)
+    if not frames or not all(isinstance(f, dict) for f in frames):
+        return history
+
+    max_codes = min(max_categories, int(len(frames) * max_category_ratio))
+    constants = []
+    categoricals = []
+    for field in _fields(frames[0]):
+        if not all(_has(f, field) for f in frames):
+            continue
+
+        codes_by_value: Dict[str, int] = {}
+        values = []
+        codes = []
+        for frame in frames:
+            value = _get(frame, field)
+            key = json.dumps(value, sort_keys=True)
+            if key not in codes_by_value:
+                if len(codes_by_value) > max_codes:
+                    break
+                codes_by_value[key] = len(values)
+                values.append(value)
+            codes.append(codes_by_value[key])
+        else:
+            if len(values) == 1:
+                constants.append({"field": list(field), "value": values[0]})
+            elif len(values) <= max_codes:
+                categoricals.append(
+                    {"field": list(field), "values": values, "codes": codes}
+                )
+
+    if not constants and not categoricals:
+        return history
+
+    encoded_frames = []
+    for frame in frames:
+        frame = {k: dict(v) if isinstance(v, dict) else v for k, v in frame.items()}
+        for encoded_field in constants + categoricals:
+            _pop(frame, encoded_field["field"])
+        encoded_frames.append(frame)
+
+    encoded = dict(history)
+    encoded[car_state_key] = encoded_frames
+    encoded[ENCODING_KEY] = {
+        "car_state_key": car_state_key,
+        # So the decoded car states have their keys in the original order
+        "fields": [list(field) for field in _fields(frames[0])],
+        "constants": constants,
+        "categoricals": categoricals,
+    }
+
+    return encoded
+
+
+def decode_history(history: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """
+    Restore a history encoded by encode_history. Histories that aren't encoded are returned unchanged.
+
+    Decoded categorical values are shared between the steps they appear in.
+    """
+    encoding: Optional[Dict[str, Any]] = history.get(ENCODING_KEY)
+    if encoding is None:
+        return history
+
+    decoded = {k: v for k, v in history.items() if k != ENCODING_KEY}
+    frames = decoded[encoding["car_state_key"]]
+    for constant in encoding["constants"]:
+        for frame in frames:
+            _set(frame, constant["field"], constant["value"])
+
+    for categorical in encoding["categoricals"]:
+        values = categorical["values"]
+        for frame, code in zip(frames, categorical["codes"]):
+            _set(frame, categorical["field"], values[code])
+
+    decoded[encoding["car_state_key"]] = [
+        _reorder(frame, encoding["fields"]) for frame in frames
+    ]
+
+    return decoded
+
+
+def _reorder(frame: Dict[str, Any], fields: List[List[str]]) -> Dict[str, Any]:
+    """Order a car state's keys as in fields; any others follow."""
+    ordered = {}
+    for field in fields:
+        if _has(frame, field):
+            _set(ordered, field, _get(frame, field))
+    for k, v in frame.items():
+        if k not in ordered:
+            ordered[k] = v
+        elif isinstance(v, dict):
+            ordered[k].update({sk: sv for sk, sv in v.items() if sk not in ordered[k]})
+
+    return ordered
@@ -0,0 +1,125 @@
+import json
+import os
+import pathlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from beamng_envs import __VERSION__, __BNG_VERSION__
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.data.hashing import canonicalise, hash_dict
+
+
+class ResultCache:
+    """
+    Content-addressed cache of completed environment runs.
+
+    Runs are keyed on a hash of the env name, the canonicalised params, the config fields that affect the simulation
+    outcome, and the package/BeamNG versions. Each key has a small index file listing the output paths of the stored
+    runs; the results themselves stay where DiskResults saved them.
+
+    BeamNG runs aren't fully deterministic, so up to n_replicates runs are stored per key. Until a key has that many
+    replicates a lookup misses (and the env simulates and stores a new one); after that lookups return one of the
+    stored replicates at random.
+    """
+
+    # Config fields that don't affect the simulation outcome (paths, game instance, logging, caching)
+    _ignored_config_fields = (
+        "bng_config",
+        "output_path",
+        "results_layout",
+        "logging",
+        "close_on_done",
+        "car_configs",
+        "cache_path",
+        "cache_replicates",
+        "step_timeout",
+        "job_timeout",
+        "max_retries",
+        "async_call_timeout",
+        "async_setup_timeout",
+        "fidelity",
+        "dict_observations",
+        "server_side_stepping",
+    )
+    _index_suffix = ".json"
+
+    def __init__(self, path: str, n_replicates: int = 1):
+        if n_replicates < 1:
+            raise ValueError(f"n_replicates must be at least 1, got {n_replicates}.")
+
+        self.path = path
+        self.n_replicates = n_replicates
+        pathlib.Path(path).mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, config: BNGSimConfig) -> Optional["ResultCache"]:
+        """Return the cache specified by the config, or None if caching isn't enabled."""
+        if config.cache_path is None:
+            return None
+
+        return cls(path=config.cache_path, n_replicates=config.cache_replicates)
+
+    @classmethod
+    def key_inputs(
+        cls, env_name: str, params: Dict[str, Any], config: BNGSimConfig
+    ) -> Dict[str, Any]:
+        """The (canonicalised) values the cache key is built from."""
+        return canonicalise(
+            {
+                "env": env_name,
+                "params": params,
+                "config": {
+                    k: v
+                    for k, v in config.__dict__.items()
+                    if k not in cls._ignored_config_fields
+                },
+                "version": __VERSION__,
+                "bng_version": __BNG_VERSION__,
+            }
+        )
+
+    @classmethod
+    def key(cls, env_name: str, params: Dict[str, Any], config: BNGSimConfig) -> str:
+        return hash_dict(
+            cls.key_inputs(env_name=env_name, params=params, config=config)
+        )
+
+    def _index_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{self._index_suffix}")
+
+    def _read_runs(self, key: str) -> List[str]:
+        try:
+            with open(self._index_path(key), "r") as f:
+                return json.load(f)["runs"]
+        except FileNotFoundError:
+            return []
+
+    def _write_runs(self, key: str, runs: List[str]):
+        # Write then rename so concurrent readers never see a partial index
+        tmp_path = f"{self._index_path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"key": key, "runs": runs}, f)
+        os.replace(tmp_path, self._index_path(key))
+
+    def _read_valid_runs(self, key: str) -> List[str]:
+        """Return the stored runs for the key that are still complete on disk."""
+        return [r for r in self._read_runs(key) if DiskResults.is_complete(r)]
+
+    def get(self, key: str) -> Optional[DiskResults]:
+        """Return a stored run for the key, or None if fewer than n_replicates valid runs are stored."""
+        runs = self._read_valid_runs(key)
+        if len(runs) < self.n_replicates:
+            return None
+
+        return DiskResults.load(str(np.random.choice(runs)))
+
+    def put(self, key: str, disk_results: DiskResults):
+        """Add a saved run to the key's replicates, if there's space for it."""
+        runs = self._read_valid_runs(key)
+        if len(runs) >= self.n_replicates:
+            return
+
+        runs.append(disk_results.output_path)
+        self._write_runs(key, runs=runs)
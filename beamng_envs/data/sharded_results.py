@@ -0,0 +1,249 @@
+"""
+Sharded results directory layout, for large sweeps.
+
+In the default "flat" layout, DiskResults saves each run to output_path/<run_id>/ as six or more small json files.
+After a large sweep that's a huge number of small files in one directory, which is slow to list, back up and sync
+(especially on network filesystems). In the "sharded" layout (BNGSimConfig.results_layout = "sharded"):
+
+  - Run directories are sharded by run ID prefix, as output_path/runs/<id[:2]>/<id[2:4]>/<run_id>/. They hold the
+    per-step data: the history, and any BeamNG logs.
+  - The scalar files (params, config, bng_config, results and outcome) of each run are packed into one json line,
+    appended to a packed file, output_path/scalars/<writer>.jsonl. Each writing process has its own packed file (see
+    ScalarsWriter), started afresh every max_rows runs, so a sweep of many single-run envs adds a handful of files
+    rather than one per run.
+  - Saved runs are listed in an append-only index, output_path/index.jsonl, with one line per run giving its directory
+    and where its scalars are packed (the file, and the byte offset and length of its line). A run is complete once
+    it's in the index (as with outcome.json in the flat layout). Later lines for the same run ID, e.g. from rerunning
+    it, supersede earlier ones.
+
+Packed files are only appended to by the process that created them, and index lines are appended with a single write,
+so several processes can save to the same output path.
+"""
+
+import json
+import os
+import pathlib
+import socket
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from beamng_envs.data.numpy_json_encoder import NumpyJSONEncoder
+
+FLAT_LAYOUT = "flat"
+SHARDED_LAYOUT = "sharded"
+LAYOUTS = (FLAT_LAYOUT, SHARDED_LAYOUT)
+
+RUNS_DIR = "runs"
+SCALARS_DIR = "scalars"
+
+
+def _shards(run_id: str) -> Tuple[str, str]:
+    # Pad short IDs, so every run has two levels of shards
+    padded = run_id.ljust(4, "_")
+
+    return padded[:2], padded[2:4]
+
+
+def run_path(output_path: str, run_id: str, layout: str = FLAT_LAYOUT) -> str:
+    """The directory of a run's results in a layout."""
+    if layout == FLAT_LAYOUT:
+        return os.path.join(output_path, run_id)
+    if layout == SHARDED_LAYOUT:
+        return os.path.join(output_path, RUNS_DIR, *_shards(run_id), run_id)
+
+    raise ValueError(f"Unknown results layout {layout}, expected one of {LAYOUTS}.")
+
+
+def sharded_root(path: str) -> Optional[str]:
+    """The output path containing a sharded run directory, or None if the path isn't one."""
+    path = os.path.abspath(path)
+    shard_path = os.path.dirname(path)
+    shards = (
+        os.path.basename(os.path.dirname(shard_path)),
+        os.path.basename(shard_path),
+    )
+    runs_path = os.path.dirname(os.path.dirname(shard_path))
+    if (os.path.basename(runs_path) != RUNS_DIR) or (
+        shards != _shards(os.path.basename(path))
+    ):
+        return None
+
+    root = os.path.dirname(runs_path)
+
+    return root if os.path.exists(os.path.join(root, ResultsIndex.fn)) else None
+
+
+class ResultsIndex:
+    """
+    The append-only index of the runs in a sharded results directory.
+
+    Instances are shared per output path within a process (see .for_root), and read the index incrementally, so
+    repeated lookups (e.g. checking which runs in a manifest are complete) only parse new lines.
+    """
+
+    fn = "index.jsonl"
+
+    _instances: Dict[str, "ResultsIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self.path = os.path.join(self.root, self.fn)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._offset = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ResultsIndex at {self.path}"
+
+    @classmethod
+    def for_root(cls, root: str) -> "ResultsIndex":
+        root = os.path.abspath(root)
+        with cls._instances_lock:
+            if root not in cls._instances:
+                cls._instances[root] = cls(root)
+
+            return cls._instances[root]
+
+    def append(self, entries: Sequence[Dict[str, Any]]) -> None:
+        """Append entries (each with at least a run_id) to the index."""
+        data = "".join(json.dumps(e) + "\n" for e in entries).encode()
+        pathlib.Path(self.root).mkdir(parents=True, exist_ok=True)
+        # One write in append mode, so lines from concurrent writers aren't interleaved
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def refresh(self) -> None:
+        """Read any lines appended since the last refresh."""
+        with self._lock:
+            try:
+                with open(self.path, "rb") as f:
+                    if os.fstat(f.fileno()).st_size < self._offset:
+                        # Replaced, e.g. the output path was deleted and reused
+                        self._entries = {}
+                        self._offset = 0
+                    f.seek(self._offset)
+                    data = f.read()
+            except FileNotFoundError:
+                self._entries = {}
+                self._offset = 0
+                return
+
+            # Leave any partially written last line for the next refresh
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                if line.strip():
+                    entry = json.loads(line)
+                    self._entries[entry["run_id"]] = entry
+            self._offset += end
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        self.refresh()
+
+        return self._entries.get(run_id)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """The latest entry for each run, in the order the runs were first saved."""
+        self.refresh()
+
+        return list(self._entries.values())
+
+
+class ScalarsWriter:
+    """
+    Appends runs' packed scalars to this process's packed file in an output path.
+
+    Instances are shared per output path and process (see .for_root), so the runs saved by all the envs in a process
+    go to one file. A new file is started every max_rows runs, to keep files a manageable size.
+    """
+
+    max_rows = 10000
+
+    _instances: Dict[Tuple[str, int], "ScalarsWriter"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self._rel_path: Optional[str] = None
+        self._n_rows = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"ScalarsWriter for {self.root}"
+
+    @classmethod
+    def for_root(cls, root: str) -> "ScalarsWriter":
+        # Keyed by PID too, so forked processes don't append to their parent's file
+        key = (os.path.abspath(root), os.getpid())
+        with cls._instances_lock:
+            if key not in cls._instances:
+                cls._instances[key] = cls(root)
+
+            return cls._instances[key]
+
+    def _new_file(self) -> str:
+        return os.path.join(
+            SCALARS_DIR,
+            f"{socket.gethostname()}_{os.getpid()}_{uuid.uuid4().hex}.jsonl",
+        )
+
+    def write(self, rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Append the scalars of several runs.
+
+        :param rows: The scalars for each run, e.g. {"run_id": ..., "params": {...}, "results": {...}, ...}.
+        :return: The location of each run's scalars, for its index entry: the packed file (relative to the root), and
+                 the offset and length of its line.
+        """
+        lines = [
+            (json.dumps(row, cls=NumpyJSONEncoder) + "\n").encode() for row in rows
+        ]
+        with self._lock:
+            if (self._rel_path is None) or (self._n_rows >= self.max_rows):
+                self._rel_path = self._new_file()
+                self._n_rows = 0
+            rel_path = self._rel_path
+            path = os.path.join(self.root, rel_path)
+            pathlib.Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+
+            with open(path, "ab") as f:
+                offset = f.tell()
+                f.write(b"".join(lines))
+            self._n_rows += len(rows)
+
+        locations = []
+        for line in lines:
+            locations.append(
+                {"scalars": rel_path, "offset": offset, "length": len(line)}
+            )
+            offset += len(line)
+
+        return locations
+
+
+def read_scalars(root: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Read a run's scalars from its packed file, given its index entry."""
+    with open(os.path.join(root, entry["scalars"]), "rb") as f:
+        f.seek(entry["offset"])
+
+        return json.loads(f.read(entry["length"]))
+
+
+def read_all_scalars(root: str) -> List[Dict[str, Any]]:
+    """Read the scalars of every run in the index, in the order they were saved."""
+    packed: Dict[str, bytes] = {}
+    rows = []
+    for entry in ResultsIndex.for_root(root).entries():
+        if entry["scalars"] not in packed:
+            with open(os.path.join(root, entry["scalars"]), "rb") as f:
+                packed[entry["scalars"]] = f.read()
+        data = packed[entry["scalars"]]
+        rows.append(
+            json.loads(data[entry["offset"] : entry["offset"] + entry["length"]])
+        )
+
+    return rows
@@ -0,0 +1,203 @@
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def default_root() -> str:
+    """Directory for shared run data: in shared memory (/dev/shm) where available, otherwise the temp directory."""
+    base = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+    return os.path.join(base, "beamng_envs_shared")
+
+
+def clean_stale(root: Optional[str] = None, max_age_s: float = 24 * 3600) -> List[str]:
+    """
+    Remove shared run data (including partial publishes) older than max_age_s, e.g. left behind by a coordinator that
+    died before releasing it. Returns the removed paths.
+
+    :param root: Directory to clean, defaults to default_root().
+    :param max_age_s: Age (since last modified) after which data is treated as stale.
+    """
+    root = root if root is not None else default_root()
+    if not os.path.isdir(root):
+        return []
+
+    removed = []
+    cutoff = time.time() - max_age_s
+    for entry in os.scandir(root):
+        try:
+            stale = entry.stat().st_mtime < cutoff
+        except FileNotFoundError:
+            # Released in the meantime
+            continue
+        if stale:
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed.append(entry.path)
+
+    return removed
+
+
+def _numeric(values: Sequence[Any]) -> Optional[np.ndarray]:
+    try:
+        array = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+
+    return array if array.ndim > 0 else None
+
+
+def history_columns(
+    history: Dict[str, List[Any]], car_state_key: str = "car_state"
+) -> Dict[str, np.ndarray]:
+    """
+    Columnar numeric view of a history, with one row per step.
+
+    Columns are named as in DiskResults.ts_df (without the per-dimension suffix, so vectors such as state_pos are
+    2D), e.g. time_s, state_pos, damage_damage. Fields that aren't numeric are skipped.
+    """
+    columns = {}
+    for key, values in history.items():
+        if key == car_state_key:
+            continue
+        array = _numeric(values)
+        if array is not None:
+            columns[key] = array
+
+    frames = history.get(car_state_key) or []
+    if not frames:
+        return columns
+
+    for sensor, data in frames[0].items():
+        if isinstance(data, dict):
+            fields = {
+                f"{sensor}_{k}": [(f.get(sensor) or {}).get(k) for f in frames]
+                for k in data
+            }
+        else:
+            fields = {sensor: [f.get(sensor) for f in frames]}
+
+        for name, values in fields.items():
+            array = _numeric(values)
+            if array is not None:
+                columns[name] = array
+
+    return columns
+
+
+@dataclass
+class SharedRunData:
+    """
+    Hands a run's history and results from a worker process to a coordinator without pickling them.
+
+    The worker publishes the history's numeric columns and the numeric results as memory-mapped .npy files (in shared
+    memory where available, see default_root), and returns this small descriptor. The coordinator maps the columns
+    read-only (.column, .results), so aggregating many runs doesn't copy them between processes, or re-read them from
+    the results directories. Call .release when done with the data; data left by coordinators that died first can be
+    removed with clean_stale.
+
+    This is for runs in worker processes. When runs are in threads of the coordinator, return the results directly
+    instead, as publishing them would only copy them out and back into the same process.
+
+    e.g.
+    ````
+    # In the worker
+    results, history = env.run()
+    return SharedRunData.publish(run_id=run_id, history=history.__dict__, results=results)
+
+    # In the coordinator
+    summary = aggregate_results(runs)
+    max_gx = [np.max(np.abs(run.column("g_forces_gx"))) for run in runs]
+    ````
+    """
+
+    run_id: str
+    path: str
+    n_steps: int
+    # Shape of each history column, by name
+    columns: Dict[str, List[int]]
+    result_keys: List[str]
+
+    _results_fn = "results.npy"
+
+    @classmethod
+    def publish(
+        cls,
+        run_id: str,
+        history: Dict[str, List[Any]],
+        results: Dict[str, Any],
+        root: Optional[str] = None,
+        car_state_key: str = "car_state",
+    ) -> "SharedRunData":
+        """
+        Write a run's numeric history columns and results, and return the descriptor.
+
+        :param run_id: ID of the run.
+        :param history: The history dict, e.g. History.__dict__.
+        :param results: The results; only numeric scalars are published.
+        :param root: Directory to publish to, defaults to default_root().
+        :param car_state_key: Key of the per-step car states in the history.
+        """
+        root = root if root is not None else default_root()
+        path = os.path.join(root, run_id)
+        tmp_path = os.path.join(root, f".{run_id}.{uuid.uuid4().hex}")
+        os.makedirs(tmp_path)
+
+        columns = history_columns(history, car_state_key=car_state_key)
+        for i, array in enumerate(columns.values()):
+            np.save(os.path.join(tmp_path, f"{i}.npy"), array)
+
+        result_keys = [
+            k
+            for k, v in results.items()
+            if isinstance(v, (int, float, np.number)) and not isinstance(v, bool)
+        ]
+        np.save(
+            os.path.join(tmp_path, cls._results_fn),
+            np.asarray([results[k] for k in result_keys], dtype=np.float64),
+        )
+
+        # Publish atomically, replacing any previous data for the run
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+
+        return cls(
+            run_id=run_id,
+            path=path,
+            n_steps=len(history.get(car_state_key) or []),
+            columns={k: list(v.shape) for k, v in columns.items()},
+            result_keys=result_keys,
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """Memory map a history column (read-only)."""
+        idx = list(self.columns).index(name)
+
+        return np.load(os.path.join(self.path, f"{idx}.npy"), mmap_mode="r")
+
+    @property
+    def results(self) -> Dict[str, float]:
+        values = np.load(os.path.join(self.path, self._results_fn), mmap_mode="r")
+
+        return dict(zip(self.result_keys, values.tolist()))
+
+    def release(self) -> None:
+        """Delete the published data."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def aggregate_results(runs: Sequence[SharedRunData]) -> "pd.DataFrame":
+    """The numeric results of each run, indexed by run ID."""
+    import pandas as pd
+
+    return pd.DataFrame(
+        [run.results for run in runs], index=[run.run_id for run in runs]
+    )
@@ -0,0 +1,13 @@
+from beamng_envs.lazy import lazy_module_attrs
+
+# Job broker and agents are imported on first access, so importing the package (or one module in it) stays cheap.
+_LAZY_ATTRS = {
+    "Job": "beamng_envs.distributed.job_broker",
+    "JobBroker": "beamng_envs.distributed.job_broker",
+    "JobBrokerServer": "beamng_envs.distributed.job_broker_server",
+    "JobBrokerClient": "beamng_envs.distributed.job_broker_server",
+    "JobAgent": "beamng_envs.distributed.job_agent",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
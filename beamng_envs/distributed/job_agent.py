@@ -0,0 +1,189 @@
+import dataclasses
+import http.client
+import os
+import socket
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Set, Type, Union
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.data.hashing import canonicalise
+from beamng_envs.distributed.job_broker import Job, JobBroker
+from beamng_envs.distributed.job_broker_server import JobBrokerClient
+from beamng_envs.interfaces.env import IEnv
+
+
+class JobAgent:
+    """
+    Pulls jobs from a broker and runs them on the game instances in a local BNGSimWorkerPool.
+
+    One job is run per worker at a time. While jobs are running, a background thread heartbeats their leases with the
+    broker. Completed jobs are reported with metadata on the saved DiskResults (the host and output path, attempts and
+    scalar results); jobs that raise are reported as failed, and re-queued by the broker. The agent stops when the
+    broker has no pending or leased jobs left. Calls to the broker that fail with a connection error are retried with
+    exponential backoff, so a transient outage doesn't stop the agent or lose finished jobs.
+
+    e.g.
+    ````
+    pool = BNGSimWorkerPool(user_path=..., n_workers=4)
+    pool.launch(bng_config=bng_config, level="gridmap_v2")
+    agent = JobAgent(broker=JobBrokerClient(url="http://broker_host:8765"), worker_pool=pool, env_cls=CrashTestEnv,
+                     config=config)
+    agent.run()
+    pool.close()
+    ````
+    """
+
+    def __init__(
+        self,
+        broker: Union[JobBroker, JobBrokerClient],
+        worker_pool: BNGSimWorkerPool,
+        env_cls: Type[IEnv],
+        config: BNGSimConfig,
+        agent_id: Optional[str] = None,
+        heartbeat_interval: float = 30,
+        poll_interval: float = 10,
+        recycle: bool = False,
+        broker_retries: int = 6,
+        broker_backoff: float = 1,
+    ):
+        """
+        :param broker: The JobBroker, or a client for a remote one.
+        :param worker_pool: The pool of workers to run jobs on. Launch it first to have the pool manage game instances.
+        :param env_cls: The environment to run the jobs in.
+        :param config: Config for the environment; the port and user path are set from each worker.
+        :param agent_id: ID for this agent. Defaults to the host name and PID.
+        :param heartbeat_interval: Interval between lease heartbeats (s). Should be well inside the broker's
+                                   lease_timeout.
+        :param poll_interval: Interval between checks for new jobs (s), when there are none pending but others are
+                              still running (and may be re-queued).
+        :param recycle: Relaunch each worker's game instance after each job; see BNGSimWorkerPool.release.
+        :param broker_retries: Number of times to retry a broker call that fails with a connection error.
+        :param broker_backoff: Wait before the first retry of a broker call (s); doubled for each further retry.
+        """
+        self.broker = broker
+        self.worker_pool = worker_pool
+        self.env_cls = env_cls
+        self.config = config
+        self.agent_id = (
+            agent_id
+            if agent_id is not None
+            else f"{socket.gethostname()}_{os.getpid()}"
+        )
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.recycle = recycle
+        self.broker_retries = broker_retries
+        self.broker_backoff = broker_backoff
+
+        self._active: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self) -> int:
+        """Run jobs until there are none left. Returns the number of jobs this agent completed."""
+        self._stop.clear()
+        heartbeat = threading.Thread(target=self._heartbeat, daemon=True)
+        heartbeat.start()
+        try:
+            with ThreadPoolExecutor(max_workers=self.worker_pool.n_workers) as executor:
+                futures = [
+                    executor.submit(self._work)
+                    for _ in range(self.worker_pool.n_workers)
+                ]
+                n_completed = sum(f.result() for f in futures)
+        finally:
+            self._stop.set()
+            heartbeat.join()
+
+        return n_completed
+
+    def stop(self) -> None:
+        """Stop after the jobs currently running."""
+        self._stop.set()
+
+    def _work(self) -> int:
+        n_completed = 0
+        while not self._stop.is_set():
+            job = self._call_broker("lease", agent_id=self.agent_id)
+            if job is None:
+                counts = self._call_broker("counts")
+                if counts[JobBroker.pending] + counts[JobBroker.leased] == 0:
+                    break
+                self._stop.wait(self.poll_interval)
+                continue
+
+            n_completed += self.run_job(job)
+
+        return n_completed
+
+    def run_job(self, job: Job) -> bool:
+        """Run a leased job on the next free worker and report the outcome to the broker."""
+        with self._lock:
+            self._active.add(job.run_id)
+
+        try:
+            with self.worker_pool.checkout(recycle=self.recycle) as worker:
+                config = dataclasses.replace(
+                    self.config,
+                    bng_config=worker.get_config(self.config.bng_config),
+                )
+                env = self.env_cls(
+                    params=job.params, config=config, bng=worker.bng, run_id=job.run_id
+                )
+                results, _ = env.run()
+        except Exception as e:
+            self._call_broker(
+                "fail",
+                agent_id=self.agent_id,
+                run_id=job.run_id,
+                reason=f"{type(e).__name__}: {e}",
+            )
+            return False
+        finally:
+            with self._lock:
+                self._active.discard(job.run_id)
+
+        self._call_broker(
+            "complete",
+            agent_id=self.agent_id,
+            run_id=job.run_id,
+            metadata={
+                "host": socket.gethostname(),
+                "output_path": env.disk_results.output_path,
+                "attempts": len(env.failures) + 1,
+                "results": canonicalise(results),
+            },
+        )
+
+        return True
+
+    def _call_broker(self, method: str, **kwargs) -> Any:
+        """Call a broker method, retrying with exponential backoff if it fails with a connection error."""
+        for attempt in range(self.broker_retries + 1):
+            try:
+                return getattr(self.broker, method)(**kwargs)
+            except (OSError, http.client.HTTPException) as e:
+                if attempt == self.broker_retries:
+                    raise
+                wait = self.broker_backoff * 2**attempt
+                warnings.warn(f"Broker {method} failed: {e}; retrying in {wait}s.")
+                time.sleep(wait)
+
+    def _heartbeat(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            with self._lock:
+                run_ids = list(self._active)
+            if not run_ids:
+                continue
+
+            try:
+                lost = self.broker.heartbeat(agent_id=self.agent_id, run_ids=run_ids)
+            except (OSError, http.client.HTTPException) as e:
+                warnings.warn(f"Heartbeat to broker failed: {e}")
+                continue
+            if lost:
+                warnings.warn(f"Leases lost for runs {lost}; they may be re-run.")
@@ -0,0 +1,228 @@
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from beamng_envs.data.hashing import canonicalise
+from beamng_envs.data.numpy_json_encoder import NumpyJSONEncoder
+
+
+@dataclass
+class Job:
+    """A parameter set to run, as leased to an agent."""
+
+    run_id: str
+    params: Dict[str, Any]
+    attempts: int = 0
+
+
+class JobBroker:
+    """
+    A queue of parameter sets to run, backed by a local SQLite database.
+
+    Agents lease jobs for lease_timeout seconds, and must heartbeat to keep their leases while the jobs are running.
+    Jobs with expired leases (e.g. the agent's host has died or lost connection) are re-queued for other agents, up to
+    max_attempts leases. Agents report completed jobs with metadata on the results (e.g. the output path of the saved
+    DiskResults), or failed jobs, which are also re-queued up to max_attempts.
+
+    The database should be on a local disk; serve the broker with JobBrokerServer for agents on other hosts.
+
+    e.g.
+    ````
+    broker = JobBroker(db_path="jobs.db")
+    broker.submit(manifest.pending())
+    job = broker.lease(agent_id="host_1")
+    broker.heartbeat(agent_id="host_1", run_ids=[job.run_id])
+    broker.complete(agent_id="host_1", run_id=job.run_id, metadata={"output_path": ...})
+    ````
+    """
+
+    pending = "pending"
+    leased = "leased"
+    done = "done"
+    failed = "failed"
+
+    def __init__(self, db_path: str, lease_timeout: float = 120, max_attempts: int = 3):
+        self.db_path = db_path
+        self.lease_timeout = lease_timeout
+        self.max_attempts = max_attempts
+
+        with self._transaction() as con:
+            con.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    run_id TEXT PRIMARY KEY,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    agent_id TEXT,
+                    lease_expires REAL,
+                    metadata TEXT,
+                    failures TEXT NOT NULL DEFAULT '[]'
+                )
+                """
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and run an immediate (write locked) transaction."""
+        con = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            try:
+                yield con
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            con.execute("COMMIT")
+        finally:
+            con.close()
+
+    def submit(self, jobs: List[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Add (run_id, params) jobs to the queue. Jobs already in the queue are ignored, so resubmitting the pending runs
+        from an ExperimentManifest is safe.
+
+        :return: The number of new jobs added.
+        """
+        with self._transaction() as con:
+            before = con.total_changes
+            con.executemany(
+                "INSERT OR IGNORE INTO jobs (run_id, params, status) VALUES (?, ?, ?)",
+                [
+                    (run_id, json.dumps(canonicalise(params)), self.pending)
+                    for run_id, params in jobs
+                ],
+            )
+
+            return con.total_changes - before
+
+    def _requeue_expired(self, con: sqlite3.Connection, now: float) -> None:
+        expired = con.execute(
+            "SELECT run_id, attempts, agent_id, failures FROM jobs WHERE status = ? AND lease_expires < ?",
+            (self.leased, now),
+        ).fetchall()
+        for run_id, attempts, agent_id, failures in expired:
+            self._requeue(
+                con,
+                run_id=run_id,
+                attempts=attempts,
+                failures=failures,
+                reason=f"Lease expired on agent {agent_id}.",
+            )
+
+    def _requeue(
+        self,
+        con: sqlite3.Connection,
+        run_id: str,
+        attempts: int,
+        failures: str,
+        reason: str,
+    ) -> None:
+        status = self.failed if attempts >= self.max_attempts else self.pending
+        con.execute(
+            "UPDATE jobs SET status = ?, agent_id = NULL, lease_expires = NULL, failures = ? WHERE run_id = ?",
+            (status, json.dumps(json.loads(failures) + [reason]), run_id),
+        )
+
+    def lease(self, agent_id: str) -> Optional[Job]:
+        """Lease the next pending job to an agent, or return None if there are none pending."""
+        now = time.time()
+        with self._transaction() as con:
+            self._requeue_expired(con, now=now)
+            row = con.execute(
+                "SELECT run_id, params, attempts FROM jobs WHERE status = ? ORDER BY rowid LIMIT 1",
+                (self.pending,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            run_id, params, attempts = row
+            con.execute(
+                "UPDATE jobs SET status = ?, agent_id = ?, lease_expires = ?, attempts = ? WHERE run_id = ?",
+                (self.leased, agent_id, now + self.lease_timeout, attempts + 1, run_id),
+            )
+
+        return Job(run_id=run_id, params=json.loads(params), attempts=attempts + 1)
+
+    def heartbeat(self, agent_id: str, run_ids: List[str]) -> List[str]:
+        """
+        Extend the agent's leases on the jobs it's running.
+
+        :return: The run IDs the agent no longer holds leases for (e.g. they expired and were re-queued).
+        """
+        now = time.time()
+        lost = []
+        with self._transaction() as con:
+            for run_id in run_ids:
+                updated = con.execute(
+                    "UPDATE jobs SET lease_expires = ? WHERE run_id = ? AND agent_id = ? AND status = ?",
+                    (now + self.lease_timeout, run_id, agent_id, self.leased),
+                ).rowcount
+                if not updated:
+                    lost.append(run_id)
+
+        return lost
+
+    def complete(self, agent_id: str, run_id: str, metadata: Dict[str, Any]) -> None:
+        """Mark a job done, storing metadata on its results. Late completions of re-queued jobs are also accepted."""
+        with self._transaction() as con:
+            con.execute(
+                "UPDATE jobs SET status = ?, agent_id = ?, lease_expires = NULL, metadata = ? "
+                "WHERE run_id = ? AND status != ?",
+                (
+                    self.done,
+                    agent_id,
+                    json.dumps(metadata, cls=NumpyJSONEncoder),
+                    run_id,
+                    self.done,
+                ),
+            )
+
+    def fail(self, agent_id: str, run_id: str, reason: str) -> None:
+        """Release a job the agent failed to run, re-queueing it if it has attempts remaining."""
+        with self._transaction() as con:
+            row = con.execute(
+                "SELECT attempts, failures FROM jobs WHERE run_id = ? AND agent_id = ? AND status = ?",
+                (run_id, agent_id, self.leased),
+            ).fetchone()
+            if row is not None:
+                self._requeue(
+                    con,
+                    run_id=run_id,
+                    attempts=row[0],
+                    failures=row[1],
+                    reason=f"{agent_id}: {reason}",
+                )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs in each status."""
+        with self._transaction() as con:
+            self._requeue_expired(con, now=time.time())
+            rows = con.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+
+        counts = {s: 0 for s in (self.pending, self.leased, self.done, self.failed)}
+        counts.update(dict(rows))
+
+        return counts
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """The status, metadata and failures for each job, by run ID."""
+        with self._transaction() as con:
+            rows = con.execute(
+                "SELECT run_id, status, attempts, metadata, failures FROM jobs"
+            ).fetchall()
+
+        return {
+            run_id: {
+                "status": status,
+                "attempts": attempts,
+                "metadata": json.loads(metadata) if metadata is not None else None,
+                "failures": json.loads(failures),
+            }
+            for run_id, status, attempts, metadata, failures in rows
+        }
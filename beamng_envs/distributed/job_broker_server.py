@@ -0,0 +1,151 @@
+import dataclasses
+import hmac
+import json
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from beamng_envs.data.numpy_json_encoder import NumpyJSONEncoder
+from beamng_envs.distributed.job_broker import Job, JobBroker
+
+
+class JobBrokerServer:
+    """
+    Serves a JobBroker over HTTP (stdlib only), for agents on other hosts to connect to with a JobBrokerClient.
+
+    Each request is a POST to /[method] with the method's kwargs as a json body, e.g. /lease {"agent_id": "host_1"}.
+    Errors are returned as {"error": ...} with a 4xx or 500 status.
+
+    By default the server only listens on localhost. To serve agents on other hosts, bind to another interface (e.g.
+    host="0.0.0.0"), which requires a shared token; requests without it in the X-Broker-Token header are rejected.
+    """
+
+    methods = ("lease", "heartbeat", "complete", "fail", "counts")
+    token_header = "X-Broker-Token"
+    local_hosts = ("127.0.0.1", "localhost", "::1")
+
+    def __init__(
+        self,
+        broker: JobBroker,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        token: Optional[str] = None,
+    ):
+        """
+        :param broker: The broker to serve.
+        :param host: Interface to listen on.
+        :param port: Port to listen on, or 0 for a free port.
+        :param token: Shared token clients must send. Required if host isn't local.
+        """
+        if token is None and host not in self.local_hosts:
+            raise ValueError(
+                f"A token is required to serve the broker on non-local host {host}."
+            )
+
+        self.broker = broker
+        self.token = token
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if server.token is not None and not hmac.compare_digest(
+                    self.headers.get(server.token_header, "").encode(),
+                    server.token.encode(),
+                ):
+                    self._send_json(401, {"error": "Invalid or missing token."})
+                    return
+
+                method = self.path.strip("/")
+                if method not in server.methods:
+                    self._send_json(404, {"error": f"Unknown method {method}"})
+                    return
+
+                length = int(self.headers.get("Content-Length", 0))
+                try:
+                    kwargs = json.loads(self.rfile.read(length) or b"{}")
+                    result = getattr(server.broker, method)(**kwargs)
+                except (TypeError, ValueError) as e:
+                    self._send_json(400, {"error": str(e)})
+                    return
+                except Exception as e:
+                    # e.g. sqlite3.OperationalError if the database is locked; respond, so the client doesn't see a
+                    # dropped connection
+                    self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+                    return
+                if isinstance(result, Job):
+                    result = dataclasses.asdict(result)
+
+                self._send_json(200, {"result": result})
+
+            def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+                body = json.dumps(payload, cls=NumpyJSONEncoder).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def start(self) -> None:
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class JobBrokerClient:
+    """Connects to a JobBrokerServer, with the same job methods as JobBroker."""
+
+    def __init__(self, url: str, timeout: float = 30, token: Optional[str] = None):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.token = token
+
+    def _call(self, method: str, **kwargs) -> Any:
+        headers = {"Content-Type": "application/json"}
+        if self.token is not None:
+            headers[JobBrokerServer.token_header] = self.token
+        request = urllib.request.Request(
+            f"{self.url}/{method}",
+            data=json.dumps(kwargs, cls=NumpyJSONEncoder).encode(),
+            headers=headers,
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.loads(response.read())["result"]
+
+    def lease(self, agent_id: str) -> Optional[Job]:
+        job = self._call("lease", agent_id=agent_id)
+
+        return Job(**job) if job is not None else None
+
+    def heartbeat(self, agent_id: str, run_ids: List[str]) -> List[str]:
+        return self._call("heartbeat", agent_id=agent_id, run_ids=run_ids)
+
+    def complete(self, agent_id: str, run_id: str, metadata: Dict[str, Any]) -> None:
+        self._call("complete", agent_id=agent_id, run_id=run_id, metadata=metadata)
+
+    def fail(self, agent_id: str, run_id: str, reason: str) -> None:
+        self._call("fail", agent_id=agent_id, run_id=run_id, reason=reason)
+
+    def counts(self) -> Dict[str, int]:
+        return self._call("counts")
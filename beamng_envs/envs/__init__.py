@@ -1,9 +1,21 @@
-from beamng_envs.envs.crash_test.crash_test_config import CrashTestConfig
-from beamng_envs.envs.crash_test.crash_test_env import CrashTestEnv
-from beamng_envs.envs.crash_test.crash_test_param_space import (
-    CrashTestParamSpaceBuilder,
-)
-from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
-from beamng_envs.envs.drag_strip.drag_strip_env import DragStripEnv
-from beamng_envs.envs.track_test.track_test_config import TrackTestConfig
-from beamng_envs.envs.track_test.track_test_env import TrackTestEnv
+from beamng_envs.lazy import lazy_module_attrs
+
+# Envs are imported on first access, so modules in the envs package (e.g. envs.errors) can be imported without
+# importing every env (and the BNGSim modules that depend on them).
+_LAZY_ATTRS = {
+    "BNGVectorEnv": "beamng_envs.envs.vector_env",
+    "CrashTestBatchEnv": "beamng_envs.envs.crash_test.crash_test_batch_env",
+    "CrashTestConfig": "beamng_envs.envs.crash_test.crash_test_config",
+    "CrashTestEnv": "beamng_envs.envs.crash_test.crash_test_env",
+    "CrashTestParamSpaceBuilder": "beamng_envs.envs.crash_test.crash_test_param_space",
+    "DragStripBatchEnv": "beamng_envs.envs.drag_strip.drag_strip_batch_env",
+    "DragStripConfig": "beamng_envs.envs.drag_strip.drag_strip_config",
+    "DragStripEnv": "beamng_envs.envs.drag_strip.drag_strip_env",
+    "EventHistory": "beamng_envs.envs.event_history",
+    "History": "beamng_envs.envs.history",
+    "TrackTestConfig": "beamng_envs.envs.track_test.track_test_config",
+    "TrackTestEnv": "beamng_envs.envs.track_test.track_test_env",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,183 @@
+import asyncio
+import copy
+from typing import Optional, Dict, Iterable, Any, Tuple, List, Callable
+
+from beamngpy import BeamNGpy
+
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.envs.crash_test.crash_test_batch_paradigm import (
+    CrashTestBatchParadigm,
+)
+from beamng_envs.envs.crash_test.crash_test_config import CrashTestConfig
+from beamng_envs.envs.history import History
+from beamng_envs.interfaces.env import IEnv
+
+
+class CrashTestBatchEnv(IEnv):
+    """
+    Runs several crash tests in one gridmap_v2 scenario, with one vehicle per target lane.
+
+    This amortises the cost of loading the level and scenario over up to 4 tests (one each for the flat wall, raised
+    bar, bollards and wedge). The simulation is stepped once per step for all the vehicles, and each vehicle's
+    history and results are saved to their own DiskResults, in the same format as CrashTestEnv.
+
+    Results from batched runs aren't added to the result cache, as the vehicles share a simulation.
+
+    e.g.
+    ````
+    for batch in CrashTestBatchEnv.batch(param_sets):
+        env = CrashTestBatchEnv(params=[param_sets[i] for i in batch], config=crash_test_config)
+        results, histories = env.run()
+    ````
+    """
+
+    config: CrashTestConfig
+    histories: List[History]
+
+    def __init__(
+        self,
+        params: List[Dict[str, Any]],
+        config: CrashTestConfig,
+        bng: Optional[BeamNGpy] = None,
+        run_ids: Optional[List[Optional[str]]] = None,
+        history_fn: Callable[[], History] = History,
+    ):
+        """
+        :param params: The params for each test, each with a start position in a different lane. See .batch.
+        :param config: The env config, shared by all the tests.
+        :param bng: Optional existing BNG instance to use.
+        :param run_ids: Optional IDs to save each test's results under.
+        :param history_fn: Creates the history for each test, e.g. EventHistory to record at full rate only around
+                           the impacts.
+        """
+        if (run_ids is not None) and (len(run_ids) != len(params)):
+            raise ValueError(
+                f"Got {len(run_ids)} run IDs for {len(params)} param sets."
+            )
+
+        self.params = params
+        self.config = config
+        self.run_ids = run_ids if run_ids is not None else [None] * len(params)
+        self.histories = [history_fn() for _ in params]
+        self.disk_results = None
+        self.failures = []
+        self._bng_simulation = BNGSim(config=config, bng=bng)
+        self._paradigm = CrashTestBatchParadigm(params=params)
+
+    @staticmethod
+    def batch(params: List[Dict[str, Any]]) -> List[List[int]]:
+        """Split param sets into batches that can be run together. See CrashTestBatchParadigm.batch."""
+        return CrashTestBatchParadigm.batch(params)
+
+    @property
+    def history(self) -> History:
+        """The history of the first test in the batch."""
+        return self.histories[0]
+
+    def step(
+        self, action: Optional[int] = None, **kwargs
+    ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
+        """
+
+        :param action: Action to take on step - ignored in this environment
+        :param kwargs: Other step kwargs.
+        :return: Tuple containing (observations, reward, done, info), with an observation for each test.
+        """
+        obs, reward, done, info = self._paradigm.step(
+            bng_simulation=self._bng_simulation, action=action, **kwargs
+        )
+
+        return self._observation(obs), reward, done, info
+
+    def run(
+        self, modifiers: Optional[Dict[str, Iterable[Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[History]]:
+        """
+        Run all the tests in the batch to completion.
+
+        :return: Tuple containing (results, histories), with one of each for each test, in the order of the params.
+        """
+        current_time_s = self._run_with_retries(self._run_steps)
+        self._finish(current_time_s)
+
+        return self.results, self.histories
+
+    async def async_run(
+        self,
+        modifiers: Optional[Dict[str, Iterable[Any]]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[History]]:
+        """
+        Asyncio equivalent of .run; see IEnv.async_run.
+
+        :return: Tuple containing (results, histories), with one of each for each test, in the order of the params.
+        """
+        await super().async_run(modifiers=modifiers, limit=limit)
+
+        return self.results, self.histories
+
+    def _finish(self, current_time_s: float) -> None:
+        config_dict = copy.deepcopy(self.config.__dict__)
+        _ = config_dict.pop("car_configs")
+
+        self.results = []
+        self.disk_results = []
+        for params, vehicle, history, run_id in zip(
+            self.params, self._paradigm.vehicles, self.histories, self.run_ids
+        ):
+            results = {history.time_key: current_time_s, "batch_size": len(self.params)}
+            results.update(
+                self._paradigm.summarise(
+                    params=params, vehicle=vehicle, history=history
+                )
+            )
+            if self.config.fidelity is not None:
+                results["fidelity"] = self.config.fidelity
+
+            disk_results = DiskResults(
+                path=self.config.output_path,
+                params=params,
+                config=config_dict,
+                history=history.__dict__,
+                path_to_bng_logs=self._bng_simulation.stop_bng_logging_for(vehicle),
+                results=results,
+                run_id=run_id,
+                failures=self.failures,
+            )
+
+            self.results.append(results)
+            self.disk_results.append(disk_results)
+        DiskResults.save_batch(self.disk_results)
+
+        self._bng_simulation.close()
+
+    def _load_cached_results(self) -> bool:
+        # Batched runs aren't cached, as the vehicles share a simulation
+        return False
+
+    def _record_step(self, obs: List[Any]) -> float:
+        current_time_s = self._bng_simulation.get_real_time(self._paradigm.current_step)
+        for history, vehicle_obs in zip(self.histories, obs):
+            history.append(
+                {
+                    history.step_key: self._paradigm.current_step,
+                    history.time_key: current_time_s,
+                    history.car_state_key: vehicle_obs,
+                }
+            )
+        self.done = self._paradigm.done
+
+        return current_time_s
+
+    def _flush_history(self) -> None:
+        for history in self.histories:
+            history.flush()
+
+    def reset(self) -> None:
+        self.done = False
+        self._bng_simulation.reset()
+        self._paradigm.reset(bng_simulation=self._bng_simulation)
+        for history in self.histories:
+            history.reset()
+        self.results = []
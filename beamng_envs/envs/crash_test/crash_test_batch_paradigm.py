@@ -0,0 +1,126 @@
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from beamngpy import Vehicle, Scenario
+
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.envs.crash_test.crash_test_paradigm import CrashTestParadigm
+
+
+class CrashTestBatchParadigm(CrashTestParadigm):
+    """
+    Runs several crash tests at once, with one vehicle per target lane in the same gridmap_v2 scenario.
+
+    The targets are grouped into lanes that don't interfere with each other: the flat wall, the raised bar, the bollards
+    and the wedge. The start positions within a lane (e.g. flat_left and flat_mid) are too close together to run
+    side by side, so each param set in a batch must use a different lane. Use .batch to split a list of param sets into
+    valid batches.
+    """
+
+    lanes = {
+        "flat": ["flat_left", "flat_mid", "flat_right"],
+        "raised_bar": ["raised_bar"],
+        "bollards": ["bollards_left", "bollards_mid", "bollards_right"],
+        "wedge": ["wedge"],
+    }
+
+    vehicles: List[Vehicle]
+
+    def __init__(self, params: List[Dict[str, Any]]):
+        """
+        :param params: The params for each test in the batch, each with a start position in a different lane.
+        """
+        lanes = [self.lane_of(p["start_position"]) for p in params]
+        if len(set(lanes)) != len(lanes):
+            raise ValueError(
+                f"Each test in a batch needs a start position in a different lane, got lanes {lanes}."
+            )
+
+        super().__init__(params=params[0] if params else {})
+        self.params_list = params
+
+    @classmethod
+    def lane_of(cls, start_position: str) -> str:
+        for lane, start_positions in cls.lanes.items():
+            if start_position in start_positions:
+                return lane
+
+        raise KeyError(f"Unknown start position {start_position}.")
+
+    @classmethod
+    def batch(cls, params: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Split param sets into batches that can be run together, with at most one test per lane in each.
+
+        :param params: Param sets to split.
+        :return: Indexes of the param sets in each batch, in order of first appearance.
+        """
+        batches: List[List[int]] = []
+        batch_lanes: List[set] = []
+        for i, p in enumerate(params):
+            lane = cls.lane_of(p["start_position"])
+            for batch, lanes in zip(batches, batch_lanes):
+                if lane not in lanes:
+                    batch.append(i)
+                    lanes.add(lane)
+                    break
+            else:
+                batches.append([i])
+                batch_lanes.append({lane})
+
+        return batches
+
+    def start_scenario(self, bng_simulation: BNGSim):
+        self._scenario = Scenario("gridmap_v2", name="crash_test_batch")
+        self.vehicles = []
+        for i, params in enumerate(self.params_list):
+            car_model = params["car_config_name"].split("__")[0]
+            vehicle = Vehicle(f"{car_model}_{i}", model=car_model, licence="MONOLITH")
+            self._scenario.add_vehicle(
+                vehicle,
+                pos=self._start_positions[params["start_position"]],
+                rot_quat=self._rot_quat,
+            )
+            self.vehicles.append(vehicle)
+
+        self._scenario.make(bng_simulation.bng)
+        bng_simulation.start_scenario(self._scenario, load_start_wait=3)
+        bng_simulation.remove_debug_paths()
+
+        self._n_nodes = 10
+        for params, vehicle in zip(self.params_list, self.vehicles):
+            parts_config = copy.deepcopy(
+                bng_simulation.config.car_configs.configs[params["car_config_name"]]
+            )
+            vehicle.set_part_config(parts_config)
+            bng_simulation.attach_sensors_to_vehicle(vehicle)
+
+            speed_mps = float(params["speed_kph"]) * 0.27778
+            path_nodes = self._path_to_target(
+                start_position=params["start_position"], initial_speed_mps=speed_mps
+            )
+            vehicle.set_velocity(speed_mps)
+            vehicle.ai.set_script(path_nodes)
+            bng_simulation.add_debug_path(path_nodes)
+
+        self.vehicle = self.vehicles[0]
+        bng_simulation.bng.switch_vehicle(self.vehicle)
+
+    def step(
+        self, bng_simulation: BNGSim, action: Optional[int] = None, **kwargs
+    ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
+        """Step the simulation once, returning the sensor data for each vehicle (in the order of the params)."""
+        if not self._ready:
+            self.reset(bng_simulation)
+
+        if self.done:
+            raise ValueError("Finished")
+
+        sensor_data = bng_simulation.step_and_poll(self.vehicles)
+        self.current_step += 1
+
+        # Check done - here always end at max steps
+        self.finished = bng_simulation.check_time_limit(scenario_step=self.current_step)
+        self.done = self.finished
+
+        return sensor_data, None, self.done, {}
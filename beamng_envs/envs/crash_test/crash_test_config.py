@@ -1,16 +1,21 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from beamng_envs.cars.cars_and_configs import CarConfigs
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class CrashTestConfig(BNGSimConfig):
     car_configs: CarConfigs = None
     output_path: str = "crash_test_results"
     bng_close_on_done: bool = False
     max_time: int = 20
     bng_fps: int = 100
+    # The env only uses the vehicle's state, total damage and g-forces
+    sensor_keys: Optional[Dict[str, Optional[List[str]]]] = field(
+        default_factory=lambda: {"state": None, "damage": ["damage"], "g_forces": None}
+    )
 
     def __post_init__(self):
         if (self.car_configs is None) or (self.car_configs.summary is None):
@@ -1,7 +1,6 @@
 import copy
 from typing import Optional, Dict, Iterable, Any, Tuple
 
-import numpy as np
 from beamngpy import BeamNGpy
 
 from beamng_envs.bng_sim.bng_sim import BNGSim
@@ -35,11 +34,23 @@ class CrashTestEnv(IEnv):
         params: Dict[str, Any],
         config: CrashTestConfig,
         bng: Optional[BeamNGpy] = None,
+        run_id: Optional[str] = None,
+        history: Optional[History] = None,
     ):
+        """
+        :param params: The test params.
+        :param config: The env config.
+        :param bng: Optional existing BNG instance to use.
+        :param run_id: Optional ID to save the results under.
+        :param history: Optional history to record to, e.g. an EventHistory to record at full rate only around the
+                        impact. Defaults to recording every step.
+        """
         self.params = params
         self.config = config
-        self.history = History()
+        self.run_id = run_id
+        self.history = history if history is not None else History()
         self.disk_results = None
+        self.failures = []
         self._bng_simulation = BNGSim(config=config, bng=bng)
         self._paradigm: CrashTestParadigm = CrashTestParadigm(params=params)
 
@@ -52,48 +63,32 @@ class CrashTestEnv(IEnv):
         :param kwargs: Other step kwargs.
         :return: Tuple containing (observation, reward, done, info) (to match OpenAI Gym interface).
         """
-        return self._paradigm.step(
+        obs, reward, done, info = self._paradigm.step(
             bng_simulation=self._bng_simulation, action=action, **kwargs
         )
 
+        return self._observation(obs), reward, done, info
+
     def run(
         self, modifiers: Optional[Dict[str, Iterable[Any]]] = None
     ) -> Tuple[Dict[str, Any], History]:
-        self.reset()
-        current_time_s = 0
+        if self._load_cached_results():
+            return self.results, self.history
 
-        if self.done:
-            raise ValueError("Finished, reset before use.")
-
-        while not self.done:
-            obs, _, done, _ = self.step()
-            current_time_s = self._bng_simulation.get_real_time(
-                self._paradigm.current_step
-            )
-            self.history.append(
-                {
-                    self.history.step_key: self._paradigm.current_step,
-                    self.history.time_key: current_time_s,
-                    self.history.car_state_key: obs,
-                }
-            )
+        current_time_s = self._run_with_retries(self._run_steps)
+        self._finish(current_time_s)
 
-            self.done = self._paradigm.done
+        return self.results, self.history
 
+    def _finish(self, current_time_s: float) -> None:
         self.results[self.history.time_key] = current_time_s
-        self.results["parts_requested"] = self.params
-        self.results["parts_actual"] = self._paradigm.vehicle.get_part_config()
-        self.results["max_damage"] = np.max(
-            [v["damage"]["damage"] for v in self.history[self.history.car_state_key]]
-        )
-        g_force_maxs = {}
-        for k in self._paradigm.g_force_keys:
-            g_force_maxs[f"max_abs_{k}"] = np.max(
-                np.abs(
-                    [t["g_forces"][k] for t in self.history[self.history.car_state_key]]
-                )
+        self.results.update(
+            self._paradigm.summarise(
+                params=self.params, vehicle=self._paradigm.vehicle, history=self.history
             )
-        self.results.update(g_force_maxs)
+        )
+        if self.config.fidelity is not None:
+            self.results["fidelity"] = self.config.fidelity
 
         config_dict = copy.deepcopy(self.config.__dict__)
         _ = config_dict.pop("car_configs")
@@ -107,12 +102,13 @@ class CrashTestEnv(IEnv):
                 self._paradigm.vehicle
             ),
             results=self.results,
+            run_id=self.run_id,
+            failures=self.failures,
         )
         self.disk_results.save()
+        self._cache_results()
         self._bng_simulation.close()
 
-        return self.results, self.history
-
     def reset(self) -> None:
         self.done = False
         self._bng_simulation.reset()
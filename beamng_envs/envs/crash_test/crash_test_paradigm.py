@@ -1,10 +1,11 @@
 import copy
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from beamngpy import Vehicle, Scenario
 
 from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.envs.history import History
 from beamng_envs.interfaces.paradigm import IParadigm
 
 
@@ -51,13 +52,23 @@ class CrashTestParadigm(IParadigm):
         :param initial_speed_mps: Initial speed in ms-1.
         """
         self._n_nodes = 10
+        self._path_nodes = self._path_to_target(
+            start_position=self.params["start_position"],
+            initial_speed_mps=initial_speed_mps,
+        )
+
+    def _path_to_target(
+        self, start_position: str, initial_speed_mps: float
+    ) -> List[Dict[str, float]]:
+        """Straight path nodes from a start position to its target, timed for the initial speed."""
         path_target_deltas = np.linspace(0, 120, self._n_nodes)
 
         times = path_target_deltas / initial_speed_mps
 
-        start_x = self._start_positions[self.params["start_position"]][0]
-        start_y = self._start_positions[self.params["start_position"]][1]
-        self._path_nodes = [
+        start_x = self._start_positions[start_position][0]
+        start_y = self._start_positions[start_position][1]
+
+        return [
             {"x": start_x, "y": start_y + y, "z": self.z_pos, "t": t}
             for y, t in zip(path_target_deltas, times)
         ]
@@ -99,8 +110,7 @@ class CrashTestParadigm(IParadigm):
         if self.done:
             raise ValueError("Finished")
 
-        bng_simulation.bng.step(1, wait=True)
-        sensor_data = bng_simulation.poll_sensors_for_vehicle(self.vehicle)
+        sensor_data = bng_simulation.step_and_poll([self.vehicle])[0]
         self.current_step += 1
 
         # Check done - here always end at max steps
@@ -115,3 +125,20 @@ class CrashTestParadigm(IParadigm):
         self.finished = False
         self.done = False
         self.current_step = 0
+
+    def summarise(
+        self, params: Dict[str, Any], vehicle: Vehicle, history: History
+    ) -> Dict[str, Any]:
+        """Summary results for a vehicle's test: the parts requested and fitted, max damage and max abs g-forces."""
+        car_states = history[history.car_state_key]
+        results = {
+            "parts_requested": params,
+            "parts_actual": vehicle.get_part_config(),
+            "max_damage": np.max([v["damage"]["damage"] for v in car_states]),
+        }
+        for k in self.g_force_keys:
+            results[f"max_abs_{k}"] = np.max(
+                np.abs([t["g_forces"][k] for t in car_states])
+            )
+
+        return results
@@ -55,7 +55,14 @@ class CrashTestParamSpaceBuilder:
 
         self.param_space = {}
         self.param_space.update(copy.deepcopy(self._fixed_space))
-        self.param_space.update(copy.deepcopy(self._available_car_configs))
+        car_config_names = tuple(self._available_car_configs.keys())
+        self.param_space[self._car_config_name_key] = dict(
+            values=car_config_names,
+            name=self._car_config_name_key,
+            description="Car config template, name",
+            type=str,
+            default=car_config_names[0],
+        )
 
     def _build_gym_space(self):
         if self.param_space is None:
@@ -0,0 +1,195 @@
+import asyncio
+from typing import Optional, Dict, Iterable, Any, Tuple, List
+
+from beamngpy import BeamNGpy
+
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.envs.drag_strip.drag_strip_batch_paradigm import (
+    DragStripBatchParadigm,
+)
+from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
+from beamng_envs.envs.history import History
+from beamng_envs.interfaces.env import IEnv
+from beamng_envs.lazy import LazyImport
+
+
+class DragStripBatchEnv(IEnv):
+    """
+    Races several Sunburst part configs at once, on parallel lanes of the drag strip in gridmap_v2.
+
+    This evaluates up to max_lanes configs with one scenario load and one step loop. Each vehicle has its own AI script
+    path and finish detection, and its own history and DiskResults, in the same format as DragStripEnv. A vehicle's
+    history and time_s end when it passes the end of the drag strip.
+
+    Results from batched runs aren't added to the result cache, as the vehicles share a simulation.
+
+    e.g.
+    ````
+    env = DragStripBatchEnv(params=[DragStripBatchEnv.param_space.sample() for _ in range(4)], config=config)
+    results, histories = env.run()
+    ````
+    """
+
+    param_space = LazyImport(
+        "beamng_envs.envs.drag_strip.drag_strip_param_space",
+        "DRAG_STRIP_PARAM_SPACE_GYM",
+    )
+    histories: List[History]
+
+    def __init__(
+        self,
+        params: List[Dict[str, Any]],
+        config: DragStripConfig = DragStripConfig(),
+        bng: Optional[BeamNGpy] = None,
+        run_ids: Optional[List[Optional[str]]] = None,
+        lane_spacing: float = 5,
+        max_lanes: int = 4,
+    ):
+        """
+        :param params: The part config for each vehicle.
+        :param config: The env config, shared by all the vehicles.
+        :param bng: Optional existing BNG instance to use.
+        :param run_ids: Optional IDs to save each vehicle's results under.
+        :param lane_spacing: Distance between the lanes, in m.
+        :param max_lanes: Maximum number of vehicles to allow.
+        """
+        if (run_ids is not None) and (len(run_ids) != len(params)):
+            raise ValueError(
+                f"Got {len(run_ids)} run IDs for {len(params)} param sets."
+            )
+
+        self.params = params
+        self.config = config
+        self.run_ids = run_ids if run_ids is not None else [None] * len(params)
+        self.histories = [History() for _ in params]
+        self.disk_results = None
+        self.failures = []
+
+        self._bng_simulation = BNGSim(config=config, bng=bng)
+        self._paradigm = DragStripBatchParadigm(
+            params=params, lane_spacing=lane_spacing, max_lanes=max_lanes
+        )
+
+    @property
+    def history(self) -> History:
+        """The history of the first vehicle in the batch."""
+        return self.histories[0]
+
+    def step(
+        self, action: Optional[int] = None, **kwargs
+    ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
+        """
+
+        :param action:
+        :param kwargs:
+        :return: Tuple containing (observations, reward, done, info), with an observation for each vehicle.
+        """
+        obs, reward, done, info = self._paradigm.step(
+            bng_simulation=self._bng_simulation, action=action
+        )
+
+        return self._observation(obs), reward, done, info
+
+    def run(
+        self, modifiers: Optional[Dict[str, Iterable[Any]]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[History]]:
+        """
+        Run all the vehicles to completion.
+
+        :return: Tuple containing (results, histories), with one of each for each vehicle, in the order of the params.
+        """
+        current_time_s = self._run_with_retries(self._run_steps)
+        self._finish(current_time_s)
+
+        return self.results, self.histories
+
+    async def async_run(
+        self,
+        modifiers: Optional[Dict[str, Iterable[Any]]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[History]]:
+        """
+        Asyncio equivalent of .run; see IEnv.async_run.
+
+        :return: Tuple containing (results, histories), with one of each for each vehicle, in the order of the params.
+        """
+        await super().async_run(modifiers=modifiers, limit=limit)
+
+        return self.results, self.histories
+
+    def _finish(self, current_time_s: float) -> None:
+        self.results = []
+        self.disk_results = []
+        for i, (params, vehicle, history, run_id) in enumerate(
+            zip(self.params, self._paradigm.vehicles, self.histories, self.run_ids)
+        ):
+            finish_step = self._paradigm.finish_steps[i]
+            results = {
+                "finished": self._paradigm.finished_lanes[i],
+                "parts_requested": dict(params),
+                "parts_actual": dict(vehicle.get_part_config()),
+                history.time_key: (
+                    self._bng_simulation.get_real_time(finish_step)
+                    if finish_step is not None
+                    else current_time_s
+                ),
+                "batch_size": len(self.params),
+            }
+            if self.config.fidelity is not None:
+                results["fidelity"] = self.config.fidelity
+
+            disk_results = DiskResults(
+                path=self.config.output_path,
+                params=params,
+                config=self.config.__dict__,
+                history=history.__dict__,
+                path_to_bng_logs=self._bng_simulation.stop_bng_logging_for(vehicle),
+                results=results,
+                run_id=run_id,
+                failures=self.failures,
+            )
+
+            self.results.append(results)
+            self.disk_results.append(disk_results)
+        DiskResults.save_batch(self.disk_results)
+
+        self._bng_simulation.close()
+
+    def _load_cached_results(self) -> bool:
+        # Batched runs aren't cached, as the vehicles share a simulation
+        return False
+
+    def _record_step(self, obs: List[Any]) -> float:
+        current_time_s = self._bng_simulation.get_real_time(self._paradigm.current_step)
+        for history, vehicle_obs, finish_step in zip(
+            self.histories, obs, self._paradigm.finish_steps
+        ):
+            # Stop recording a vehicle once it's past the end of the drag strip
+            if (finish_step is not None) and (
+                finish_step < self._paradigm.current_step
+            ):
+                continue
+
+            history.append(
+                {
+                    history.step_key: self._paradigm.current_step,
+                    history.time_key: current_time_s,
+                    history.car_state_key: vehicle_obs,
+                }
+            )
+        self.done = self._paradigm.done
+
+        return current_time_s
+
+    def _flush_history(self) -> None:
+        for history in self.histories:
+            history.flush()
+
+    def reset(self) -> None:
+        self.done = False
+        self._bng_simulation.reset()
+        self._paradigm.reset(bng_simulation=self._bng_simulation)
+        for history in self.histories:
+            history.reset()
+        self.results = []
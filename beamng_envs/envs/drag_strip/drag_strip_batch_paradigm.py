@@ -0,0 +1,104 @@
+import copy
+from typing import Any, Dict, List, Optional, Tuple
+
+from beamngpy import Vehicle, Scenario
+
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.envs.drag_strip.drag_strip_paradigm import DragStripParadigm
+
+
+class DragStripBatchParadigm(DragStripParadigm):
+    """
+    Races several Sunbursts, each with its own part config, side by side on parallel lanes of the drag strip.
+
+    Lane i is offset lane_spacing * i metres from the original lane (y=405), and each vehicle follows its own copy of
+    the AI script path along its lane. Each vehicle finishes when it passes the end of the drag strip; the run is done
+    when all have finished, or at the time limit.
+    """
+
+    vehicles: List[Vehicle]
+    finished_lanes: List[bool]
+    finish_steps: List[Optional[int]]
+
+    def __init__(
+        self, params: List[Dict[str, Any]], lane_spacing: float = 5, max_lanes: int = 4
+    ):
+        """
+        :param params: The part config for each vehicle.
+        :param lane_spacing: Distance between the lanes, in m.
+        :param max_lanes: Maximum number of vehicles to allow, as the drag strip only has room for a few lanes.
+        """
+        if not 0 < len(params) <= max_lanes:
+            raise ValueError(
+                f"Got {len(params)} param sets, a batch needs between 1 and {max_lanes}."
+            )
+
+        super().__init__(params=params[0])
+        self.params_list = params
+        self.lane_spacing = lane_spacing
+        self._lane_path_nodes = [
+            [{**node, "y": node["y"] + lane_spacing * i} for node in self._path_nodes]
+            for i in range(len(params))
+        ]
+
+    def start_scenario(self, bng_simulation: BNGSim) -> None:
+        self._scenario = Scenario("gridmap_v2", name="drag_strip_batch")
+        self.vehicles = []
+        for i in range(len(self.params_list)):
+            vehicle = Vehicle(
+                f"{self._car_model}_{i}", model=self._car_model, licence="MONOLITH"
+            )
+            pos = self._vehicle_pos["pos"]
+            self._scenario.add_vehicle(
+                vehicle,
+                pos=(pos[0], pos[1] + self.lane_spacing * i, pos[2]),
+                rot_quat=self._vehicle_pos["rot_quat"],
+            )
+            self.vehicles.append(vehicle)
+
+        self._scenario.make(bng_simulation.bng)
+        bng_simulation.start_scenario(self._scenario)
+        bng_simulation.remove_debug_paths()
+
+        for params, vehicle, path_nodes in zip(
+            self.params_list, self.vehicles, self._lane_path_nodes
+        ):
+            car_config = {"vars": {}, "parts": copy.deepcopy(params)}
+            vehicle.set_part_config(car_config)
+            bng_simulation.attach_sensors_to_vehicle(vehicle)
+            bng_simulation.add_debug_path(path_nodes)
+            vehicle.ai.set_script(path_nodes)
+
+        self.vehicle = self.vehicles[0]
+        bng_simulation.bng.switch_vehicle(self.vehicle)
+
+    def step(
+        self, bng_simulation: BNGSim, action: Optional[int] = None, **kwargs
+    ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
+        """Step the simulation once, returning the sensor data for each vehicle (in the order of the params)."""
+        if not self._ready:
+            self.reset(bng_simulation)
+
+        if self.done:
+            raise ValueError("Finished")
+
+        sensor_data = bng_simulation.step_and_poll(self.vehicles)
+
+        self.current_step += 1
+
+        # Check done - each vehicle is finished when its x pos is past the node at the end of the drag strip
+        for i, data in enumerate(sensor_data):
+            if (not self.finished_lanes[i]) and (
+                data["state"]["pos"][0] >= self._end_of_ds[0]
+            ):
+                self.finished_lanes[i] = True
+                self.finish_steps[i] = self.current_step
+        self.finished = all(self.finished_lanes)
+        self.done = bng_simulation.check_time_limit(self.current_step) or self.finished
+
+        return sensor_data, None, self.done, {}
+
+    def reset(self, bng_simulation: BNGSim):
+        super().reset(bng_simulation)
+        self.finished_lanes = [False] * len(self.params_list)
+        self.finish_steps = [None] * len(self.params_list)
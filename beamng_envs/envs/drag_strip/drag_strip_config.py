@@ -1,10 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class DragStripConfig(BNGSimConfig):
     output_path: str = "drag_strip_results"
     close_on_done: bool = False
     fps: int = 20
+    # The env only uses the vehicle's position and velocity
+    sensor_keys: Optional[Dict[str, Optional[List[str]]]] = field(
+        default_factory=lambda: {"state": None}
+    )
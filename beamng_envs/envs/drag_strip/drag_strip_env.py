@@ -6,11 +6,9 @@ from beamng_envs.data.disk_results import DiskResults
 from beamng_envs.bng_sim.bng_sim import BNGSim
 from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
 from beamng_envs.envs.drag_strip.drag_strip_paradigm import DragStripParadigm
-from beamng_envs.envs.drag_strip.drag_strip_param_space import (
-    DRAG_STRIP_PARAM_SPACE_GYM,
-)
 from beamng_envs.envs.history import History
 from beamng_envs.interfaces.env import IEnv
+from beamng_envs.lazy import LazyImport
 
 
 class DragStripEnv(IEnv):
@@ -24,18 +22,24 @@ class DragStripEnv(IEnv):
     results include the requested part config, and an actual part config (what BeamNG actually applied to the car).
     """
 
-    param_space = DRAG_STRIP_PARAM_SPACE_GYM
+    param_space = LazyImport(
+        "beamng_envs.envs.drag_strip.drag_strip_param_space",
+        "DRAG_STRIP_PARAM_SPACE_GYM",
+    )
 
     def __init__(
         self,
         params: Dict[str, Any],
         config: DragStripConfig = DragStripConfig(),
         bng: Optional[BeamNGpy] = None,
+        run_id: Optional[str] = None,
     ):
         self.params = params
         self.config = config
+        self.run_id = run_id
         self.history = History()
         self.disk_results = None
+        self.failures = []
 
         self._bng_simulation = BNGSim(config=config, bng=bng)
         self._paradigm = DragStripParadigm(params=params)
@@ -49,36 +53,30 @@ class DragStripEnv(IEnv):
         :param kwargs:
         :return: Tuple containing (observation, reward, done, info) (to match OpenAI Gym interface).
         """
-        return self._paradigm.step(bng_simulation=self._bng_simulation, action=action)
+        obs, reward, done, info = self._paradigm.step(
+            bng_simulation=self._bng_simulation, action=action
+        )
+
+        return self._observation(obs), reward, done, info
 
     def run(
         self, modifiers: Optional[Dict[str, Iterable[Any]]] = None
     ) -> Tuple[Dict[str, Any], History]:
-        self.reset()
-        current_time_s = 0
-
-        if self.done:
-            raise ValueError("Finished, reset before use.")
-
-        while not self.done:
-            obs, _, done, _ = self.step()
-            current_time_s = self._bng_simulation.get_real_time(
-                self._paradigm.current_step
-            )
-            self.history.append(
-                {
-                    self.history.step_key: self._paradigm.current_step,
-                    self.history.time_key: current_time_s,
-                    self.history.car_state_key: obs,
-                }
-            )
-
-            self.done = self._paradigm.done
+        if self._load_cached_results():
+            return self.results, self.history
 
+        current_time_s = self._run_with_retries(self._run_steps)
+        self._finish(current_time_s)
+
+        return self.results, self.history
+
+    def _finish(self, current_time_s: float) -> None:
         self.results["finished"] = self._paradigm.finished
         self.results["parts_requested"] = dict(self.params)
         self.results["parts_actual"] = dict(self._paradigm.vehicle.get_part_config())
         self.results[self.history.time_key] = current_time_s
+        if self.config.fidelity is not None:
+            self.results["fidelity"] = self.config.fidelity
 
         self.disk_results = DiskResults(
             path=self.config.output_path,
@@ -89,12 +87,13 @@ class DragStripEnv(IEnv):
                 self._paradigm.vehicle
             ),
             results=self.results,
+            run_id=self.run_id,
+            failures=self.failures,
         )
         self.disk_results.save()
+        self._cache_results()
         self._bng_simulation.close()
 
-        return self.results, self.history
-
     def reset(self) -> None:
         self.done = False
         self._bng_simulation.reset()
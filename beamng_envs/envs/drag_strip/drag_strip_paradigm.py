@@ -5,14 +5,15 @@ from beamngpy import Vehicle, Scenario
 from gym import Space
 
 from beamng_envs.bng_sim.bng_sim import BNGSim
-from beamng_envs.envs.drag_strip.drag_strip_param_space import (
-    DRAG_STRIP_PARAM_SPACE_GYM,
-)
 from beamng_envs.interfaces.paradigm import IParadigm
+from beamng_envs.lazy import LazyImport
 
 
 class DragStripParadigm(IParadigm):
-    param_space: Space = DRAG_STRIP_PARAM_SPACE_GYM
+    param_space: Space = LazyImport(
+        "beamng_envs.envs.drag_strip.drag_strip_param_space",
+        "DRAG_STRIP_PARAM_SPACE_GYM",
+    )
     _car_model = "sunburst"
     _vehicle_pos = dict(pos=(40, 405, 101), rot_quat=(0, 0, -0.707, 0.707))
     _current_step: int
@@ -67,8 +68,7 @@ class DragStripParadigm(IParadigm):
         if self.done:
             raise ValueError("Finished")
 
-        bng_simulation.bng.step(1)
-        sensor_data = bng_simulation.poll_sensors_for_vehicle(self.vehicle)
+        sensor_data = bng_simulation.step_and_poll([self.vehicle])[0]
 
         self.current_step += 1
 
@@ -1,15 +1,38 @@
-from gym.spaces import Dict, Text
+import functools
+from typing import Any, Dict, TYPE_CHECKING
 
-from beamng_envs.cars.sunburst import PART_OPTIONS
+from beamng_envs.cars.sunburst import load_part_options
 
-DRAG_STRIP_PARAM_SPACE = {
-    k: dict(values=v, name=k, descrition="A Sunburst car part.", type=str)
-    for k, v in PART_OPTIONS.items()
-}
+if TYPE_CHECKING:
+    from gym.spaces import Dict as DictSpace
 
-DRAG_STRIP_PARAM_SPACE_GYM = Dict(
-    {
-        v["name"]: Text(min_length=1, max_length=1, charset=v["values"])
-        for v in DRAG_STRIP_PARAM_SPACE.values()
+# DRAG_STRIP_PARAM_SPACE and DRAG_STRIP_PARAM_SPACE_GYM are built from the Sunburst part options on first access
+
+
+@functools.lru_cache(maxsize=None)
+def _build_param_space() -> Dict[str, Dict[str, Any]]:
+    return {
+        k: dict(values=v, name=k, descrition="A Sunburst car part.", type=str)
+        for k, v in load_part_options().items()
     }
-)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_param_space_gym() -> "DictSpace":
+    from gym.spaces import Dict as DictSpace, Text
+
+    return DictSpace(
+        {
+            v["name"]: Text(min_length=1, max_length=1, charset=v["values"])
+            for v in _build_param_space().values()
+        }
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name == "DRAG_STRIP_PARAM_SPACE":
+        return _build_param_space()
+    if name == "DRAG_STRIP_PARAM_SPACE_GYM":
+        return _build_param_space_gym()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,3 +15,15 @@ class AlreadyFinishedException(BeamNGEnvsError):
 
 class ResetNeededException(BeamNGEnvsError, ResetNeeded):
     pass
+
+
+class SimulationStalledException(BeamNGEnvsError):
+    pass
+
+
+class JobTimeoutException(BeamNGEnvsError):
+    pass
+
+
+class JobFailedException(BeamNGEnvsError):
+    pass
@@ -0,0 +1,111 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from beamng_envs.envs.history import History
+
+
+@dataclass
+class EventHistory(History):
+    """
+    History that records at a reduced rate, except around events such as crash impacts.
+
+    Outside of events, every decimation-th step is recorded. The last pre_trigger_steps steps are kept in a ring buffer,
+    and when a step triggers an event, the buffered steps are added at full rate, followed by every step for the next
+    post_trigger_steps. Triggers within the window extend it. A step triggers an event if any of the car state's
+    horizontal g-forces (gx, gy, in m/s^2) exceed g_force_threshold, or if the total damage increased by more than
+    damage_delta_threshold since the previous step. Either threshold can be disabled with None.
+
+    The recorded time_s is non-uniform, so use it (or the dt_s column of DiskResults.ts_df) rather than assuming a
+    fixed step. Call .flush at the end of a run, so the final step is recorded.
+
+    e.g.
+    ````
+    env = CrashTestEnv(params=params, config=config, history=EventHistory(decimation=20, post_trigger_steps=50))
+    ````
+    """
+
+    decimation: int = 10
+    pre_trigger_steps: int = 30
+    post_trigger_steps: int = 60
+    g_force_threshold: Optional[float] = 50.0
+    damage_delta_threshold: Optional[float] = 1.0
+
+    def __post_init__(self):
+        if self.decimation < 1:
+            raise ValueError(f"decimation must be at least 1, got {self.decimation}.")
+
+        super().__post_init__()
+
+    def reset(self):
+        super().reset()
+        # The recent steps, and whether each was recorded
+        self._buffer: Deque[Tuple[bool, Dict[str, Any]]] = deque(
+            maxlen=self.pre_trigger_steps
+        )
+        self._last: Optional[Tuple[bool, Dict[str, Any]]] = None
+        self._window_remaining = 0
+        self._steps_since_recorded = self.decimation - 1
+        self._last_damage: Optional[float] = None
+
+    def _is_trigger(self, car_state: Dict[str, Any]) -> bool:
+        damage = (car_state.get("damage") or {}).get("damage")
+        last_damage, self._last_damage = self._last_damage, damage
+        if (
+            (self.damage_delta_threshold is not None)
+            and (damage is not None)
+            and (last_damage is not None)
+            and ((damage - last_damage) > self.damage_delta_threshold)
+        ):
+            return True
+
+        g_forces = car_state.get("g_forces") or {}
+
+        return (self.g_force_threshold is not None) and any(
+            abs(g_forces.get(k) or 0) > self.g_force_threshold for k in ("gx", "gy")
+        )
+
+    def _record(self, items: Dict[str, Any]) -> None:
+        super().append(items)
+        self._steps_since_recorded = 0
+
+    def _backfill(self) -> None:
+        """Replace the recorded steps in the buffer with all of the buffered steps."""
+        n_recorded = sum(recorded for recorded, _ in self._buffer)
+        for values in self._history.values():
+            del values[len(values) - n_recorded :]
+
+        for _, items in self._buffer:
+            super().append(items)
+        self._buffer = deque(
+            ((True, items) for _, items in self._buffer), maxlen=self._buffer.maxlen
+        )
+
+    def append(self, items: Dict[str, Any]):
+        if self._is_trigger(items.get(self.car_state_key) or {}):
+            if self._window_remaining == 0:
+                self._backfill()
+            # Including this step
+            self._window_remaining = self.post_trigger_steps + 1
+
+        if self._window_remaining > 0:
+            self._window_remaining -= 1
+            recorded = True
+        else:
+            recorded = self._steps_since_recorded + 1 >= self.decimation
+
+        if recorded:
+            self._record(items)
+        else:
+            self._steps_since_recorded += 1
+        self._buffer.append((recorded, items))
+        self._last = (recorded, items)
+
+    def flush(self):
+        """Record the last step, if it wasn't already."""
+        if (self._last is not None) and not self._last[0]:
+            _, items = self._last
+            self._record(items)
+            self._last = (True, items)
+            if self._buffer:
+                self._buffer[-1] = self._last
@@ -14,6 +14,14 @@ class History:
     def __post_init__(self):
         self.reset()
 
+    @classmethod
+    def from_dict(cls, history: Dict[str, List[Any]], **kwargs) -> "History":
+        """Create a History from a saved history dict, e.g. DiskResults.history."""
+        obj = cls(**kwargs)
+        obj._history.update(history)
+
+        return obj
+
     def __getitem__(self, item):
         return self._history[item]
 
@@ -32,5 +40,9 @@ class History:
         for k, v in items.items():
             self._history[k].append(v)
 
+    def flush(self):
+        """Record anything buffered at the end of a run. Nothing is buffered by this class; see EventHistory."""
+        pass
+
     def reset(self):
         self._history = {k: [] for k in self.keys}
@@ -1,17 +1,63 @@
 import copy
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from beamngpy import Vehicle
 from beamngpy.sensors import State, Electrics, GForces, Damage, Sensor
+from gym.spaces import Box
 
 
 @dataclass
 class SensorSet:
-    """Handles the basic sensor classes and .tech."""
+    """
+    Handles the basic sensor classes and .tech.
+
+    Also defines the numeric observation layout: the channels (sensor, key and size) of the sensor data that are packed,
+    in order, into a flat float32 vector by .to_vector. Channels missing from the sensor data are NaN.
+
+    sensor_keys optionally selects the sensor data that's kept, e.g. {"state": None, "damage": ["damage"]} keeps all
+    of the state sensor's data and only the total damage. Sensors that aren't listed aren't attached or polled, and
+    unselected keys are dropped when the data is read after a poll, so aren't copied into the history or observations.
+    """
 
     include_tech_sensors: bool = False
 
+    # Keys to keep from each sensor's data, by sensor name (None keeps all the keys). None keeps all the sensors.
+    sensor_keys: Optional[Dict[str, Optional[List[str]]]] = None
+
+    # Numeric channels in the observation vector, by sensor: (key, size)
+    basic_channels = {
+        "state": [
+            ("pos", 3),
+            ("dir", 3),
+            ("up", 3),
+            ("vel", 3),
+            ("front", 3),
+            ("rotation", 4),
+        ],
+        "electrics": [
+            ("airspeed", 1),
+            ("wheelspeed", 1),
+            ("rpm", 1),
+            ("throttle", 1),
+            ("brake", 1),
+            ("clutch", 1),
+            ("steering", 1),
+            ("gear_index", 1),
+            ("fuel", 1),
+        ],
+        "g_forces": [
+            ("gx", 1),
+            ("gy", 1),
+            ("gz", 1),
+            ("gx2", 1),
+            ("gy2", 1),
+            ("gz2", 1),
+        ],
+        "damage": [("damage", 1)],
+    }
+
     @property
     def basic_sensors(self) -> Dict[str, Sensor]:
         """Return the basic sensors available in BeamNG.drive."""
@@ -35,8 +81,18 @@ class SensorSet:
         if self.include_tech_sensors:
             sensors.update(self.advanced_sensors)
 
+        if self.sensor_keys is not None:
+            sensors = {k: v for k, v in sensors.items() if k in self.sensor_keys}
+
         return sensors
 
+    def selected_keys(self, sensor_name: str) -> Optional[List[str]]:
+        """The keys kept from a sensor's data, or None for all of them."""
+        if self.sensor_keys is None:
+            return None
+
+        return self.sensor_keys.get(sensor_name)
+
     def attach_to_vehicle(self, vehicle: Vehicle) -> Vehicle:
         """Attach the managed sensors to a vehicle."""
         current_sensors = [s[0] for s in vehicle.sensors.items()]
@@ -48,9 +104,99 @@ class SensorSet:
 
     def poll_for_vehicle(self, vehicle: Vehicle) -> Dict[str, Any]:
         """Poll the sensors for a vehicle in the simulation."""
-        vehicle.sensors.poll()
-        sensor_data = copy.deepcopy(
-            {k: vehicle.sensors[k].data for k in self.sensors.keys()}
-        )
+        vehicle.sensors.poll(*self.sensors.keys())
+
+        return self.read_for_vehicle(vehicle)
+
+    def read_for_vehicle(self, vehicle: Vehicle) -> Dict[str, Any]:
+        """Copy the selected keys of the last polled sensor data for a vehicle."""
+        sensor_data = {}
+        for sensor_name in self.sensors.keys():
+            data = vehicle.sensors[sensor_name].data
+            keys = self.selected_keys(sensor_name)
+            if keys is not None:
+                data = {k: data[k] for k in keys if k in data}
+            sensor_data[sensor_name] = copy.deepcopy(data)
 
         return sensor_data
+
+    def sensor_request_for_vehicle(self, vehicle: Vehicle) -> Optional[Dict[str, Any]]:
+        """
+        The SensorRequest BeamNGpy sends to a vehicle to poll the managed sensors, e.g. to forward with
+        BNGSim.step_and_poll. None if any of the sensors are polled from the game engine (e.g. .tech sensors).
+        """
+        engine_reqs, vehicle_reqs = vehicle.sensors._encode_requests(
+            tuple(self.sensors.keys())
+        )
+        if engine_reqs["sensors"]:
+            return None
+
+        return vehicle_reqs
+
+    def update_for_vehicle(
+        self, vehicle: Vehicle, raw_sensor_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Update a vehicle's sensors from the raw response to a .sensor_request_for_vehicle request, as a poll would.
+
+        :return: A copy of the updated sensor data.
+        """
+        for sensor_name, data in vehicle.sensors._decode_response(
+            raw_sensor_data
+        ).items():
+            vehicle.sensors[sensor_name].replace(data)
+
+        return self.read_for_vehicle(vehicle)
+
+    @property
+    def channels(self) -> List[Tuple[str, str, int]]:
+        """The (sensor, key, size) of each channel in the observation vector, for the active sensors and keys."""
+        return [
+            (sensor_name, key, size)
+            for sensor_name in self.sensors
+            for key, size in self.basic_channels.get(sensor_name, [])
+            if (self.selected_keys(sensor_name) is None)
+            or (key in self.selected_keys(sensor_name))
+        ]
+
+    @property
+    def observation_size(self) -> int:
+        return sum(size for _, _, size in self.channels)
+
+    @property
+    def observation_labels(self) -> List[str]:
+        """Names for each element of the observation vector, e.g. state_pos_0."""
+        return [
+            f"{sensor_name}_{key}_{i}" if size > 1 else f"{sensor_name}_{key}"
+            for sensor_name, key, size in self.channels
+            for i in range(size)
+        ]
+
+    @property
+    def observation_space(self) -> Box:
+        return Box(
+            low=-np.inf, high=np.inf, shape=(self.observation_size,), dtype=np.float32
+        )
+
+    def to_vector(
+        self, sensor_data: Dict[str, Any], out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Pack polled sensor data into the observation vector.
+
+        :param sensor_data: Sensor data, from .poll_for_vehicle.
+        :param out: Optional float32 array of shape (observation_size,) to write into, rather than allocating a new one.
+        """
+        if out is None:
+            out = np.empty(self.observation_size, dtype=np.float32)
+
+        idx = 0
+        for sensor_name, key, size in self.channels:
+            value = sensor_data.get(sensor_name, {}).get(key)
+            if value is None:
+                out[idx : idx + size] = np.nan
+            else:
+                out[idx : idx + size] = value
+            idx += size
+
+        return out
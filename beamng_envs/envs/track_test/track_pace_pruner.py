@@ -0,0 +1,59 @@
+import threading
+from typing import List, Optional
+
+
+class TrackPacePruner:
+    """
+    Aborts track test laps that can't beat the best lap so far.
+
+    The reference pace is the split times (the time each waypoint on the route, then the finish, was reached) of the
+    fastest finished lap the pruner has been updated with. A lap is pruned once the elapsed time exceeds the reference
+    split for its next waypoint by more than the margin, as it can no longer reach that waypoint (and so finish) within
+    the margin of the reference pace.
+
+    The same pruner can be shared between envs (including those running in parallel threads), so each finished lap
+    tightens the reference for the following runs.
+
+    e.g.
+    ````
+    pruner = TrackPacePruner(margin=0.1)
+    for params in param_sets:
+        env = TrackTestEnv(params=params, config=config, pruner=pruner)
+        results, _ = env.run()  # results["pruned"] is True if aborted
+    ````
+    """
+
+    def __init__(
+        self, margin: float = 0.1, reference_splits: Optional[List[float]] = None
+    ):
+        """
+        :param margin: Fraction the lap can be behind the reference pace before it's pruned.
+        :param reference_splits: Optional initial reference split times, e.g. from a previous experiment.
+        """
+        self.margin = margin
+        self.reference_splits = reference_splits
+        self._lock = threading.Lock()
+
+    def should_prune(self, splits: List[float], current_time_s: float) -> bool:
+        """
+        Whether to abort a lap.
+
+        :param splits: The lap's split times so far.
+        :param current_time_s: The current elapsed time.
+        """
+        reference = self.reference_splits
+        if (reference is None) or (len(splits) >= len(reference)):
+            return False
+
+        return current_time_s > reference[len(splits)] * (1 + self.margin)
+
+    def update(self, splits: List[float]) -> bool:
+        """Update the reference with the splits of a finished lap, if it's the fastest so far. Returns True if so."""
+        with self._lock:
+            if (self.reference_splits is None) or (
+                splits[-1] < self.reference_splits[-1]
+            ):
+                self.reference_splits = list(splits)
+                return True
+
+        return False
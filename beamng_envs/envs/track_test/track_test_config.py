@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
 
 
-@dataclass
+@dataclass(frozen=True)
 class TrackTestConfig(BNGSimConfig):
     output_path: str = "track_test_results"
     fps: int = 30
@@ -5,6 +5,7 @@ from beamngpy import BeamNGpy
 from beamng_envs.data.disk_results import DiskResults
 from beamng_envs.bng_sim.bng_sim import BNGSim
 from beamng_envs.envs.history import History
+from beamng_envs.envs.track_test.track_pace_pruner import TrackPacePruner
 from beamng_envs.envs.track_test.track_test_config import TrackTestConfig
 from beamng_envs.envs.track_test.track_test_paradigm import TrackTestParadigm
 from beamng_envs.envs.track_test.track_test_param_space import (
@@ -24,6 +25,9 @@ class TrackTestEnv(IEnv):
     AI with customisable aggressiveness - it's worth setting a max time as the AI can crash if it's too aggressive with
     a bad car setup.
 
+    Optionally, a TrackPacePruner can be used to abort laps that fall too far behind the best lap so far; these are
+    marked as pruned in the results and outcome.
+
     Good laps are around ~85s.
 
     See scripts/ for some usage examples.
@@ -40,14 +44,19 @@ class TrackTestEnv(IEnv):
         params: Dict[str, Any],
         config: TrackTestConfig = TrackTestConfig(),
         bng: Optional[BeamNGpy] = None,
+        run_id: Optional[str] = None,
+        pruner: Optional[TrackPacePruner] = None,
     ):
         self.params = params
         self.config = config
+        self.run_id = run_id
         self.history = History()
         self.disk_results = None
+        self.failures = []
 
         self._bng_simulation = BNGSim(config=config, bng=bng)
-        self._paradigm = TrackTestParadigm(params=params)
+        self.pruner = pruner
+        self._paradigm = TrackTestParadigm(params=params, pruner=pruner)
 
     def step(
         self, action: Optional[int] = None, **kwargs
@@ -58,39 +67,35 @@ class TrackTestEnv(IEnv):
         :param kwargs:
         :return: Tuple containing (observation, reward, done, info) (to match OpenAI Gym interface).
         """
-        return self._paradigm.step(action=action, bng_simulation=self._bng_simulation)
+        obs, reward, done, info = self._paradigm.step(
+            action=action, bng_simulation=self._bng_simulation
+        )
+
+        return self._observation(obs), reward, done, info
 
     def run(
         self, modifiers: Optional[Dict[str, Iterable[Any]]] = None
     ) -> Tuple[Dict[str, Any], History]:
-        self.reset()
-        current_time_s = 0
-
-        if self.done:
-            raise ValueError("Finished, reset before use.")
-
-        while not self.done:
-            obs, _, done, _ = self.step(bng_simulation=self._bng_simulation)
-            current_time_s = self._bng_simulation.get_real_time(
-                self._paradigm.current_step
-            )
-            self.done = self._paradigm.done
-
-            self.history.append(
-                {
-                    self.history.step_key: self._paradigm.current_step,
-                    self.history.time_key: current_time_s,
-                    self.history.car_state_key: obs,
-                }
-            )
+        if self._load_cached_results():
+            return self.results, self.history
+
+        current_time_s = self._run_with_retries(self._run_steps)
+        self._finish(current_time_s)
 
+        return self.results, self.history
+
+    def _finish(self, current_time_s: float) -> None:
         bng_logs_path = self._bng_simulation.stop_bng_logging_for(
             self._paradigm.vehicle
         )
         self.results = {
             self.history.time_key: current_time_s,
             "finished": self._paradigm.finished,
+            "pruned": self._paradigm.pruned,
+            "waypoints_reached": self._paradigm.waypoints_reached,
         }
+        if self.config.fidelity is not None:
+            self.results["fidelity"] = self.config.fidelity
 
         self.disk_results = DiskResults(
             path=self.config.output_path,
@@ -99,12 +104,18 @@ class TrackTestEnv(IEnv):
             history=self.history.__dict__,
             path_to_bng_logs=bng_logs_path,
             results=self.results,
+            run_id=self.run_id,
+            failures=self.failures,
+            pruned=self._paradigm.pruned,
         )
         self.disk_results.save()
+        if self._paradigm.finished and (self.pruner is not None):
+            self.pruner.update(self._paradigm.split_times)
+        if not self._paradigm.pruned:
+            # Pruning depends on the reference lap at the time, so pruned runs aren't cached
+            self._cache_results()
         self._bng_simulation.close()
 
-        return self.results, self.history
-
     def reset(self) -> None:
         self.done = False
         self._bng_simulation.reset()
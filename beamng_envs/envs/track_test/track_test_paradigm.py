@@ -6,6 +6,7 @@ from beamngpy.types import Float3
 
 from beamng_envs.cars.scintilla_rally import ScintillaRally
 from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.envs.track_test.track_pace_pruner import TrackPacePruner
 from beamng_envs.interfaces.paradigm import IParadigm
 from beamng_envs.interfaces.types import WAYPOINT_TYPE
 
@@ -24,12 +25,18 @@ class TrackTestParadigm(IParadigm):
     _current_waypoint_idx: int
     _route_done: List[bool]
 
+    # Time each route waypoint, then the finish, was reached
+    split_times: List[float]
+    pruned: bool
     done: bool
     current_step: int
     vehicle: Vehicle
 
-    def __init__(self, params: Dict[str, Any]):
+    def __init__(
+        self, params: Dict[str, Any], pruner: Optional[TrackPacePruner] = None
+    ):
         self.params = params
+        self.pruner = pruner
         # Route over short tack - start line (spawn point) to start line
         self._route: List[WAYPOINT_TYPE] = [
             self._wp1,
@@ -74,8 +81,7 @@ class TrackTestParadigm(IParadigm):
         if self.done:
             raise ValueError("Finished")
 
-        bng_simulation.bng.step(1)
-        sensor_data = bng_simulation.poll_sensors_for_vehicle(self.vehicle)
+        sensor_data = bng_simulation.step_and_poll([self.vehicle])[0]
 
         # Check if close enough to next waypoint yet
         dist = self._euclidean_distance(
@@ -95,6 +101,7 @@ class TrackTestParadigm(IParadigm):
         if (dist < 150) and (not self._route_done[self._current_waypoint_idx]):
             self._route_done[self._current_waypoint_idx] = True
             self._current_waypoint_idx += 1
+            self.split_times.append(current_time_s)
 
             if self._current_waypoint_idx == len(self._route):
                 self._current_waypoint = self._final_waypoint
@@ -118,8 +125,24 @@ class TrackTestParadigm(IParadigm):
                 f"Within dist thresh of final waypoint, setting done"
             )
             self.finished = True
+            self.split_times.append(current_time_s)
 
-        self.done = self.finished or bng_simulation.check_time_limit(self.current_step)
+        if (
+            (self.pruner is not None)
+            and not self.finished
+            and self.pruner.should_prune(self.split_times, current_time_s)
+        ):
+            print(
+                f"{self.current_step} (t={current_time_s}): "
+                f"Behind reference pace, pruning"
+            )
+            self.pruned = True
+
+        self.done = (
+            self.finished
+            or self.pruned
+            or bng_simulation.check_time_limit(self.current_step)
+        )
         self.current_step += 1
 
         sensor_data["dist_to_next_waypoint"] = dist
@@ -128,6 +151,10 @@ class TrackTestParadigm(IParadigm):
 
         return sensor_data, None, self.done, {}
 
+    @property
+    def waypoints_reached(self) -> int:
+        return int(np.sum(self._route_done))
+
     def reset(self, bng_simulation: BNGSim):
         self._current_waypoint_idx = 0
         self._current_waypoint = self._route[self._current_waypoint_idx]
@@ -136,6 +163,8 @@ class TrackTestParadigm(IParadigm):
         self.start_scenario(bng_simulation)
         self.done = False
         self.finished = False
+        self.pruned = False
+        self.split_times = []
         self.current_step = 0
 
     @staticmethod
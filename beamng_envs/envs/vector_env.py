@@ -0,0 +1,189 @@
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from beamng_envs.bng_sim.bng_sim_worker import BNGSimWorker
+from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.interfaces.env import IEnv
+
+
+def stack_observations(observations: Sequence[Any]) -> Any:
+    """
+    Batch a list of observations, one per env.
+
+    Dicts (e.g. the sensor data) are batched key by key, so {"state": {"pos": [x, y, z]}} from M envs becomes
+    {"state": {"pos": array of shape (M, 3)}}. Leaves that can't be stacked into a numeric array are kept as object
+    arrays.
+    """
+    if all(isinstance(o, dict) for o in observations):
+        keys = dict.fromkeys(k for o in observations for k in o)
+
+        return {k: stack_observations([o.get(k) for o in observations]) for k in keys}
+
+    try:
+        return np.asarray(observations, dtype=float)
+    except (TypeError, ValueError):
+        stacked = np.empty(len(observations), dtype=object)
+        stacked[:] = list(observations)
+
+        return stacked
+
+
+class BNGVectorEnv:
+    """
+    Steps M envs, each with its own game instance, concurrently from one process.
+
+    Follows the OpenAI gym VectorEnv interface (in the same 4-tuple style as IEnv.step): .step_async sends actions to
+    all the envs, which step in parallel threads (the time is spent waiting on the games over their sockets), and
+    .step_wait returns the batched observations, rewards, dones and infos. Observations are batched with
+    stack_observations: the observation vectors into an array of shape (num_envs, observation_size), or dict
+    observations (see BNGSimConfig.dict_observations) key by key. Rewards are float arrays (0 for envs without rewards)
+    and dones are bool arrays.
+
+    Finished envs are reset automatically (in the same step, so they're ready for the next one); their last observation
+    is returned in infos[i]["final_observation"], and the returned observation is the first of the new episode.
+
+    e.g.
+    ````
+    pool = BNGSimWorkerPool(user_path=..., n_workers=4)
+    pool.launch(bng_config=bng_config, level="hirochi_raceway")
+    vec_env = BNGVectorEnv.from_worker_pool(
+        worker_pool=pool,
+        env_fn=lambda worker: TrackTestEnv(params=params, config=config, bng=worker.bng),
+    )
+    obs = vec_env.reset()
+    obs, rewards, dones, infos = vec_env.step([None] * vec_env.num_envs)
+    vec_env.close()
+    ````
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], IEnv]],
+        auto_reset: bool = True,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        :param env_fns: Functions creating each env. Each env should use its own game instance.
+        :param auto_reset: Whether to reset envs as soon as they're done.
+        :param on_close: Optional callback on .close, e.g. to release workers.
+        """
+        if not env_fns:
+            raise ValueError("At least one env is required.")
+
+        self.envs: List[IEnv] = [fn() for fn in env_fns]
+        self.num_envs = len(self.envs)
+        self.auto_reset = auto_reset
+
+        self._on_close = on_close
+        self._executor = ThreadPoolExecutor(max_workers=self.num_envs)
+        self._futures: Optional[List[Future]] = None
+        self.closed = False
+
+    @classmethod
+    def from_worker_pool(
+        cls,
+        worker_pool: BNGSimWorkerPool,
+        env_fn: Callable[[BNGSimWorker], IEnv],
+        num_envs: Optional[int] = None,
+        auto_reset: bool = True,
+    ) -> "BNGVectorEnv":
+        """
+        Create envs on free workers from a pool. The workers are held until .close.
+
+        :param worker_pool: The pool to get workers from.
+        :param env_fn: Creates an env on a worker, e.g. using worker.bng.
+        :param num_envs: Number of envs, defaults to the number of workers in the pool.
+        :param auto_reset: Whether to reset envs as soon as they're done.
+        """
+        num_envs = num_envs if num_envs is not None else worker_pool.n_workers
+        workers = [worker_pool.get_free_worker() for _ in range(num_envs)]
+
+        def release_workers():
+            for worker in workers:
+                worker_pool.release(worker)
+
+        return cls(
+            env_fns=[lambda w=w: env_fn(w) for w in workers],
+            auto_reset=auto_reset,
+            on_close=release_workers,
+        )
+
+    @staticmethod
+    def _reset_env(env: IEnv) -> Any:
+        env.reset()
+
+        return env.observe()
+
+    def _step_env(self, env: IEnv, action: Any) -> Tuple[Any, float, bool, Dict]:
+        obs, reward, done, info = env.step(action)
+        info = dict(info)
+        if done and self.auto_reset:
+            # Observation vectors are overwritten by the reset
+            info["final_observation"] = copy.deepcopy(obs)
+            obs = self._reset_env(env)
+
+        return obs, reward if reward is not None else 0.0, done, info
+
+    def reset(self) -> Any:
+        """Reset all the envs concurrently, returning the batched initial observations."""
+        observations = list(self._executor.map(self._reset_env, self.envs))
+
+        return stack_observations(observations)
+
+    def step_async(self, actions: Sequence[Any]) -> None:
+        """Start stepping all the envs, with one action each."""
+        if self._futures is not None:
+            raise RuntimeError("Already stepping, call .step_wait first.")
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Got {len(actions)} actions for {self.num_envs} envs.")
+
+        self._futures = [
+            self._executor.submit(self._step_env, env, action)
+            for env, action in zip(self.envs, actions)
+        ]
+
+    def step_wait(self) -> Tuple[Any, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """Wait for the envs to finish stepping, and return (observations, rewards, dones, infos)."""
+        if self._futures is None:
+            raise RuntimeError("Not stepping, call .step_async first.")
+
+        try:
+            outputs = [f.result() for f in self._futures]
+        finally:
+            self._futures = None
+        observations, rewards, dones, infos = zip(*outputs)
+
+        return (
+            stack_observations(observations),
+            np.asarray(rewards, dtype=float),
+            np.asarray(dones, dtype=bool),
+            list(infos),
+        )
+
+    def step(
+        self, actions: Sequence[Any]
+    ) -> Tuple[Any, np.ndarray, np.ndarray, List[Dict[str, Any]]]:
+        """Step all the envs, with one action each. See .step_async and .step_wait."""
+        self.step_async(actions)
+
+        return self.step_wait()
+
+    def close(self) -> None:
+        """Wait for any steps in progress, then close the envs (if their configs allow it) and release the workers."""
+        if self.closed:
+            return
+
+        if self._futures is not None:
+            for f in self._futures:
+                _ = f.exception()
+            self._futures = None
+
+        for env in self.envs:
+            env.close()
+        self._executor.shutdown(wait=True)
+        if self._on_close is not None:
+            self._on_close()
+        self.closed = True
@@ -1,13 +1,29 @@
 import abc
-from typing import Dict, Any, Iterable, Tuple, Optional, List
+import asyncio
+import socket
+import warnings
 
+import numpy as np
+from typing import Dict, Any, Iterable, Tuple, Optional, List, Callable, TypeVar
+
+from beamngpy.logging import BNGError, BNGDisconnectedError
 from gym import Space
 
+from beamng_envs.bng_sim.async_bng_sim import AsyncBNGSim
+from beamng_envs.bng_sim.bng_sim import BNGSim
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
 from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.data.result_cache import ResultCache
+from beamng_envs.envs.errors import (
+    JobFailedException,
+    JobTimeoutException,
+    SimulationStalledException,
+)
 from beamng_envs.envs.history import History
 from beamng_envs.interfaces.paradigm import IParadigm
 
+T = TypeVar("T")
+
 
 class IEnv(abc.ABC):
     """
@@ -15,41 +31,98 @@ class IEnv(abc.ABC):
 
     Loosely based on OpenAI gym environment wrapper, with an added run method for executing all steps in one call. This
     can be used for environments that don't require external agent interaction via an action space, although these can
-    still be used with .step if implemented by the environment.
+    still be used with .step if implemented by the environment. .async_step and .async_run are asyncio equivalents, so
+    one event loop can drive many envs (each with its own game instance) concurrently; see AsyncBNGSim.
 
     Along with the abstract methods, the attributes should be used as defined here.
 
     Class attributes:
      - param_space: The full parameter/design space for the environment. Should be an OpenAI gym observation space.
-     - observation_space: The observation space for the environment. Should be an OpenAI gym observation space.
+     - observation_space: The observation space for the environment. Should be an OpenAI gym observation space. By
+                          default, the Box of the SensorSet observation vector (see .observation_space).
      - action_space: The action space, if the environment supports agent interaction. Should be an OpenAI gym action
                      space.
 
     Instance attributes:
      - config: Config for a BNGSimulation
      - params: A dict The individual set of experimental params currently in use, set on init.
+     - run_id: Optional ID to save results under, e.g. from an ExperimentManifest. A new UUID is used if not set.
      - history: A dict containing per-step history recorded by the environment (if any).
      - results: A dict containing any summary results available after the environment reaches completion (if any).
      - complete: Bool indicating if the environment has reached a completed state and will not iterate further.
+     - failures: Reasons for any failed attempts (game hangs, crashes, etc.) before the last run completed.
+     - disk_results: The DiskResults for the last run, set by .run (loaded from the result cache on a cache hit).
      - _paradigm: Paradigm defining what the environment does, the car that's used, etc.
+     - _bng_simulation: The BNGSim managing the game instance.
     """
 
+    # Errors indicating the game instance has hung, crashed, or lost connection; the run can be retried in a new
+    # instance. Other OSErrors (e.g. permission or disk full errors from provisioning) aren't the game's fault, so
+    # aren't retried.
+    _retry_exceptions = (
+        SimulationStalledException,
+        JobTimeoutException,
+        BNGError,
+        BNGDisconnectedError,
+        ConnectionError,
+        socket.timeout,
+        BrokenPipeError,
+    )
+
     done: bool
     config: BNGSimConfig
     param_space: Space
-    observation_space: Space
     action_space: Optional[Space]
+    run_id: Optional[str]
     history: History
     results: Dict[str, Any]
     complete: bool
+    failures: List[str]
     disk_results: Optional[DiskResults]
 
     _paradigm: IParadigm
+    _bng_simulation: BNGSim
 
     @abc.abstractmethod
     def __init__(self, params: Dict[str, Any], config: BNGSimConfig):
         """Ready environment for use."""
 
+    @property
+    def observation_space(self) -> Space:
+        """The float32 Box of the observations returned by .step (unless config.dict_observations is set)."""
+        return self._bng_simulation.sensor_set.observation_space
+
+    def _observation(self, sensor_data: Any) -> Any:
+        """
+        Convert the paradigm's sensor data to the observation returned by .step.
+
+        Unless config.dict_observations is set, the sensor data is packed into a preallocated float32 vector (or a
+        (n_vehicles, observation_size) array, for paradigms with several vehicles). The same array is reused on each
+        step, so copy it to keep past observations.
+        """
+        if self.config.dict_observations:
+            return sensor_data
+
+        sensor_set = self._bng_simulation.sensor_set
+        batched = isinstance(sensor_data, list)
+        shape = (
+            (len(sensor_data), sensor_set.observation_size)
+            if batched
+            else (sensor_set.observation_size,)
+        )
+        buffer = getattr(self, "_observation_buffer", None)
+        if (buffer is None) or (buffer.shape != shape):
+            buffer = np.empty(shape, dtype=np.float32)
+            self._observation_buffer = buffer
+
+        if batched:
+            for data, out in zip(sensor_data, buffer):
+                sensor_set.to_vector(data, out=out)
+        else:
+            sensor_set.to_vector(sensor_data, out=buffer)
+
+        return buffer
+
     def step(
         self, action: Optional[int] = None, **kwargs
     ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
@@ -88,3 +161,230 @@ class IEnv(abc.ABC):
     @abc.abstractmethod
     def reset(self) -> None:
         """Reset the environment to its initial state."""
+
+    def _run_steps(self) -> float:
+        """Reset and step the environment to completion, returning the final sim time."""
+        self.reset()
+        current_time_s = 0
+
+        if self.done:
+            raise ValueError("Finished, reset before use.")
+
+        while not self.done:
+            obs, _, _, _ = self._paradigm.step(bng_simulation=self._bng_simulation)
+            current_time_s = self._record_step(obs)
+        self._flush_history()
+
+        return current_time_s
+
+    def _flush_history(self) -> None:
+        """Record anything the history has buffered at the end of a run (see History.flush)."""
+        self.history.flush()
+
+    def _record_step(self, obs: Any) -> float:
+        """
+        Record a step's sensor data in the history and update .done, returning the sim time.
+
+        Envs with several vehicles override this (and ._flush_history) to record each vehicle's history.
+        """
+        current_time_s = self._bng_simulation.get_real_time(self._paradigm.current_step)
+        self.history.append(
+            {
+                self.history.step_key: self._paradigm.current_step,
+                self.history.time_key: current_time_s,
+                self.history.car_state_key: obs,
+            }
+        )
+        self.done = self._paradigm.done
+
+        return current_time_s
+
+    def _finish(self, current_time_s: float) -> None:
+        """Set .results for a completed run, save them to .disk_results and close the game (if the config allows it)."""
+        raise NotImplementedError
+
+    def _async_simulation(
+        self, limit: Optional[asyncio.Semaphore] = None
+    ) -> AsyncBNGSim:
+        """The AsyncBNGSim driving this env's BNGSim, created on first use (and if the BNGSim is replaced)."""
+        async_sim = getattr(self, "_async_bng_simulation", None)
+        if (async_sim is None) or (async_sim.sim is not self._bng_simulation):
+            async_sim = AsyncBNGSim(
+                self._bng_simulation,
+                call_timeout=self.config.async_call_timeout,
+                setup_timeout=self.config.async_setup_timeout,
+            )
+            self._async_bng_simulation = async_sim
+        if limit is not None:
+            async_sim.limit = limit
+
+        return async_sim
+
+    async def async_step(
+        self,
+        action: Optional[int] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+        **kwargs,
+    ) -> Tuple[Optional[Any], Optional[float], bool, Dict[str, Any]]:
+        """
+        Asyncio equivalent of .step. The paradigm's step (the game calls, and decoding the sensor data) runs in the env's
+        AsyncBNGSim thread, subject to config.async_call_timeout.
+
+        :param action: Optional action to apply to environment.
+        :param limit: Optional semaphore limiting the number of game calls in flight, shared with other envs.
+        :param kwargs: Flexible kwargs to pass on to the paradigm.
+        :return: Tuple containing (observation, reward, done, info) (to match OpenAI Gym interface).
+        """
+        obs, reward, done, info = await self._async_simulation(limit).call(
+            self._paradigm.step,
+            bng_simulation=self._bng_simulation,
+            action=action,
+            **kwargs,
+        )
+
+        return self._observation(obs), reward, done, info
+
+    async def async_run(
+        self,
+        modifiers: Optional[Dict[str, Iterable[Any]]] = None,
+        limit: Optional[asyncio.Semaphore] = None,
+    ) -> Tuple[Dict[str, Any], History]:
+        """
+        Asyncio equivalent of .run, e.g. to run many envs from one event loop:
+
+        ````
+        limit = asyncio.Semaphore(8)
+        outputs = await asyncio.gather(*[env.async_run(limit=limit) for env in envs])
+        ````
+
+        Each step's game calls run in the env's AsyncBNGSim thread, and the history is recorded in the loop, so one env's
+        processing overlaps with the others waiting on their games. Hung calls (see config.async_call_timeout for steps,
+        and config.async_setup_timeout for the reset and saving the results) and crashes are retried as in .run.
+
+        :param modifiers: Not currently used, as for .run.
+        :param limit: Optional semaphore limiting the number of game calls in flight, shared with other envs.
+        :return: Tuple containing (self.results, self.history).
+        """
+        async_sim = self._async_simulation(limit)
+        if await async_sim.setup_call(self._load_cached_results):
+            return self.results, self.history
+
+        current_time_s = await self._async_run_with_retries(async_sim)
+        await async_sim.setup_call(self._finish, current_time_s)
+
+        return self.results, self.history
+
+    async def _async_run_steps(self, async_sim: AsyncBNGSim) -> float:
+        """Asyncio equivalent of ._run_steps."""
+        await async_sim.setup_call(self.reset)
+        current_time_s = 0
+
+        while not self.done:
+            obs, _, _, _ = await async_sim.call(
+                self._paradigm.step, bng_simulation=self._bng_simulation
+            )
+            current_time_s = self._record_step(obs)
+        self._flush_history()
+
+        return current_time_s
+
+    def observe(self) -> Any:
+        """Poll the current observation for the paradigm's vehicle without stepping, e.g. after reset."""
+        return self._observation(
+            self._bng_simulation.poll_sensors_for_vehicle(self._paradigm.vehicle)
+        )
+
+    def close(self) -> None:
+        """Close the game instance, if the config allows it (see BNGSimConfig.close_on_done)."""
+        self._bng_simulation.close()
+
+    def _load_cached_results(self) -> bool:
+        """
+        Look up the current params in the result cache, if one is configured.
+
+        On a hit, sets .disk_results, .results, and .history from the cached run and marks the env done.
+
+        :return: True if results were loaded from the cache (and the env doesn't need to be run).
+        """
+        cache = ResultCache.from_config(self.config)
+        if cache is None:
+            return False
+
+        disk_results = cache.get(
+            ResultCache.key(
+                env_name=type(self).__name__, params=self.params, config=self.config
+            )
+        )
+        if disk_results is None:
+            return False
+
+        self.disk_results = disk_results
+        self.results = disk_results.results
+        self.history = History.from_dict(disk_results.history)
+        self.done = True
+
+        return True
+
+    def _cache_results(self) -> None:
+        """Add the saved .disk_results to the result cache, if one is configured."""
+        cache = ResultCache.from_config(self.config)
+        if (cache is None) or (self.disk_results is None):
+            return
+
+        cache.put(
+            ResultCache.key(
+                env_name=type(self).__name__, params=self.params, config=self.config
+            ),
+            disk_results=self.disk_results,
+        )
+
+    def _run_with_retries(self, run_steps: Callable[[], T]) -> T:
+        """
+        Call run_steps, retrying in a new game instance if the game hangs or crashes.
+
+        On failure the game process is killed and the reason added to .failures; the next attempt relaunches it (via
+        reset). Up to config.max_retries retries are made.
+
+        :param run_steps: Callable that resets and runs the environment to completion.
+        :return: The output of run_steps.
+        """
+        self.failures = []
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                output = run_steps()
+                self._bng_simulation.watchdog.end_job()
+
+                return output
+            except self._retry_exceptions as e:
+                self._add_failure(attempt, e)
+                self._bng_simulation.kill()
+
+        raise JobFailedException(
+            f"Failed after {self.config.max_retries + 1} attempts: {self.failures}"
+        )
+
+    async def _async_run_with_retries(self, async_sim: AsyncBNGSim) -> float:
+        """Asyncio equivalent of ._run_with_retries, running ._async_run_steps."""
+        self.failures = []
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                output = await self._async_run_steps(async_sim)
+                self._bng_simulation.watchdog.end_job()
+
+                return output
+            except self._retry_exceptions as e:
+                self._add_failure(attempt, e)
+                await async_sim.kill()
+
+        raise JobFailedException(
+            f"Failed after {self.config.max_retries + 1} attempts: {self.failures}"
+        )
+
+    def _add_failure(self, attempt: int, error: Exception) -> None:
+        # Prefer the watchdog's reason, the error raised here may just be the socket closing
+        reason = self._bng_simulation.watchdog.fired or error
+        self.failures.append(f"{type(reason).__name__}: {reason}")
+        warnings.warn(
+            f"Attempt {attempt + 1}/{self.config.max_retries + 1} failed with {self.failures[-1]}; "
+            "killing game instance."
+        )
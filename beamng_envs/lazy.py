@@ -0,0 +1,55 @@
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module_attrs(
+    module_name: str, attrs: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module level __getattr__ and __dir__ (PEP 562) that import attributes from other modules on first access.
+
+    e.g. in a package's __init__.py
+    ````
+    _LAZY_ATTRS = {"TrackTestEnv": "beamng_envs.envs.track_test.track_test_env"}
+    __all__ = list(_LAZY_ATTRS)
+    __getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
+    ````
+
+    :param module_name: Name of the module the functions are for, i.e. __name__.
+    :param attrs: The module each attribute is imported from, by attribute name.
+    """
+    module = importlib.import_module(module_name)
+
+    def __getattr__(name: str) -> Any:
+        if name not in attrs:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(attrs[name]), name)
+        # Cache on the module, so later accesses don't go through __getattr__
+        setattr(module, name, value)
+
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(attrs))
+
+    return __getattr__, __dir__
+
+
+class LazyImport:
+    """
+    Class attribute that's imported from another module on first access, e.g. a param space that's slow to build.
+
+    e.g.
+    ````
+    class DragStripEnv(IEnv):
+        param_space = LazyImport("beamng_envs.envs.drag_strip.drag_strip_param_space", "DRAG_STRIP_PARAM_SPACE_GYM")
+    ````
+    """
+
+    def __init__(self, module_name: str, name: str):
+        self.module_name = module_name
+        self.name = name
+
+    def __get__(self, obj: Any, owner: type) -> Any:
+        return getattr(importlib.import_module(self.module_name), self.name)
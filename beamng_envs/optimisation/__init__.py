@@ -0,0 +1,21 @@
+from beamng_envs.lazy import lazy_module_attrs
+
+# Optimisers and designs are imported on first access, so importing the package (or one module in it) stays cheap.
+_LAZY_ATTRS = {
+    "AskTellOptimiser": "beamng_envs.optimisation.optimiser",
+    "Trial": "beamng_envs.optimisation.optimiser",
+    "ParamSpaceEncoder": "beamng_envs.optimisation.param_space_encoder",
+    "RandomProposer": "beamng_envs.optimisation.proposers",
+    "SobolProposer": "beamng_envs.optimisation.proposers",
+    "TPEProposer": "beamng_envs.optimisation.proposers",
+    "Design": "beamng_envs.optimisation.doe",
+    "latin_hypercube": "beamng_envs.optimisation.doe",
+    "sobol": "beamng_envs.optimisation.doe",
+    "full_factorial": "beamng_envs.optimisation.doe",
+    "fractional_factorial": "beamng_envs.optimisation.doe",
+    "Candidate": "beamng_envs.optimisation.multi_fidelity",
+    "SuccessiveHalvingRunner": "beamng_envs.optimisation.multi_fidelity",
+}
+
+__all__ = list(_LAZY_ATTRS)
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -0,0 +1,173 @@
+import itertools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+
+
+@dataclass
+class Design:
+    """
+    A batch of param sets from a design of experiments.
+
+    x holds the points in the unit hypercube (see ParamSpaceEncoder), shape (n, n_dims), and params the corresponding
+    param sets, ready to pass to the envs (or an ExperimentManifest).
+    """
+
+    x: np.ndarray
+    params: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.params)
+
+
+def _design(encoder: ParamSpaceEncoder, x: np.ndarray) -> Design:
+    return Design(x=x, params=[encoder.decode(x_i) for x_i in x])
+
+
+def latin_hypercube(
+    encoder: ParamSpaceEncoder, n: int, seed: Optional[int] = None
+) -> Design:
+    """
+    Latin hypercube sample of n points: each dimension is split into n equal strata, with one point in each.
+
+    For categorical dimensions, this means each value is used (n / n_values) times, +/- 1.
+    """
+    rng = np.random.default_rng(seed)
+    strata = np.stack([rng.permutation(n) for _ in range(encoder.n_dims)], axis=1)
+    x = (strata + rng.uniform(size=(n, encoder.n_dims))) / n
+
+    return _design(encoder, x)
+
+
+def sobol(encoder: ParamSpaceEncoder, n: int, seed: Optional[int] = None) -> Design:
+    """Scrambled Sobol sample of n points; n should be a power of 2 to keep the sequence's balance. Requires scipy."""
+    try:
+        from scipy.stats import qmc
+    except ImportError as e:
+        raise ImportError(
+            "sobol requires scipy, install with pip install beamng_envs[full]."
+        ) from e
+
+    x = qmc.Sobol(d=encoder.n_dims, scramble=True, seed=seed).random(n)
+
+    return _design(encoder, x)
+
+
+def _levels(encoder: ParamSpaceEncoder, continuous_levels: int) -> List[np.ndarray]:
+    """The unit hypercube positions of the levels of each dimension."""
+    levels = []
+    for param_def, continuous in zip(encoder.param_space.values(), encoder.continuous):
+        if continuous:
+            levels.append(np.linspace(0, 1, continuous_levels))
+        else:
+            n_values = len(param_def["values"])
+            levels.append((np.arange(n_values) + 0.5) / n_values)
+
+    return levels
+
+
+def full_factorial(
+    encoder: ParamSpaceEncoder, continuous_levels: int = 2, max_runs: int = 100000
+) -> Design:
+    """
+    Full factorial design: every combination of the levels of each dimension.
+
+    :param encoder: Encoder for the param space.
+    :param continuous_levels: Number of evenly spaced levels (including the bounds) for the continuous dimensions.
+    :param max_runs: Raise rather than build designs larger than this.
+    """
+    levels = _levels(encoder, continuous_levels=continuous_levels)
+    n_runs = int(np.prod([len(lv) for lv in levels], dtype=float))
+    if n_runs > max_runs:
+        raise ValueError(
+            f"Full factorial design has {n_runs} runs, more than max_runs {max_runs}. Use fractional_factorial."
+        )
+
+    return _design(encoder, np.array(list(itertools.product(*levels))))
+
+
+def _next_prime(n: int) -> int:
+    n = max(n, 2)
+    while any(n % d == 0 for d in range(2, int(np.sqrt(n)) + 1)):
+        n += 1
+
+    return n
+
+
+def _orthogonal_array(
+    levels: List[int], n_dims: int, strength: int
+) -> Tuple[int, np.ndarray]:
+    """An orthogonal array with n_dims columns, and q levels in each, where q is prime and at least max(levels)."""
+    if strength == 2:
+        # Rao-Hamming construction, OA(q^m, (q^m - 1) / (q - 1), q, 2); efficient for many dimensions. Runs are all the
+        # vectors u in GF(q)^m, and columns are the vectors v with a leading 1: entries are u.v.
+        # Use the prime q >= max(levels) giving the fewest runs, e.g. 7^2 rather than 5^3 runs for 8 dimensions
+        q, m = None, None
+        q_i = _next_prime(max(levels))
+        while (q is None) or (q_i <= max(n_dims - 1, q)):
+            m_i = 2
+            while (q_i**m_i - 1) // (q_i - 1) < n_dims:
+                m_i += 1
+            if (q is None) or (q_i**m_i < q**m):
+                q, m = q_i, m_i
+            q_i = _next_prime(q_i + 1)
+
+        runs = np.array(list(itertools.product(range(q), repeat=m)))
+        cols = np.array(
+            [v for v in runs if np.any(v) and (v[np.flatnonzero(v)[0]] == 1)][:n_dims]
+        )
+
+        return q, (runs @ cols.T) % q
+
+    # Bush construction, OA(q^t, q + 1, q, t): runs are polynomials of degree < t over GF(q), and columns are their
+    # values at 0..q-1, plus their leading coefficient.
+    q = _next_prime(max(max(levels), n_dims - 1, strength))
+    coefs = np.array(list(itertools.product(range(q), repeat=strength)))
+    powers = np.arange(q)[None, :] ** np.arange(strength)[:, None]
+    oa = np.concatenate([(coefs @ powers) % q, coefs[:, -1:]], axis=1)
+
+    return q, oa[:, :n_dims]
+
+
+def fractional_factorial(
+    encoder: ParamSpaceEncoder,
+    strength: int = 2,
+    continuous_levels: int = 2,
+    max_levels: Optional[int] = None,
+) -> Design:
+    """
+    Fractional factorial design, as an orthogonal array of the given strength.
+
+    Every combination of levels of any `strength` dimensions appears (near) equally often, so all main effects (and,
+    with strength 2, all two-way interactions) are covered with far fewer runs than a full factorial. Arrays have q
+    levels, where q is the smallest prime at least the largest number of levels; dimensions with fewer levels are
+    mapped onto q evenly, so are balanced to within one run. Strength 2 designs use q^m runs, with m growing
+    logarithmically with the number of dimensions. Higher strengths use q^strength runs, with q also at least
+    n_dims - 1.
+
+    :param encoder: Encoder for the param space.
+    :param strength: Strength of the array.
+    :param continuous_levels: Number of evenly spaced levels (including the bounds) for the continuous dimensions.
+    :param max_levels: If set, dimensions with more levels use an evenly spaced subset of this many, to limit the size
+                       of the design (e.g. for the crash test car configs).
+    """
+    levels = _levels(encoder, continuous_levels=continuous_levels)
+    if max_levels is not None:
+        levels = [
+            (
+                lv[np.round(np.linspace(0, len(lv) - 1, max_levels)).astype(int)]
+                if len(lv) > max_levels
+                else lv
+            )
+            for lv in levels
+        ]
+
+    q, oa = _orthogonal_array(
+        levels=[len(lv) for lv in levels], n_dims=encoder.n_dims, strength=strength
+    )
+    x = np.stack([lv[(oa[:, i] * len(lv)) // q] for i, lv in enumerate(levels)], axis=1)
+
+    return _design(encoder, x)
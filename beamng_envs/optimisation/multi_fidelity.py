@@ -0,0 +1,170 @@
+import dataclasses
+import math
+import warnings
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+
+
+@dataclass
+class Candidate:
+    """A param set in a multi-fidelity search, with its results at each fidelity level it was run at."""
+
+    params: Dict[str, Any]
+    results: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    values: Dict[int, Optional[float]] = field(default_factory=dict)
+
+    @property
+    def fidelity(self) -> Optional[int]:
+        """The highest fidelity level the candidate was run at."""
+        return max(self.values) if self.values else None
+
+    @property
+    def value(self) -> Optional[float]:
+        """The objective value at the highest fidelity level run."""
+        return self.values[self.fidelity] if self.values else None
+
+    @property
+    def best_fidelity(self) -> Optional[int]:
+        """The highest fidelity level the candidate ran at without failing."""
+        succeeded = [f for f, v in self.values.items() if v is not None]
+        return max(succeeded) if succeeded else None
+
+
+class SuccessiveHalvingRunner:
+    """
+    Screens param sets at cheap fidelities, promoting only the best to full fidelity runs.
+
+    Each fidelity level (rung) is a set of config overrides, e.g. a lower fps or shorter max_time, applied to the base
+    config with dataclasses.replace; the last rung should normally be {} (the full fidelity config). All candidates are
+    run at the first rung, then the best 1 / eta of them are promoted to the next, and so on. The rung index is set as
+    config.fidelity, so it's recorded in each run's results.
+
+    Runs that didn't finish (results["finished"] false, including pruned runs) are ranked after all finished runs, by
+    how far they got (results[progress_key], e.g. waypoints reached in the track test), then by the objective. With a
+    short max_time rung, where most runs stop early, candidates are then promoted on progress rather than on the time
+    they were stopped at.
+
+    e.g.
+    ````
+    runner = SuccessiveHalvingRunner(
+        config=track_test_config,
+        rungs=[{"fps": 20}, {"fps": 30}, {}],
+        run_fn=lambda params, config: TrackTestEnv(params=params, config=config).run()[0],
+    )
+    candidates = runner.run(param_sets)
+    ````
+    """
+
+    def __init__(
+        self,
+        config: BNGSimConfig,
+        rungs: List[Dict[str, Any]],
+        run_fn: Callable[[Dict[str, Any], BNGSimConfig], Dict[str, Any]],
+        objective_key: str = "time_s",
+        minimise: bool = True,
+        eta: float = 3,
+        progress_key: str = "waypoints_reached",
+    ):
+        """
+        :param config: Base (full fidelity) config.
+        :param rungs: Config overrides for each fidelity level, cheapest first.
+        :param run_fn: Runs a param set with a config, returning the results dict. Exceptions mark the candidate as
+                       failed, and it isn't promoted.
+        :param objective_key: Key of the objective in the results, e.g. "time_s" for TrackTestEnv.
+        :param minimise: Whether to minimise or maximise the objective.
+        :param eta: Reduction factor; the top 1 / eta of candidates at each rung are promoted.
+        :param progress_key: Key of the progress made in the results (higher is further), used to rank runs that didn't
+                             finish. Runs without it count as no progress.
+        """
+        if eta <= 1:
+            raise ValueError(f"eta {eta} must be greater than 1.")
+
+        self.config = config
+        self.rungs = rungs
+        self.run_fn = run_fn
+        self.objective_key = objective_key
+        self.minimise = minimise
+        self.eta = eta
+        self.progress_key = progress_key
+
+    def rung_config(self, fidelity: int) -> BNGSimConfig:
+        return dataclasses.replace(
+            self.config, fidelity=fidelity, **self.rungs[fidelity]
+        )
+
+    def _evaluate(self, candidate: Candidate, fidelity: int) -> None:
+        try:
+            results = self.run_fn(candidate.params, self.rung_config(fidelity))
+        except Exception as e:
+            warnings.warn(f"Run failed at fidelity {fidelity}: {e}")
+            candidate.values[fidelity] = None
+            return
+
+        candidate.results[fidelity] = results
+        value = results.get(self.objective_key)
+        candidate.values[fidelity] = float(value) if value is not None else None
+
+    def _rank_key(
+        self, fidelity: int
+    ) -> Callable[[Candidate], Tuple[int, float, float]]:
+        sign = 1 if self.minimise else -1
+
+        def key(candidate: Candidate) -> Tuple[int, float, float]:
+            value = candidate.values.get(fidelity)
+            if value is None:
+                return 2, 0.0, math.inf
+
+            results = candidate.results[fidelity]
+            if results.get("pruned", False) or not results.get("finished", True):
+                return 1, -float(results.get(self.progress_key, 0)), sign * value
+
+            return 0, 0.0, sign * value
+
+        return key
+
+    def run(
+        self,
+        param_sets: List[Dict[str, Any]],
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> List[Candidate]:
+        """
+        Run the successive halving search.
+
+        :param param_sets: The candidate param sets, e.g. from a design of experiments.
+        :param n_workers: Number of concurrent runs.
+        :param executor: Executor to run in. Defaults to a thread pool.
+        :return: All candidates, best first (ranked by the highest fidelity run without failing, then value). Candidates
+                 that failed at every fidelity are last.
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+
+        candidates = [Candidate(params=p) for p in param_sets]
+        try:
+            active = candidates
+            for fidelity in range(len(self.rungs)):
+                list(executor.map(lambda c: self._evaluate(c, fidelity), active))
+
+                if fidelity < len(self.rungs) - 1:
+                    n_promoted = max(1, math.ceil(len(active) / self.eta))
+                    ranked = sorted(active, key=self._rank_key(fidelity))
+                    active = [
+                        c for c in ranked[:n_promoted] if c.values[fidelity] is not None
+                    ]
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+
+        return sorted(candidates, key=self._final_rank_key)
+
+    def _final_rank_key(self, candidate: Candidate) -> Tuple[int, int, Any]:
+        fidelity = candidate.best_fidelity
+        if fidelity is None:
+            return 1, 0, (2, 0.0, math.inf)
+
+        return 0, -fidelity, self._rank_key(fidelity)(candidate)
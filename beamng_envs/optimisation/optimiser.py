@@ -0,0 +1,165 @@
+import threading
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+from beamng_envs.optimisation.proposers import IProposer
+
+
+@dataclass
+class Trial:
+    """A proposed param set, and its outcome once evaluated."""
+
+    trial_id: int
+    params: Dict[str, Any]
+    x: np.ndarray = field(repr=False)
+    value: Optional[float] = None
+    results: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    failure: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        return (self.value is not None) or (self.failure is not None)
+
+
+class AskTellOptimiser:
+    """
+    Ask/tell optimisation over an env's param space.
+
+    .ask proposes the next param set, given those still being evaluated (pending), and .tell feeds back each env's
+    results as soon as they land, in any order. The objective is read from the results by objective_key, e.g. "time_s"
+    for TrackTestEnv. .run keeps n_workers evaluations in flight, proposing a new param set each time one finishes.
+
+    e.g.
+    ````
+    encoder = ParamSpaceEncoder(TRACK_TEST_PARAM_SPACE)
+    optimiser = AskTellOptimiser(encoder=encoder, proposer=TPEProposer(n_dims=encoder.n_dims))
+    trial = optimiser.ask()
+    results, _ = TrackTestEnv(params=trial.params, config=config).run()
+    optimiser.tell(trial, results)
+    ````
+    """
+
+    def __init__(
+        self,
+        encoder: ParamSpaceEncoder,
+        proposer: IProposer,
+        objective_key: str = "time_s",
+        minimise: bool = True,
+    ):
+        self.encoder = encoder
+        self.proposer = proposer
+        self.objective_key = objective_key
+        self.minimise = minimise
+        self.trials: List[Trial] = []
+
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> List[Trial]:
+        return [t for t in self.trials if not t.complete]
+
+    @property
+    def best(self) -> Optional[Trial]:
+        evaluated = [t for t in self.trials if t.value is not None]
+        if not evaluated:
+            return None
+
+        sign = 1 if self.minimise else -1
+
+        return min(evaluated, key=lambda t: sign * t.value)
+
+    def ask(self) -> Trial:
+        """Propose the next param set to evaluate."""
+        with self._lock:
+            pending_x = np.array([t.x for t in self.pending]).reshape(
+                -1, self.encoder.n_dims
+            )
+            x = self.proposer.ask(pending=pending_x)
+            trial = Trial(trial_id=len(self.trials), params=self.encoder.decode(x), x=x)
+            self.trials.append(trial)
+
+        return trial
+
+    def tell(self, trial: Trial, results: Dict[str, Any]) -> None:
+        """
+        Feed back the results of evaluating a trial.
+
+        Runs that were pruned or didn't finish fail the trial, as their objective (e.g. the time the lap was stopped
+        at) isn't comparable with finished runs.
+        """
+        if results.get("pruned", False):
+            self.fail(trial, reason="Run was pruned.")
+            return
+        if not results.get("finished", True):
+            self.fail(trial, reason="Run didn't finish.")
+            return
+
+        value = results.get(self.objective_key)
+        if (value is None) or not np.isfinite(float(value)):
+            self.fail(trial, reason=f"No finite {self.objective_key} in results.")
+            return
+
+        with self._lock:
+            trial.results = results
+            trial.value = float(value)
+            self.proposer.tell(trial.x, trial.value if self.minimise else -trial.value)
+
+    def fail(self, trial: Trial, reason: str) -> None:
+        """Mark a trial as failed; it's no longer pending, and isn't fed back to the proposer."""
+        with self._lock:
+            trial.failure = reason
+
+    def run(
+        self,
+        run_fn: Callable[[Dict[str, Any]], Dict[str, Any]],
+        n_trials: int,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+    ) -> Optional[Trial]:
+        """
+        Run an asynchronous optimisation loop, keeping n_workers evaluations in flight.
+
+        :param run_fn: Evaluates a param set, returning the results dict, e.g. runs an env on a free worker from a
+                       BNGSimWorkerPool. Exceptions mark the trial as failed.
+        :param n_trials: Total number of trials to run (including failures).
+        :param n_workers: Number of concurrent evaluations.
+        :param executor: Executor to run evaluations in. Defaults to a thread pool, as evaluations are mostly spent
+                         waiting on the game.
+        :return: The best trial.
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=n_workers)
+
+        try:
+            in_flight = {}
+            n_submitted = 0
+            while (n_submitted < n_trials) or in_flight:
+                while (n_submitted < n_trials) and (len(in_flight) < n_workers):
+                    trial = self.ask()
+                    in_flight[executor.submit(run_fn, trial.params)] = trial
+                    n_submitted += 1
+
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    trial = in_flight.pop(future)
+                    if future.exception() is not None:
+                        warnings.warn(
+                            f"Trial {trial.trial_id} failed: {future.exception()}"
+                        )
+                        self.fail(
+                            trial,
+                            reason=f"{type(future.exception()).__name__}: {future.exception()}",
+                        )
+                    else:
+                        self.tell(trial, future.result())
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+
+        return self.best
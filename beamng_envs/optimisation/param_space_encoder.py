@@ -0,0 +1,63 @@
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+class ParamSpaceEncoder:
+    """
+    Maps between env param sets and points in the unit hypercube, for optimisers and samplers.
+
+    Built from the env param space definitions (e.g. TRACK_TEST_PARAM_SPACE), which are dicts of
+    dict(values=..., name=..., type=...). Params are keyed by their "name", as expected by the envs. Float params with
+    two values are continuous in [low, high]; all others are categorical over their values, with each value taking an
+    equal width bin of the unit interval.
+    """
+
+    def __init__(self, param_space: Dict[str, Dict[str, Any]]):
+        self.param_space = param_space
+        self.names: List[str] = [v["name"] for v in param_space.values()]
+        self._defs: List[Dict[str, Any]] = list(param_space.values())
+
+    @property
+    def n_dims(self) -> int:
+        return len(self._defs)
+
+    @staticmethod
+    def is_continuous(param_def: Dict[str, Any]) -> bool:
+        return (param_def.get("type") is float) and (len(param_def["values"]) == 2)
+
+    @property
+    def continuous(self) -> np.ndarray:
+        """Mask of the continuous dimensions."""
+        return np.array([self.is_continuous(d) for d in self._defs], dtype=bool)
+
+    def decode(self, x: np.ndarray) -> Dict[str, Any]:
+        """Convert a point in the unit hypercube to a param set."""
+        x = np.clip(np.asarray(x, dtype=float), 0, 1)
+        params = {}
+        for x_i, param_def in zip(x, self._defs):
+            values = param_def["values"]
+            if self.is_continuous(param_def):
+                params[param_def["name"]] = float(
+                    values[0] + x_i * (values[1] - values[0])
+                )
+            else:
+                params[param_def["name"]] = values[
+                    min(int(x_i * len(values)), len(values) - 1)
+                ]
+
+        return params
+
+    def encode(self, params: Dict[str, Any]) -> np.ndarray:
+        """Convert a param set to a point in the unit hypercube. Categorical values map to the centres of their bins."""
+        x = np.zeros(self.n_dims)
+        for i, param_def in enumerate(self._defs):
+            values = param_def["values"]
+            value = params[param_def["name"]]
+            if self.is_continuous(param_def):
+                x[i] = (float(np.squeeze(value)) - values[0]) / (values[1] - values[0])
+            else:
+                idx = [str(v) for v in values].index(str(value))
+                x[i] = (idx + 0.5) / len(values)
+
+        return x
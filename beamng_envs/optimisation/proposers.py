@@ -0,0 +1,145 @@
+import abc
+from typing import List, Optional
+
+import numpy as np
+
+
+class IProposer(abc.ABC):
+    """
+    Proposes points in the unit hypercube to evaluate next, for minimisation.
+
+    Proposers are told the objective value of each evaluated point as it lands (in any order). When asked, they're
+    also given the points that are still being evaluated, so concurrent proposals don't duplicate them.
+    """
+
+    def __init__(self, n_dims: int, seed: Optional[int] = None):
+        self.n_dims = n_dims
+        self._rng = np.random.default_rng(seed)
+        self._x: List[np.ndarray] = []
+        self._y: List[float] = []
+
+    @property
+    def n_observations(self) -> int:
+        return len(self._y)
+
+    def tell(self, x: np.ndarray, y: float) -> None:
+        self._x.append(np.asarray(x, dtype=float))
+        self._y.append(float(y))
+
+    @abc.abstractmethod
+    def ask(self, pending: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Propose the next point.
+
+        :param pending: Points currently being evaluated, shape (n_pending, n_dims).
+        """
+        pass
+
+
+class RandomProposer(IProposer):
+    """Uniform random search."""
+
+    def ask(self, pending: Optional[np.ndarray] = None) -> np.ndarray:
+        return self._rng.uniform(size=self.n_dims)
+
+
+class SobolProposer(IProposer):
+    """Scrambled Sobol sequence, for more even coverage than random search. Requires scipy."""
+
+    def __init__(self, n_dims: int, seed: Optional[int] = None):
+        super().__init__(n_dims=n_dims, seed=seed)
+        try:
+            from scipy.stats import qmc
+        except ImportError as e:
+            raise ImportError(
+                "SobolProposer requires scipy, install with pip install beamng_envs[full]."
+            ) from e
+
+        self._engine = qmc.Sobol(d=n_dims, scramble=True, seed=seed)
+        self._buffer: List[np.ndarray] = []
+
+    def ask(self, pending: Optional[np.ndarray] = None) -> np.ndarray:
+        if not self._buffer:
+            # Draw in doubling blocks, so the total drawn is always a power of 2 (keeping the sequence's balance)
+            n = max(self._engine.num_generated, 8)
+            self._buffer = list(self._engine.random(n))
+
+        return self._buffer.pop(0)
+
+
+class TPEProposer(IProposer):
+    """
+    Tree-structured Parzen estimator style proposer.
+
+    After n_startup random points, observations are split into the best gamma fraction ("good") and the rest ("bad"),
+    with a Gaussian kernel density estimate fit to each. Candidates are sampled from the good density, and the one
+    maximising l(x) / g(x) is proposed. Pending points are added to the bad set (a constant liar with the worst
+    value), so concurrent proposals spread out rather than piling onto the same region.
+    """
+
+    def __init__(
+        self,
+        n_dims: int,
+        seed: Optional[int] = None,
+        n_startup: int = 10,
+        gamma: float = 0.25,
+        n_candidates: int = 64,
+        min_bandwidth: float = 0.05,
+    ):
+        super().__init__(n_dims=n_dims, seed=seed)
+        self.n_startup = max(n_startup, 2)
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self.min_bandwidth = min_bandwidth
+
+    def _bandwidth(self, x: np.ndarray) -> np.ndarray:
+        # Scott's rule, per dimension
+        scott = x.std(axis=0) * len(x) ** (-1 / (self.n_dims + 4))
+
+        return np.maximum(scott, self.min_bandwidth)
+
+    @staticmethod
+    def _log_density(
+        candidates: np.ndarray, centres: np.ndarray, bandwidth: np.ndarray
+    ) -> np.ndarray:
+        if len(centres) == 0:
+            # Uniform on the unit hypercube
+            return np.zeros(len(candidates))
+
+        z = (candidates[:, None, :] - centres[None, :, :]) / bandwidth
+        log_k = -0.5 * np.sum(z**2, axis=2) - np.sum(
+            np.log(bandwidth * np.sqrt(2 * np.pi))
+        )
+        max_log_k = log_k.max(axis=1, keepdims=True)
+
+        return np.squeeze(max_log_k, axis=1) + np.log(
+            np.mean(np.exp(log_k - max_log_k), axis=1)
+        )
+
+    def ask(self, pending: Optional[np.ndarray] = None) -> np.ndarray:
+        if self.n_observations < self.n_startup:
+            return self._rng.uniform(size=self.n_dims)
+
+        x = np.array(self._x)
+        order = np.argsort(self._y)
+        n_good = min(
+            max(1, int(np.ceil(self.gamma * self.n_observations))),
+            self.n_observations - 1,
+        )
+        good = x[order[:n_good]]
+        bad = x[order[n_good:]]
+        if (pending is not None) and len(pending):
+            bad = np.vstack([bad, pending])
+
+        good_bw = self._bandwidth(good)
+        bad_bw = self._bandwidth(bad)
+
+        centres = good[self._rng.integers(0, n_good, size=self.n_candidates)]
+        candidates = np.clip(
+            centres + self._rng.normal(size=centres.shape) * good_bw, 0, 1
+        )
+        score = self._log_density(candidates, good, good_bw) - self._log_density(
+            candidates, bad, bad_bw
+        )
+
+        return candidates[np.argmax(score)]
@@ -37,3 +37,10 @@ PARSER_BATCH.add_argument(
     default=8,
     help="Number of jobs to use for parallel running.",
 )
+PARSER_BATCH.add_argument(
+    "--manifest_name",
+    type=str,
+    default=None,
+    help="Name of the experiment manifest in the output path. Re-running with the name of an existing manifest resumes "
+    "its remaining runs, rather than sampling new ones. If not set, a new manifest is created.",
+)
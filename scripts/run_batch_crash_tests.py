@@ -10,6 +10,7 @@ from tqdm import tqdm
 from beamng_envs import __VERSION__
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
 from beamng_envs.cars.cars_and_configs import CarConfigs
+from beamng_envs.data.experiment_manifest import ExperimentManifest
 from beamng_envs.envs import CrashTestEnv, CrashTestParamSpaceBuilder, CrashTestConfig
 from scripts.args_batch import PARSER_BATCH
 
@@ -31,7 +32,8 @@ def plot_crash(sca_ser: pd.Series, ts_df: pd.DataFrame, filename: Optional[str]
     fig.tight_layout()
 
     if filename is not None:
-        plt.savefig(filename)
+        fig.savefig(filename)
+        plt.close(fig)
     else:
         plt.show()
 
@@ -67,16 +69,24 @@ if __name__ == "__main__":
         close_on_done=True,  # This env currently doesn't run reliably when reusing the game instance
     )
 
-    # Sample N sets of parameters
-    param_sets = [
-        param_space_space_builder.param_space_gym.sample() for _ in range(opt.N)
-    ]
+    # Sample N sets of parameters, or resume the remaining runs in an existing manifest
+    manifest = ExperimentManifest.load_or_create(
+        output_path=opt.output_path,
+        param_sets=[
+            param_space_space_builder.param_space_gym.sample() for _ in range(opt.N)
+        ],
+        name=opt.manifest_name,
+    )
+    pending_runs = manifest.pending()
+    print(
+        f"Running {len(pending_runs)}/{len(manifest.run_ids)} runs in {manifest.path}"
+    )
 
     # Set up the mlflow experiment
     mlflow.set_experiment("Crash test example")
 
-    for p_set in tqdm(param_sets):
-        env = CrashTestEnv(config=crash_test_config, params=p_set)
+    for run_id, p_set in tqdm(pending_runs):
+        env = CrashTestEnv(config=crash_test_config, params=p_set, run_id=run_id)
 
         with mlflow.start_run():
             results, history = env.run()
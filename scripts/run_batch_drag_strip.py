@@ -10,6 +10,7 @@ from tqdm import tqdm
 
 from beamng_envs import __VERSION__
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.data.experiment_manifest import ExperimentManifest
 
 from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
 from beamng_envs.envs.drag_strip.drag_strip_env import DragStripEnv
@@ -31,14 +32,23 @@ if __name__ == "__main__":
     )
     bng = BeamNGpy(**config.bng_config.__dict__)
 
+    # Sample N sets of parameters, or resume the remaining runs in an existing manifest
+    manifest = ExperimentManifest.load_or_create(
+        output_path=opt.output_path,
+        param_sets=[DragStripEnv.param_space.sample() for _ in range(opt.N)],
+        name=opt.manifest_name,
+    )
+    pending_runs = manifest.pending()
+    print(
+        f"Running {len(pending_runs)}/{len(manifest.run_ids)} runs in {manifest.path}"
+    )
+
     # Set up the mlflow experiment
     mlflow.set_experiment("Drag strip example")
 
-    for run in tqdm(range(opt.N)):
-        params = DragStripEnv.param_space.sample()
-
+    for run, (run_id, params) in enumerate(tqdm(pending_runs)):
         with mlflow.start_run():
-            env = DragStripEnv(params=params, config=config, bng=bng)
+            env = DragStripEnv(params=params, config=config, bng=bng, run_id=run_id)
             results, _ = env.run()
 
             fig, ax = plt.subplots()
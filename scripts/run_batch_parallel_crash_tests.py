@@ -8,39 +8,66 @@ python -m scripts.run_parallel_crash_tests --beamng_path '' --beamng_user_path '
 
 """
 
+import dataclasses
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 import mlflow
-import numpy as np
+import pandas as pd
 from joblib import Parallel, delayed
 from tqdm import tqdm
 
 from beamng_envs import __VERSION__
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
-from beamng_envs.bng_sim.bng_sim_worker import BNGSimWorker
 from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.bng_sim.bng_sim_workspace import BNGSimWorkspaceTemplate
 from beamng_envs.cars.cars_and_configs import CarConfigs
-from beamng_envs.envs import TrackTestConfig, CrashTestEnv
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.data.experiment_manifest import ExperimentManifest
+from beamng_envs.envs import CrashTestEnv
 from beamng_envs.envs.crash_test.crash_test_config import CrashTestConfig
 from beamng_envs.envs.crash_test.crash_test_param_space import (
     CrashTestParamSpaceBuilder,
 )
+from beamng_envs.envs.errors import JobFailedException
 from scripts.args_batch import PARSER_BATCH
 from scripts.run_batch_crash_tests import plot_crash
 
 
-def run_crash_test(worker: BNGSimWorker, conf: TrackTestConfig, p_set: Dict[str, Any]):
-    worker.set_busy()
-    conf.bng_config = worker.get_config(conf.bng_config)
-
-    env = CrashTestEnv(config=conf, params=p_set)
-
+def run_crash_test(
+    worker_pool: BNGSimWorkerPool,
+    conf: CrashTestConfig,
+    run_id: str,
+    p_set: Dict[str, Any],
+) -> Optional[Tuple[str, Dict[str, Any], Dict[str, Any], DiskResults]]:
+    """Run an env in a worker, returning the run ID, params, results and saved results, or None if it failed."""
+    # Wait for a free worker with a ready game instance. The crash env doesn't run reliably when reusing the game
+    # instance, so the worker's instance is relaunched in the background after each run.
+    with worker_pool.checkout(recycle=True) as worker:
+        conf = dataclasses.replace(conf, bng_config=worker.get_config(conf.bng_config))
+        env = CrashTestEnv(config=conf, params=p_set, run_id=run_id, bng=worker.bng)
+
+        try:
+            results, _ = env.run()
+        except JobFailedException as e:
+            # Out of retries; leave the run incomplete so it's retried when the manifest is resumed
+            print(f"Run {run_id} failed: {e}")
+            return None
+
+    # The jobs run in threads, so the results are returned directly (see SharedRunData for handing off runs from
+    # worker processes)
+    return run_id, p_set, results, env.disk_results
+
+
+def log_run(
+    p_set: Dict[str, Any], results: Dict[str, Any], disk_results: DiskResults
+) -> None:
+    """
+    Plot a run and log it to mlflow. Called from the main thread once the jobs are done, as pyplot and mlflow's active
+    run aren't thread-safe.
+    """
     with mlflow.start_run():
-        results, history = env.run()
-
-        p_set.update({"version": __VERSION__})
-        mlflow.log_params(p_set)
+        mlflow.log_params({**p_set, "version": __VERSION__})
         mlflow.log_metrics(
             {
                 k: v
@@ -50,13 +77,11 @@ def run_crash_test(worker: BNGSimWorker, conf: TrackTestConfig, p_set: Dict[str,
         )
 
         plot_crash(
-            sca_ser=env.disk_results.scalars_series,
-            ts_df=env.disk_results.ts_df,
-            filename=os.path.join(env.disk_results.output_path, "crash_test_plot.png"),
+            sca_ser=disk_results.scalars_series,
+            ts_df=disk_results.ts_df,
+            filename=os.path.join(disk_results.output_path, "crash_test_plot.png"),
         )
-        mlflow.log_artifacts(env.disk_results.output_path)
-
-    worker.set_free()
+        mlflow.log_artifacts(disk_results.output_path)
 
 
 if __name__ == "__main__":
@@ -80,31 +105,63 @@ if __name__ == "__main__":
         car_configs=car_configs,
         output_path=opt.output_path,
         bng_config=bng_config,
-        close_on_done=True,  # This env currently doesn't run reliably when reusing the game instance
+        close_on_done=False,  # The worker pool manages the game instances
+        # Kill and restart hung game instances (e.g. stuck on the loading screen) rather than blocking the batch
+        step_timeout=30,
+        job_timeout=300,
+        max_retries=2,
     )
 
-    # Sample N sets of parameters
-    param_sets = [
-        param_space_space_builder.param_space_gym.sample() for _ in range(opt.N)
-    ]
+    # Sample N sets of parameters, or resume the remaining runs in an existing manifest
+    manifest = ExperimentManifest.load_or_create(
+        output_path=opt.output_path,
+        param_sets=[
+            param_space_space_builder.param_space_gym.sample() for _ in range(opt.N)
+        ],
+        name=opt.manifest_name,
+    )
+    pending_runs = manifest.pending()
+    print(
+        f"Running {len(pending_runs)}/{len(manifest.run_ids)} runs in {manifest.path}"
+    )
 
     # Set up the mlflow experiment
     mlflow.set_experiment("Crash test example_p")
 
-    # Set up a worker pool to manage separate game instances (including disk workspaces and ports)
+    # Set up a template workspace, and launch the game in it once to generate the shader and level caches. Each
+    # worker's workspace is provisioned from this, so they don't need to regenerate them.
+    worker_pool_path = "c:\\worker_pool_test\\"
+    template = BNGSimWorkspaceTemplate.create(
+        path=os.path.join(worker_pool_path, "template")
+    )
+    if not template.is_warm:
+        template.warm(bng_config=bng_config, level="gridmap_v2")
+
+    # Set up a worker pool to manage separate game instances (including disk workspaces and ports). Instances are
+    # launched in the background and preloaded with the level, ahead of being needed.
     worker_pool = BNGSimWorkerPool(
-        user_path="c:\\worker_pool_test\\",
+        user_path=worker_pool_path,
         n_workers=opt.n_jobs,
+        template_path=template.path,
     )
-
-    # Run in chunks the size of the worker pool. All in batch need to finish before the next batch can start, but it
-    # avoids needing to track workers at a higher level - they'll all be free at the end of the batch.
-    pool = Parallel(n_jobs=opt.n_jobs)
-    for worker_sets in tqdm(
-        np.array_split(param_sets, np.ceil(len(param_sets) / opt.n_jobs))
-    ):
-        jobs = (
-            delayed(run_crash_test)(w, crash_test_config, p_set)
-            for w, p_set in zip(worker_pool.workers, worker_sets)
+    worker_pool.launch(bng_config=bng_config, level="gridmap_v2")
+
+    # Each job waits for the next free worker, so a slow or hung instance only holds up its own job. Threads are used
+    # as the pool's live game instances can't be shared between processes; time is mostly spent waiting on the game.
+    pool = Parallel(n_jobs=opt.n_jobs, prefer="threads")
+    runs = pool(
+        delayed(run_crash_test)(worker_pool, crash_test_config, run_id, p_set)
+        for run_id, p_set in tqdm(pending_runs)
+    )
+    worker_pool.close()
+
+    # Log the completed runs and summarise their numeric results
+    runs = [run for run in runs if run is not None]
+    for _, p_set, results, disk_results in runs:
+        log_run(p_set=p_set, results=results, disk_results=disk_results)
+    if runs:
+        summary = pd.DataFrame(
+            [results for _, _, results, _ in runs],
+            index=[run_id for run_id, _, _, _ in runs],
         )
-        pool(jobs)
+        print(summary.select_dtypes("number").describe())
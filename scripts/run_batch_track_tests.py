@@ -8,6 +8,7 @@ from tqdm import tqdm
 
 from beamng_envs import __VERSION__
 from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.data.experiment_manifest import ExperimentManifest
 
 from beamng_envs.envs.track_test.track_test_config import TrackTestConfig
 from beamng_envs.envs.track_test.track_test_env import TrackTestEnv
@@ -30,8 +31,16 @@ if __name__ == "__main__":
         bng_config=BeamNGPyConfig(home=opt.beamng_path, user=opt.beamng_user_path),
     )
 
-    # Sample N sets of parameters
-    param_sets = [TRACK_TEST_PARAM_SPACE_GYM.sample() for _ in range(opt.N)]
+    # Sample N sets of parameters, or resume the remaining runs in an existing manifest
+    manifest = ExperimentManifest.load_or_create(
+        output_path=opt.output_path,
+        param_sets=[TRACK_TEST_PARAM_SPACE_GYM.sample() for _ in range(opt.N)],
+        name=opt.manifest_name,
+    )
+    pending_runs = manifest.pending()
+    print(
+        f"Running {len(pending_runs)}/{len(manifest.run_ids)} runs in {manifest.path}"
+    )
 
     # Set up the mlflow experiment
     mlflow.set_experiment("Track test example")
@@ -39,11 +48,12 @@ if __name__ == "__main__":
     # Create a persistent game instance to use to run multiple tests in
     with BeamNGpy(**track_test_config.bng_config.__dict__) as bng:
         # Run the test for each set of parameters
-        for p_set in tqdm(param_sets):
+        for run_id, p_set in tqdm(pending_runs):
             env = TrackTestEnv(
                 params=p_set,
                 config=track_test_config,
                 bng=bng,
+                run_id=run_id,
             )
 
             with mlflow.start_run():
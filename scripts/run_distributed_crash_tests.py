@@ -0,0 +1,155 @@
+"""
+Runs a batch of crash test experiments across multiple hosts.
+
+One host runs the broker, which plans the runs in an experiment manifest and serves the job queue. Each game host runs
+an agent with its own pool of game instances, which pulls jobs from the broker until none are left. Results are saved
+to each agent's output path (which can be a shared drive), with metadata on them pushed back to the broker.
+
+````
+pip install -r scripts/requirements.txt
+
+# A shared token, which agents need to connect to the broker
+export BROKER_TOKEN=[token]
+
+# On the broker host
+python -m scripts.run_distributed_crash_tests --role broker -N 100 --broker_host 0.0.0.0 --broker_port 8765
+
+# On each game host
+python -m scripts.run_distributed_crash_tests --role agent --broker_url http://[broker host]:8765 --n_jobs 3 \
+    --beamng_path '' --beamng_user_path ''
+````
+
+"""
+
+import json
+import os
+import time
+
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.bng_sim.bng_sim_workspace import BNGSimWorkspaceTemplate
+from beamng_envs.cars.cars_and_configs import CarConfigs
+from beamng_envs.data.experiment_manifest import ExperimentManifest
+from beamng_envs.distributed.job_agent import JobAgent
+from beamng_envs.distributed.job_broker import JobBroker
+from beamng_envs.distributed.job_broker_server import JobBrokerClient, JobBrokerServer
+from beamng_envs.envs import CrashTestEnv
+from beamng_envs.envs.crash_test.crash_test_config import CrashTestConfig
+from beamng_envs.envs.crash_test.crash_test_param_space import (
+    CrashTestParamSpaceBuilder,
+)
+from scripts.args_batch import PARSER_BATCH
+
+PARSER_BATCH.add_argument(
+    "--role",
+    type=str,
+    choices=["broker", "agent"],
+    required=True,
+    help="Run the job broker, or an agent that runs jobs from it.",
+)
+PARSER_BATCH.add_argument(
+    "--broker_host",
+    type=str,
+    default="127.0.0.1",
+    help="Interface for the broker to serve on, e.g. 0.0.0.0 for agents on other hosts (requires a token).",
+)
+PARSER_BATCH.add_argument(
+    "--broker_port", type=int, default=8765, help="Port for the broker to serve on."
+)
+PARSER_BATCH.add_argument(
+    "--broker_token",
+    type=str,
+    default=os.environ.get("BROKER_TOKEN"),
+    help="Shared token for agents to connect to the broker. Defaults to the BROKER_TOKEN environment variable.",
+)
+PARSER_BATCH.add_argument(
+    "--broker_url",
+    type=str,
+    default="http://localhost:8765",
+    help="URL of the broker, for agents.",
+)
+
+
+def run_broker(opt) -> None:
+    # The broker only needs the param space to sample from; the car configs are found from the game installation
+    param_space_space_builder = CrashTestParamSpaceBuilder()
+    _ = param_space_space_builder.build(
+        car_configs=CarConfigs.find(beamng_path=opt.beamng_path)
+    )
+
+    # Plan the runs, or resume an existing manifest. Jobs are keyed on run ID, so resubmitting is safe.
+    manifest = ExperimentManifest.load_or_create(
+        output_path=opt.output_path,
+        param_sets=[
+            param_space_space_builder.param_space_gym.sample() for _ in range(opt.N)
+        ],
+        name=opt.manifest_name,
+    )
+    broker = JobBroker(db_path=os.path.join(opt.output_path, f"{manifest.name}.db"))
+    n_added = broker.submit(manifest.pending())
+    print(f"Added {n_added} jobs from {manifest.path}")
+
+    server = JobBrokerServer(
+        broker=broker,
+        host=opt.broker_host,
+        port=opt.broker_port,
+        token=opt.broker_token,
+    )
+    server.start()
+    counts = broker.counts()
+    while counts[JobBroker.pending] + counts[JobBroker.leased] > 0:
+        print(f"Jobs: {counts}")
+        time.sleep(30)
+        counts = broker.counts()
+    server.stop()
+
+    print(f"Finished: {counts}")
+    with open(os.path.join(opt.output_path, f"{manifest.name}_jobs.json"), "w") as f:
+        json.dump(broker.results(), f)
+
+
+def run_agent(opt) -> None:
+    bng_config = BeamNGPyConfig(home=opt.beamng_path, user=opt.beamng_user_path)
+    crash_test_config = CrashTestConfig(
+        car_configs=CarConfigs.find(beamng_path=bng_config.home),
+        output_path=opt.output_path,
+        bng_config=bng_config,
+        close_on_done=False,  # The worker pool manages the game instances
+        step_timeout=30,
+        job_timeout=300,
+        max_retries=1,
+    )
+
+    template = BNGSimWorkspaceTemplate.create(
+        path=os.path.join(opt.beamng_user_path, "template")
+    )
+    if not template.is_warm:
+        template.warm(bng_config=bng_config, level="gridmap_v2")
+    worker_pool = BNGSimWorkerPool(
+        user_path=opt.beamng_user_path,
+        n_workers=opt.n_jobs,
+        template_path=template.path,
+    )
+    worker_pool.launch(bng_config=bng_config, level="gridmap_v2")
+
+    # The crash env doesn't run reliably when reusing the game instance, so recycle instances between jobs
+    agent = JobAgent(
+        broker=JobBrokerClient(url=opt.broker_url, token=opt.broker_token),
+        worker_pool=worker_pool,
+        env_cls=CrashTestEnv,
+        config=crash_test_config,
+        recycle=True,
+    )
+    n_completed = agent.run()
+    worker_pool.close()
+
+    print(f"Agent {agent.agent_id} completed {n_completed} jobs.")
+
+
+if __name__ == "__main__":
+    opt = PARSER_BATCH.parse_args()
+
+    if opt.role == "broker":
+        run_broker(opt)
+    else:
+        run_agent(opt)
@@ -0,0 +1,86 @@
+"""
+Optimise the Scintilla Rally car's setup for lap time in the TrackTestEnv, using multiple BeamNG instances.
+
+Rather than sampling all the param sets up front, each finished run is fed back to the optimiser and a new param set
+is proposed for the freed worker.
+
+````
+pip install -r scripts/requirements.txt
+python -m scripts.run_optimise_track_tests --beamng_path '' --beamng_user_path '' -N 100 --n_jobs 3
+````
+
+"""
+
+import dataclasses
+import os
+from typing import Any, Dict
+
+import mlflow
+
+from beamng_envs import __VERSION__
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.envs.track_test.track_test_config import TrackTestConfig
+from beamng_envs.envs.track_test.track_test_env import TrackTestEnv
+from beamng_envs.envs.track_test.track_test_param_space import TRACK_TEST_PARAM_SPACE
+from beamng_envs.optimisation.optimiser import AskTellOptimiser
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+from beamng_envs.optimisation.proposers import TPEProposer
+from scripts.args_batch import PARSER_BATCH
+
+
+def run_track_test(
+    worker_pool: BNGSimWorkerPool, conf: TrackTestConfig, p_set: Dict[str, Any]
+) -> Dict[str, Any]:
+    with worker_pool.checkout() as worker:
+        conf = dataclasses.replace(conf, bng_config=worker.get_config(conf.bng_config))
+        env = TrackTestEnv(params=p_set, config=conf, bng=worker.bng)
+
+        with mlflow.start_run():
+            results, _ = env.run()
+
+            params = {k.replace("$", ""): float(v) for k, v in p_set.items()}
+            params.update({"version": __VERSION__})
+            mlflow.log_params(params)
+            mlflow.log_metrics({k: float(v) for k, v in results.items()})
+
+    return results
+
+
+if __name__ == "__main__":
+    opt = PARSER_BATCH.parse_args()
+
+    bng_config = BeamNGPyConfig(home=opt.beamng_path, user=opt.beamng_user_path)
+    track_test_config = TrackTestConfig(
+        output_path=opt.output_path,
+        bng_config=bng_config,
+        close_on_done=False,  # The worker pool manages the game instances
+        step_timeout=30,
+        job_timeout=600,
+        max_retries=1,
+    )
+
+    mlflow.set_experiment("Track test optimisation example")
+
+    worker_pool = BNGSimWorkerPool(
+        user_path=os.path.join(opt.beamng_user_path, "workers"),
+        n_workers=opt.n_jobs,
+    )
+    worker_pool.launch(bng_config=bng_config, level="hirochi_raceway")
+
+    # Minimise lap time, with TPE proposals (random for the first 10 runs)
+    encoder = ParamSpaceEncoder(TRACK_TEST_PARAM_SPACE)
+    optimiser = AskTellOptimiser(
+        encoder=encoder,
+        proposer=TPEProposer(n_dims=encoder.n_dims, n_startup=10),
+        objective_key="time_s",
+        minimise=True,
+    )
+    best = optimiser.run(
+        run_fn=lambda p_set: run_track_test(worker_pool, track_test_config, p_set),
+        n_trials=opt.N,
+        n_workers=opt.n_jobs,
+    )
+    worker_pool.close()
+
+    print(f"Best lap time: {best.value}s with params {best.params}")
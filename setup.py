@@ -12,7 +12,7 @@ except FileNotFoundError:
     long_description = ""
 
 REQS_CORE = ["beamngpy>=1.26.0", "numpy", "gym", "pandas", "ruamel-yaml"]
-RES_FULL = ["mlflow", "tqdm"]
+RES_FULL = ["mlflow", "tqdm", "scipy"]
 
 setuptools.setup(
     name="beamng_envs",
@@ -23,6 +23,13 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/MonolithAILtd/beamng_envs",
     packages=setuptools.find_packages(),
+    package_data={
+        "beamng_envs": [
+            "cars/data/*.json",
+            "BeamNGpy.zip",
+            "bng_sim/lua/ge/extensions/beamngEnvs/*.lua",
+        ]
+    },
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
         "Programming Language :: Python :: 3.7",
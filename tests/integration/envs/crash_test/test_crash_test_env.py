@@ -1,20 +1,24 @@
+import asyncio
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pandas as pd
 
 from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.envs.crash_test.crash_test_batch_env import CrashTestBatchEnv
 from beamng_envs.envs.crash_test.crash_test_config import CrashTestConfig
 from beamng_envs.envs.crash_test.crash_test_env import CrashTestEnv
 from beamng_envs.envs.crash_test.crash_test_param_space import (
     CrashTestParamSpaceBuilder,
 )
+from beamng_envs.envs.event_history import EventHistory
 from beamng_envs.envs.history import History
 from tests.mocks.mock_beamng_simulation import MockBNGSimulation
 from tests.mocks.mock_vehicle import MockVehicle
 from tests.common.tidy_test_case import TidyTestCase
 
 PARADIGM_PATH = "beamng_envs.envs.crash_test.crash_test_paradigm"
+BATCH_PARADIGM_PATH = "beamng_envs.envs.crash_test.crash_test_batch_paradigm"
 
 
 class TestCrashTestEnv(TidyTestCase):
@@ -48,3 +52,136 @@ class TestCrashTestEnv(TidyTestCase):
         self.assertIsInstance(disk_results.ts_df, pd.DataFrame)
         self.assertEqual(len(disk_results.ts_df), env._paradigm.current_step)
         self.assertIsInstance(disk_results.scalars_series, pd.Series)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_async_run_envs_concurrently(self):
+        # Arrange
+        car_configs = MagicMock()
+        car_configs.configs = {"car_1": {"parts": {"part_name": "part"}}}
+        config = self._sut_config_class(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, car_configs=car_configs
+        )
+        param_space_space_builder = CrashTestParamSpaceBuilder()
+        _ = param_space_space_builder.build(car_configs=car_configs)
+        envs = [
+            self._sut_class(
+                params=param_space_space_builder.param_space_gym.sample(),
+                config=config,
+            )
+            for _ in range(3)
+        ]
+        for env in envs:
+            env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+            env._paradigm.vehicle = MagicMock()
+
+        async def run_all():
+            limit = asyncio.Semaphore(2)
+
+            return await asyncio.gather(*[env.async_run(limit=limit) for env in envs])
+
+        # Act
+        outputs = asyncio.run(run_all())
+
+        # Assert
+        self.assertEqual(3, len(outputs))
+        for env, (results, history) in zip(envs, outputs):
+            disk_results = DiskResults.load(env.disk_results.output_path)
+            self.assertIsInstance(history, History)
+            self.assertEqual(env._paradigm.current_step, len(disk_results.ts_df))
+            self.assertEqual(results["time_s"], disk_results.results["time_s"])
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_with_event_history_records_decimated_steps(self):
+        # Arrange
+        car_configs = MagicMock()
+        car_configs.configs = {"car_1": {"parts": {"part_name": "part"}}}
+        config = self._sut_config_class(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, car_configs=car_configs
+        )
+        param_space_space_builder = CrashTestParamSpaceBuilder()
+        _ = param_space_space_builder.build(car_configs=car_configs)
+        env = self._sut_class(
+            params=param_space_space_builder.param_space_gym.sample(),
+            config=config,
+            history=EventHistory(decimation=10),
+        )
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+        env._paradigm.vehicle = MagicMock()
+
+        # Act
+        _, history = env.run()
+        disk_results = DiskResults.load(env.disk_results.output_path)
+
+        # Assert
+        n_steps = env._paradigm.current_step
+        self.assertEqual([1, 11, 21], history["time_pts"][:3])
+        self.assertEqual(len(history), len(disk_results.ts_df))
+        self.assertEqual(n_steps, history["time_pts"][-1])
+        self.assertAlmostEqual(0.5, disk_results.ts_df["dt_s"].iloc[1])
+
+
+class TestCrashTestBatchEnv(TidyTestCase):
+    _sut_class = CrashTestBatchEnv
+
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_batch_saves_results_for_each_test(self):
+        # Arrange
+        car_configs = MagicMock()
+        car_configs.configs = {"car_1": {"parts": {"part_name": "part"}}}
+        config = CrashTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, car_configs=car_configs
+        )
+        params = [
+            {"car_config_name": "car_1", "speed_kph": 50, "start_position": "flat_mid"},
+            {"car_config_name": "car_1", "speed_kph": 80, "start_position": "wedge"},
+            {
+                "car_config_name": "car_1",
+                "speed_kph": 30,
+                "start_position": "raised_bar",
+            },
+        ]
+        env = self._sut_class(params=params, config=config, run_ids=["a", "b", "c"])
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        results, histories = env.run()
+        disk_results = [DiskResults.load(dr.output_path) for dr in env.disk_results]
+
+        # Assert
+        self.assertEqual(3, len(results))
+        self.assertEqual(3, len(histories))
+        self.assertListEqual(["a", "b", "c"], [dr.run_id for dr in disk_results])
+        for p, r, h, dr in zip(params, results, histories, disk_results):
+            self.assertEqual(3, r["batch_size"])
+            self.assertEqual(len(h), env._paradigm.current_step)
+            self.assertEqual(len(dr.ts_df), env._paradigm.current_step)
+            self.assertEqual(p["speed_kph"], dr.params["speed_kph"])
+
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Scenario", MagicMock())
+    def test_async_run_batch_saves_results_for_each_test(self):
+        # Arrange
+        car_configs = MagicMock()
+        car_configs.configs = {"car_1": {"parts": {"part_name": "part"}}}
+        config = CrashTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, car_configs=car_configs
+        )
+        params = [
+            {"car_config_name": "car_1", "speed_kph": 50, "start_position": "flat_mid"},
+            {"car_config_name": "car_1", "speed_kph": 80, "start_position": "wedge"},
+        ]
+        env = self._sut_class(params=params, config=config, run_ids=["a", "b"])
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        results, histories = asyncio.run(env.async_run())
+
+        # Assert
+        self.assertEqual(2, len(results))
+        self.assertListEqual(["a", "b"], [dr.run_id for dr in env.disk_results])
+        for r, h in zip(results, histories):
+            self.assertEqual(2, r["batch_size"])
+            self.assertEqual(len(h), env._paradigm.current_step)
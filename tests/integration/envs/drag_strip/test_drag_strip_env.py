@@ -1,9 +1,13 @@
+import asyncio
+import os
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 
 from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.envs.drag_strip.drag_strip_batch_env import DragStripBatchEnv
 from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
 from beamng_envs.envs.drag_strip.drag_strip_env import DragStripEnv
 from beamng_envs.envs.history import History
@@ -12,6 +16,7 @@ from tests.mocks.mock_beamng_simulation import MockBNGSimulation
 from tests.mocks.mock_vehicle import MockVehicle
 
 PARADIGM_PATH = "beamng_envs.envs.drag_strip.drag_strip_paradigm"
+BATCH_PARADIGM_PATH = "beamng_envs.envs.drag_strip.drag_strip_batch_paradigm"
 
 
 class TestDragStripEnv(TidyTestCase):
@@ -38,3 +43,160 @@ class TestDragStripEnv(TidyTestCase):
         self.assertIsInstance(disk_results.ts_df, pd.DataFrame)
         self.assertEqual(len(disk_results.ts_df), env._paradigm.current_step)
         self.assertIsInstance(disk_results.scalars_series, pd.Series)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_step_returns_observation_vector(self):
+        # Arrange
+        config = DragStripConfig(output_path=self._tmp_dir.name, fps=20, max_time=10)
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        obs, _, _, _ = env.step()
+        obs_2, _, _, _ = env.step()
+
+        # Assert
+        self.assertEqual(env.observation_space.shape, obs.shape)
+        self.assertEqual(np.float32, obs.dtype)
+        self.assertIs(obs, obs_2)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_async_step_returns_observation_vector(self):
+        # Arrange
+        config = DragStripConfig(output_path=self._tmp_dir.name, fps=20, max_time=10)
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        obs, _, done, _ = asyncio.run(env.async_step())
+
+        # Assert
+        self.assertEqual(env.observation_space.shape, obs.shape)
+        self.assertEqual(np.float32, obs.dtype)
+        self.assertFalse(done)
+        self.assertEqual(1, env._paradigm.current_step)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_step_returns_dict_observations_if_set(self):
+        # Arrange
+        config = DragStripConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, dict_observations=True
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        obs, _, _, _ = env.step()
+
+        # Assert
+        self.assertIsInstance(obs, dict)
+        self.assertIn("state", obs)
+
+
+class MockLaneBNGSimulation(MockBNGSimulation):
+    """Polls alternate between two vehicles: the first stays put, the second moves 50m along the strip each step."""
+
+    _n_polls = 0
+
+    def poll_sensors_for_vehicle(self, *args, **kwargs):
+        sensor_data = super().poll_sensors_for_vehicle(*args, **kwargs)
+        self._n_polls += 1
+        if self._n_polls % 2 == 0:
+            sensor_data["state"]["pos"] = [50 * self._n_polls / 2, 410, 101]
+
+        return sensor_data
+
+
+class TestDragStripBatchEnv(TidyTestCase):
+    _sut_class = DragStripBatchEnv
+
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_batch_finishes_each_lane_separately(self):
+        # Arrange
+        config = DragStripConfig(output_path=self._tmp_dir.name, fps=20, max_time=2)
+        env = self._sut_class(
+            params=[self._sut_class.param_space.sample() for _ in range(2)],
+            config=config,
+        )
+        env._bng_simulation = MockLaneBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        results, histories = env.run()
+        disk_results = [DiskResults.load(dr.output_path) for dr in env.disk_results]
+
+        # Assert
+        self.assertListEqual([False, True], [r["finished"] for r in results])
+        self.assertAlmostEqual(2.05, results[0]["time_s"])
+        self.assertAlmostEqual(0.45, results[1]["time_s"])
+        self.assertEqual(41, len(histories[0]))
+        self.assertEqual(9, len(histories[1]))
+        self.assertListEqual([41, 9], [len(dr.ts_df) for dr in disk_results])
+
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Scenario", MagicMock())
+    def test_async_run_batch_finishes_each_lane_separately(self):
+        # Arrange
+        config = DragStripConfig(output_path=self._tmp_dir.name, fps=20, max_time=2)
+        env = self._sut_class(
+            params=[self._sut_class.param_space.sample() for _ in range(2)],
+            config=config,
+        )
+        env._bng_simulation = MockLaneBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        results, histories = asyncio.run(env.async_run())
+
+        # Assert
+        self.assertListEqual([False, True], [r["finished"] for r in results])
+        self.assertAlmostEqual(0.45, results[1]["time_s"])
+        self.assertListEqual([41, 9], [len(h) for h in histories])
+        self.assertEqual(2, len(env.disk_results))
+
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{BATCH_PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_batch_with_sharded_layout_packs_scalars(self):
+        # Arrange
+        config = DragStripConfig(
+            output_path=self._tmp_dir.name,
+            fps=20,
+            max_time=2,
+            results_layout="sharded",
+        )
+        env = self._sut_class(
+            params=[self._sut_class.param_space.sample() for _ in range(2)],
+            config=config,
+        )
+        env._bng_simulation = MockLaneBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        results, _ = env.run()
+        disk_results = [
+            DiskResults.load(self._tmp_dir.name, run_id=dr.run_id)
+            for dr in env.disk_results
+        ]
+
+        # Assert
+        self.assertEqual(
+            {"index.jsonl", "runs", "scalars"}, set(os.listdir(self._tmp_dir.name))
+        )
+        self.assertEqual(
+            1, len(os.listdir(os.path.join(self._tmp_dir.name, "scalars")))
+        )
+        self.assertListEqual(results, [dr.results for dr in disk_results])
+        self.assertListEqual([41, 9], [len(dr.ts_df) for dr in disk_results])
+
+    def test_too_many_lanes_raises_error(self):
+        self.assertRaises(
+            ValueError,
+            lambda: self._sut_class(params=[{}] * 3, max_lanes=2),
+        )
@@ -0,0 +1,76 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from beamng_envs.envs.drag_strip.drag_strip_config import DragStripConfig
+from beamng_envs.envs.drag_strip.drag_strip_env import DragStripEnv
+from beamng_envs.envs.vector_env import BNGVectorEnv
+from tests.common.tidy_test_case import TidyTestCase
+from tests.mocks.mock_beamng_simulation import MockBNGSimulation
+from tests.mocks.mock_vehicle import MockVehicle
+
+PARADIGM_PATH = "beamng_envs.envs.drag_strip.drag_strip_paradigm"
+
+
+class TestBNGVectorEnv(TidyTestCase):
+    _sut_class = BNGVectorEnv
+
+    def _make_env(self, dict_observations: bool = False) -> DragStripEnv:
+        config = DragStripConfig(
+            output_path=self._tmp_dir.name,
+            fps=20,
+            max_time=1,
+            dict_observations=dict_observations,
+        )
+        env = DragStripEnv(params=DragStripEnv.param_space.sample(), config=config)
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+
+        return env
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_step_returns_batched_outputs(self):
+        # Arrange
+        sut = self._sut_class(env_fns=[self._make_env for _ in range(3)])
+        _ = sut.reset()
+
+        # Act
+        obs, rewards, dones, infos = sut.step([None] * 3)
+        sut.close()
+
+        # Assert
+        self.assertEqual((3,) + sut.envs[0].observation_space.shape, obs.shape)
+        self.assertListEqual([0.0, 0.0, 0.0], list(rewards))
+        self.assertListEqual([False, False, False], list(dones))
+        self.assertEqual(3, len(infos))
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_step_auto_resets_done_envs(self):
+        # Arrange
+        sut = self._sut_class(
+            env_fns=[lambda: self._make_env(dict_observations=True) for _ in range(2)]
+        )
+        _ = sut.reset()
+
+        # Act
+        for _ in range(20):
+            _, _, dones, _ = sut.step([None, None])
+            self.assertFalse(np.any(dones))
+        obs, _, dones, infos = sut.step([None, None])
+        sut.close()
+
+        # Assert
+        self.assertTrue(np.all(dones))
+        self.assertIn("final_observation", infos[0])
+        self.assertEqual(0, sut.envs[0]._paradigm.current_step)
+        self.assertEqual((2, 3), obs["state"]["pos"].shape)
+
+    def test_step_wait_without_step_async_raises_error(self):
+        # Arrange
+        sut = self._sut_class(env_fns=[self._make_env])
+
+        # Act/Assert
+        self.assertRaises(RuntimeError, sut.step_wait)
+        sut.close()
@@ -1,11 +1,16 @@
+import asyncio
+import os
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pandas as pd
+from beamngpy.logging import BNGDisconnectedError
 
 from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.envs.errors import JobFailedException
 from beamng_envs.envs.history import History
 from beamng_envs.envs.track_test.track_test_config import TrackTestConfig
+from beamng_envs.envs.track_test.track_pace_pruner import TrackPacePruner
 from beamng_envs.envs.track_test.track_test_env import TrackTestEnv
 from tests.common.tidy_test_case import TidyTestCase
 from tests.mocks.mock_beamng_simulation import MockBNGSimulation
@@ -14,6 +19,20 @@ from tests.mocks.mock_vehicle import MockVehicle
 PARADIGM_PATH = "beamng_envs.envs.track_test.track_test_paradigm"
 
 
+class FailingBNGSimulation(MockBNGSimulation):
+    """Mock simulation where the game disconnects (or raises error) on the first step of the first n_failures runs."""
+
+    n_failures = 1
+    error = BNGDisconnectedError("The simulator ended the connection.")
+
+    def step(self, n_steps: int = 1):
+        if self.n_failures > 0:
+            self.n_failures -= 1
+            raise self.error
+
+        super().step(n_steps)
+
+
 class TestTrackTestEnv(TidyTestCase):
     _sut_class = TrackTestEnv
 
@@ -38,3 +57,153 @@ class TestTrackTestEnv(TidyTestCase):
         self.assertIsInstance(disk_results.ts_df, pd.DataFrame)
         self.assertEqual(len(disk_results.ts_df), env._paradigm.current_step)
         self.assertIsInstance(disk_results.scalars_series, pd.Series)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_returns_cached_results(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name,
+            fps=20,
+            max_time=10,
+            cache_path=os.path.join(self._tmp_dir.name, "cache"),
+        )
+        params = self._sut_class.param_space.sample()
+        env = self._sut_class(params=params, config=config)
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+        _ = env.run()
+        cached_env = self._sut_class(params=params, config=config)
+        cached_env._bng_simulation = MagicMock()
+
+        # Act
+        results, history = cached_env.run()
+
+        # Assert
+        cached_env._bng_simulation.reset.assert_not_called()
+        self.assertEqual(env.disk_results.run_id, cached_env.disk_results.run_id)
+        self.assertEqual(env.results["time_s"], results["time_s"])
+        self.assertEqual(len(env.history), len(history))
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_retries_after_game_failure(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, max_retries=1
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = FailingBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        with self.assertWarns(UserWarning):
+            _ = env.run()
+        disk_results = DiskResults.load(env.disk_results.output_path)
+
+        # Assert
+        self.assertEqual(1, len(env.failures))
+        self.assertIn("BNGDisconnectedError", env.failures[0])
+        self.assertEqual(2, disk_results.outcome["attempts"])
+        self.assertEqual(env.failures, disk_results.outcome["failures"])
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_async_run_retries_after_game_failure(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, max_retries=1
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = FailingBNGSimulation(config=config, bng=MagicMock())
+
+        # Act
+        with self.assertWarns(UserWarning):
+            results, _ = asyncio.run(env.async_run())
+        disk_results = DiskResults.load(env.disk_results.output_path)
+
+        # Assert
+        self.assertEqual(1, len(env.failures))
+        self.assertIn("BNGDisconnectedError", env.failures[0])
+        self.assertEqual(2, disk_results.outcome["attempts"])
+        self.assertEqual(results, disk_results.results)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_raises_when_out_of_retries(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, max_retries=1
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = FailingBNGSimulation(config=config, bng=MagicMock())
+        env._bng_simulation.n_failures = 2
+
+        # Act/assert
+        with self.assertWarns(UserWarning):
+            self.assertRaises(JobFailedException, env.run)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_retries_after_connection_error(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, max_retries=1
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = FailingBNGSimulation(config=config, bng=MagicMock())
+        env._bng_simulation.error = ConnectionResetError("Connection reset.")
+
+        # Act
+        with self.assertWarns(UserWarning):
+            _ = env.run()
+
+        # Assert
+        self.assertEqual(1, len(env.failures))
+        self.assertIn("ConnectionResetError", env.failures[0])
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_doesnt_retry_other_os_errors(self):
+        # Arrange
+        config = TrackTestConfig(
+            output_path=self._tmp_dir.name, fps=20, max_time=10, max_retries=1
+        )
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config
+        )
+        env._bng_simulation = FailingBNGSimulation(config=config, bng=MagicMock())
+        env._bng_simulation.error = PermissionError("Access denied.")
+
+        # Act/assert
+        self.assertRaises(PermissionError, env.run)
+        self.assertEqual([], env.failures)
+
+    @mock.patch(f"{PARADIGM_PATH}.Vehicle", MockVehicle())
+    @mock.patch(f"{PARADIGM_PATH}.Scenario", MagicMock())
+    def test_run_pruned_when_behind_reference_pace(self):
+        # Arrange
+        config = TrackTestConfig(output_path=self._tmp_dir.name, fps=20, max_time=10)
+        pruner = TrackPacePruner(margin=0.5, reference_splits=[1.0, 2.0, 3.0])
+        env = self._sut_class(
+            params=self._sut_class.param_space.sample(), config=config, pruner=pruner
+        )
+        env._bng_simulation = MockBNGSimulation(config=config, bng=MagicMock())
+        env._paradigm.vehicle = MagicMock()
+
+        # Act
+        results, _ = env.run()
+        disk_results = DiskResults.load(env.disk_results.output_path)
+
+        # Assert
+        self.assertTrue(results["pruned"])
+        self.assertFalse(results["finished"])
+        self.assertLess(results["time_s"], 2.0)
+        self.assertTrue(disk_results.pruned)
+        self.assertEqual([1.0, 2.0, 3.0], pruner.reference_splits)
@@ -13,7 +13,7 @@ class MockBNGSimulation(BNGSim):
     def poll_sensors_for_vehicle(self, *args, **kwargs):
         return {
             "state": {
-                "rotation": [0, 0, 0],
+                "rotation": [0, 0, 0, 1],
                 "front": [0, 0, 0],
                 "vel": [0, 0, 0],
                 "up": [0, 0, 0],
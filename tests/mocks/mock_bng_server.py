@@ -0,0 +1,168 @@
+import socket
+import struct
+import threading
+from typing import Any, Dict, List
+
+import msgpack
+
+from beamng_envs.bng_sim import step_predicates
+
+
+class MockBNGServer:
+    """
+    Local stand-in for the game's side of the BeamNGpy socket protocol (length prefixed msgpack), enough for
+    BeamNGpy.open(launch=False), stepping, Lua commands and the beamngEnvs/stepUntil and beamngEnvs/stepAndPoll
+    extensions.
+
+    Simulates one vehicle (vid "vehicle") moving at a constant velocity, and records the type of each request received.
+    supports_step_and_poll=False simulates an older game build, which rejects BeamNGEnvsStepAndPoll requests.
+    """
+
+    protocol_version = "v1.21"
+
+    def __init__(
+        self,
+        vel=(10.0, 0.0, 0.0),
+        fps: int = 60,
+        supports_step_and_poll: bool = True,
+    ):
+        self.vel = list(vel)
+        self.fps = fps
+        self.supports_step_and_poll = supports_step_and_poll
+        self.pos = [0.0, 0.0, 0.0]
+        self.requests: List[str] = []
+        self.lua_chunks: List[str] = []
+
+        self._skt = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._skt.bind(("localhost", 0))
+        self._skt.listen(1)
+        self.port = self._skt.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._skt.close()
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        return {"pos": list(self.pos), "dir": [1.0, 0.0, 0.0], "vel": list(self.vel)}
+
+    def _advance(self, n_steps: int) -> None:
+        self.pos = [p + v * n_steps / self.fps for p, v in zip(self.pos, self.vel)]
+
+    def _step_until(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not any("beamngEnvs_stepUntil" in c for c in self.lua_chunks):
+            return {"bngError": "Unhandled request type BeamNGEnvsStepUntil"}
+
+        frames = []
+        satisfied = False
+        steps = 0
+        while (not satisfied) and (steps < request["maxSteps"]):
+            self._advance(1)
+            steps += 1
+            state = dict(self.state, step=steps)
+            if steps % request["recordEvery"] == 0:
+                frames.append(state)
+            satisfied = step_predicates.evaluate(request["predicate"], state)
+
+        if frames[-1]["step"] != steps:
+            frames.append(state)
+
+        return {"frames": frames, "steps": steps, "satisfied": satisfied}
+
+    def _sensor_data(self, sensor_request: Dict[str, Any]) -> Dict[str, Any]:
+        raw = {
+            "State": {"state": self.state},
+            "Electrics": {"values": {"wheelspeed": self.vel[0]}},
+            "GForces": {"gx": 0.0, "gy": 0.0, "gz": 0.0},
+            "Damage": {"damage": 0.0},
+        }
+
+        return {
+            name: raw[sensor["type"]]
+            for name, sensor in sensor_request["sensors"].items()
+        }
+
+    def _step_and_poll(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.supports_step_and_poll or not any(
+            "beamngEnvs_stepAndPoll" in c for c in self.lua_chunks
+        ):
+            return {"bngError": "Unhandled request type BeamNGEnvsStepAndPoll"}
+
+        self._advance(request["count"])
+
+        return {
+            "steps": request["count"],
+            "data": {
+                vid: self._sensor_data(sensor_request)
+                for vid, sensor_request in request["vehicles"].items()
+            },
+        }
+
+    def _handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        kind = request["type"]
+        self.requests.append(kind)
+        if kind == "Hello":
+            return {"type": "Hello", "protocolVersion": self.protocol_version}
+        if kind == "GetSystemInfo":
+            return {"type": "GetSystemInfo", "os": {"type": "Linux"}, "tech": True}
+        if kind == "Step":
+            self._advance(request["count"])
+            return {"type": "Stepped"}
+        if kind == "QueueLuaCommandGE":
+            self.lua_chunks.append(request["chunk"])
+            return {"type": "ExecutedLuaChunkGE"}
+        if kind == "BeamNGEnvsStepUntil":
+            return dict(self._step_until(request), type=kind)
+        if kind == "BeamNGEnvsStepAndPoll":
+            return dict(self._step_and_poll(request), type=kind)
+
+        return {"bngError": f"Unhandled request type {kind}"}
+
+    def _recv_exactly(self, conn: socket.socket, length: int) -> bytes:
+        data = b""
+        while len(data) < length:
+            received = conn.recv(length - len(data))
+            if not received:
+                raise ConnectionError("Client disconnected.")
+            data += received
+
+        return data
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self._skt.accept()
+            except OSError:
+                # Closed
+                return
+
+            with conn:
+                try:
+                    while True:
+                        (length,) = struct.unpack("!I", self._recv_exactly(conn, 4))
+                        request = msgpack.unpackb(
+                            self._recv_exactly(conn, length), raw=False
+                        )
+                        response = dict(self._handle(request), _id=request["_id"])
+                        packed = msgpack.packb(response, use_bin_type=True)
+                        conn.sendall(struct.pack("!I", len(packed)) + packed)
+                except (ConnectionError, OSError):
+                    continue
+
+
+class MockServerVehicle:
+    """Vehicle whose state sensor reads the MockBNGServer's vehicle state when polled."""
+
+    vid = "vehicle"
+
+    def __init__(self, server: MockBNGServer):
+        self._server = server
+        self.data = {}
+        self.sensors = self
+
+    def poll(self, *sensor_names: str) -> None:
+        self.data = self._server.state
+
+    def __getitem__(self, sensor_name: str) -> "MockServerVehicle":
+        return self
@@ -10,7 +10,7 @@ class MockStateSensor(MagicMock):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.data: Dict[str, Any] = {
-            "rotation": [0, 0, 0],
+            "rotation": [0, 0, 0, 1],
             "front": [0, 0, 0],
             "vel": [0, 0, 0],
             "up": [0, 0, 0],
@@ -54,7 +54,7 @@ class MockSensors(MagicMock):
         self._step += 1
         self.sensors = {"state": MockSensor(), "damage": MockSensor()}
         self.sensors["state"].data = {
-            "rotation": [0, 0, 0],
+            "rotation": [0, 0, 0, 1],
             "front": [0, 0, 0],
             "vel": [0, 0, 0],
             "up": [0, 0, 0],
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from beamng_envs.bng_sim.async_bng_sim import AsyncBNGSim
+from beamng_envs.envs.errors import SimulationStalledException
+
+
+class SlowSim:
+    """Stand-in for a BNGSim whose steps block for a fixed time, recording the number of steps in flight."""
+
+    def __init__(self, step_time: float, in_flight: list):
+        self.step_time = step_time
+        self.in_flight = in_flight
+        self.threads = set()
+        self._kill_game_process = MagicMock()
+        self.kill = MagicMock()
+
+    def step(self, n_steps: int = 1):
+        self.threads.add(threading.get_ident())
+        self.in_flight.append(1)
+        time.sleep(self.step_time)
+        self.in_flight.append(-1)
+
+
+def max_in_flight(in_flight: list) -> int:
+    current = peak = 0
+    for change in in_flight:
+        current += change
+        peak = max(peak, current)
+
+    return peak
+
+
+class TestAsyncBNGSim(unittest.TestCase):
+    def test_steps_instances_concurrently(self):
+        # Arrange
+        in_flight = []
+        sims = [AsyncBNGSim(SlowSim(0.1, in_flight)) for _ in range(4)]
+
+        async def step_all():
+            await asyncio.gather(*[s.step() for s in sims])
+
+        # Act
+        t0 = time.monotonic()
+        asyncio.run(step_all())
+        elapsed = time.monotonic() - t0
+
+        # Assert
+        self.assertLess(elapsed, 0.3)
+        self.assertEqual(4, max_in_flight(in_flight))
+
+    def test_calls_to_one_instance_run_in_order_in_one_thread(self):
+        # Arrange
+        in_flight = []
+        sim = SlowSim(0.01, in_flight)
+        sut = AsyncBNGSim(sim)
+
+        async def step_concurrently():
+            await asyncio.gather(*[sut.step() for _ in range(5)])
+
+        # Act
+        asyncio.run(step_concurrently())
+
+        # Assert
+        self.assertEqual(1, max_in_flight(in_flight))
+        self.assertEqual(1, len(sim.threads))
+
+    def test_limit_applies_back_pressure(self):
+        # Arrange
+        in_flight = []
+
+        async def step_all():
+            limit = asyncio.Semaphore(2)
+            sims = [
+                AsyncBNGSim(SlowSim(0.02, in_flight), limit=limit) for _ in range(6)
+            ]
+            await asyncio.gather(*[s.step() for s in sims])
+
+        # Act
+        asyncio.run(step_all())
+
+        # Assert
+        self.assertEqual(2, max_in_flight(in_flight))
+
+    def test_call_timeout_kills_game_and_raises(self):
+        # Arrange
+        sim = SlowSim(0.2, [])
+        sut = AsyncBNGSim(sim, call_timeout=0.05)
+
+        # Act/Assert
+        with self.assertRaises(SimulationStalledException):
+            asyncio.run(sut.step())
+        sim._kill_game_process.assert_called_once()
+
+    def test_setup_call_uses_setup_timeout(self):
+        # Arrange
+        sim = SlowSim(0.1, [])
+        sut = AsyncBNGSim(sim, call_timeout=0.05, setup_timeout=1)
+
+        # Act
+        asyncio.run(sut.setup_call(sim.step))
+
+        # Assert
+        sim._kill_game_process.assert_not_called()
@@ -0,0 +1,40 @@
+import dataclasses
+import unittest
+
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+
+
+class TestBNGSimConfig(unittest.TestCase):
+    def test_config_is_immutable(self):
+        # Arrange
+        config = BNGSimConfig()
+
+        # Act/Assert
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.fps = 30
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            config.bng_config.port = 1
+
+    def test_bng_config_default_is_not_shared(self):
+        # Act
+        config_1 = BNGSimConfig()
+        config_2 = BNGSimConfig()
+
+        # Assert
+        self.assertEqual(config_1.bng_config, config_2.bng_config)
+        self.assertIsNot(config_1.bng_config, config_2.bng_config)
+
+    def test_replace_derives_new_config(self):
+        # Arrange
+        config = BNGSimConfig(fps=30)
+
+        # Act
+        derived = dataclasses.replace(
+            config, bng_config=dataclasses.replace(config.bng_config, port=1)
+        )
+
+        # Assert
+        self.assertEqual(1, derived.bng_config.port)
+        self.assertEqual(30, derived.fps)
+        self.assertEqual(BeamNGPyConfig().port, config.bng_config.port)
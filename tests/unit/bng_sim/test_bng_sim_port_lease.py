@@ -0,0 +1,129 @@
+import os
+import socket
+import subprocess
+import sys
+
+from beamng_envs.bng_sim.bng_sim_port_lease import BNGSimPortLease
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestBNGSimPortLease(TidyTestCase):
+    _start_port = 58100
+
+    def test_acquire_creates_lockfile(self):
+        # Act
+        lease = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Assert
+        self.assertEqual(self._start_port, lease.port)
+        with open(lease.lock_fn, "r") as f:
+            self.assertEqual(str(os.getpid()), f.read())
+
+    def test_acquire_skips_leased_port(self):
+        # Arrange
+        lease_1 = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Act
+        lease_2 = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Assert
+        self.assertEqual(lease_1.port + 1, lease_2.port)
+
+    def test_acquire_skips_port_in_use(self):
+        # Arrange
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as skt:
+            skt.bind(("localhost", self._start_port))
+            skt.listen()
+
+            # Act
+            lease = BNGSimPortLease.acquire(
+                start_port=self._start_port, lock_path=self._tmp_dir.name
+            )
+
+        # Assert
+        self.assertEqual(self._start_port + 1, lease.port)
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self._tmp_dir.name, f"port_{self._start_port}.lock")
+            )
+        )
+
+    def test_acquire_takes_over_stale_lease(self):
+        # Arrange
+        dead_process = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead_process.wait()
+        with open(
+            os.path.join(self._tmp_dir.name, f"port_{self._start_port}.lock"), "w"
+        ) as f:
+            f.write(str(dead_process.pid))
+
+        # Act
+        lease = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Assert
+        self.assertEqual(self._start_port, lease.port)
+
+    def test_acquire_takes_over_empty_lockfile(self):
+        # Arrange
+        open(
+            os.path.join(self._tmp_dir.name, f"port_{self._start_port}.lock"), "w"
+        ).close()
+
+        # Act
+        lease = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Assert
+        self.assertEqual(self._start_port, lease.port)
+
+    def test_acquire_takes_over_lease_once_holding_process_dies(self):
+        # Arrange
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from beamng_envs.bng_sim.bng_sim_port_lease import BNGSimPortLease; "
+                f"lease = BNGSimPortLease.acquire(start_port={self._start_port}, lock_path=sys.argv[1]); "
+                "print(lease.port, flush=True); sys.stdin.read()",
+                self._tmp_dir.name,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        held_port = int(holder.stdout.readline())
+
+        # Act
+        lease_while_held = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+        holder.kill()
+        holder.wait()
+        holder.stdin.close()
+        holder.stdout.close()
+        lease_after_death = BNGSimPortLease.acquire(
+            start_port=self._start_port, lock_path=self._tmp_dir.name
+        )
+
+        # Assert
+        self.assertEqual(self._start_port, held_port)
+        self.assertEqual(self._start_port + 1, lease_while_held.port)
+        self.assertEqual(self._start_port, lease_after_death.port)
+
+    def test_release_removes_lockfile(self):
+        # Arrange
+        lease = BNGSimPortLease.acquire(lock_path=self._tmp_dir.name)
+
+        # Act
+        lease.release()
+
+        # Assert
+        self.assertFalse(os.path.exists(lease.lock_fn))
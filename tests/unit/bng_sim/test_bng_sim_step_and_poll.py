@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock
+
+from beamngpy import BeamNGpy, Vehicle
+
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from tests.mocks.mock_bng_server import MockBNGServer
+
+
+class TestBNGSimStepAndPoll(unittest.TestCase):
+    def _set_up(self, supports_step_and_poll: bool = True) -> None:
+        # Vehicle moving at 10 m/s along x, at 60 steps/s
+        self._server = MockBNGServer(
+            vel=(10.0, 0.0, 0.0),
+            fps=60,
+            supports_step_and_poll=supports_step_and_poll,
+        )
+        self._bng = BeamNGpy("localhost", self._server.port).open(launch=False)
+        self._sut = BNGSim(
+            config=BNGSimConfig(server_side_stepping=True), bng=self._bng
+        )
+        self._vehicle = self._sut.attach_sensors_to_vehicle(
+            Vehicle("vehicle", model="etk800")
+        )
+        self._server.requests.clear()
+
+    def tearDown(self) -> None:
+        self._bng.disconnect()
+        self._server.close()
+
+    def test_steps_and_polls_in_one_request(self):
+        # Arrange
+        self._set_up()
+
+        # Act
+        sensor_data = self._sut.step_and_poll([self._vehicle], n_steps=6)
+        sensor_data_2 = self._sut.step_and_poll([self._vehicle], n_steps=6)
+
+        # Assert
+        self.assertEqual(
+            ["QueueLuaCommandGE", "BeamNGEnvsStepAndPoll", "BeamNGEnvsStepAndPoll"],
+            self._server.requests,
+        )
+        self.assertEqual(1, len(sensor_data))
+        self.assertAlmostEqual(1.0, sensor_data[0]["state"]["pos"][0])
+        self.assertAlmostEqual(2.0, sensor_data_2[0]["state"]["pos"][0])
+        self.assertEqual(10.0, sensor_data[0]["electrics"]["wheelspeed"])
+        self.assertEqual(sensor_data_2[0]["state"], self._vehicle.sensors["state"].data)
+
+    def test_falls_back_to_step_and_poll_on_older_builds(self):
+        # Arrange
+        self._set_up(supports_step_and_poll=False)
+        self._sut.poll_sensors_for_vehicle = MagicMock(return_value={"state": {}})
+
+        # Act
+        self._sut.step_and_poll([self._vehicle], n_steps=6)
+        self._sut.step_and_poll([self._vehicle], n_steps=6)
+
+        # Assert
+        self.assertEqual(
+            ["QueueLuaCommandGE", "BeamNGEnvsStepAndPoll", "Step", "Step"],
+            self._server.requests,
+        )
+        self.assertEqual(2, self._sut.poll_sensors_for_vehicle.call_count)
+        self.assertAlmostEqual(2.0, self._server.pos[0])
@@ -0,0 +1,123 @@
+import os
+import unittest
+
+from beamngpy import BeamNGpy
+
+from beamng_envs.bng_sim import step_predicates
+from beamng_envs.bng_sim.bng_sim import BNGSim
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from tests.common.tidy_test_case import TidyTestCase
+from tests.mocks.mock_bng_server import MockBNGServer, MockServerVehicle
+
+
+class TestBNGSimStepUntil(unittest.TestCase):
+    def setUp(self) -> None:
+        # Vehicle moving at 10 m/s along x, at 60 steps/s
+        self._server = MockBNGServer(vel=(10.0, 0.0, 0.0), fps=60)
+        self._bng = BeamNGpy("localhost", self._server.port).open(launch=False)
+        self._vehicle = MockServerVehicle(self._server)
+
+    def tearDown(self) -> None:
+        self._bng.disconnect()
+        self._server.close()
+
+    def _sut(self, server_side_stepping: bool) -> BNGSim:
+        return BNGSim(
+            config=BNGSimConfig(server_side_stepping=server_side_stepping),
+            bng=self._bng,
+        )
+
+    def test_server_side_stops_on_predicate_in_one_request(self):
+        # Arrange
+        sut = self._sut(server_side_stepping=True)
+        self._server.requests.clear()
+
+        # Act
+        result = sut.step_until(
+            self._vehicle,
+            predicate=step_predicates.pos_past(axis=0, value=9.9),
+            max_steps=600,
+            record_every=10,
+        )
+
+        # Assert
+        self.assertTrue(result.satisfied)
+        self.assertEqual(60, result.n_steps)
+        self.assertEqual(list(range(10, 61, 10)), [f["step"] for f in result.frames])
+        self.assertAlmostEqual(10, result.frames[-1]["pos"][0])
+        self.assertEqual(
+            ["QueueLuaCommandGE", "BeamNGEnvsStepUntil"], self._server.requests
+        )
+
+    def test_server_side_stops_at_max_steps(self):
+        # Arrange
+        sut = self._sut(server_side_stepping=True)
+
+        # Act
+        result = sut.step_until(
+            self._vehicle,
+            predicate=step_predicates.pos_past(axis=0, value=1000),
+            max_steps=25,
+            record_every=10,
+        )
+
+        # Assert
+        self.assertFalse(result.satisfied)
+        self.assertEqual(25, result.n_steps)
+        self.assertEqual([10, 20, 25], [f["step"] for f in result.frames])
+
+    def test_extension_is_only_loaded_once(self):
+        # Arrange
+        sut = self._sut(server_side_stepping=True)
+        predicate = step_predicates.speed_below(1)
+
+        # Act
+        sut.step_until(self._vehicle, predicate=predicate, max_steps=5)
+        sut.step_until(self._vehicle, predicate=predicate, max_steps=5)
+
+        # Assert
+        self.assertEqual(1, len(self._server.lua_chunks))
+
+    def test_polling_fallback_matches_server_side(self):
+        # Arrange
+        sut = self._sut(server_side_stepping=False)
+        self._server.requests.clear()
+
+        # Act
+        result = sut.step_until(
+            self._vehicle,
+            predicate=step_predicates.pos_past(axis=0, value=9.9),
+            max_steps=600,
+            record_every=10,
+        )
+
+        # Assert
+        self.assertTrue(result.satisfied)
+        self.assertEqual(60, result.n_steps)
+        self.assertEqual(list(range(10, 61, 10)), [f["step"] for f in result.frames])
+        self.assertAlmostEqual(10, result.frames[-1]["pos"][0])
+        self.assertEqual(["Step"] * 60, self._server.requests)
+
+
+class TestBNGSimInstallExtension(TidyTestCase):
+    def test_install_extension_adds_unpacked_mod(self):
+        # Act
+        BNGSim.install_extension(self._tmp_dir.name, bng_version="0.28")
+
+        # Assert
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self._tmp_dir.name,
+                    "0.28",
+                    "mods",
+                    "unpacked",
+                    "beamng_envs",
+                    "lua",
+                    "ge",
+                    "extensions",
+                    "beamngEnvs",
+                    "stepUntil.lua",
+                )
+            )
+        )
@@ -0,0 +1,96 @@
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from beamng_envs.bng_sim.bng_sim_watchdog import BNGSimWatchdog
+from beamng_envs.envs.errors import JobTimeoutException, SimulationStalledException
+
+
+class TestBNGSimWatchdog(unittest.TestCase):
+    def test_fires_on_stalled_step(self):
+        # Arrange
+        on_fire = MagicMock()
+        sut = BNGSimWatchdog(on_fire=on_fire, step_timeout=0.05, poll_interval=0.01)
+        sut.start_job()
+
+        # Act
+        with sut.watch_step():
+            time.sleep(0.2)
+        sut.stop()
+
+        # Assert
+        on_fire.assert_called_once()
+        self.assertRaises(SimulationStalledException, sut.check)
+
+    def test_fires_on_job_timeout(self):
+        # Arrange
+        on_fire = MagicMock()
+        sut = BNGSimWatchdog(on_fire=on_fire, job_timeout=0.05, poll_interval=0.01)
+
+        # Act
+        sut.start_job()
+        time.sleep(0.2)
+        sut.stop()
+
+        # Assert
+        on_fire.assert_called_once()
+        self.assertRaises(JobTimeoutException, sut.check)
+
+    def test_does_not_fire_for_completed_steps(self):
+        # Arrange
+        on_fire = MagicMock()
+        sut = BNGSimWatchdog(on_fire=on_fire, step_timeout=0.1, poll_interval=0.01)
+        sut.start_job()
+
+        # Act
+        for _ in range(5):
+            with sut.watch_step():
+                time.sleep(0.01)
+        time.sleep(0.2)
+        sut.stop()
+
+        # Assert
+        on_fire.assert_not_called()
+        sut.check()
+
+    def test_step_timeout_scales_with_n_steps(self):
+        # Arrange
+        on_fire = MagicMock()
+        sut = BNGSimWatchdog(on_fire=on_fire, step_timeout=0.05, poll_interval=0.01)
+        sut.start_job()
+
+        # Act
+        with sut.watch_step(n_steps=10):
+            time.sleep(0.2)
+        sut.stop()
+
+        # Assert
+        on_fire.assert_not_called()
+        sut.check()
+
+    def test_disabled_without_timeouts(self):
+        # Arrange
+        sut = BNGSimWatchdog(on_fire=MagicMock())
+
+        # Act
+        sut.start_job()
+
+        # Assert
+        self.assertFalse(sut.enabled)
+        self.assertIsNone(sut._thread)
+
+    def test_restarts_after_stop(self):
+        # Arrange
+        on_fire = MagicMock()
+        sut = BNGSimWatchdog(on_fire=on_fire, job_timeout=0.05, poll_interval=0.01)
+        sut.start_job()
+        sut.stop()
+
+        # Act
+        sut.start_job()
+        time.sleep(0.2)
+        sut.stop()
+
+        # Assert
+        on_fire.assert_called_once()
+        self.assertIsNone(sut._thread)
@@ -1,15 +1,25 @@
+import os
 import tempfile
-import unittest
+from unittest.mock import patch
+
+from beamng_envs.bng_sim.beamngpy_config import BeamNGPyConfig
 
 from beamng_envs.bng_sim.bng_sim_worker import BNGSimWorker
 from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.bng_sim.bng_sim_workspace import BNGSimWorkspaceTemplate
 from tests.common.tidy_test_case import TidyTestCase
 
 
 class TestBNGSimWorkerPool(TidyTestCase):
     def setUp(self) -> None:
         self._tmp_dir = tempfile.TemporaryDirectory()
-        self._sut = BNGSimWorkerPool(n_workers=2, user_path=self._tmp_dir.name)
+        self._sut = BNGSimWorkerPool(
+            n_workers=2, user_path=self._tmp_dir.name, lock_path=self._tmp_dir.name
+        )
+
+    def tearDown(self) -> None:
+        self._sut.close()
+        super().tearDown()
 
     def test_get_free_worker(self):
         # Act
@@ -17,3 +27,139 @@ class TestBNGSimWorkerPool(TidyTestCase):
 
         # Assert
         self.assertIsInstance(worker, BNGSimWorker)
+
+    def test_get_free_worker_marks_worker_busy(self):
+        # Act
+        with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+            worker_1 = self._sut.get_free_worker()
+            worker_2 = self._sut.get_free_worker()
+
+        # Assert
+        self.assertTrue(worker_1.busy)
+        self.assertIsNot(worker_1, worker_2)
+
+    def test_checkout_gives_launched_instance(self):
+        # Arrange
+        with patch("beamng_envs.bng_sim.bng_sim_worker.BeamNGpy") as mock_bng:
+            # Connected, and not launched by this process
+            mock_bng.return_value.process = None
+            self._sut.launch(bng_config=BeamNGPyConfig())
+            self._sut.wait_until_ready()
+
+        # Act
+        with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+            with self._sut.checkout() as worker:
+                busy = worker.busy
+
+        # Assert
+        self.assertTrue(busy)
+        self.assertFalse(worker.busy)
+        self.assertIs(worker.bng, mock_bng.return_value)
+        self.assertEqual(2, mock_bng.return_value.open.call_count)
+        self.assertIn(worker.port, [c.kwargs["port"] for c in mock_bng.call_args_list])
+
+    def test_release_with_recycle_relaunches_instance(self):
+        # Arrange
+        with patch("beamng_envs.bng_sim.bng_sim_worker.BeamNGpy") as mock_bng:
+            # Connected, and not launched by this process
+            mock_bng.return_value.process = None
+            self._sut.launch(bng_config=BeamNGPyConfig())
+            self._sut.wait_until_ready()
+
+            # Act
+            with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+                with self._sut.checkout(recycle=True):
+                    pass
+            self._sut.wait_until_ready()
+
+        # Assert
+        self.assertEqual(1, mock_bng.return_value.close.call_count)
+        self.assertEqual(3, mock_bng.return_value.open.call_count)
+
+    def test_release_relaunches_dead_instance(self):
+        # Arrange
+        with patch("beamng_envs.bng_sim.bng_sim_worker.BeamNGpy") as mock_bng:
+            # Connected, and not launched by this process
+            mock_bng.return_value.process = None
+            self._sut.launch(bng_config=BeamNGPyConfig())
+            self._sut.wait_until_ready()
+
+            # Act
+            with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+                with self._sut.checkout() as worker:
+                    worker.bng = None
+            self._sut.wait_until_ready()
+
+        # Assert
+        self.assertIsNotNone(worker.bng)
+        self.assertEqual(3, mock_bng.return_value.open.call_count)
+
+    def test_failed_launches_retried_with_backoff_then_raised(self):
+        # Arrange
+        with patch("beamng_envs.bng_sim.bng_sim_worker.BeamNGpy") as mock_bng:
+            mock_bng.return_value.open.side_effect = FileNotFoundError("No game.")
+            with patch(
+                "beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"
+            ) as mock_sleep:
+                self._sut.launch(bng_config=BeamNGPyConfig())
+                self._sut.wait_until_ready()
+
+                # Act
+                with self.assertRaises(FileNotFoundError):
+                    self._sut.get_free_worker()
+
+        # Assert
+        self.assertEqual(2 * 3, mock_bng.return_value.open.call_count)
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        self.assertEqual(2, delays.count(5))
+        self.assertEqual(2, delays.count(10))
+
+    def test_launch_provisions_workspaces_from_template(self):
+        # Arrange
+        template = BNGSimWorkspaceTemplate.create(
+            path=os.path.join(self._tmp_dir.name, "template")
+        )
+        self._sut.close()
+        self._sut = BNGSimWorkerPool(
+            n_workers=2,
+            user_path=self._tmp_dir.name,
+            template_path=template.path,
+            lock_path=self._tmp_dir.name,
+        )
+
+        # Act
+        with patch("beamng_envs.bng_sim.bng_sim_worker.BeamNGpy") as mock_bng:
+            mock_bng.return_value.process = None
+            self._sut.launch(bng_config=BeamNGPyConfig())
+            self._sut.wait_until_ready()
+
+        # Assert
+        for worker in self._sut.workers:
+            self.assertTrue(template.is_provisioned(worker.worker_path))
+
+    def test_pools_lease_different_ports(self):
+        # Act
+        other_pool = BNGSimWorkerPool(
+            n_workers=2, user_path=self._tmp_dir.name, lock_path=self._tmp_dir.name
+        )
+        other_pool.close()
+
+        # Assert
+        self.assertEqual(
+            set(),
+            {w.port for w in self._sut.workers} & {w.port for w in other_pool.workers},
+        )
+
+    def test_get_config_derives_per_worker_configs(self):
+        # Arrange
+        bng_config = BeamNGPyConfig(user="shared_user", port=1)
+
+        # Act
+        configs = [w.get_config(bng_config) for w in self._sut.workers]
+
+        # Assert
+        self.assertEqual(BeamNGPyConfig(user="shared_user", port=1), bng_config)
+        self.assertEqual(
+            [(w.worker_path, w.port) for w in self._sut.workers],
+            [(c.user, c.port) for c in configs],
+        )
@@ -0,0 +1,88 @@
+import os
+import pathlib
+
+from beamng_envs.bng_sim.bng_sim_workspace import BNGSimWorkspaceTemplate
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestBNGSimWorkspaceTemplate(TidyTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._template_path = os.path.join(self._tmp_dir.name, "template")
+        self._workspace_path = os.path.join(self._tmp_dir.name, "port_58000")
+        self._sut = BNGSimWorkspaceTemplate.create(
+            path=self._template_path, bng_version="0.28"
+        )
+
+        # Some caches and settings generated by the game on first run
+        cache_path = os.path.join(self._template_path, "0.28", "temp", "shaders")
+        settings_path = os.path.join(self._template_path, "0.28", "settings")
+        pathlib.Path(cache_path).mkdir(parents=True)
+        pathlib.Path(settings_path).mkdir(parents=True)
+        pathlib.Path(os.path.join(cache_path, "shader.bin")).write_text("cache")
+        pathlib.Path(os.path.join(settings_path, "game.json")).write_text("{}")
+        pathlib.Path(
+            os.path.join(self._template_path, "0.28", "mods", "db.json")
+        ).write_text("{}")
+
+    def test_create_sets_up_user_path(self):
+        # Assert
+        self.assertTrue(
+            os.path.exists(os.path.join(self._template_path, "ResearchHelper.txt"))
+        )
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self._template_path, "0.28", "mods", "BeamNGpy.zip")
+            )
+        )
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(
+                    self._template_path,
+                    "0.28",
+                    "mods",
+                    "unpacked",
+                    "beamng_envs",
+                    "lua",
+                    "ge",
+                    "extensions",
+                    "beamngEnvs",
+                    "stepUntil.lua",
+                )
+            )
+        )
+
+    def test_provision_links_caches_and_copies_settings(self):
+        # Act
+        self._sut.provision(workspace_path=self._workspace_path)
+
+        # Assert
+        self.assertTrue(self._sut.is_provisioned(self._workspace_path))
+        for rel_path, linked in [
+            (("0.28", "mods", "BeamNGpy.zip"), True),
+            (("0.28", "temp", "shaders", "shader.bin"), True),
+            (("0.28", "settings", "game.json"), False),
+            (("0.28", "mods", "db.json"), False),
+            (("ResearchHelper.txt",), False),
+        ]:
+            self.assertEqual(
+                linked,
+                os.path.samefile(
+                    os.path.join(self._template_path, *rel_path),
+                    os.path.join(self._workspace_path, *rel_path),
+                ),
+            )
+
+    def test_provision_keeps_existing_workspace(self):
+        # Arrange
+        self._sut.provision(workspace_path=self._workspace_path)
+        settings_fn = os.path.join(
+            self._workspace_path, "0.28", "settings", "game.json"
+        )
+        pathlib.Path(settings_fn).write_text('{"modified": true}')
+
+        # Act
+        self._sut.provision(workspace_path=self._workspace_path)
+
+        # Assert
+        self.assertEqual('{"modified": true}', pathlib.Path(settings_fn).read_text())
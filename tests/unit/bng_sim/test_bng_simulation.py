@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import MagicMock, patch
 
 from beamng_envs.bng_sim.bng_sim import BNGSim
 from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
@@ -39,3 +40,50 @@ class TestBNGSimulation(unittest.TestCase):
         self.assertRaises(
             OutOfTimeException, lambda: sut.check_time_limit(scenario_step=100000)
         )
+
+    def test_close_stops_watchdog_without_closing_instance(self):
+        # Arrange
+        bng = MagicMock()
+        sut = self._sut_class(
+            BNGSimConfig(step_timeout=10, close_on_done=False), bng=bng
+        )
+        sut.watchdog.start_job()
+        thread = sut.watchdog._thread
+
+        # Act
+        sut.close()
+
+        # Assert
+        self.assertFalse(thread.is_alive())
+        self.assertIs(bng, sut.bng)
+        bng.close.assert_not_called()
+
+    def test_kill_disconnects_supplied_instance(self):
+        # Arrange
+        bng = MagicMock()
+        sut = self._sut_class(BNGSimConfig(), bng=bng)
+
+        # Act
+        sut.kill()
+
+        # Assert
+        bng.process.kill.assert_called_once()
+        bng.disconnect.assert_called_once()
+        self.assertIsNone(sut.bng)
+
+    def test_close_closes_instance_replacing_killed_supplied_instance(self):
+        # Arrange
+        supplied_bng = MagicMock()
+        sut = self._sut_class(BNGSimConfig(close_on_done=False), bng=supplied_bng)
+        sut.kill()
+        relaunched_bng = MagicMock()
+        sut.bng = relaunched_bng
+
+        # Act
+        with patch("time.sleep"):
+            sut.close()
+
+        # Assert
+        relaunched_bng.close.assert_called_once()
+        supplied_bng.close.assert_not_called()
+        self.assertIsNone(sut.bng)
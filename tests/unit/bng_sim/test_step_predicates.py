@@ -0,0 +1,57 @@
+import unittest
+
+from beamng_envs.bng_sim import step_predicates
+
+
+class TestStepPredicates(unittest.TestCase):
+    _state = {"pos": [10.0, 5.0, 0.0], "vel": [3.0, 4.0, 0.0]}
+
+    def test_pos_past(self):
+        # Act/assert
+        self.assertTrue(
+            step_predicates.evaluate(step_predicates.pos_past(0, 10), self._state)
+        )
+        self.assertFalse(
+            step_predicates.evaluate(step_predicates.pos_past(1, 6), self._state)
+        )
+
+    def test_within(self):
+        # Act/assert
+        self.assertTrue(
+            step_predicates.evaluate(
+                step_predicates.within((10, 0, 0), radius=5.5), self._state
+            )
+        )
+        self.assertFalse(
+            step_predicates.evaluate(
+                step_predicates.within((10, 0, 0), radius=4.5), self._state
+            )
+        )
+
+    def test_speed_below(self):
+        # Act/assert
+        self.assertTrue(
+            step_predicates.evaluate(step_predicates.speed_below(5.5), self._state)
+        )
+        self.assertFalse(
+            step_predicates.evaluate(step_predicates.speed_below(4.5), self._state)
+        )
+
+    def test_any_and_all_of(self):
+        # Arrange
+        true = step_predicates.pos_past(0, 0)
+        false = step_predicates.pos_past(0, 100)
+
+        # Act/assert
+        self.assertTrue(
+            step_predicates.evaluate(step_predicates.any_of(false, true), self._state)
+        )
+        self.assertFalse(
+            step_predicates.evaluate(step_predicates.all_of(false, true), self._state)
+        )
+
+    def test_unknown_type_raises_error(self):
+        # Act/assert
+        self.assertRaises(
+            ValueError, lambda: step_predicates.evaluate({"type": "?"}, self._state)
+        )
@@ -0,0 +1,157 @@
+import glob
+import os
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.data.disk_results import DiskResults
+from beamng_envs.data.sharded_results import ResultsIndex
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestDiskResults(TidyTestCase):
+    def _disk_results(self, run_id: str, layout: str = "flat") -> DiskResults:
+        config = BNGSimConfig(output_path=self._tmp_dir.name, results_layout=layout)
+
+        return DiskResults(
+            path=self._tmp_dir.name,
+            config=dict(config.__dict__),
+            params={"a": 1.0},
+            results={"time_s": 2.0, "finished": True},
+            history={
+                "time_s": [0.1, 0.2],
+                "time_pts": [1, 2],
+                "car_state": [{"state": {"pos": [0, 0, i]}} for i in range(2)],
+            },
+            run_id=run_id,
+        )
+
+    def test_sharded_save_shards_run_directories_and_packs_scalars(self):
+        # Arrange
+        disk_results = self._disk_results("abcdef", layout="sharded")
+
+        # Act
+        disk_results.save()
+
+        # Assert
+        run_path = os.path.join(self._tmp_dir.name, "runs", "ab", "cd", "abcdef")
+        self.assertEqual(run_path, disk_results.output_path)
+        self.assertEqual(["history.json"], os.listdir(run_path))
+        self.assertEqual(
+            1, len(glob.glob(os.path.join(self._tmp_dir.name, "scalars", "*.jsonl")))
+        )
+        self.assertTrue(os.path.exists(os.path.join(self._tmp_dir.name, "index.jsonl")))
+
+    def test_load_by_run_id_from_either_layout(self):
+        # Arrange
+        self._disk_results("flat_run").save()
+        self._disk_results("sharded_run", layout="sharded").save()
+
+        # Act
+        flat = DiskResults.load(self._tmp_dir.name, run_id="flat_run")
+        sharded = DiskResults.load(self._tmp_dir.name, run_id="sharded_run")
+
+        # Assert
+        for loaded in [flat, sharded]:
+            self.assertEqual({"time_s": 2.0, "finished": True}, loaded.results)
+            self.assertEqual({"a": 1.0}, loaded.params)
+            self.assertEqual(2, len(loaded.ts_df))
+        self.assertEqual("sharded_run", sharded.run_id)
+        self.assertEqual("sharded", sharded.config["results_layout"])
+
+    def test_load_from_sharded_run_path(self):
+        # Arrange
+        disk_results = self._disk_results("abcdef", layout="sharded")
+        disk_results.save()
+
+        # Act
+        loaded = DiskResults.load(disk_results.output_path)
+
+        # Assert
+        self.assertEqual("abcdef", loaded.run_id)
+        self.assertEqual(
+            disk_results.scalars_series["results_time_s"],
+            loaded.scalars_series["results_time_s"],
+        )
+
+    def test_is_complete_once_in_index(self):
+        # Arrange
+        disk_results = self._disk_results("abcdef", layout="sharded")
+        disk_results._save_history()
+
+        # Act
+        complete_before = DiskResults.is_complete(disk_results.output_path)
+        disk_results.save()
+        complete_after = DiskResults.is_complete(disk_results.output_path)
+
+        # Assert
+        self.assertFalse(complete_before)
+        self.assertTrue(complete_after)
+        self.assertTrue(DiskResults.is_complete(self._tmp_dir.name, run_id="abcdef"))
+
+    def test_save_batch_packs_one_file_and_indexes_each_run(self):
+        # Arrange
+        batch = [self._disk_results(f"run_{i}", layout="sharded") for i in range(3)]
+
+        # Act
+        DiskResults.save_batch(batch)
+
+        # Assert
+        entries = ResultsIndex.for_root(self._tmp_dir.name).entries()
+        self.assertEqual(["run_0", "run_1", "run_2"], [e["run_id"] for e in entries])
+        self.assertEqual(1, len({e["scalars"] for e in entries}))
+        self.assertEqual(
+            [e["offset"] + e["length"] for e in entries[:-1]],
+            [e["offset"] for e in entries[1:]],
+        )
+
+    def test_single_run_saves_share_packed_file(self):
+        # Arrange
+        runs = [self._disk_results(f"run_{i}", layout="sharded") for i in range(5)]
+
+        # Act
+        for disk_results in runs:
+            disk_results.save()
+        loaded = DiskResults.load(self._tmp_dir.name, run_id="run_3")
+
+        # Assert
+        self.assertEqual(
+            1, len(os.listdir(os.path.join(self._tmp_dir.name, "scalars")))
+        )
+        self.assertEqual("run_3", loaded.run_id)
+        self.assertEqual(runs[3].results, loaded.results)
+
+    def test_rerun_supersedes_earlier_index_entry(self):
+        # Arrange
+        self._disk_results("abcdef", layout="sharded").save()
+        rerun = self._disk_results("abcdef", layout="sharded")
+        rerun.results = {"time_s": 3.0}
+
+        # Act
+        rerun.save()
+        loaded = DiskResults.load(self._tmp_dir.name, run_id="abcdef")
+
+        # Assert
+        self.assertEqual({"time_s": 3.0}, loaded.results)
+        self.assertEqual(1, len(ResultsIndex.for_root(self._tmp_dir.name).entries()))
+
+    def test_load_scalars_df_from_both_layouts(self):
+        # Arrange
+        self._disk_results("flat_run").save()
+        DiskResults.save_batch(
+            [self._disk_results(f"run_{i}", layout="sharded") for i in range(2)]
+        )
+
+        # Act
+        df = DiskResults.load_scalars_df(self._tmp_dir.name)
+
+        # Assert
+        self.assertEqual({"flat_run", "run_0", "run_1"}, set(df["run_id"]))
+        self.assertEqual([2.0, 2.0, 2.0], list(df["results_time_s"]))
+        self.assertEqual([1.0, 1.0, 1.0], list(df["params_a"]))
+
+    def test_unknown_layout_raises(self):
+        # Arrange
+        disk_results = self._disk_results("abcdef", layout="nested")
+
+        # Act/Assert
+        with self.assertRaises(ValueError):
+            disk_results.save()
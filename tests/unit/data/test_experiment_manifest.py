@@ -0,0 +1,107 @@
+import os
+import tempfile
+
+import numpy as np
+
+from beamng_envs.data.experiment_manifest import ExperimentManifest
+from beamng_envs.data.sharded_results import ResultsIndex, run_path
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestExperimentManifest(TidyTestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._param_sets = [
+            {"a": np.array([0.1]), "b": "x"},
+            {"a": np.array([0.2]), "b": "y"},
+            {"a": np.array([0.1]), "b": "x"},
+        ]
+
+    def _complete_run(self, run_id: str):
+        os.makedirs(os.path.join(self._tmp_dir.name, run_id))
+        with open(os.path.join(self._tmp_dir.name, run_id, "outcome.json"), "w") as f:
+            f.write("{}")
+
+    def test_run_ids_deterministic_and_unique_for_replicates(self):
+        # Act
+        manifest_1 = ExperimentManifest(
+            output_path=self._tmp_dir.name,
+            param_sets=self._param_sets,
+            experiment_id="exp",
+        )
+        manifest_2 = ExperimentManifest(
+            output_path=self._tmp_dir.name,
+            param_sets=self._param_sets,
+            experiment_id="exp",
+        )
+
+        # Assert
+        self.assertEqual(manifest_1.run_ids, manifest_2.run_ids)
+        self.assertEqual(3, len(set(manifest_1.run_ids)))
+
+    def test_run_ids_differ_between_manifests(self):
+        # Arrange
+        manifest_1 = ExperimentManifest.load_or_create(
+            output_path=self._tmp_dir.name, param_sets=self._param_sets, name="exp_1"
+        )
+        self._complete_run(manifest_1.run_ids[0])
+
+        # Act
+        manifest_2 = ExperimentManifest.load_or_create(
+            output_path=self._tmp_dir.name, param_sets=self._param_sets, name="exp_2"
+        )
+
+        # Assert
+        self.assertEqual(set(), set(manifest_1.run_ids) & set(manifest_2.run_ids))
+        self.assertEqual(3, len(manifest_2.pending()))
+
+    def test_load_or_create_resumes_existing_manifest(self):
+        # Arrange
+        manifest = ExperimentManifest.load_or_create(
+            output_path=self._tmp_dir.name, param_sets=self._param_sets, name="exp"
+        )
+
+        # Act
+        loaded = ExperimentManifest.load_or_create(
+            output_path=self._tmp_dir.name, param_sets=[{"a": 1}], name="exp"
+        )
+
+        # Assert
+        self.assertEqual(manifest.run_ids, loaded.run_ids)
+        self.assertEqual(manifest.param_sets, loaded.param_sets)
+
+    def test_pending_skips_complete_and_cleans_partial_runs(self):
+        # Arrange
+        manifest = ExperimentManifest(
+            output_path=self._tmp_dir.name, param_sets=self._param_sets
+        )
+        self._complete_run(manifest.run_ids[0])
+        partial_path = os.path.join(self._tmp_dir.name, manifest.run_ids[1])
+        os.makedirs(partial_path)
+
+        # Act
+        pending = manifest.pending()
+
+        # Assert
+        self.assertEqual(manifest.run_ids[1:], [run_id for run_id, _ in pending])
+        self.assertFalse(os.path.exists(partial_path))
+
+    def test_pending_with_sharded_layout(self):
+        # Arrange
+        manifest = ExperimentManifest(
+            output_path=self._tmp_dir.name, param_sets=self._param_sets
+        )
+        ResultsIndex.for_root(self._tmp_dir.name).append(
+            [{"run_id": manifest.run_ids[0]}]
+        )
+        partial_path = run_path(
+            self._tmp_dir.name, manifest.run_ids[1], layout="sharded"
+        )
+        os.makedirs(partial_path)
+
+        # Act
+        pending = manifest.pending()
+
+        # Assert
+        self.assertEqual(manifest.run_ids[1:], [run_id for run_id, _ in pending])
+        self.assertFalse(os.path.exists(partial_path))
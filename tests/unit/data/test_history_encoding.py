@@ -0,0 +1,101 @@
+import json
+import unittest
+
+from beamng_envs.data.history_encoding import (
+    ENCODING_KEY,
+    decode_history,
+    encode_history,
+)
+
+
+def _history(n_steps: int = 100):
+    waypoints = [{"name": f"wp_{i}", "pos": [i * 10.0, 0.0, 0.0]} for i in range(3)]
+
+    return {
+        "time_s": [i * 0.05 for i in range(n_steps)],
+        "time_pts": list(range(n_steps)),
+        "car_state": [
+            {
+                "state": {"pos": [i * 0.1, 0.0, 0.0], "vel": [2.0, 0.0, 0.0]},
+                "electrics": {"gear": i * 3 // n_steps, "rpm": 1000.0 + i},
+                "dist_to_next_waypoint": 100.0 - i,
+                "current_waypoint": waypoints[i * 3 // n_steps],
+                "current_waypoint_idx": i * 3 // n_steps,
+            }
+            for i in range(n_steps)
+        ],
+    }
+
+
+class TestHistoryEncoding(unittest.TestCase):
+    def test_round_trip_restores_history(self):
+        # Arrange
+        history = _history()
+
+        # Act
+        decoded = decode_history(json.loads(json.dumps(encode_history(history))))
+
+        # Assert
+        self.assertEqual(history, decoded)
+        self.assertEqual(list(history["car_state"][0]), list(decoded["car_state"][0]))
+        self.assertEqual(
+            list(history["car_state"][0]["electrics"]),
+            list(decoded["car_state"][0]["electrics"]),
+        )
+
+    def test_low_cardinality_fields_are_encoded(self):
+        # Act
+        encoded = encode_history(_history())
+
+        # Assert
+        encoding = encoded[ENCODING_KEY]
+        self.assertEqual(
+            [["state", "vel"]], [c["field"] for c in encoding["constants"]]
+        )
+        self.assertEqual(
+            [
+                ["electrics", "gear"],
+                ["current_waypoint", "name"],
+                ["current_waypoint", "pos"],
+                ["current_waypoint_idx"],
+            ],
+            [c["field"] for c in encoding["categoricals"]],
+        )
+        self.assertEqual(
+            {
+                "state": {"pos": [0.0, 0.0, 0.0]},
+                "electrics": {"rpm": 1000.0},
+                "dist_to_next_waypoint": 100.0,
+                "current_waypoint": {},
+            },
+            encoded["car_state"][0],
+        )
+
+    def test_encoding_shrinks_saved_history(self):
+        # Arrange
+        history = _history(n_steps=1000)
+
+        # Act
+        encoded_size = len(json.dumps(encode_history(history)))
+
+        # Assert
+        self.assertLess(encoded_size, 0.7 * len(json.dumps(history)))
+
+    def test_does_not_modify_input(self):
+        # Arrange
+        history = _history()
+        original = json.dumps(history)
+
+        # Act
+        _ = encode_history(history)
+
+        # Assert
+        self.assertEqual(original, json.dumps(history))
+
+    def test_unencoded_history_is_unchanged(self):
+        # Arrange
+        history = {"time_s": [0.0, 0.1], "car_state": [{"a": 1.0}, {"a": 2.0}]}
+
+        # Act/assert
+        self.assertIs(history, encode_history(history))
+        self.assertIs(history, decode_history(history))
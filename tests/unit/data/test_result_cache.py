@@ -0,0 +1,112 @@
+import os
+import tempfile
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.data.hashing import canonicalise, hash_dict
+from beamng_envs.data.result_cache import ResultCache
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestHashing(TidyTestCase):
+    def test_canonicalise_squeezes_and_converts_numpy(self):
+        # Arrange
+        params = {"$brakebias": np.array([0.5], dtype=np.float32), "n": np.int64(2)}
+
+        # Act
+        canonical = canonicalise(params)
+
+        # Assert
+        self.assertEqual({"$brakebias": 0.5, "n": 2}, canonical)
+
+    def test_canonicalise_doesnt_squeeze_lists(self):
+        # Arrange
+        params = {"a": [5], "b": (np.float64(0.5),), "c": np.array([[1]])}
+
+        # Act
+        canonical = canonicalise(params)
+
+        # Assert
+        self.assertEqual({"a": [5], "b": [0.5], "c": [[1]]}, canonical)
+        self.assertNotEqual(hash_dict({"a": [5]}), hash_dict({"a": 5}))
+
+    def test_hash_dict_independent_of_key_order_and_float_type(self):
+        # Arrange
+        params_1 = {"a": np.array([0.1], dtype=np.float64), "b": "x"}
+        params_2 = {"b": "x", "a": 0.1}
+
+        # Act/assert
+        self.assertEqual(hash_dict(params_1), hash_dict(params_2))
+
+
+class TestResultCache(TidyTestCase):
+    def setUp(self) -> None:
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        self._sut = ResultCache(path=os.path.join(self._tmp_dir.name, "cache"))
+
+    def _mock_disk_results(self, name: str) -> MagicMock:
+        output_path = os.path.join(self._tmp_dir.name, name)
+        os.makedirs(output_path)
+        with open(os.path.join(output_path, "outcome.json"), "w") as f:
+            f.write("{}")
+
+        disk_results = MagicMock()
+        disk_results.output_path = output_path
+
+        return disk_results
+
+    def test_key_ignores_paths_and_instance_config(self):
+        # Arrange
+        config_1 = BNGSimConfig(output_path="a", close_on_done=True)
+        config_2 = BNGSimConfig(output_path="b", close_on_done=False)
+
+        # Act
+        key_1 = ResultCache.key(env_name="Env", params={"p": 1}, config=config_1)
+        key_2 = ResultCache.key(env_name="Env", params={"p": 1}, config=config_2)
+
+        # Assert
+        self.assertEqual(key_1, key_2)
+
+    def test_key_depends_on_sim_config_and_env(self):
+        # Arrange
+        params = {"p": 1}
+
+        # Act
+        key_1 = ResultCache.key(env_name="Env", params=params, config=BNGSimConfig())
+        key_2 = ResultCache.key(
+            env_name="Env", params=params, config=BNGSimConfig(fps=30)
+        )
+        key_3 = ResultCache.key(
+            env_name="OtherEnv", params=params, config=BNGSimConfig()
+        )
+
+        # Assert
+        self.assertEqual(3, len({key_1, key_2, key_3}))
+
+    def test_get_misses_until_replicates_stored(self):
+        # Arrange
+        sut = ResultCache(path=self._sut.path, n_replicates=2)
+        sut.put("key", self._mock_disk_results("run_1"))
+
+        # Act
+        miss = sut.get("key")
+        sut.put("key", self._mock_disk_results("run_2"))
+        sut.put("key", self._mock_disk_results("run_3"))
+
+        # Assert
+        self.assertIsNone(miss)
+        self.assertEqual(2, len(sut._read_runs("key")))
+
+    def test_get_ignores_deleted_runs(self):
+        # Arrange
+        disk_results = self._mock_disk_results("run_1")
+        self._sut.put("key", disk_results)
+        os.remove(os.path.join(disk_results.output_path, "outcome.json"))
+
+        # Act
+        cached = self._sut.get("key")
+
+        # Assert
+        self.assertIsNone(cached)
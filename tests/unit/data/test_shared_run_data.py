@@ -0,0 +1,120 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from beamng_envs.data.shared_run_data import (
+    SharedRunData,
+    aggregate_results,
+    clean_stale,
+    history_columns,
+)
+from tests.common.tidy_test_case import TidyTestCase
+
+
+def _history(n_steps: int = 50):
+    return {
+        "time_s": [i * 0.05 for i in range(n_steps)],
+        "time_pts": list(range(n_steps)),
+        "car_state": [
+            {
+                "state": {"pos": [i * 0.1, 0.0, 0.0], "vel": [2.0, 0.0, 0.0]},
+                "damage": {"damage": float(i)},
+                "current_waypoint": {"name": "wp_0"},
+                "current_waypoint_idx": 0,
+            }
+            for i in range(n_steps)
+        ],
+    }
+
+
+def _publish_in_worker(root: str, run_id: str) -> SharedRunData:
+    return SharedRunData.publish(
+        run_id=run_id,
+        history=_history(),
+        results={"max_damage": 49.0, "time_s": 2.45, "parts": {"a": "b"}},
+        root=root,
+    )
+
+
+class TestSharedRunData(TidyTestCase):
+    def test_history_columns_are_numeric_fields(self):
+        # Act
+        columns = history_columns(_history())
+
+        # Assert
+        self.assertEqual(
+            [
+                "time_s",
+                "time_pts",
+                "state_pos",
+                "state_vel",
+                "damage_damage",
+                "current_waypoint_idx",
+            ],
+            list(columns),
+        )
+        self.assertEqual((50, 3), columns["state_pos"].shape)
+
+    def test_publish_and_map_columns(self):
+        # Act
+        run = _publish_in_worker(root=self._tmp_dir.name, run_id="run_1")
+        pos = run.column("state_pos")
+
+        # Assert
+        self.assertIsInstance(pos, np.memmap)
+        self.assertAlmostEqual(4.9, pos[-1, 0])
+        self.assertEqual(50, run.n_steps)
+        self.assertEqual({"max_damage": 49.0, "time_s": 2.45}, run.results)
+
+    def test_descriptor_is_small(self):
+        # Arrange
+        run = _publish_in_worker(root=self._tmp_dir.name, run_id="run_1")
+
+        # Act
+        pickled = pickle.dumps(run)
+
+        # Assert
+        self.assertLess(len(pickled), 1000)
+
+    def test_hand_off_from_worker_process(self):
+        # Act
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            runs = list(
+                executor.map(
+                    _publish_in_worker,
+                    [self._tmp_dir.name] * 3,
+                    ["run_1", "run_2", "run_3"],
+                )
+            )
+        summary = aggregate_results(runs)
+
+        # Assert
+        self.assertEqual(["run_1", "run_2", "run_3"], list(summary.index))
+        self.assertEqual([49.0] * 3, summary["max_damage"].tolist())
+        self.assertEqual(49.0, runs[2].column("damage_damage").max())
+
+    def test_release_removes_data(self):
+        # Arrange
+        run = _publish_in_worker(root=self._tmp_dir.name, run_id="run_1")
+
+        # Act
+        run.release()
+
+        # Assert
+        self.assertFalse(os.path.exists(run.path))
+
+    def test_clean_stale_removes_old_data(self):
+        # Arrange
+        old_run = _publish_in_worker(root=self._tmp_dir.name, run_id="run_1")
+        new_run = _publish_in_worker(root=self._tmp_dir.name, run_id="run_2")
+        os.utime(old_run.path, (0, 0))
+
+        # Act
+        removed = clean_stale(root=self._tmp_dir.name, max_age_s=3600)
+
+        # Assert
+        self.assertEqual([old_run.path], removed)
+        self.assertFalse(os.path.exists(old_run.path))
+        self.assertTrue(os.path.exists(new_run.path))
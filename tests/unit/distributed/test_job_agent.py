@@ -0,0 +1,105 @@
+import os
+import threading
+from unittest.mock import MagicMock, patch
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.bng_sim.bng_sim_worker_pool import BNGSimWorkerPool
+from beamng_envs.distributed.job_agent import JobAgent
+from beamng_envs.distributed.job_broker import JobBroker
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class MockEnv:
+    def __init__(self, params, config, bng=None, run_id=None):
+        self.params = params
+        self.run_id = run_id
+        self.failures = []
+        self.disk_results = MagicMock(output_path=os.path.join("results", run_id))
+
+    def run(self):
+        if self.params["a"] < 0:
+            raise ValueError("Bad params.")
+
+        return {"result": self.params["a"] * 2}, None
+
+
+class FlakyBroker:
+    """Wraps a broker, failing every other call with a connection error."""
+
+    def __init__(self, broker: JobBroker):
+        self._broker = broker
+        self._n_calls = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, method: str):
+        def call(**kwargs):
+            with self._lock:
+                self._n_calls += 1
+                fail = self._n_calls % 2
+            if fail:
+                raise ConnectionRefusedError("Broker unavailable.")
+
+            return getattr(self._broker, method)(**kwargs)
+
+        return call
+
+
+class TestJobAgent(TidyTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._broker = JobBroker(
+            db_path=os.path.join(self._tmp_dir.name, "jobs.db"), max_attempts=1
+        )
+        self._broker.submit(
+            [("run_1", {"a": 1}), ("run_2", {"a": 2}), ("run_3", {"a": -1})]
+        )
+        self._pool = BNGSimWorkerPool(
+            user_path=self._tmp_dir.name, n_workers=2, lock_path=self._tmp_dir.name
+        )
+        self._sut = JobAgent(
+            broker=self._broker,
+            worker_pool=self._pool,
+            env_cls=MockEnv,
+            config=BNGSimConfig(),
+            agent_id="agent_1",
+            poll_interval=0.01,
+        )
+
+    def tearDown(self) -> None:
+        self._pool.close()
+        super().tearDown()
+
+    def test_run_completes_all_jobs(self):
+        # Act
+        with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+            n_completed = self._sut.run()
+
+        # Assert
+        results = self._broker.results()
+        self.assertEqual(2, n_completed)
+        self.assertEqual(4, results["run_2"]["metadata"]["results"]["result"])
+        self.assertEqual(
+            os.path.join("results", "run_2"),
+            results["run_2"]["metadata"]["output_path"],
+        )
+        self.assertEqual(JobBroker.failed, results["run_3"]["status"])
+        self.assertEqual(
+            ["agent_1: ValueError: Bad params."], results["run_3"]["failures"]
+        )
+
+    def test_run_retries_failed_broker_calls(self):
+        # Arrange
+        self._sut.broker = FlakyBroker(self._broker)
+        self._sut.broker_backoff = 0
+
+        # Act
+        with patch("beamng_envs.bng_sim.bng_sim_worker_pool.time.sleep"):
+            with self.assertWarns(UserWarning):
+                n_completed = self._sut.run()
+
+        # Assert
+        results = self._broker.results()
+        self.assertEqual(2, n_completed)
+        self.assertEqual(JobBroker.done, results["run_1"]["status"])
+        self.assertEqual(JobBroker.done, results["run_2"]["status"])
+        self.assertEqual(JobBroker.failed, results["run_3"]["status"])
@@ -0,0 +1,92 @@
+import os
+from unittest.mock import patch
+
+from beamng_envs.distributed.job_broker import JobBroker
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestJobBroker(TidyTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._sut = JobBroker(
+            db_path=os.path.join(self._tmp_dir.name, "jobs.db"),
+            lease_timeout=10,
+            max_attempts=2,
+        )
+        self._sut.submit([("run_1", {"a": 1}), ("run_2", {"a": 2})])
+
+    def test_submit_ignores_existing_jobs(self):
+        # Act
+        n_added = self._sut.submit([("run_2", {"a": 2}), ("run_3", {"a": 3})])
+
+        # Assert
+        self.assertEqual(1, n_added)
+        self.assertEqual(3, self._sut.counts()[JobBroker.pending])
+
+    def test_lease_gives_each_job_once(self):
+        # Act
+        job_1 = self._sut.lease(agent_id="agent_1")
+        job_2 = self._sut.lease(agent_id="agent_2")
+        job_3 = self._sut.lease(agent_id="agent_1")
+
+        # Assert
+        self.assertEqual("run_1", job_1.run_id)
+        self.assertEqual({"a": 1}, job_1.params)
+        self.assertEqual("run_2", job_2.run_id)
+        self.assertIsNone(job_3)
+
+    def test_complete_stores_metadata(self):
+        # Arrange
+        job = self._sut.lease(agent_id="agent_1")
+
+        # Act
+        self._sut.complete(
+            agent_id="agent_1", run_id=job.run_id, metadata={"output_path": "path"}
+        )
+
+        # Assert
+        self.assertEqual(1, self._sut.counts()[JobBroker.done])
+        self.assertEqual(
+            {"output_path": "path"}, self._sut.results()[job.run_id]["metadata"]
+        )
+
+    def test_expired_lease_is_requeued(self):
+        # Arrange
+        job = self._sut.lease(agent_id="agent_1")
+
+        # Act
+        with patch("beamng_envs.distributed.job_broker.time.time") as mock_time:
+            mock_time.return_value = 1e12
+            requeued_job = self._sut.lease(agent_id="agent_2")
+            lost = self._sut.heartbeat(agent_id="agent_1", run_ids=[job.run_id])
+
+        # Assert
+        self.assertEqual(job.run_id, requeued_job.run_id)
+        self.assertEqual(2, requeued_job.attempts)
+        self.assertEqual([job.run_id], lost)
+
+    def test_heartbeat_keeps_lease(self):
+        # Arrange
+        job = self._sut.lease(agent_id="agent_1")
+
+        # Act
+        lost = self._sut.heartbeat(agent_id="agent_1", run_ids=[job.run_id])
+
+        # Assert
+        self.assertEqual([], lost)
+        self.assertEqual(1, self._sut.counts()[JobBroker.leased])
+
+    def test_failed_job_requeued_until_out_of_attempts(self):
+        # Act
+        for _ in range(2):
+            job = self._sut.lease(agent_id="agent_1")
+            self._sut.fail(agent_id="agent_1", run_id="run_1", reason="Crashed")
+            self._sut.complete(agent_id="agent_1", run_id="run_2", metadata={})
+
+        # Assert
+        self.assertEqual("run_1", job.run_id)
+        self.assertEqual(JobBroker.failed, self._sut.results()["run_1"]["status"])
+        self.assertEqual(
+            ["agent_1: Crashed", "agent_1: Crashed"],
+            self._sut.results()["run_1"]["failures"],
+        )
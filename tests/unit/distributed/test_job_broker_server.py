@@ -0,0 +1,79 @@
+import json
+import os
+import sqlite3
+import urllib.error
+from unittest.mock import patch
+
+from beamng_envs.distributed.job_broker import JobBroker
+from beamng_envs.distributed.job_broker_server import JobBrokerClient, JobBrokerServer
+from tests.common.tidy_test_case import TidyTestCase
+
+
+class TestJobBrokerServer(TidyTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self._broker = JobBroker(db_path=os.path.join(self._tmp_dir.name, "jobs.db"))
+        self._broker.submit([("run_1", {"a": 1})])
+        self._server = JobBrokerServer(broker=self._broker, host="localhost", port=0)
+        self._server.start()
+        self._sut = JobBrokerClient(url=f"http://localhost:{self._server.port}")
+
+    def tearDown(self) -> None:
+        self._server.stop()
+        super().tearDown()
+
+    def test_client_runs_job_via_server(self):
+        # Act
+        job = self._sut.lease(agent_id="agent_1")
+        lost = self._sut.heartbeat(agent_id="agent_1", run_ids=[job.run_id])
+        self._sut.complete(agent_id="agent_1", run_id=job.run_id, metadata={"x": 1})
+
+        # Assert
+        self.assertEqual("run_1", job.run_id)
+        self.assertEqual({"a": 1}, job.params)
+        self.assertEqual([], lost)
+        self.assertEqual(1, self._sut.counts()[JobBroker.done])
+        self.assertIsNone(self._sut.lease(agent_id="agent_1"))
+
+    def test_broker_errors_returned_as_500(self):
+        # Arrange
+        with patch.object(
+            self._broker,
+            "counts",
+            side_effect=sqlite3.OperationalError("database is locked"),
+        ):
+            # Act
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                self._sut.counts()
+
+        # Assert
+        self.assertEqual(500, context.exception.code)
+        self.assertEqual(
+            {"error": "OperationalError: database is locked"},
+            json.loads(context.exception.read()),
+        )
+
+    def test_non_local_host_requires_token(self):
+        # Act/Assert
+        with self.assertRaises(ValueError):
+            JobBrokerServer(broker=self._broker, host="0.0.0.0", port=0)
+
+    def test_token_checked(self):
+        # Arrange
+        server = JobBrokerServer(
+            broker=self._broker, host="localhost", port=0, token="secret"
+        )
+        server.start()
+        url = f"http://localhost:{server.port}"
+
+        # Act
+        try:
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                JobBrokerClient(url=url, token="wrong").counts()
+            counts = JobBrokerClient(url=url, token="secret").counts()
+        finally:
+            server.stop()
+
+        # Assert
+        self.assertEqual(401, context.exception.code)
+        self.assertEqual(1, counts[JobBroker.pending])
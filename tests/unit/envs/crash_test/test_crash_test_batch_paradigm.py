@@ -0,0 +1,39 @@
+import unittest
+
+from beamng_envs.envs.crash_test.crash_test_batch_paradigm import (
+    CrashTestBatchParadigm,
+)
+
+
+class TestCrashTestBatchParadigm(unittest.TestCase):
+    _sut_class = CrashTestBatchParadigm
+
+    def test_batch_puts_one_test_per_lane_in_each_batch(self):
+        # Arrange
+        params = [
+            {"start_position": "flat_left"},
+            {"start_position": "flat_right"},
+            {"start_position": "wedge"},
+            {"start_position": "bollards_mid"},
+            {"start_position": "flat_mid"},
+            {"start_position": "raised_bar"},
+        ]
+
+        # Act
+        batches = self._sut_class.batch(params)
+
+        # Assert
+        self.assertListEqual([[0, 2, 3, 5], [1], [4]], batches)
+
+    def test_init_with_shared_lane_raises_error(self):
+        # Arrange
+        params = [
+            {"start_position": "bollards_left"},
+            {"start_position": "bollards_mid"},
+        ]
+
+        # Act/Assert
+        self.assertRaises(ValueError, lambda: self._sut_class(params=params))
+
+    def test_unknown_start_position_raises_error(self):
+        self.assertRaises(KeyError, lambda: self._sut_class.lane_of("grandstand"))
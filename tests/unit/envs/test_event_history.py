@@ -0,0 +1,76 @@
+import unittest
+
+from beamng_envs.envs.event_history import EventHistory
+
+
+def _step(i: int, gx: float = 0.0, damage: float = 0.0):
+    return {
+        "time_pts": i,
+        "time_s": i * 0.01,
+        "car_state": {"g_forces": {"gx": gx, "gy": 0.0}, "damage": {"damage": damage}},
+    }
+
+
+class TestEventHistory(unittest.TestCase):
+    def setUp(self) -> None:
+        self._sut = EventHistory(
+            decimation=10, pre_trigger_steps=5, post_trigger_steps=3
+        )
+
+    def test_decimates_without_events(self):
+        # Act
+        for i in range(25):
+            self._sut.append(_step(i))
+        self._sut.flush()
+
+        # Assert
+        self.assertEqual([0, 10, 20, 24], self._sut["time_pts"])
+
+    def test_records_full_rate_around_g_force_trigger(self):
+        # Act
+        for i in range(40):
+            self._sut.append(_step(i, gx=100 if i == 15 else 0))
+        self._sut.flush()
+
+        # Assert
+        # Decimated, then the 5 buffered steps, the trigger and 3 following steps at full rate, then decimated
+        self.assertEqual(
+            [0, 10, 11, 12, 13, 14, 15, 16, 17, 18, 28, 38, 39], self._sut["time_pts"]
+        )
+
+    def test_damage_delta_triggers_and_extends_window(self):
+        # Arrange
+        damage = [0] * 10 + [5, 10] + [10] * 18
+
+        # Act
+        for i, d in enumerate(damage):
+            self._sut.append(_step(i, damage=d))
+
+        # Assert
+        self.assertEqual(
+            [0, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 24], self._sut["time_pts"]
+        )
+
+    def test_time_is_monotonic_and_keys_aligned(self):
+        # Act
+        for i in range(100):
+            self._sut.append(_step(i, gx=100 if i % 17 == 0 else 0))
+        self._sut.flush()
+
+        # Assert
+        times = self._sut["time_s"]
+        self.assertEqual(sorted(set(times)), times)
+        self.assertEqual(len(times), len(self._sut["car_state"]))
+        self.assertEqual(len(times), len(self._sut["time_pts"]))
+
+    def test_reset_clears_buffer(self):
+        # Arrange
+        for i in range(5):
+            self._sut.append(_step(i))
+
+        # Act
+        self._sut.reset()
+        self._sut.append(_step(0, gx=100))
+
+        # Assert
+        self.assertEqual([0], self._sut["time_pts"])
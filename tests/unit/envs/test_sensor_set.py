@@ -1,4 +1,7 @@
 import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
 
 from beamng_envs.envs.sensor_set import SensorSet
 
@@ -22,3 +25,75 @@ class TestSensorSet(unittest.TestCase):
         # Assert
         self.assertIsInstance(sensors, dict)
         self.assertEqual(expected_basic_sensors, set(sensors))
+
+    def test_observation_space_matches_labels(self):
+        # Act
+        space = self._sut.observation_space
+
+        # Assert
+        self.assertEqual(np.float32, space.dtype)
+        self.assertEqual((len(self._sut.observation_labels),), space.shape)
+        self.assertIn("state_pos_0", self._sut.observation_labels)
+        self.assertIn("damage_damage", self._sut.observation_labels)
+
+    def test_to_vector_fills_missing_channels_with_nan(self):
+        # Arrange
+        sensor_data = {
+            "state": {"pos": [1, 2, 3], "rotation": [0, 0, 0, 1]},
+            "damage": {"damage": 5},
+        }
+        out = np.zeros(self._sut.observation_size, dtype=np.float32)
+        labels = self._sut.observation_labels
+
+        # Act
+        vector = self._sut.to_vector(sensor_data, out=out)
+
+        # Assert
+        self.assertIs(out, vector)
+        self.assertEqual(2, vector[labels.index("state_pos_1")])
+        self.assertEqual(5, vector[labels.index("damage_damage")])
+        self.assertTrue(np.isnan(vector[labels.index("electrics_rpm")]))
+
+
+class TestSensorSetKeySelection(unittest.TestCase):
+    def setUp(self) -> None:
+        self._sut = SensorSet(sensor_keys={"state": None, "damage": ["damage"]})
+
+    def test_unlisted_sensors_are_not_active(self):
+        # Act
+        sensors = self._sut.sensors
+
+        # Assert
+        self.assertEqual({"state", "damage"}, set(sensors))
+
+    def test_read_drops_unselected_keys(self):
+        # Arrange
+        vehicle = MagicMock()
+        vehicle.sensors = {
+            "state": MagicMock(data={"pos": [1, 2, 3], "vel": [0, 0, 0]}),
+            "damage": MagicMock(data={"damage": 5, "part_damage": {"door": 1}}),
+            "electrics": MagicMock(data={"rpm": 1000}),
+        }
+
+        # Act
+        sensor_data = self._sut.read_for_vehicle(vehicle)
+
+        # Assert
+        self.assertEqual(
+            {"state": {"pos": [1, 2, 3], "vel": [0, 0, 0]}, "damage": {"damage": 5}},
+            sensor_data,
+        )
+        self.assertIsNot(
+            vehicle.sensors["state"].data["pos"], sensor_data["state"]["pos"]
+        )
+
+    def test_observation_only_includes_selected_channels(self):
+        # Act
+        labels = self._sut.observation_labels
+
+        # Assert
+        self.assertIn("state_pos_0", labels)
+        self.assertIn("damage_damage", labels)
+        self.assertNotIn("electrics_rpm", labels)
+        self.assertNotIn("g_forces_gx", labels)
+        self.assertEqual((len(labels),), self._sut.observation_space.shape)
@@ -0,0 +1,31 @@
+import unittest
+
+import numpy as np
+
+from beamng_envs.envs.vector_env import stack_observations
+
+
+class TestStackObservations(unittest.TestCase):
+    def test_stacks_nested_dicts_by_key(self):
+        # Arrange
+        observations = [
+            {"state": {"pos": [0, 1, 2]}, "damage": {"damage": 0.5}},
+            {"state": {"pos": [3, 4, 5]}, "damage": {"damage": 1.5}},
+        ]
+
+        # Act
+        stacked = stack_observations(observations)
+
+        # Assert
+        np.testing.assert_array_equal(
+            np.array([[0, 1, 2], [3, 4, 5]]), stacked["state"]["pos"]
+        )
+        np.testing.assert_array_equal(np.array([0.5, 1.5]), stacked["damage"]["damage"])
+
+    def test_keeps_non_numeric_leaves_as_objects(self):
+        # Act
+        stacked = stack_observations([{"gear": "N"}, {"gear": None}])
+
+        # Assert
+        self.assertEqual(object, stacked["gear"].dtype)
+        self.assertListEqual(["N", None], list(stacked["gear"]))
@@ -0,0 +1,39 @@
+import unittest
+
+from beamng_envs.envs.track_test.track_pace_pruner import TrackPacePruner
+
+
+class TestTrackPacePruner(unittest.TestCase):
+    def test_no_pruning_without_reference(self):
+        # Arrange
+        sut = TrackPacePruner(margin=0.1)
+
+        # Act
+        pruned = sut.should_prune(splits=[], current_time_s=1000)
+
+        # Assert
+        self.assertFalse(pruned)
+
+    def test_should_prune_when_next_split_cant_be_reached_within_margin(self):
+        # Arrange
+        sut = TrackPacePruner(margin=0.1, reference_splits=[10.0, 20.0, 30.0])
+
+        # Act/Assert
+        self.assertFalse(sut.should_prune(splits=[10.5], current_time_s=21.9))
+        self.assertTrue(sut.should_prune(splits=[10.5], current_time_s=22.1))
+        self.assertFalse(sut.should_prune(splits=[10, 20, 30], current_time_s=40))
+
+    def test_update_keeps_fastest_lap(self):
+        # Arrange
+        sut = TrackPacePruner()
+
+        # Act
+        updated = [
+            sut.update([10.0, 30.0]),
+            sut.update([9.0, 25.0]),
+            sut.update([8.0, 27.0]),
+        ]
+
+        # Assert
+        self.assertEqual([True, True, False], updated)
+        self.assertEqual([9.0, 25.0], sut.reference_splits)
@@ -0,0 +1,95 @@
+import itertools
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from beamng_envs.envs.drag_strip.drag_strip_param_space import DRAG_STRIP_PARAM_SPACE
+from beamng_envs.envs.track_test.track_test_param_space import TRACK_TEST_PARAM_SPACE
+from beamng_envs.optimisation.doe import (
+    fractional_factorial,
+    full_factorial,
+    latin_hypercube,
+    sobol,
+)
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+
+
+class TestDOE(unittest.TestCase):
+    def setUp(self) -> None:
+        self._encoder = ParamSpaceEncoder(
+            dict(
+                speed_kph=dict(values=(20, 30, 40), name="speed_kph", type=float),
+                brake=dict(values=(0.6, 1), name="$brakestrength", type=float),
+                position=dict(values=("a", "b"), name="start_position", type=str),
+            )
+        )
+
+    def test_latin_hypercube_stratifies_each_dim(self):
+        # Act
+        design = latin_hypercube(self._encoder, n=12, seed=0)
+
+        # Assert
+        self.assertEqual((12, 3), design.x.shape)
+        self.assertEqual(12, len(design))
+        for i in range(3):
+            self.assertListEqual(
+                list(range(12)), sorted((design.x[:, i] * 12).astype(int))
+            )
+        self.assertEqual(
+            {20: 4, 30: 4, 40: 4}, Counter(p["speed_kph"] for p in design.params)
+        )
+
+    def test_sobol(self):
+        # Act
+        design = sobol(ParamSpaceEncoder(TRACK_TEST_PARAM_SPACE), n=16, seed=0)
+
+        # Assert
+        self.assertEqual((16, len(TRACK_TEST_PARAM_SPACE)), design.x.shape)
+        self.assertTrue(all(0.6 <= p["$brakestrength"] <= 1 for p in design.params))
+
+    def test_full_factorial(self):
+        # Act
+        design = full_factorial(self._encoder, continuous_levels=2)
+
+        # Assert
+        self.assertEqual(12, len(design))
+        self.assertEqual(
+            set(itertools.product((20, 30, 40), (0.6, 1.0), ("a", "b"))),
+            {tuple(p.values()) for p in design.params},
+        )
+
+    def test_full_factorial_raises_if_too_large(self):
+        with self.assertRaises(ValueError):
+            full_factorial(ParamSpaceEncoder(DRAG_STRIP_PARAM_SPACE))
+
+    def test_fractional_factorial_covers_all_pairs(self):
+        # Arrange
+        encoder = ParamSpaceEncoder(
+            {
+                f"p_{i}": dict(values=(0, 1, 2), name=f"p_{i}", type=int)
+                for i in range(4)
+            }
+        )
+
+        # Act
+        design = fractional_factorial(encoder, strength=2)
+
+        # Assert
+        self.assertEqual(9, len(design))
+        for i, j in itertools.combinations(range(4), 2):
+            pairs = Counter((p[f"p_{i}"], p[f"p_{j}"]) for p in design.params)
+            self.assertEqual(9, len(pairs))
+
+    def test_fractional_factorial_drag_strip_parts(self):
+        # Arrange
+        param_space = dict(list(DRAG_STRIP_PARAM_SPACE.items())[:8])
+
+        # Act
+        design = fractional_factorial(ParamSpaceEncoder(param_space), max_levels=5)
+
+        # Assert
+        self.assertEqual(49, len(design))
+        for k, v in param_space.items():
+            self.assertTrue(all(p[v["name"]] in v["values"] for p in design.params))
+        self.assertTrue(np.all((design.x >= 0) & (design.x <= 1)))
@@ -0,0 +1,112 @@
+import unittest
+
+from beamng_envs.bng_sim.bng_sim_config import BNGSimConfig
+from beamng_envs.optimisation.multi_fidelity import SuccessiveHalvingRunner
+
+
+class TestSuccessiveHalvingRunner(unittest.TestCase):
+    def setUp(self) -> None:
+        self._runs = []
+
+        def run_fn(params, config):
+            self._runs.append((params["a"], config.fps, config.fidelity))
+            if params["a"] == 2:
+                raise ValueError("Crashed.")
+
+            # Noisier at low fidelity, but with the same ranking
+            return {
+                "time_s": params["a"] + 60 / config.fps,
+                "fidelity": config.fidelity,
+            }
+
+        self._sut = SuccessiveHalvingRunner(
+            config=BNGSimConfig(fps=60),
+            rungs=[{"fps": 20}, {"fps": 30}, {}],
+            run_fn=run_fn,
+            eta=3,
+        )
+
+    def test_run_promotes_best_candidates(self):
+        # Act
+        with self.assertWarns(UserWarning):
+            candidates = self._sut.run([{"a": a} for a in range(9)], n_workers=3)
+
+        # Assert
+        self.assertEqual(9 + 3 + 1, len(self._runs))
+        self.assertIn((0, 60, 2), self._runs)
+        self.assertEqual({"a": 0}, candidates[0].params)
+        self.assertEqual(2, candidates[0].fidelity)
+        self.assertEqual(1.0, candidates[0].value)
+        self.assertEqual(2, candidates[0].results[2]["fidelity"])
+        self.assertEqual([2, 1, 1], [c.fidelity for c in candidates[:3]])
+
+    def test_failed_candidates_not_promoted(self):
+        # Act
+        with self.assertWarns(UserWarning):
+            candidates = self._sut.run([{"a": 2}, {"a": 5}], n_workers=1)
+
+        # Assert
+        self.assertEqual({"a": 5}, candidates[0].params)
+        self.assertEqual(2, candidates[0].fidelity)
+        self.assertIsNone(candidates[1].value)
+
+    def test_unfinished_runs_ranked_after_finished(self):
+        # Arrange
+        def run_fn(params, config):
+            if config.fidelity == 0:
+                # Short max_time rung: only "a" == 4 finishes, the rest stop at the time limit
+                return {
+                    "time_s": 10.0 if params["a"] != 4 else 9.5,
+                    "finished": params["a"] == 4,
+                    "waypoints_reached": params["a"],
+                }
+
+            # Full fidelity: a DNF (crash) stops early, so has the lowest time
+            return {
+                "time_s": 5.0 if params["a"] == 5 else 50.0 + params["a"],
+                "finished": params["a"] != 5,
+                "waypoints_reached": 6 if params["a"] != 5 else 2,
+            }
+
+        sut = SuccessiveHalvingRunner(
+            config=BNGSimConfig(),
+            rungs=[{"max_time": 10}, {}],
+            run_fn=run_fn,
+            eta=2,
+        )
+
+        # Act
+        candidates = sut.run([{"a": a} for a in range(6)], n_workers=2)
+
+        # Assert
+        self.assertEqual(
+            [{"a": 3}, {"a": 4}, {"a": 5}], [c.params for c in candidates[:3]]
+        )
+        self.assertEqual([1, 1, 1], [c.fidelity for c in candidates[:3]])
+
+    def test_failed_at_top_rung_ranked_after_lower_rung_results(self):
+        # Arrange
+        def run_fn(params, config):
+            if config.fidelity == 1:
+                raise ValueError("Crashed.")
+
+            return {"time_s": float(params["x"])}
+
+        sut = SuccessiveHalvingRunner(
+            config=BNGSimConfig(),
+            rungs=[{"fps": 20}, {}],
+            run_fn=run_fn,
+            eta=2,
+        )
+
+        # Act
+        with self.assertWarns(UserWarning):
+            candidates = sut.run([{"x": x} for x in range(4)], n_workers=1)
+
+        # Assert
+        self.assertEqual(
+            [{"x": 0}, {"x": 1}, {"x": 2}, {"x": 3}], [c.params for c in candidates]
+        )
+        self.assertEqual([0, 0, 0, 0], [c.best_fidelity for c in candidates])
+        self.assertEqual(1, candidates[0].fidelity)
+        self.assertIsNone(candidates[0].value)
@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from beamng_envs.optimisation.optimiser import AskTellOptimiser
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+from beamng_envs.optimisation.proposers import RandomProposer
+
+
+class TestAskTellOptimiser(unittest.TestCase):
+    def setUp(self) -> None:
+        encoder = ParamSpaceEncoder(
+            dict(
+                a=dict(values=(0, 1), name="a", type=float),
+                b=dict(values=(0, 1), name="b", type=float),
+            )
+        )
+        self._sut = AskTellOptimiser(
+            encoder=encoder,
+            proposer=RandomProposer(n_dims=encoder.n_dims, seed=0),
+            objective_key="time_s",
+        )
+
+    def test_ask_tell(self):
+        # Act
+        trial_1 = self._sut.ask()
+        trial_2 = self._sut.ask()
+        self._sut.tell(trial_2, {"time_s": 2.0})
+
+        # Assert
+        self.assertEqual([trial_1], self._sut.pending)
+        self.assertEqual(trial_2, self._sut.best)
+        self.assertEqual(1, self._sut.proposer.n_observations)
+
+    def test_tell_without_objective_fails_trial(self):
+        # Arrange
+        trial = self._sut.ask()
+
+        # Act
+        self._sut.tell(trial, {"time_s": np.nan})
+
+        # Assert
+        self.assertIsNotNone(trial.failure)
+        self.assertEqual([], self._sut.pending)
+        self.assertIsNone(self._sut.best)
+
+    def test_tell_pruned_run_fails_trial(self):
+        # Arrange
+        trial_1 = self._sut.ask()
+        trial_2 = self._sut.ask()
+        trial_3 = self._sut.ask()
+        self._sut.tell(trial_1, {"time_s": 85.0, "finished": True, "pruned": False})
+
+        # Act
+        self._sut.tell(trial_2, {"time_s": 20.0, "finished": False, "pruned": True})
+        self._sut.tell(trial_3, {"time_s": 30.0, "finished": False, "pruned": False})
+
+        # Assert
+        self.assertIsNotNone(trial_2.failure)
+        self.assertIsNotNone(trial_3.failure)
+        self.assertEqual(trial_1, self._sut.best)
+        self.assertEqual(1, self._sut.proposer.n_observations)
+
+    def test_run_keeps_workers_busy(self):
+        # Arrange
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def run_fn(params):
+            with lock:
+                running.append(1)
+                max_running.append(len(running))
+            time.sleep(0.01 * (1 + params["a"]))
+            with lock:
+                running.pop()
+            if params["b"] > 0.9:
+                raise ValueError("Crashed.")
+
+            return {"time_s": params["a"] + params["b"]}
+
+        # Act
+        best = self._sut.run(run_fn=run_fn, n_trials=20, n_workers=3)
+
+        # Assert
+        self.assertEqual(20, len(self._sut.trials))
+        self.assertEqual(3, max(max_running))
+        self.assertEqual([], self._sut.pending)
+        self.assertEqual(
+            min(t.value for t in self._sut.trials if t.value is not None), best.value
+        )
@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from beamng_envs.envs.crash_test.crash_test_param_space import (
+    CrashTestParamSpaceBuilder,
+)
+from beamng_envs.envs.track_test.track_test_param_space import (
+    TRACK_TEST_PARAM_SPACE,
+    TRACK_TEST_PARAM_SPACE_GYM,
+)
+from beamng_envs.optimisation.param_space_encoder import ParamSpaceEncoder
+
+
+class TestParamSpaceEncoder(unittest.TestCase):
+    def setUp(self) -> None:
+        self._param_space = dict(
+            speed_kph=dict(values=(20, 30, 40), name="speed_kph", type=float),
+            brake_strength=dict(values=(0.6, 1), name="$brakestrength", type=float),
+            start_position=dict(values=("a", "b"), name="start_position", type=str),
+        )
+        self._sut = ParamSpaceEncoder(self._param_space)
+
+    def test_decode(self):
+        # Act
+        params = self._sut.decode(np.array([0.5, 0.5, 1.0]))
+
+        # Assert
+        self.assertEqual(
+            {"speed_kph": 30, "$brakestrength": 0.8, "start_position": "b"}, params
+        )
+        self.assertListEqual([False, True, False], list(self._sut.continuous))
+
+    def test_encode_decode_round_trip(self):
+        # Arrange
+        params = {"speed_kph": "40", "$brakestrength": 0.7, "start_position": "a"}
+
+        # Act
+        x = self._sut.encode(params)
+
+        # Assert
+        np.testing.assert_allclose([5 / 6, 0.25, 0.25], x)
+        self.assertEqual(
+            {"speed_kph": 40, "$brakestrength": 0.7, "start_position": "a"},
+            self._sut.decode(x),
+        )
+
+    def test_encode_gym_sample(self):
+        # Arrange
+        sut = ParamSpaceEncoder(TRACK_TEST_PARAM_SPACE)
+
+        # Act
+        x = sut.encode(TRACK_TEST_PARAM_SPACE_GYM.sample())
+
+        # Assert
+        self.assertEqual((len(TRACK_TEST_PARAM_SPACE),), x.shape)
+        self.assertTrue(np.all((x >= 0) & (x <= 1)))
+
+    def test_decode_crash_test_space(self):
+        # Arrange
+        car_configs = MagicMock()
+        car_configs.configs = {"car_1": {"parts": {}}, "car_2": {"parts": {}}}
+        builder = CrashTestParamSpaceBuilder()
+        builder.build(car_configs=car_configs)
+        sut = ParamSpaceEncoder(builder.param_space)
+
+        # Act
+        params = sut.decode(np.ones(sut.n_dims))
+
+        # Assert
+        self.assertEqual(
+            {
+                "speed_kph": 80,
+                "start_position": "bollards_right",
+                "car_config_name": "car_2",
+            },
+            params,
+        )
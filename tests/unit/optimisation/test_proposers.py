@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from beamng_envs.optimisation.proposers import (
+    RandomProposer,
+    SobolProposer,
+    TPEProposer,
+)
+
+
+class TestProposers(unittest.TestCase):
+    def test_proposals_in_unit_cube(self):
+        for proposer_cls in [RandomProposer, SobolProposer, TPEProposer]:
+            with self.subTest(proposer_cls.__name__):
+                # Arrange
+                sut = proposer_cls(n_dims=3, seed=0)
+
+                # Act
+                xs = []
+                for _ in range(20):
+                    x = sut.ask()
+                    sut.tell(x, float(np.sum(x)))
+                    xs.append(x)
+
+                # Assert
+                xs = np.array(xs)
+                self.assertEqual((20, 3), xs.shape)
+                self.assertTrue(np.all((xs >= 0) & (xs <= 1)))
+                self.assertEqual(20, len(np.unique(xs, axis=0)))
+
+    def test_tpe_proposes_near_good_points(self):
+        # Arrange
+        sut = TPEProposer(n_dims=2, seed=0, n_startup=20)
+        for _ in range(20):
+            x = sut.ask()
+            sut.tell(x, float(np.sum((x - 0.2) ** 2)))
+
+        # Act
+        xs = np.array([sut.ask() for _ in range(20)])
+
+        # Assert
+        self.assertLess(np.mean(np.sum((xs - 0.2) ** 2, axis=1)), 1 / 6)
+
+    def test_tpe_pending_points_spread_proposals(self):
+        # Arrange
+        sut = TPEProposer(n_dims=2, seed=0, n_startup=5)
+        for x in [[0.1, 0.1], [0.9, 0.9], [0.5, 0.9], [0.9, 0.5], [0.7, 0.7]]:
+            sut.tell(np.array(x), float(np.sum(x)))
+
+        # Act
+        x_1 = sut.ask()
+        x_2 = sut.ask(pending=np.array([[0.1, 0.1]] * 10))
+
+        # Assert
+        self.assertLess(np.linalg.norm(x_1 - 0.1), np.linalg.norm(x_2 - 0.1))
@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Modules that pooled workers, CLI calls and results loading import; these shouldn't pull in the heavy dependencies
+LIGHT_MODULES = [
+    "beamng_envs",
+    "beamng_envs.bng_sim",
+    "beamng_envs.cars",
+    "beamng_envs.cars.sunburst",
+    "beamng_envs.data",
+    "beamng_envs.data.experiment_manifest",
+    "beamng_envs.data.result_cache",
+    "beamng_envs.distributed",
+    "beamng_envs.envs",
+    "beamng_envs.envs.drag_strip.drag_strip_param_space",
+    "beamng_envs.optimisation",
+]
+HEAVY_MODULES = ["beamngpy", "gym", "pandas", "scipy"]
+
+# Wall-clock budget for importing all the light modules in a fresh interpreter. Timing depends on machine load and
+# disk caches, so the check is opt-in (set BEAMNG_ENVS_TIMING_TESTS=1); the heavy dependency check covers regressions.
+IMPORT_BUDGET_S = 0.5
+RUN_TIMING_TESTS = os.environ.get("BEAMNG_ENVS_TIMING_TESTS", "") == "1"
+
+
+def _run_in_fresh_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+
+class TestImportTime(unittest.TestCase):
+    def test_light_modules_dont_import_heavy_dependencies(self):
+        # Act
+        output = _run_in_fresh_interpreter(
+            f"import json, sys\n"
+            f"import {', '.join(LIGHT_MODULES)}\n"
+            f"print(json.dumps([m for m in {HEAVY_MODULES} if m in sys.modules]))"
+        )
+
+        # Assert
+        self.assertListEqual([], json.loads(output))
+
+    @unittest.skipUnless(RUN_TIMING_TESTS, "Set BEAMNG_ENVS_TIMING_TESTS=1 to run.")
+    def test_light_modules_import_within_budget(self):
+        # Act
+        output = _run_in_fresh_interpreter(
+            f"import time\n"
+            f"t0 = time.perf_counter()\n"
+            f"import {', '.join(LIGHT_MODULES)}\n"
+            f"print(time.perf_counter() - t0)"
+        )
+
+        # Assert
+        self.assertLess(float(output), IMPORT_BUDGET_S)
+
+    def test_lazy_attributes_load_on_access(self):
+        # Act
+        output = _run_in_fresh_interpreter(
+            "import json, sys\n"
+            "from beamng_envs.cars.sunburst import PART_OPTIONS\n"
+            "from beamng_envs.envs.drag_strip.drag_strip_param_space import DRAG_STRIP_PARAM_SPACE\n"
+            "from beamng_envs.data import DiskResults\n"
+            "print(json.dumps([len(PART_OPTIONS), len(DRAG_STRIP_PARAM_SPACE), DiskResults.__name__]))"
+        )
+
+        # Assert
+        n_parts, n_params, name = json.loads(output)
+        self.assertGreater(n_parts, 0)
+        self.assertEqual(n_parts, n_params)
+        self.assertEqual("DiskResults", name)